@@ -0,0 +1,66 @@
+"""Fixtures of the benchmarks.
+
+The size of the synthetic pipelines is set with `--bench-size`, so the same
+suite can be run quickly in CI and on projects the size of the largest ones
+seen in the wild.
+"""
+
+from __future__ import annotations
+
+import types
+
+import pytest
+
+from benchmarks.synthetic import SHAPES, make_generator, make_pipelines
+
+PACKAGE_NAME = "bench_project"
+"""Package name of the synthetic projects."""
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-size",
+        type=int,
+        default=200,
+        help="Number of nodes in every synthetic pipeline",
+    )
+    parser.addoption(
+        "--memory-multiple",
+        type=float,
+        default=10.0,
+        help="Multiple of the size of the resource files that the peak memory "
+        "of generating them may reach",
+    )
+
+
+@pytest.fixture(scope="session")
+def bench_size(request) -> int:
+    return request.config.getoption("--bench-size")
+
+
+@pytest.fixture(scope="session")
+def memory_multiple(request) -> float:
+    return request.config.getoption("--memory-multiple")
+
+
+@pytest.fixture(scope="session")
+def bench_metadata(tmp_path_factory):
+    return types.SimpleNamespace(
+        package_name=PACKAGE_NAME,
+        project_name=PACKAGE_NAME,
+        project_path=tmp_path_factory.mktemp("bench_metadata"),
+    )
+
+
+@pytest.fixture(scope="session", params=SHAPES)
+def shape(request) -> str:
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def jobs(bench_metadata, bench_size):
+    """The jobs generated by the `node` generator for every shape."""
+    generator = make_generator(
+        "node", bench_metadata, make_pipelines(SHAPES, bench_size)
+    )
+    return generator.generate_jobs()
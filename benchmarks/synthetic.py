@@ -0,0 +1,268 @@
+"""Synthetic Kedro pipelines, resources and projects for the benchmarks.
+
+Pipelines are built in one of the shapes of `SHAPES`, with `size` nodes:
+
+- `chain`: every node consumes the output of the previous one;
+- `fan-out`: one node feeds all the others;
+- `diamond`: repeated diamonds, where a node feeds two nodes joined by a fourth;
+- `namespaces`: chains of five nodes, each in its own namespace.
+"""
+
+from __future__ import annotations
+
+import types
+from pathlib import Path
+from typing import Any
+
+import kedro
+import yaml
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node, pipeline
+
+from kedro_databricks.utilities.resource_generator import (
+    RESOURCE_GENERATOR_RESOLVER,
+    AbstractResourceGenerator,
+)
+
+SHAPES = ["chain", "fan-out", "diamond", "namespaces"]
+"""Shapes of the synthetic pipelines."""
+
+CATALOG = {
+    "{name}": {"type": "pickle.PickleDataset", "filepath": "data/{name}.pkl"},
+}
+"""Catalog of the synthetic projects, matching every dataset with a factory."""
+
+NAMESPACE_SIZE = 5
+"""Number of nodes in each namespace of the `namespaces` shape."""
+
+
+def identity(*args: Any) -> Any:
+    """Node function returning its first input."""
+    return args[0] if args else None
+
+
+def make_pipeline(shape: str, size: int) -> Pipeline:
+    """Build a pipeline of the given shape with about `size` nodes.
+
+    Args:
+        shape (str): one of `SHAPES`
+        size (int): the number of nodes
+
+    Raises:
+        ValueError: if the shape is unknown
+
+    Returns:
+        Pipeline: the pipeline
+    """
+    if shape == "chain":
+        return _chain(size)
+    if shape == "fan-out":
+        nodes = [node(identity, "source", "fan_0", name="fan_0")]
+        nodes += [
+            node(identity, "fan_0", f"fan_{i}", name=f"fan_{i}") for i in range(1, size)
+        ]
+        return Pipeline(nodes)
+    if shape == "diamond":
+        nodes = []
+        for d in range(max(size // 4, 1)):
+            start = "source" if d == 0 else f"diamond_{d - 1}_join"
+            prefix = f"diamond_{d}"
+            nodes += [
+                node(identity, start, f"{prefix}_top", name=f"{prefix}_top"),
+                node(
+                    identity, f"{prefix}_top", f"{prefix}_left", name=f"{prefix}_left"
+                ),
+                node(
+                    identity, f"{prefix}_top", f"{prefix}_right", name=f"{prefix}_right"
+                ),
+                node(
+                    identity,
+                    [f"{prefix}_left", f"{prefix}_right"],
+                    f"{prefix}_join",
+                    name=f"{prefix}_join",
+                ),
+            ]
+        return Pipeline(nodes)
+    if shape == "namespaces":
+        return sum(
+            (
+                pipeline(_chain(NAMESPACE_SIZE), namespace=f"namespace_{n}")
+                for n in range(max(size // NAMESPACE_SIZE, 1))
+            ),
+            Pipeline([]),
+        )
+    raise ValueError(f"Unknown shape '{shape}', expected one of {SHAPES}")
+
+
+def make_pipelines(shapes: list[str], size: int) -> dict[str, Pipeline]:
+    """Build a pipeline registry with one pipeline of every shape.
+
+    Args:
+        shapes (list[str]): the shapes of the pipelines
+        size (int): the number of nodes of every pipeline
+
+    Returns:
+        dict[str, Pipeline]: the pipelines by name, with `__default__`
+            combining all of them
+    """
+    pipelines = {
+        shape.replace("-", "_"): make_pipeline(shape, size) for shape in shapes
+    }
+    pipelines["__default__"] = sum(pipelines.values(), Pipeline([]))
+    return pipelines
+
+
+def make_generator(
+    name: str, metadata: Any, pipelines: dict[str, Pipeline]
+) -> AbstractResourceGenerator:
+    """Create a resource generator for the given pipelines, outside of a project.
+
+    Args:
+        name (str): the name of the resource generator
+        metadata (Any): the project metadata, only `package_name` and
+            `project_name` are used
+        pipelines (dict[str, Pipeline]): the pipelines to generate jobs for
+
+    Returns:
+        AbstractResourceGenerator: the generator, with the `CATALOG`
+    """
+    generator = RESOURCE_GENERATOR_RESOLVER.resolve(name)(
+        session=None,
+        metadata=metadata,
+        context=types.SimpleNamespace(catalog=DataCatalog.from_config(CATALOG)),  # type: ignore
+    )
+    generator.pipelines = pipelines
+    return generator
+
+
+def make_overrides(job_names: list[str]) -> dict[str, Any]:
+    """Build `jobs` overrides touching every overrider of the jobs resource.
+
+    Args:
+        job_names (list[str]): the names of the generated jobs
+
+    Returns:
+        dict[str, Any]: the overrides, with a `default` entry applied to every
+            job and task, and a specific entry for every other job
+    """
+    default = {
+        "tags": {"team": "data", "cost_center": "1234"},
+        "job_clusters": [
+            {
+                "job_cluster_key": "default",
+                "new_cluster": {
+                    "spark_version": "15.4.x-scala2.12",
+                    "node_type_id": "Standard_DS3_v2",
+                    "num_workers": 2,
+                    "spark_conf": {"spark.speculation": "true"},
+                },
+            }
+        ],
+        "access_control_list": [
+            {"group_name": "admins", "permission_level": "CAN_MANAGE"},
+            {"user_name": "me@example.com", "permission_level": "IS_OWNER"},
+        ],
+        "webhook_notifications": {"on_failure": [{"id": "failure-hook"}]},
+        "health": {
+            "rules": [
+                {"metric": "RUN_DURATION_SECONDS", "op": "GREATER_THAN", "value": 3600}
+            ]
+        },
+        "tasks": [
+            {
+                "task_key": "default",
+                "job_cluster_key": "default",
+                "libraries": [{"whl": "../dist/*.whl"}],
+                "max_retries": 1,
+            }
+        ],
+    }
+    overrides: dict[str, Any] = {"default": default}
+    for name in job_names[::2]:
+        overrides[name] = {
+            "tags": {"job": name},
+            "job_clusters": [
+                {"job_cluster_key": "default", "new_cluster": {"num_workers": 4}}
+            ],
+            "tasks": [{"task_key": "re:.*_1", "max_retries": 3}],
+        }
+    return overrides
+
+
+PYPROJECT = """\
+[build-system]
+requires = ["setuptools"]
+build-backend = "setuptools.build_meta"
+
+[project]
+name = "{package_name}"
+version = "0.1"
+
+[tool.kedro]
+package_name = "{package_name}"
+project_name = "{package_name}"
+kedro_init_version = "{kedro_version}"
+source_dir = "src"
+"""
+"""`pyproject.toml` of the synthetic projects."""
+
+PIPELINE_REGISTRY = """\
+from benchmarks.synthetic import make_pipelines
+
+
+def register_pipelines():
+    return make_pipelines({shapes!r}, {size})
+"""
+"""Pipeline registry of the synthetic projects, building the pipelines on load."""
+
+
+def make_project(path: Path, package_name: str, shapes: list[str], size: int) -> Path:
+    """Write a minimal Kedro project with the synthetic pipelines.
+
+    The datasets of the project are defined by the `CATALOG`, and the `dev`
+    environment holds the overrides of `make_overrides`.
+
+    Args:
+        path (Path): the folder of the project
+        package_name (str): the name of the project package, which must be
+            unique within a benchmark session as Kedro caches the registry
+        shapes (list[str]): the shapes of the pipelines
+        size (int): the number of nodes of every pipeline
+
+    Returns:
+        Path: the folder of the project
+    """
+    package_dir = path / "src" / package_name
+    package_dir.mkdir(parents=True)
+    (path / "pyproject.toml").write_text(
+        PYPROJECT.format(package_name=package_name, kedro_version=kedro.__version__)
+    )
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "settings.py").write_text("")
+    (package_dir / "pipeline_registry.py").write_text(
+        PIPELINE_REGISTRY.format(shapes=shapes, size=size)
+    )
+    for env in ["base", "local", "dev"]:
+        (path / "conf" / env).mkdir(parents=True)
+    with open(path / "conf" / "base" / "catalog.yml", "w") as f:
+        yaml.safe_dump(CATALOG, f)
+    job_names = [package_name] + [
+        f"{package_name}_{shape.replace('-', '_')}" for shape in shapes
+    ]
+    with open(path / "conf" / "dev" / "databricks.yml", "w") as f:
+        yaml.safe_dump({"resources": {"jobs": make_overrides(job_names)}}, f)
+    return path
+
+
+def _chain(size: int) -> Pipeline:
+    return Pipeline(
+        [
+            node(
+                identity,
+                f"chain_{i - 1}" if i else "source",
+                f"chain_{i}",
+                name=f"chain_{i}",
+            )
+            for i in range(size)
+        ]
+    )
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+from kedro.framework.startup import bootstrap_project
+
+from benchmarks.conftest import PACKAGE_NAME
+from benchmarks.synthetic import SHAPES, make_project
+from kedro_databricks.plugin import commands
+
+ROUNDS = 3
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory, bench_size):
+    path = make_project(
+        tmp_path_factory.mktemp("project"), PACKAGE_NAME, SHAPES, bench_size
+    )
+    return bootstrap_project(path)
+
+
+@pytest.mark.benchmark(group="bundle")
+def test_bundle_command(benchmark, project):
+    runner = CliRunner()
+
+    result = benchmark.pedantic(
+        runner.invoke,
+        args=(commands, ["databricks", "bundle", "--env", "dev", "--overwrite"]),
+        kwargs={"obj": project},
+        rounds=ROUNDS,
+        iterations=1,
+    )
+
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert (project.project_path / "resources").exists()
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.synthetic import make_generator, make_pipelines
+
+
+@pytest.mark.parametrize("generator", ["node", "pipeline"])
+def test_generate_jobs(benchmark, bench_metadata, bench_size, shape, generator):
+    benchmark.group = f"generate_jobs[{generator}]"
+    g = make_generator(generator, bench_metadata, make_pipelines([shape], bench_size))
+
+    jobs = benchmark(g.generate_jobs, shape.replace("-", "_"))
+
+    assert len(jobs) == 1
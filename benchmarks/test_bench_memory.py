@@ -0,0 +1,34 @@
+"""Peak memory of applying the overrides and writing the resources.
+
+The peak is traced with the `MemoryTracer` of `bundle --trace-memory`, and must
+stay below `--memory-multiple` times the size of the written resource files.
+"""
+
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from benchmarks.synthetic import make_overrides
+from kedro_databricks.api import apply_overrides
+from kedro_databricks.utilities.memory_tracer import MemoryTracer, trace_phase
+from kedro_databricks.utilities.resource_writer import OUTPUT_FORMATS, save_resources
+
+
+@pytest.mark.parametrize("output_format", OUTPUT_FORMATS)
+def test_peak_memory(bench_metadata, jobs, memory_multiple, output_format):
+    resources_dir = bench_metadata.project_path / "resources"
+    shutil.rmtree(resources_dir, ignore_errors=True)
+    overrides = {"jobs": make_overrides(list(jobs))}
+
+    with MemoryTracer() as tracer:
+        with trace_phase("apply_overrides"):
+            resources = apply_overrides({"jobs": jobs}, overrides)
+        with trace_phase("save_resources"):
+            save_resources(
+                bench_metadata, "dev", resources, True, output_format=output_format
+            )
+
+    output_size = sum(path.stat().st_size for path in resources_dir.iterdir())
+    assert tracer.peak <= memory_multiple * output_size, tracer.report()
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from benchmarks.synthetic import make_overrides
+from kedro_databricks.api import apply_overrides
+from kedro_databricks.constants import DEFAULT_CONFIG_KEY, JOB_KEY_ORDER
+from kedro_databricks.utilities.common import PatternIndex, remove_nulls, sort_dict
+from kedro_databricks.utilities.resource_overrider import (
+    DefaultResourceOverrider,
+    JobsResourceOverrider,
+    VolumesResourceOverrider,
+)
+from kedro_databricks.utilities.resource_overrider.jobs_resource_overrider import (
+    _access_control_list_overrider,
+    _libraries_overrider,
+    _notification_overrider,
+    _tasks_overrider,
+)
+
+ROUNDS = 20
+
+PATTERNS = 300
+"""Number of `re:` and `glob:` overrides matched against the task keys."""
+
+
+def _pedantic(benchmark, func, *args):
+    # Overriders may modify their arguments, so each round gets fresh copies,
+    # made outside of the timed call.
+    return benchmark.pedantic(
+        func,
+        setup=lambda: (copy.deepcopy(args), {}),
+        rounds=ROUNDS,
+        iterations=1,
+    )
+
+
+def _with_nulls(value):
+    if isinstance(value, dict):
+        result = {key: _with_nulls(item) for key, item in value.items()}
+        result["unset"] = None
+        result["empty"] = {}
+        return result
+    if isinstance(value, list):
+        return [_with_nulls(item) for item in value] + [None]
+    return value
+
+
+@pytest.fixture(scope="module")
+def job(jobs):
+    """The largest generated job."""
+    return max(jobs.values(), key=lambda job: len(job["tasks"]))
+
+
+@pytest.fixture(scope="module")
+def overrides(jobs):
+    return make_overrides(list(jobs))
+
+
+@pytest.mark.benchmark(group="apply_overrides")
+def test_apply_overrides(benchmark, jobs, overrides):
+    result = benchmark(apply_overrides, {"jobs": jobs}, {"jobs": overrides})
+
+    assert set(result["jobs"]) == set(jobs)
+
+
+@pytest.mark.benchmark(group="overriders")
+def test_jobs_overrider(benchmark, job, overrides):
+    result = _pedantic(
+        benchmark,
+        JobsResourceOverrider().override,
+        job["name"],
+        job,
+        overrides,
+        DEFAULT_CONFIG_KEY,
+    )
+
+    assert result["tags"]["team"] == "data"
+
+
+@pytest.mark.benchmark(group="overriders")
+def test_default_overrider(benchmark):
+    volumes = {
+        f"volume_{i}": {"catalog_name": "main", "name": f"v{i}"} for i in range(100)
+    }
+    volumes["default"] = {"schema_name": "default", "volume_type": "MANAGED"}
+
+    result = _pedantic(
+        benchmark,
+        DefaultResourceOverrider().override,
+        "volume_0",
+        {"comment": "synthetic"},
+        volumes,
+        DEFAULT_CONFIG_KEY,
+    )
+
+    assert result["volume_type"] == "MANAGED"
+
+
+@pytest.mark.benchmark(group="overriders")
+def test_volumes_overrider(benchmark):
+    grants = [
+        {"principal": f"group_{i}", "privileges": ["READ_VOLUME"]} for i in range(50)
+    ]
+    volumes = {f"volume_{i}": {"grants": grants[i::2]} for i in range(100)}
+    volumes["default"] = {"volume_type": "MANAGED", "grants": grants}
+    volumes["glob:volume_1*"] = {"comment": "synthetic"}
+
+    result = _pedantic(
+        benchmark,
+        VolumesResourceOverrider().override,
+        "volume_1",
+        {"name": "volume_1", "catalog_name": "main"},
+        volumes,
+        DEFAULT_CONFIG_KEY,
+    )
+
+    assert len(result["grants"]) == len(grants)
+
+
+@pytest.mark.benchmark(group="overriders")
+def test_tasks_overrider(benchmark, job, overrides):
+    result = _pedantic(
+        benchmark,
+        _tasks_overrider,
+        job["tasks"],
+        overrides[DEFAULT_CONFIG_KEY]["tasks"],
+        DEFAULT_CONFIG_KEY,
+    )
+
+    assert len(result) == len(job["tasks"])
+
+
+@pytest.mark.benchmark(group="overriders")
+def test_access_control_list_overrider(benchmark):
+    old = [
+        {"user_name": f"user_{i}", "permission_level": "CAN_VIEW"} for i in range(200)
+    ]
+    new = [
+        {"user_name": f"user_{i}", "permission_level": "CAN_MANAGE"}
+        for i in range(0, 200, 2)
+    ]
+
+    result = _pedantic(benchmark, _access_control_list_overrider, old, new)
+
+    assert len(result) == len(old)
+
+
+@pytest.mark.benchmark(group="overriders")
+def test_notification_overrider(benchmark):
+    old = {"on_failure": [{"id": f"hook_{i}"} for i in range(200)]}
+    new = {"on_failure": [{"id": f"hook_{i}"} for i in range(100, 300)]}
+
+    result = _pedantic(benchmark, _notification_overrider, old, new)
+
+    assert len(result["on_failure"]) == 300
+
+
+@pytest.mark.benchmark(group="overriders")
+def test_libraries_overrider(benchmark):
+    old = [{"whl": f"dist/package_{i}.whl"} for i in range(200)]
+    new = [{"whl": f"dist/package_{i}.whl"} for i in range(100, 300)]
+
+    result = _pedantic(benchmark, _libraries_overrider, old, new)
+
+    assert len(result) == 300
+
+
+def _libraries(start, stop):
+    # One library of every kind per index.
+    libraries = []
+    for i in range(start, stop):
+        libraries += [
+            {"whl": f"dist/package_{i}.whl"},
+            {"jar": f"dist/package_{i}.jar"},
+            {"egg": f"dist/package_{i}.egg"},
+            {"requirements": f"requirements_{i}.txt"},
+            {"pypi": {"package": f"package_{i}"}},
+            {"maven": {"coordinates": f"org.example:package_{i}:1.0"}},
+            {"cran": {"package": f"package_{i}"}},
+        ]
+    return libraries
+
+
+@pytest.mark.benchmark(group="overriders")
+def test_libraries_overrider_shared_defaults(benchmark, job):
+    # A default list of 42 libraries merged into the libraries of every task.
+    default = _libraries(0, 6)
+    tasks = [_libraries(3, 4) for _ in job["tasks"]]
+
+    def override_all():
+        return [_libraries_overrider(default, libraries) for libraries in tasks]
+
+    result = benchmark(override_all)
+
+    assert all(len(libraries) == len(default) for libraries in result)
+
+
+def _patterns(count):
+    # Half regexes and half globs, about half of them without a literal prefix.
+    patterns = []
+    for i in range(count // 4):
+        patterns += [
+            f"re:.*_{i}$",
+            f"glob:*_{i}_*",
+            f"re:chain_{i}",
+            f"glob:fan_{i}?",
+        ]
+    return patterns
+
+
+@pytest.mark.benchmark(group="patterns")
+def test_pattern_index_match(benchmark, bench_size):
+    keys = [
+        f"{prefix}_{i}"
+        for prefix in ["chain", "fan", "diamond"]
+        for i in range(bench_size * 5)
+    ]
+    patterns = _patterns(PATTERNS)
+
+    def match_all(index):
+        return [index.match(key) for key in keys]
+
+    result = benchmark.pedantic(
+        match_all,
+        setup=lambda: ((PatternIndex(patterns),), {}),
+        rounds=ROUNDS,
+        iterations=1,
+    )
+
+    assert result[1] == ["re:.*_1$", "re:chain_1"]
+
+
+@pytest.mark.benchmark(group="patterns")
+def test_tasks_overrider_patterns(benchmark, job):
+    new = [{"task_key": key, "max_retries": 1} for key in _patterns(PATTERNS)]
+
+    result = _pedantic(
+        benchmark, _tasks_overrider, job["tasks"], new, DEFAULT_CONFIG_KEY
+    )
+
+    assert len(result) == len(job["tasks"])
+
+
+@pytest.mark.benchmark(group="cleanup")
+def test_remove_nulls(benchmark, job):
+    result = _pedantic(benchmark, remove_nulls, _with_nulls(job))
+
+    assert result == job
+
+
+@pytest.mark.benchmark(group="cleanup")
+def test_sort_dict(benchmark, job):
+    shuffled = dict(reversed(list(job.items())))
+
+    result = benchmark(sort_dict, shuffled, JOB_KEY_ORDER)
+
+    assert list(result) == list(sort_dict(job, JOB_KEY_ORDER))
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.synthetic import make_overrides
+from kedro_databricks.api import apply_overrides
+from kedro_databricks.utilities.resource_validator import validate_resources
+
+
+@pytest.fixture(scope="module")
+def resources(jobs):
+    return apply_overrides({"jobs": jobs}, {"jobs": make_overrides(list(jobs))})
+
+
+@pytest.mark.benchmark(group="validate")
+def test_validate_resources(benchmark, resources):
+    issues = benchmark(validate_resources, resources)
+
+    assert issues == []
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import shutil
+
+import pytest
+
+from kedro_databricks.utilities.resource_writer import (
+    OUTPUT_FORMATS,
+    OUTPUT_LAYOUTS,
+    save_resources,
+)
+
+ROUNDS = 10
+
+
+@pytest.mark.parametrize("output_format", OUTPUT_FORMATS)
+@pytest.mark.parametrize("layout", OUTPUT_LAYOUTS)
+def test_save_resources(benchmark, bench_metadata, jobs, layout, output_format):
+    benchmark.group = "save_resources"
+    resources_dir = bench_metadata.project_path / "resources"
+
+    def setup():
+        shutil.rmtree(resources_dir, ignore_errors=True)
+
+    files = benchmark.pedantic(
+        save_resources,
+        args=(bench_metadata, "dev", {"jobs": jobs}, True),
+        kwargs={"layout": layout, "output_format": output_format},
+        setup=setup,
+        rounds=ROUNDS,
+        iterations=1,
+    )
+
+    assert files
+
+
+@pytest.mark.benchmark(group="save_resources")
+def test_save_resources_unchanged(benchmark, bench_metadata, jobs):
+    save_resources(bench_metadata, "dev", {"jobs": jobs}, overwrite=True)
+
+    files = benchmark(save_resources, bench_metadata, "dev", {"jobs": jobs}, True)
+
+    assert files == []
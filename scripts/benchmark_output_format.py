@@ -0,0 +1,125 @@
+"""Compare the formats used to write the generated resources.
+
+A single job with `--tasks` tasks is written with the pure Python YAML dumper
+used before, with the format options of `kedro databricks bundle --format` and
+with `--yaml-anchors`, and loaded back with the libyaml loader, as a proxy for
+the bundle parser:
+
+    python scripts/benchmark_output_format.py --tasks 5000 --runs 5
+"""
+
+import argparse
+import io
+import statistics
+import time
+
+import yaml
+
+from kedro_databricks.utilities.resource_writer import _dump, share_identical
+
+LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""Fastest available YAML loader."""
+
+
+def make_job(tasks: int) -> dict:
+    """Create a job with `tasks` chained tasks.
+
+    Every task has the blocks that `default` overrides typically add to tasks.
+    """
+    return {
+        "targets": {
+            "dev": {
+                "resources": {
+                    "jobs": {
+                        "benchmark": {
+                            "name": "benchmark",
+                            "tasks": [
+                                {
+                                    "task_key": f"node_{t}",
+                                    "depends_on": [{"task_key": f"node_{t - 1}"}]
+                                    if t
+                                    else [],
+                                    "environment_key": "default",
+                                    "libraries": [
+                                        {"whl": "../dist/*.whl"},
+                                        {"pypi": {"package": "kedro-datasets"}},
+                                    ],
+                                    "health": {
+                                        "rules": [
+                                            {
+                                                "metric": "RUN_DURATION_SECONDS",
+                                                "op": "GREATER_THAN",
+                                                "value": 3600,
+                                            }
+                                        ]
+                                    },
+                                    "email_notifications": {
+                                        "on_failure": ["team@example.com"],
+                                        "on_duration_warning_threshold_exceeded": [
+                                            "team@example.com"
+                                        ],
+                                    },
+                                    "python_wheel_task": {
+                                        "package_name": "benchmark",
+                                        "entry_point": "databricks_run",
+                                        "parameters": [
+                                            "--nodes",
+                                            f"node_{t}",
+                                            "--conf-source",
+                                            "/Workspace/conf",
+                                            "--env",
+                                            "${var.environment}",
+                                        ],
+                                    },
+                                }
+                                for t in range(tasks)
+                            ],
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+
+def _pure_python_yaml(data, stream):
+    yaml.dump(data, stream, default_flow_style=False, indent=4, sort_keys=False)
+
+
+WRITERS = {
+    "yaml (pure Python)": _pure_python_yaml,
+    "yaml": lambda data, stream: _dump(data, stream, "yaml"),
+    "yaml (anchors)": lambda data, stream: _dump(share_identical(data), stream, "yaml"),
+    "json": lambda data, stream: _dump(data, stream, "json"),
+}
+"""Writers to compare, keyed by name."""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    data = make_job(args.tasks)
+    print(f"{'format':<20} {'size KiB':>9} {'write ms':>9} {'load ms':>9}")  # noqa: T201
+    for name, writer in WRITERS.items():
+        write_times, load_times = [], []
+        for _ in range(args.runs):
+            stream = io.StringIO()
+            start = time.perf_counter()
+            writer(data, stream)
+            write_times.append((time.perf_counter() - start) * 1000)
+            content = stream.getvalue()
+            start = time.perf_counter()
+            assert yaml.load(content, Loader=LOADER) == data  # noqa: S101
+            load_times.append((time.perf_counter() - start) * 1000)
+        print(  # noqa: T201
+            f"{name:<20} {len(content.encode()) / 1024:>9.0f} "
+            f"{statistics.median(write_times):>9.0f} "
+            f"{statistics.median(load_times):>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
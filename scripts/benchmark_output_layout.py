@@ -0,0 +1,131 @@
+"""Compare the resource output layouts of `kedro databricks bundle`.
+
+A synthetic bundle with `--jobs` jobs is written once per layout. For every
+layout, the script reports how many files were written, how long it takes to
+load them with PyYAML, and, if the Databricks CLI is installed and configured
+for `--target`, the median time of `databricks bundle validate`:
+
+    python scripts/benchmark_output_layout.py --jobs 500 --runs 5
+"""
+
+import argparse
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+import types
+from pathlib import Path
+
+import yaml
+
+from kedro_databricks.utilities.resource_writer import OUTPUT_LAYOUTS, save_resources
+
+BUNDLE_CONFIG = """
+bundle:
+  name: benchmark
+
+include:
+  - resources/*.yml
+
+targets:
+  {target}:
+    default: true
+"""
+"""Minimal `databricks.yml` including the generated resources."""
+
+
+def make_resources(jobs: int, tasks: int) -> dict:
+    """Create `jobs` jobs with `tasks` chained tasks each."""
+    resources = {}
+    for j in range(jobs):
+        resources[f"benchmark_pipeline_{j}"] = {
+            "name": f"benchmark_pipeline_{j}",
+            "tasks": [
+                {
+                    "task_key": f"node_{t}",
+                    "depends_on": [{"task_key": f"node_{t - 1}"}] if t else [],
+                    "python_wheel_task": {
+                        "package_name": "benchmark",
+                        "entry_point": "databricks_run",
+                        "parameters": ["--nodes", f"node_{t}"],
+                    },
+                }
+                for t in range(tasks)
+            ],
+        }
+    return {"jobs": resources}
+
+
+def time_yaml_load(resources_dir: Path, runs: int) -> float:
+    """Median time in ms to load every resource file."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for path in sorted(resources_dir.glob("*.yml")):
+            with open(path) as f:
+                yaml.safe_load(f)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def time_validate(project: Path, target: str, runs: int) -> float | None:
+    """Median time in ms of `databricks bundle validate`, `None` if it fails."""
+    databricks = shutil.which("databricks")
+    if databricks is None:
+        return None
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [databricks, "bundle", "validate", "--target", target],
+            cwd=project,
+            capture_output=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            return None
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=10)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target", default="dev")
+    args = parser.parse_args()
+
+    resources = make_resources(args.jobs, args.tasks)
+    header = f"{'layout':<10} {'files':>6} {'write ms':>9} {'load ms':>9} {'validate ms':>12}"
+    print(header)  # noqa: T201
+    for layout in OUTPUT_LAYOUTS:
+        with tempfile.TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            (project / "databricks.yml").write_text(
+                BUNDLE_CONFIG.format(target=args.target)
+            )
+            metadata = types.SimpleNamespace(project_path=project)
+            start = time.perf_counter()
+            files = save_resources(
+                metadata,  # type: ignore
+                args.target,
+                resources,
+                overwrite=True,
+                layout=layout,
+                shards=args.shards,
+            )
+            write_ms = (time.perf_counter() - start) * 1000
+            load_ms = time_yaml_load(project / "resources", args.runs)
+            validate_ms = time_validate(project, args.target, args.runs)
+            validate = "n/a" if validate_ms is None else f"{validate_ms:.0f}"
+            print(  # noqa: T201
+                f"{layout:<10} {len(files):>6} {write_ms:>9.0f} "
+                f"{load_ms:>9.0f} {validate:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Measure how long `kedro databricks --help` and shell completion take.
+
+Each scenario runs in a fresh interpreter, so the measurement includes the
+imports done by the plugin. The script fails if the median exceeds the budget:
+
+    python scripts/benchmark_startup.py --runs 20 --budget-ms 100
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "help": (
+        "from kedro_databricks.plugin import commands\n"
+        "commands(['databricks', '--help'], standalone_mode=False)\n"
+    ),
+    "complete": (
+        "from kedro_databricks.plugin import commands\n"
+        "commands(prog_name='kedro', complete_var='_KEDRO_COMPLETE')\n"
+    ),
+}
+"""Code run for each scenario."""
+
+COMPLETE_ENV = {
+    "_KEDRO_COMPLETE": "bash_complete",
+    "COMP_WORDS": "kedro databricks ",
+    "COMP_CWORD": "2",
+}
+"""Environment variables triggering click's shell completion."""
+
+
+def measure(code: str, runs: int, env: dict[str, str]) -> list[float]:
+    """Run the code in fresh interpreters and return the wall times in ms."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, **env},
+            stdout=subprocess.DEVNULL,
+            check=False,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure("pass", args.runs, {}))
+    print(f"interpreter startup: {baseline:.1f} ms (not counted)")  # noqa: T201
+    failed = False
+    for name, code in SCENARIOS.items():
+        env = COMPLETE_ENV if name == "complete" else {}
+        median = statistics.median(measure(code, args.runs, env)) - baseline
+        status = "ok" if median <= args.budget_ms else "over budget"
+        failed |= median > args.budget_ms
+        print(f"{name}: {median:.1f} ms ({status}, budget {args.budget_ms:.0f} ms)")  # noqa: T201
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare two runs of the benchmark suite and fail on regressions.
+
+Both files are written by `pytest benchmarks --benchmark-json=<file>`, usually
+one on the main branch and one on the change under review:
+
+    python scripts/compare_benchmarks.py baseline.json benchmark.json --threshold 20
+
+The median of every benchmark is compared, and the script exits with status 1
+if any benchmark got slower by more than `--threshold` percent. Benchmarks only
+found in one of the files are listed but never fail the comparison.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def load_medians(path: Path) -> dict[str, float]:
+    """Median time in seconds of every benchmark, keyed by its full name."""
+    data = json.loads(path.read_text())
+    return {
+        benchmark["fullname"]: benchmark["stats"]["median"]
+        for benchmark in data["benchmarks"]
+    }
+
+
+def compare(
+    baseline: dict[str, float], current: dict[str, float], threshold: float
+) -> list[str]:
+    """Print the comparison and return the names of the regressed benchmarks."""
+    regressions = []
+    width = max((len(name) for name in baseline | current), default=0)
+    print(f"{'benchmark':<{width}} {'baseline':>12} {'current':>12} {'change':>8}")  # noqa: T201
+    for name in sorted(baseline | current):
+        if name not in baseline or name not in current:
+            status = "new" if name not in baseline else "removed"
+            print(f"{name:<{width}} {status:>34}")  # noqa: T201
+            continue
+        before, after = baseline[name], current[name]
+        change = (after - before) / before * 100 if before else 0.0
+        marker = ""
+        if change > threshold:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        print(  # noqa: T201
+            f"{name:<{width}} {before * 1000:>10.2f}ms {after * 1000:>10.2f}ms "
+            f"{change:>+7.1f}%{marker}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="Percentage by which a median may grow before it is a regression",
+    )
+    args = parser.parse_args()
+
+    regressions = compare(
+        load_medians(args.baseline), load_medians(args.current), args.threshold
+    )
+    if regressions:
+        print(  # noqa: T201
+            f"{len(regressions)} benchmark(s) regressed by more than {args.threshold}%",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Generate the static command registry in `kedro_databricks/commands/__init__.py`.
+
+Run this script whenever a command is added, removed or its help text changes:
+
+    python scripts/generate_command_registry.py
+
+Use `--check` to fail instead of writing when the registry is out of date.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from kedro_databricks.utilities.plugin import discover_commands
+
+root = Path(__file__).parent.parent
+commands_dir = root / "src" / "kedro_databricks" / "commands"
+registry_path = commands_dir / "__init__.py"
+
+BLOCK = re.compile(
+    r"(# BEGIN GENERATED REGISTRY.*?\n)(.*?)(# END GENERATED REGISTRY)", re.S
+)
+
+
+def render_registry() -> str:
+    """Render the `COMMANDS` dictionary."""
+    lines = ["COMMANDS = {"]
+    for name, spec in discover_commands(commands_dir).items():
+        module, help_text = json.dumps(spec.module), json.dumps(spec.help)
+        lines.append(f"    {json.dumps(name)}: CommandSpec({module}, {help_text}),")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="Only check the registry")
+    args = parser.parse_args()
+
+    current = registry_path.read_text()
+    updated = BLOCK.sub(
+        lambda m: m.group(1) + render_registry() + m.group(3), current, count=1
+    )
+    if updated == current:
+        print(f"{registry_path.relative_to(root)} is up to date")  # noqa: T201
+        return
+    if args.check:
+        print(f"{registry_path.relative_to(root)} is out of date, regenerate it")  # noqa: T201
+        sys.exit(1)
+    registry_path.write_text(updated)
+    print(f"Updated {registry_path.relative_to(root)}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,11 @@
-from importlib.metadata import version
+from typing import Any
 
-__version__ = version("kedro-databricks")
+
+def __getattr__(name: str) -> Any:
+    # The version is read from the package metadata on first access, as this
+    # module is imported by Kedro for every `kedro` command.
+    if name == "__version__":
+        from importlib.metadata import version  # noqa: PLC0415
+
+        return version("kedro-databricks")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
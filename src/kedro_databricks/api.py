@@ -0,0 +1,370 @@
+"""Python API for generating Databricks Asset Bundle resources.
+
+`generate_bundle` produces the same resources as `kedro databricks bundle`, but
+returns them instead of writing them to `resources/`. It can reuse a Kedro
+session or context that the caller already holds, and does not touch the disk,
+which makes it suitable for services rendering bundles for many projects from a
+single long-lived process:
+
+```python
+from kedro_databricks.api import generate_bundle
+
+resources = generate_bundle("path/to/project", env="dev", generator="node")
+resources["jobs"]["my_project"]["tasks"]
+```
+
+`generate_bundles` does the same for several environments at once. Jobs are
+generated only once, and each environment's configuration is applied to them.
+
+Kedro keeps the settings and pipelines of the current project in process-wide
+state, so calls to `generate_bundle` and `generate_bundles` are serialised with
+a lock.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from pathlib import Path
+from typing import Any
+
+from kedro.config import AbstractConfigLoader, MissingConfigException, OmegaConfigLoader
+from kedro.framework.context import KedroContext
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import ProjectMetadata, bootstrap_project
+
+from kedro_databricks.constants import (
+    DEFAULT_CONF_FOLDER,
+    DEFAULT_CONFIG_GENERATOR,
+    DEFAULT_CONFIG_KEY,
+    DEFAULT_ENV,
+)
+from kedro_databricks.utilities.common import is_pattern_key
+from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.memory_tracer import trace_phase
+from kedro_databricks.utilities.provenance import Provenance
+from kedro_databricks.utilities.resource_generator import (
+    RESOURCE_GENERATOR_RESOLVER,
+    AbstractResourceGenerator,
+)
+from kedro_databricks.utilities.resource_overrider import RESOURCE_OVERRIDER_RESOLVER
+
+log = get_logger("api")
+
+_LOCK = threading.RLock()
+
+__all__ = [
+    "apply_overrides",
+    "generate_bundle",
+    "generate_bundles",
+    "load_databricks_config",
+]
+
+
+def generate_bundle(
+    project_path: str | Path | None = None,
+    env: str = DEFAULT_ENV,
+    generator: str | type[AbstractResourceGenerator] = DEFAULT_CONFIG_GENERATOR,
+    pipeline: str | None = None,
+    params: str | None = None,
+    conf_source: str = DEFAULT_CONF_FOLDER,
+    default_key: str = DEFAULT_CONFIG_KEY,
+    session: KedroSession | None = None,
+    context: KedroContext | None = None,
+    metadata: ProjectMetadata | None = None,
+    provenance: dict[str, dict[str, Provenance]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Generate the Databricks Asset Bundle resources of a Kedro project.
+
+    The Kedro context is taken from `context` or `session` if given. Otherwise a
+    new session is created for `project_path` and `env`, and closed again before
+    returning.
+
+    Args:
+        project_path (str | Path | None): root of the Kedro project, only needed
+            if neither `metadata`, `session` nor `context` is given
+        env (str): Kedro environment, only used when creating a new session
+        generator (str | type[AbstractResourceGenerator]): `node`, `pipeline`,
+            the dotted path of a generator class or the class itself
+        pipeline (str | None): only generate the job of this pipeline
+        params (str | None): runtime parameters passed on to every task
+        conf_source (str): name of the configuration folder
+        default_key (str): key of the overrides applied to every resource
+        session (KedroSession | None): an existing session to reuse
+        context (KedroContext | None): an existing context to reuse
+        metadata (ProjectMetadata | None): metadata of the project, resolved with
+            `bootstrap_project` if not given
+        provenance (dict[str, dict[str, Provenance]] | None): filled with the
+            provenance of every resource, see `apply_overrides`
+
+    Raises:
+        ValueError: if the project cannot be determined or `default_key` is invalid
+        KeyError: if the Databricks configuration has no `resources`
+
+    Returns:
+        dict[str, dict[str, Any]]: the resources by resource type and name
+    """
+    if default_key.startswith("_"):
+        raise ValueError(
+            "Default key cannot start with `_` as this is not recognized by OmegaConf."
+        )
+    with _LOCK:
+        if metadata is None:
+            metadata = bootstrap_project(
+                _resolve_project_path(project_path, session, context)
+            )
+        if context is None and session is None:
+            with KedroSession.create(
+                project_path=metadata.project_path, env=env
+            ) as new_session:
+                with trace_phase("load_context"):
+                    new_context = new_session.load_context()
+                return _generate(
+                    metadata,
+                    new_context,
+                    generator,
+                    pipeline,
+                    params,
+                    conf_source,
+                    default_key,
+                    provenance,
+                )
+        if context is None:
+            with trace_phase("load_context"):
+                context = session.load_context()  # type: ignore - checked above
+        return _generate(
+            metadata,
+            context,
+            generator,
+            pipeline,
+            params,
+            conf_source,
+            default_key,
+            provenance,
+        )
+
+
+def generate_bundles(
+    envs: list[str],
+    project_path: str | Path | None = None,
+    generator: str | type[AbstractResourceGenerator] = DEFAULT_CONFIG_GENERATOR,
+    pipeline: str | None = None,
+    params: str | None = None,
+    conf_source: str = DEFAULT_CONF_FOLDER,
+    default_key: str = DEFAULT_CONFIG_KEY,
+    metadata: ProjectMetadata | None = None,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Generate the Databricks Asset Bundle resources for several environments.
+
+    A Kedro context is loaded for every environment, to read its Databricks
+    configuration and let the generator validate its catalog. The jobs are only
+    generated for the first environment if the generator's jobs do not depend
+    on the environment (see `AbstractResourceGenerator.env_independent`), and
+    reused for the others.
+
+    Args:
+        envs (list[str]): the Kedro environments
+        project_path (str | Path | None): root of the Kedro project, only needed
+            if `metadata` is not given
+        generator (str | type[AbstractResourceGenerator]): `node`, `pipeline`,
+            the dotted path of a generator class or the class itself
+        pipeline (str | None): only generate the job of this pipeline
+        params (str | None): runtime parameters passed on to every task
+        conf_source (str): name of the configuration folder
+        default_key (str): key of the overrides applied to every resource
+        metadata (ProjectMetadata | None): metadata of the project, resolved with
+            `bootstrap_project` if not given
+
+    Raises:
+        ValueError: if the project cannot be determined or `default_key` is invalid
+        KeyError: if the Databricks configuration of an environment has no `resources`
+
+    Returns:
+        dict[str, dict[str, dict[str, Any]]]: the resources by environment,
+            resource type and name
+    """
+    if default_key.startswith("_"):
+        raise ValueError(
+            "Default key cannot start with `_` as this is not recognized by OmegaConf."
+        )
+    if isinstance(generator, str):
+        generator = RESOURCE_GENERATOR_RESOLVER.resolve(generator)
+    results = {}
+    with _LOCK:
+        if metadata is None:
+            metadata = bootstrap_project(
+                _resolve_project_path(project_path, None, None)
+            )
+        jobs = None
+        for env in envs:
+            with KedroSession.create(
+                project_path=metadata.project_path, env=env
+            ) as session:
+                with trace_phase(f"load_context ({env})"):
+                    context = session.load_context()
+                overrides = _load_overrides(context)
+                g = generator(
+                    session=None,
+                    metadata=metadata,
+                    conf_source=conf_source,
+                    params=params,
+                    context=context,
+                )
+                if jobs is None or not generator.env_independent:
+                    with trace_phase(f"generate_jobs ({env})"):
+                        jobs = g.generate_jobs(pipeline)
+                else:
+                    log.debug(f"Reusing the generated jobs for environment '{env}'")
+            with trace_phase(f"apply_overrides ({env})"):
+                results[env] = apply_overrides({"jobs": jobs}, overrides, default_key)
+    return results
+
+
+def apply_overrides(
+    resources: dict[str, dict[str, Any]],
+    overrides: dict[str, dict[str, Any]],
+    default_key: str = DEFAULT_CONFIG_KEY,
+    provenance: dict[str, dict[str, Provenance]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Apply the `resources` section of the Databricks configuration.
+
+    Every resource type in `overrides` is merged into the generated resources of
+    that type with the overrider registered for it. Resources that only exist in
+    the overrides are created. Neither argument is modified, but the result may
+    share nested values with them, such as a block of the `default` overrides
+    that ends up in every task. Copy the result before modifying it in place.
+
+    If `provenance` is given, the layer that set every field of a resource is
+    recorded in `provenance[resource_type][resource_key]`, see `Provenance`.
+
+    Args:
+        resources (dict[str, dict[str, Any]]): the generated resources by type
+        overrides (dict[str, dict[str, Any]]): the overrides by resource type
+        default_key (str): key of the overrides applied to every resource
+        provenance (dict[str, dict[str, Provenance]] | None): filled with the
+            provenance of every resource, if given
+
+    Returns:
+        dict[str, dict[str, Any]]: the overridden resources by type
+    """
+    overridden_resources = {}
+    for resource_type, resource_override_items in overrides.items():
+        overridden_resources[resource_type] = {}
+        resource_items = resources.get(resource_type, {})
+        overrider = RESOURCE_OVERRIDER_RESOLVER.resolve(resource_type)()
+        all_keys = set(resource_items.keys()).union(set(resource_override_items.keys()))
+        for key in all_keys:
+            if key == default_key or is_pattern_key(key):
+                continue
+            resource = resource_items.get(key, {})
+            override_items = resource_override_items
+            if overrider.copy_inputs:
+                resource = copy.deepcopy(resource)
+                override_items = copy.deepcopy(override_items)
+            overridden_resources[resource_type][key] = overrider.override(
+                resource_key=key,
+                resource=resource,
+                overrides=override_items,
+                default_key=default_key,
+            )
+            if provenance is not None:
+                overrider.record_provenance(
+                    provenance.setdefault(resource_type, {}).setdefault(
+                        key, Provenance()
+                    ),
+                    resource_type=resource_type,
+                    resource_key=key,
+                    resource=resource_items.get(key, {}),
+                    overrides=resource_override_items,
+                    default_key=default_key,
+                )
+    return overridden_resources
+
+
+def load_databricks_config(config_loader: AbstractConfigLoader) -> dict[str, Any]:
+    """Load the Databricks configuration with the given config loader.
+
+    The `databricks` config pattern is registered on the loader if the project
+    settings do not define it.
+
+    Args:
+        config_loader (AbstractConfigLoader): the config loader of the Kedro context
+
+    Raises:
+        TypeError: if the config loader is not an `OmegaConfigLoader`
+
+    Returns:
+        dict[str, Any]: The Databricks configuration for the given environment
+    """
+    # Backwards compatibility for ConfigLoader that does not support `config_patterns`
+    if not hasattr(config_loader, "config_patterns"):
+        return config_loader.get("databricks*", "databricks/**")
+
+    if not isinstance(config_loader, OmegaConfigLoader):
+        raise TypeError(
+            "Only OmegaConfigLoader is supported to load Databricks configuration."
+        )
+
+    # Set the default pattern for `databricks` if not provided in `settings.py`
+    if "databricks" not in config_loader.config_patterns.keys():
+        config_loader.config_patterns.update(
+            {"databricks": ["databricks*", "databricks/**"]}
+        )
+
+    try:
+        return config_loader["databricks"]
+    except MissingConfigException:
+        log.warning("No Databricks configuration found.")
+        return {}
+
+
+def _generate(  # noqa: PLR0913
+    metadata: ProjectMetadata,
+    context: KedroContext,
+    generator: str | type[AbstractResourceGenerator],
+    pipeline: str | None,
+    params: str | None,
+    conf_source: str,
+    default_key: str,
+    provenance: dict[str, dict[str, Provenance]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    overrides = _load_overrides(context)
+    if isinstance(generator, str):
+        generator = RESOURCE_GENERATOR_RESOLVER.resolve(generator)
+    g = generator(
+        session=None,
+        metadata=metadata,
+        conf_source=conf_source,
+        params=params,
+        context=context,
+    )
+    with trace_phase("generate_jobs"):
+        resources = {"jobs": g.generate_jobs(pipeline)}
+    with trace_phase("apply_overrides"):
+        return apply_overrides(resources, overrides, default_key, provenance)
+
+
+def _load_overrides(context: KedroContext) -> dict[str, dict[str, Any]]:
+    overrides = load_databricks_config(context.config_loader)
+    if "resources" not in overrides:
+        raise KeyError(
+            "'resources' key not found in the 'databricks' configuration "
+            f"for environment '{context.env}'."
+        )
+    return overrides["resources"]
+
+
+def _resolve_project_path(
+    project_path: str | Path | None,
+    session: KedroSession | None,
+    context: KedroContext | None,
+) -> Path:
+    if project_path is not None:
+        return Path(project_path)
+    if context is not None:
+        return Path(context.project_path)
+    if session is not None:
+        return Path(session._project_path)
+    raise ValueError(
+        "One of `project_path`, `metadata`, `session` or `context` is required."
+    )
@@ -0,0 +1,135 @@
+"""Thin client of the bundle server started with `kedro databricks serve`.
+
+The client only depends on the standard library, so it starts in a few tens of
+milliseconds instead of the seconds it takes to start Kedro:
+
+```bash
+python -m kedro_databricks.client bundle --env dev
+python -m kedro_databricks.client ping
+python -m kedro_databricks.client stop
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+from kedro_databricks.constants import SERVER_INFO_FILE, STATE_DIR
+
+DEFAULT_TIMEOUT = 600.0
+"""Default number of seconds to wait for a response of the server."""
+
+
+def find_server(start: Path | None = None) -> dict[str, Any]:
+    """Find the address of the bundle server of the project containing `start`.
+
+    Args:
+        start (Path | None): folder to start searching from, defaults to the
+            current working directory
+
+    Raises:
+        FileNotFoundError: if no running server is found
+
+    Returns:
+        dict[str, Any]: the server information written by the server
+    """
+    start = (start or Path.cwd()).resolve()
+    for folder in [start, *start.parents]:
+        info_path = folder / STATE_DIR / SERVER_INFO_FILE
+        if info_path.exists():
+            return json.loads(info_path.read_text())
+    raise FileNotFoundError(
+        "No bundle server found, start one with `kedro databricks serve`."
+    )
+
+
+def send(
+    request: dict[str, Any],
+    server: dict[str, Any] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> dict[str, Any]:
+    """Send a request to the bundle server and wait for the response.
+
+    Args:
+        request (dict[str, Any]): the request, with at least a `command`
+        server (dict[str, Any] | None): the server information, found with
+            `find_server` if not given
+        timeout (float): seconds to wait for the response
+
+    Returns:
+        dict[str, Any]: the response of the server
+    """
+    server = server or find_server()
+    if server["family"] == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address: Any = server["address"]
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = tuple(server["address"])
+    with sock:
+        sock.settimeout(timeout)
+        sock.connect(address)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            return json.loads(reader.readline())
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the client from the command line.
+
+    Args:
+        argv (list[str] | None): the command line arguments
+
+    Returns:
+        int: the exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m kedro_databricks.client")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    commands = parser.add_subparsers(dest="command", required=True)
+    bundle = commands.add_parser("bundle", help="Generate the bundle resources")
+    bundle.add_argument("-e", "--env", default=None)
+    bundle.add_argument("-g", "--resource-generator", dest="generator", default=None)
+    bundle.add_argument("-p", "--pipeline", default=None)
+    bundle.add_argument("-r", "--params", default=None)
+    bundle.add_argument("-c", "--conf-source", default=None)
+    bundle.add_argument("-d", "--default-key", default=None)
+    bundle.add_argument("--overwrite", action="store_true")
+    bundle.add_argument("--output-layout", default=None)
+    bundle.add_argument("--shards", type=int, default=None)
+    bundle.add_argument("--format", default=None)
+    bundle.add_argument("--yaml-anchors", action="store_true")
+    bundle.add_argument("--no-validate", dest="validate", action="store_false")
+    commands.add_parser("ping", help="Check that the server is running")
+    commands.add_parser("stop", help="Stop the server")
+    args = parser.parse_args(argv)
+
+    request = vars(args).copy()
+    timeout = request.pop("timeout")
+    if args.command == "stop":
+        request["command"] = "shutdown"
+    if args.command == "bundle":
+        request["include_resources"] = False
+    try:
+        response = send(request, timeout=timeout)
+    except (FileNotFoundError, OSError) as exc:
+        print(f"Error: {exc}", file=sys.stderr)  # noqa: T201
+        return 1
+    for issue in response.get("issues", []):
+        if not issue["error"]:
+            print(f"Warning: {issue['path']}: {issue['message']}", file=sys.stderr)  # noqa: T201
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}", file=sys.stderr)  # noqa: T201
+        return 1
+    for file in response.get("files", []):
+        print(f"Wrote {file}")  # noqa: T201
+    print(f"Done in {response['elapsed_ms']}ms")  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
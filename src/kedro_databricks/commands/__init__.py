@@ -0,0 +1,20 @@
+"""Commands of the `kedro databricks` command group."""
+
+from kedro_databricks.utilities.plugin import CommandSpec
+
+# fmt: off
+# BEGIN GENERATED REGISTRY - run `python scripts/generate_command_registry.py`
+COMMANDS = {
+    "bundle": CommandSpec("kedro_databricks.commands.bundle", "Databricks Asset Bundle commands"),
+    "deploy": CommandSpec("kedro_databricks.commands.deploy", "Deploy the Databricks Asset Bundle."),
+    "destroy": CommandSpec("kedro_databricks.commands.destroy", "Databricks Asset Bundle Destroy commands"),
+    "init": CommandSpec("kedro_databricks.commands.init", "Initialize a Kedro project for Databricks Asset Bundles."),
+    "package": CommandSpec("kedro_databricks.commands.package", "Build the project wheel, reusing a cached build when the sources are unchanged."),
+    "report": CommandSpec("kedro_databricks.commands.report", "Aggregate the runtime of every node recorded by `bundle --instrument`."),
+    "run": CommandSpec("kedro_databricks.commands.run", "Databricks Asset Bundle Run commands"),
+    "serve": CommandSpec("kedro_databricks.commands.serve", "Serve bundle requests from a warm Kedro session."),
+    "sync-catalog": CommandSpec("kedro_databricks.commands.sync_catalog", "Merge the changes of the base catalog into the target catalogs."),
+    "version": CommandSpec("kedro_databricks.commands.version", "Show the version of kedro-databricks."),
+}
+# END GENERATED REGISTRY
+# fmt: on
@@ -1,18 +1,16 @@
-import copy
-from typing import Any
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
 import click
-import yaml
-from kedro.config import MissingConfigException, OmegaConfigLoader
 from kedro.framework.cli.project import (
     CONF_SOURCE_HELP,
     PARAMS_ARG_HELP,
     PIPELINE_ARG_HELP,
 )
 from kedro.framework.cli.utils import ENV_HELP
-from kedro.framework.session import KedroSession
 from kedro.framework.startup import ProjectMetadata
 
+from kedro_databricks.api import generate_bundle, generate_bundles
 from kedro_databricks.constants import (
     DEFAULT_CONF_FOLDER,
     DEFAULT_CONFIG_GENERATOR,
@@ -21,11 +19,22 @@ from kedro_databricks.constants import (
     DEFAULT_CONFIG_KEY_HELP,
     DEFAULT_ENV,
 )
+from kedro_databricks.utilities.instrumentation import (
+    instrument_resources,
+    is_databricks_run_script_current,
+)
 from kedro_databricks.utilities.logger import get_logger
-from kedro_databricks.utilities.resource_generator import (
-    RESOURCE_GENERATOR_RESOLVER,
+from kedro_databricks.utilities.memory_tracer import MemoryTracer, trace_phase
+from kedro_databricks.utilities.provenance import Provenance, find_config_files
+from kedro_databricks.utilities.resource_validator import validate_resources
+from kedro_databricks.utilities.resource_writer import (
+    DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_OUTPUT_LAYOUT,
+    DEFAULT_SHARDS,
+    OUTPUT_FORMATS,
+    OUTPUT_LAYOUTS,
+    save_resources,
 )
-from kedro_databricks.utilities.resource_overrider import RESOURCE_OVERRIDER_RESOLVER
 
 log = get_logger("bundle")
 
@@ -47,7 +56,7 @@ log = get_logger("bundle")
     "-e",
     "--env",
     default=DEFAULT_ENV,
-    help=ENV_HELP,
+    help=ENV_HELP + " Use a comma-separated list to bundle several environments.",
 )
 @click.option(
     "-c",
@@ -74,6 +83,86 @@ log = get_logger("bundle")
     show_default=True,
     help="Overwrite the existing resources",
 )
+@click.option(
+    "--output-layout",
+    type=click.Choice(OUTPUT_LAYOUTS),
+    default=DEFAULT_OUTPUT_LAYOUT,
+    show_default=True,
+    help="Write one file per resource, a single file per environment, "
+    "or the resources spread over --shards files",
+)
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SHARDS,
+    show_default=True,
+    help="Number of files written with --output-layout sharded",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default=DEFAULT_OUTPUT_FORMAT,
+    show_default=True,
+    help="Format of the resource files. JSON is valid YAML, so the files keep "
+    "their .yml extension, but it is faster to write and to parse",
+)
+@click.option(
+    "--yaml-anchors",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="Write blocks repeated across tasks once, and refer to them with YAML "
+    "aliases. Cannot be combined with --format json",
+)
+@click.option(
+    "--watch",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="Keep running and regenerate the resources affected by every change "
+    "to the configuration or the pipelines. Implies --overwrite",
+)
+@click.option(
+    "--validate/--no-validate",
+    default=True,
+    show_default=True,
+    help="Check the generated jobs against the Jobs API schema before writing "
+    "them. Unknown fields are reported as warnings, invalid fields fail the command",
+)
+@click.option(
+    "--explain",
+    default=None,
+    metavar="JOB[.TASK]",
+    help="Show the override layer and configuration file that set every field "
+    "of a job or task, instead of writing the resources",
+)
+@click.option(
+    "--instrument",
+    "instrument_dir",
+    default=None,
+    metavar="DIR",
+    help="Run every task with a hook recording the load, compute and save time "
+    "and the bytes read and written of every node, written as JSON files to "
+    "DIR, e.g. a directory of a volume. Aggregate them with "
+    "`kedro databricks report`",
+)
+@click.option(
+    "--task-values",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="With --instrument, also set a summary of every task as its "
+    "`kedro_instrumentation` task value",
+)
+@click.option(
+    "--trace-memory",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="Report the peak memory and the top allocation sites of every phase. "
+    "Slows the command down considerably",
+)
 @click.pass_obj
 def command(
     metadata: ProjectMetadata,
@@ -84,153 +173,235 @@ def command(
     pipeline: str | None,
     params: str | None,
     overwrite: bool,
+    output_layout: str,
+    shards: int,
+    output_format: str,
+    yaml_anchors: bool,
+    watch: bool,
+    validate: bool,
+    explain: str | None,
+    instrument_dir: str | None,
+    task_values: bool,
+    trace_memory: bool,
 ):
-    """Databricks Asset Bundle commands"""
-    local_config_dir = metadata.project_path / conf_source / env
-
-    # If the configuration directory does not exist, Kedro will not load any configuration
-    if not local_config_dir.exists():
-        log.warning(f"Creating {local_config_dir.relative_to(metadata.project_path)}")
-        local_config_dir.mkdir(parents=True)
+    """Databricks Asset Bundle commands
 
-    if default_key.startswith("_"):  # pragma: no cover
-        raise ValueError(
-            "Default key cannot start with `_` as this is not recognized by OmegaConf."
+    Several environments can be bundled at once with `--env dev,staging,prod`.
+    The jobs are then generated once, and each environment's configuration is
+    applied to them.
+    """
+    if yaml_anchors and output_format != "yaml":
+        raise click.UsageError("--yaml-anchors cannot be combined with --format json.")
+    envs = [e.strip() for e in env.split(",") if e.strip()]
+    if watch and len(envs) > 1:
+        raise click.UsageError("--watch cannot be combined with multiple envs.")
+    if watch and trace_memory:
+        raise click.UsageError("--trace-memory cannot be combined with --watch.")
+    if explain and (watch or len(envs) > 1):
+        raise click.UsageError(
+            "--explain cannot be combined with --watch or multiple envs."
         )
+    instrumentation = _instrumentation(
+        metadata, instrument_dir, task_values, watch=watch, explain=explain
+    )
+    for _env in envs:
+        local_config_dir = metadata.project_path / conf_source / _env
 
-    if not (metadata.project_path / conf_source / env / "databricks.yml").exists():
-        raise FileNotFoundError(
-            f"Databricks configuration for environment '{env}' not found "
-            f"in '{conf_source}/{env}/databricks.yml'."
-        )
+        # If the configuration directory does not exist, Kedro will not load any configuration
+        if not local_config_dir.exists():
+            log.warning(
+                f"Creating {local_config_dir.relative_to(metadata.project_path)}"
+            )
+            local_config_dir.mkdir(parents=True)
 
-    with KedroSession.create(project_path=metadata.project_path, env=env) as session:
-        overrides = _load_kedro_env_config(session=session)
-        if "resources" not in overrides:
-            raise KeyError(
-                f"'resources' key not found in the 'databricks' configuration for environment '{env}'."
+        if not (local_config_dir / "databricks.yml").exists():
+            raise FileNotFoundError(
+                f"Databricks configuration for environment '{_env}' not found "
+                f"in '{conf_source}/{_env}/databricks.yml'."
             )
 
-        ResourceGenerator = RESOURCE_GENERATOR_RESOLVER.resolve(resource_generator)
+    if explain:
+        provenance: dict[str, dict[str, Provenance]] = {}
+        generate_bundle(
+            env=envs[0],
+            generator=resource_generator,
+            pipeline=pipeline,
+            params=params,
+            conf_source=conf_source,
+            default_key=default_key,
+            metadata=metadata,
+            provenance=provenance,
+        )
+        _explain(metadata, envs[0], conf_source, explain, provenance)
+        return
+
+    write_options = {
+        "overwrite": overwrite,
+        "layout": output_layout,
+        "shards": shards,
+        "output_format": output_format,
+        "yaml_anchors": yaml_anchors,
+    }
+    if watch:
+        # Imported here to keep the import of this command cheap.
+        from kedro_databricks.utilities.bundle_watcher import (  # noqa: PLC0415
+            watch_bundle,
+        )
 
-        g = ResourceGenerator(
-            session=session,
+        write_options.pop("overwrite")
+        watch_bundle(
             metadata=metadata,
+            env=envs[0],
+            generator=resource_generator,
+            pipeline=pipeline,
+            params=params,
             conf_source=conf_source,
+            default_key=default_key,
+            validate=validate,
+            **write_options,
+        )
+        return
+
+    tracer = MemoryTracer() if trace_memory else contextlib.nullcontext()
+    with tracer:
+        _bundle(
+            metadata,
+            envs,
+            generator=resource_generator,
+            pipeline=pipeline,
             params=params,
+            conf_source=conf_source,
+            default_key=default_key,
+            validate=validate,
+            write_options=write_options,
+            instrumentation=instrumentation,
         )
+    if isinstance(tracer, MemoryTracer):
+        log.info(tracer.report())
 
-        all_resources = {"jobs": g.generate_jobs(pipeline)}
-        overridden_resources = {}
-        for resource_type, resource_override_items in overrides["resources"].items():
-            overridden_resources[resource_type] = {}
-            resource_items = all_resources.get(resource_type, {})
-            overrider = RESOURCE_OVERRIDER_RESOLVER.resolve(resource_type)()
-            all_keys = set(resource_items.keys()).union(
-                set(resource_override_items.keys())
-            )
-            for key in all_keys:
-                if key == default_key or key.startswith("re:"):
-                    continue
-                resource = resource_items.get(key, {})
-                overridden_resources[resource_type][key] = overrider.override(
-                    resource_key=key,
-                    resource=resource,
-                    overrides=copy.deepcopy(resource_override_items),
-                    default_key=default_key,
-                )
-
-        save_resources(
+
+def _bundle(  # noqa: PLR0913
+    metadata: ProjectMetadata,
+    envs: list[str],
+    generator: str,
+    pipeline: str | None,
+    params: str | None,
+    conf_source: str,
+    default_key: str,
+    validate: bool,
+    write_options: dict,
+    instrumentation: dict | None = None,
+):
+    if len(envs) == 1:
+        resources = generate_bundle(
+            env=envs[0],
+            generator=generator,
+            pipeline=pipeline,
+            params=params,
+            conf_source=conf_source,
+            default_key=default_key,
             metadata=metadata,
-            env=env,
-            resources=overridden_resources,
-            overwrite=overwrite,
         )
+        if instrumentation:
+            resources = instrument_resources(
+                resources, metadata.package_name, **instrumentation
+            )
+        if validate:
+            _validate(envs[0], resources)
+        with trace_phase("save_resources"):
+            save_resources(metadata, envs[0], resources, **write_options)
+        return
 
+    bundles = generate_bundles(
+        envs,
+        generator=generator,
+        pipeline=pipeline,
+        params=params,
+        conf_source=conf_source,
+        default_key=default_key,
+        metadata=metadata,
+    )
+    if instrumentation:
+        bundles = {
+            _env: instrument_resources(
+                resources, metadata.package_name, **instrumentation
+            )
+            for _env, resources in bundles.items()
+        }
+    if validate:
+        for _env, resources in bundles.items():
+            _validate(_env, resources)
+    with (
+        trace_phase("save_resources"),
+        ThreadPoolExecutor(max_workers=len(bundles)) as executor,
+    ):
+        futures = [
+            executor.submit(save_resources, metadata, _env, resources, **write_options)
+            for _env, resources in bundles.items()
+        ]
+        for future in futures:
+            future.result()
 
-def save_resources(
-    metadata: ProjectMetadata,
-    env: str,
-    resources: dict[str, dict[str, Any]],
-    overwrite: bool,
-) -> None:
-    """Save the given resources to the project directory.
 
-    Args:
-        metadata (ProjectMetadata): The metadata of the project
-        env (str): The kedro environment
-        resources (dict[str, dict[str, Any]]): The resources to save
-        overwrite (bool): Whether to overwrite existing resources
-    """
-    resources_dir = metadata.project_path / "resources"
-    resources_dir.mkdir(exist_ok=True, parents=True)
-    for resource_type, items in resources.items():
-        for resource_name, resource in items.items():
-            file_name = f"target.{env}.{resource_type}.{resource_name}"
-            file_path = resources_dir / f"{file_name}.yml"
-            relative_path = file_path.relative_to(metadata.project_path)
-
-            if file_path.exists() and not overwrite:  # pragma: no cover
-                log.warning(
-                    f"{relative_path} already exists. Use --overwrite to replace."
-                )
-                continue
-
-            with open(file_path, "w") as f:
-                yaml.dump(
-                    {
-                        "targets": {
-                            env: {
-                                "resources": {resource_type: {resource_name: resource}}
-                            }
-                        }
-                    },
-                    f,
-                    default_flow_style=False,
-                    indent=4,
-                    sort_keys=False,
-                )
-                if file_path.exists() and overwrite:
-                    log.info(f"Overwrote {relative_path}")
-                else:
-                    log.info(f"Wrote {relative_path}")
-
-
-def _load_kedro_env_config(session: KedroSession) -> dict[str, Any]:
-    """Load the Databricks configuration for the given environment.
-
-    Args:
-        metadata (ProjectMetadata): The metadata of the project
-        config_dir (str): The name of the configuration directory
-        env (str): The name of the kedro environment
-
-    Returns:
-        dict[str, Any]: The Databricks configuration for the given environment
-    """
-    config_loader = session._get_config_loader()
-    # Backwards compatibility for ConfigLoader that does not support `config_patterns`
-    if not hasattr(config_loader, "config_patterns"):
-        return config_loader.get("databricks*", "databricks/**")
-
-    if not isinstance(config_loader, OmegaConfigLoader):
-        raise TypeError(
-            "Only OmegaConfigLoader is supported to load Databricks configuration."
+def _instrumentation(
+    metadata: ProjectMetadata,
+    instrument_dir: str | None,
+    task_values: bool,
+    watch: bool,
+    explain: str | None,
+) -> dict | None:
+    if task_values and not instrument_dir:
+        raise click.UsageError("--task-values requires --instrument.")
+    if not instrument_dir:
+        return None
+    if watch or explain:
+        raise click.UsageError(
+            "--instrument cannot be combined with --watch or --explain."
         )
-
-    # Set the default pattern for `databricks` if not provided in `settings.py`
-    if "databricks" not in config_loader.config_patterns.keys():
-        config_loader.config_patterns.update(
-            {"databricks": ["databricks*", "databricks/**"]}
+    if not is_databricks_run_script_current(metadata):
+        raise click.ClickException(
+            "The databricks_run script of the project is missing or out of date. "
+            "Run `kedro databricks init --instrument` to update it, then build "
+            "the project again."
         )
+    return {"instrument_dir": instrument_dir, "task_values": task_values}
 
-    if "databricks" not in config_loader.config_patterns.keys():
-        log.warning(
-            "No Databricks configuration found. "
-            "Please ensure that `databricks` is included in your config patterns."
+
+def _validate(env: str, resources: dict) -> None:
+    with trace_phase("validate"):
+        issues = validate_resources(resources)
+    for issue in issues:
+        if not issue.error:
+            log.warning(f"{issue} (environment '{env}')")
+    errors = [str(issue) for issue in issues if issue.error]
+    if errors:
+        raise click.ClickException(
+            f"The jobs of environment '{env}' do not match the Jobs API schema:\n  "
+            + "\n  ".join(errors)
+            + "\nFix the Databricks configuration, or skip this check with "
+            "--no-validate."
         )
 
-    try:
-        return config_loader["databricks"]
-    except MissingConfigException:
-        log.warning("No Databricks configuration found.")
-        return {}
+
+def _explain(
+    metadata: ProjectMetadata,
+    env: str,
+    conf_source: str,
+    target: str,
+    provenance: dict[str, dict[str, Provenance]],
+) -> None:
+    job, _, task = target.partition(".")
+    job_provenance = provenance.get("jobs", {}).get(job)
+    if job_provenance is None:
+        raise click.ClickException(f"Job '{job}' not found in environment '{env}'.")
+    sources = job_provenance.select(f"tasks[{task}]" if task else "")
+    if not sources:
+        raise click.ClickException(f"Task '{task}' not found in job '{job}'.")
+    conf_path = metadata.project_path / conf_source
+    files = find_config_files([conf_path / env, conf_path / "base"], sources.values())
+    width = max(len(path) for path in sources)
+    click.echo(f"Provenance of jobs.{target} in environment '{env}':")
+    for path, source in sources.items():
+        file = files.get(source)
+        location = f" ({file.relative_to(metadata.project_path)})" if file else ""
+        click.echo(f"  {path:<{width}}  {source}{location}")
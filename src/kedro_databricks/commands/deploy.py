@@ -1,6 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import fnmatch
+import hashlib
+import os
+import shutil
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import click
+import yaml
 from kedro.framework.cli.project import (
     CONF_SOURCE_HELP,
     PARAMS_ARG_HELP,
@@ -9,7 +20,6 @@ from kedro.framework.cli.project import (
 from kedro.framework.cli.utils import ENV_HELP
 from kedro.framework.startup import ProjectMetadata
 
-from kedro_databricks.commands.bundle import command as bundle_command
 from kedro_databricks.constants import (
     DEFAULT_CONF_FOLDER,
     DEFAULT_CONFIG_GENERATOR,
@@ -17,19 +27,42 @@ from kedro_databricks.constants import (
     DEFAULT_CONFIG_KEY,
     DEFAULT_CONFIG_KEY_HELP,
     DEFAULT_ENV,
+    STATE_DIR,
 )
+from kedro_databricks.utilities.common import get_arg_value
 from kedro_databricks.utilities.databricks_cli import DatabricksCli
+from kedro_databricks.utilities.fingerprint import (
+    collect_files,
+    hash_file_stats,
+    hash_files,
+    read_state,
+    write_state,
+)
 from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.wheel_cache import build_wheel
 
 log = get_logger("deploy")
 
+CACHED_BUILD_COMMAND = "kedro databricks package"
+"""Artifact build command whose wheel is built once before concurrent deployments."""
+
+WORKSPACE_ENV_VARS = [
+    "DATABRICKS_HOST",
+    "DATABRICKS_CONFIG_PROFILE",
+    "DATABRICKS_CONFIG_FILE",
+]
+"""Environment variables that select the workspace the Databricks CLI deploys to."""
+
+PREBUILT_PREFIX = "kedro-databricks.prebuilt."
+"""Prefix of the target overrides in `resources/` written for concurrent deploys."""
+
 
 @click.command()
 @click.option(
     "-e",
     "--env",
     default=DEFAULT_ENV,
-    help=ENV_HELP,
+    help=ENV_HELP + " Use a comma-separated list to deploy several targets.",
 )
 @click.option(
     "-b",
@@ -67,6 +100,27 @@ log = get_logger("deploy")
     default=DEFAULT_CONFIG_KEY,
     help=DEFAULT_CONFIG_KEY_HELP + " (forwarded to the bundle command).",
 )
+@click.option(
+    "--force",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="Deploy even if nothing changed since the last deployment of the target.",
+)
+@click.option(
+    "--max-parallel",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of `databricks bundle deploy` run concurrently when "
+    "deploying several targets.",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Seconds after which a Databricks CLI command is stopped.",
+)
 @click.argument(
     "databricks_args",
     nargs=-1,
@@ -82,6 +136,9 @@ def command(
     resource_generator: str,
     pipeline: str | None,
     runtime_params: str | None,
+    force: bool,
+    max_parallel: int,
+    timeout: float | None,
     databricks_args: tuple[str, ...],
 ):
     """Deploy the Databricks Asset Bundle.
@@ -89,14 +146,31 @@ def command(
     This function deploys the Databricks Asset Bundle in the current project
     directory. It also creates a Databricks configuration file and a
     Databricks target configuration file.
+
+    The deployment is skipped when the project files that make up the bundle are
+    unchanged since the last successful deployment of the target, unless
+    `--force` is given.
+
+    Several targets can be deployed at once with `--env dev,staging,prod`, with
+    their output written to `.databricks/kedro-databricks/logs/deploy.<target>.log`.
+    When the artifact is built with `kedro databricks package`, the project
+    wheel is built once up front and the targets are deployed concurrently.
+    Otherwise they are deployed one at a time.
     """
     metadata = ctx.obj
     if not isinstance(metadata, ProjectMetadata):
         raise TypeError("Project metadata is not available in the context.")
+    envs = [e.strip() for e in env.split(",") if e.strip()]
+    args = list(databricks_args)
+    if len(envs) > 1 and get_arg_value(args, "--target") is not None:
+        raise click.UsageError("`--target` cannot be combined with multiple envs.")
     if bundle:
+        # Imported here as the bundle command loads the Kedro session machinery.
+        from kedro_databricks.commands.bundle import command as bundle_command  # noqa: PLC0415
+
         ctx.invoke(
             bundle_command,
-            env=env,
+            env=",".join(envs),
             default_key=default_key,
             conf_source=conf_source,
             resource_generator=resource_generator,
@@ -104,9 +178,278 @@ def command(
             params=runtime_params,
             overwrite=True,
         )
-    dbcli = DatabricksCli(metadata, env=env, additional_args=list(databricks_args))
+    if len(envs) == 1:
+        _deploy_target(metadata, envs[0], args, force=force, timeout=timeout)
+        return
+    _deploy_targets(
+        metadata, envs, args, force=force, max_parallel=max_parallel, timeout=timeout
+    )
+
+
+def _deploy_target(
+    metadata: ProjectMetadata,
+    env: str,
+    databricks_args: list[str],
+    force: bool,
+    stream=None,
+    timeout: float | None = None,
+    cancel_event: threading.Event | None = None,
+) -> bool:
+    """Deploy a single target unless it is unchanged since its last deployment.
+
+    Args:
+        metadata (ProjectMetadata): The metadata of the project
+        env (str): The kedro environment to deploy
+        databricks_args (list[str]): Arguments forwarded to the Databricks CLI
+        force (bool): Whether to deploy even if nothing changed
+        stream (TextIO | None): Where to write the output of the Databricks CLI
+        timeout (float | None): Seconds after which a Databricks CLI command is stopped
+        cancel_event (threading.Event | None): Event that stops the deployment when set
+
+    Returns:
+        bool: whether the target was deployed
+    """
+    target = get_arg_value(databricks_args, "--target") or env
+    state_name = f"deploy.{target}"
+    fingerprint = _compute_deploy_fingerprint(metadata, env, databricks_args)
+    previous = read_state(metadata.project_path, state_name).get("fingerprint")
+    if not force and previous == fingerprint:
+        log.info(
+            f"Nothing changed since the last deployment of target '{target}'. "
+            "Skipping deploy, use --force to deploy anyway."
+        )
+        return False
+    dbcli = DatabricksCli(
+        metadata,
+        env=env,
+        additional_args=databricks_args,
+        stream=stream,
+        timeout=timeout,
+        cancel_event=cancel_event,
+    )
     dbcli.deploy()
-    log.info(f"Deployed Databricks Asset Bundle in {metadata.project_path}")
+    log.info(f"Deployed Databricks Asset Bundle for target '{target}'")
     dbcli.upload()
-    log.info(f"Uploaded project data to Databricks from {metadata.project_path}")
+    log.info(f"Uploaded project data to Databricks for target '{target}'")
+    write_state(metadata.project_path, state_name, {"fingerprint": fingerprint})
     dbcli.summary()
+    return True
+
+
+def _deploy_targets(
+    metadata: ProjectMetadata,
+    envs: list[str],
+    databricks_args: list[str],
+    force: bool,
+    max_parallel: int,
+    timeout: float | None = None,
+) -> None:
+    """Deploy several targets concurrently.
+
+    Each target writes the output of the Databricks CLI to its own log file.
+    `databricks bundle deploy` builds the artifacts into the shared `dist/`
+    folder, which it may clean first, so the targets must not build them
+    concurrently. When the artifacts use the cached build, the wheel is built
+    once before the deployments start, and every target deploys its own copy
+    of it without a build step, see `_prebuilt_artifacts`. Other build commands
+    are run once per target, so the targets are deployed one at a time in that
+    case.
+
+    Args:
+        metadata (ProjectMetadata): The metadata of the project
+        envs (list[str]): The kedro environments to deploy
+        databricks_args (list[str]): Arguments forwarded to the Databricks CLI
+        force (bool): Whether to deploy even if nothing changed
+        max_parallel (int): Maximum number of concurrent deployments
+        timeout (float | None): Seconds after which a Databricks CLI command is stopped
+
+    Raises:
+        click.ClickException: if any of the targets failed to deploy
+    """
+    config = _read_bundle_config(metadata.project_path)
+    builds = _get_artifact_builds(config)
+    prebuilt: contextlib.AbstractContextManager = contextlib.nullcontext()
+    if any(build != CACHED_BUILD_COMMAND for build in builds.values()):
+        log.warning(
+            f"The bundle artifacts are not built with `{CACHED_BUILD_COMMAND}`. "
+            "Deploying targets one at a time."
+        )
+        max_parallel = 1
+    elif builds and not _includes_overrides(config):
+        log.warning(
+            "`databricks.yml` does not include `resources/*.yml`, so the "
+            "artifacts cannot be prebuilt. Deploying targets one at a time."
+        )
+        max_parallel = 1
+    elif builds:
+        wheels = build_wheel(metadata.project_path)
+        prebuilt = _prebuilt_artifacts(metadata.project_path, envs, builds, wheels)
+
+    log_dir = metadata.project_path / STATE_DIR / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    cancel_event = threading.Event()
+
+    def _run(env: str) -> bool:
+        with open(log_dir / f"deploy.{env}.log", "w") as stream:
+            return _deploy_target(
+                metadata,
+                env,
+                databricks_args,
+                force,
+                stream,
+                timeout,
+                cancel_event,
+            )
+
+    failures = {}
+    executor = ThreadPoolExecutor(max_workers=min(max_parallel, len(envs)))
+    try:
+        with prebuilt:
+            futures = {env: executor.submit(_run, env) for env in envs}
+            for env, future in futures.items():
+                log_file = (log_dir / f"deploy.{env}.log").relative_to(
+                    metadata.project_path
+                )
+                try:
+                    deployed = future.result()
+                except Exception as exc:
+                    failures[env] = exc
+                    log.error(f"Failed to deploy target '{env}', see {log_file}")
+                    continue
+                status = "Deployed" if deployed else "Skipped"
+                log.info(f"{status} target '{env}', see {log_file}")
+    except KeyboardInterrupt:
+        # Stop the running Databricks CLI commands instead of waiting for them.
+        cancel_event.set()
+        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    if failures:
+        details = "\n".join(f"  - {env}: {exc}" for env, exc in failures.items())
+        raise click.ClickException(f"Failed to deploy targets:\n{details}")
+
+
+def _read_bundle_config(project_path: Path) -> dict:
+    """Read `databricks.yml`, or an empty configuration if there is none."""
+    config_path = project_path / "databricks.yml"
+    if not config_path.exists():
+        return {}
+    with open(config_path) as f:
+        return yaml.safe_load(f) or {}
+
+
+def _get_artifact_builds(config: dict) -> dict[str, str]:
+    """Get the build commands of the artifacts of the bundle configuration.
+
+    Args:
+        config (dict): the content of `databricks.yml`
+
+    Returns:
+        dict[str, str]: the build command of each artifact that has one, by name
+    """
+    return {
+        name: artifact["build"].strip()
+        for name, artifact in (config.get("artifacts") or {}).items()
+        if isinstance(artifact, dict) and artifact.get("build")
+    }
+
+
+def _includes_overrides(config: dict) -> bool:
+    """Check that the bundle configuration includes the prebuilt overrides."""
+    path = f"resources/{PREBUILT_PREFIX}target.yml"
+    return any(
+        fnmatch.fnmatch(path, pattern) for pattern in config.get("include") or []
+    )
+
+
+@contextlib.contextmanager
+def _prebuilt_artifacts(
+    project_path: Path, targets: list[str], builds: dict[str, str], wheels: list[Path]
+) -> Iterator[None]:
+    """Deploy every target from its own copy of the prebuilt wheels.
+
+    The wheels are copied to `.databricks/kedro-databricks/prebuilt/<target>/`,
+    and `resources/kedro-databricks.prebuilt.<target>.yml` overrides the
+    artifacts of the target to upload that copy without a build step. The
+    `databricks bundle deploy` of the targets thereby neither build into nor
+    clean the shared `dist/` folder, and can run concurrently. The overrides and
+    copies are removed when the deployments are done.
+
+    Args:
+        project_path (Path): root of the Kedro project
+        targets (list[str]): the targets that are deployed
+        builds (dict[str, str]): the build command of each artifact, by name
+        wheels (list[Path]): the wheels built by `build_wheel`
+
+    Yields:
+        None: while the targets are deployed
+    """
+    resources_dir = project_path / "resources"
+    resources_dir.mkdir(exist_ok=True)
+    written = []
+    try:
+        for target in targets:
+            wheel_dir = project_path / STATE_DIR / "prebuilt" / target
+            shutil.rmtree(wheel_dir, ignore_errors=True)
+            wheel_dir.mkdir(parents=True)
+            files = []
+            for wheel in wheels:
+                shutil.copy2(wheel, wheel_dir / wheel.name)
+                files.append({"source": (wheel_dir / wheel.name).as_posix()})
+            override_path = resources_dir / f"{PREBUILT_PREFIX}{target}.yml"
+            artifacts = {name: {"build": "", "files": files} for name in builds}
+            with open(override_path, "w") as f:
+                yaml.dump({"targets": {target: {"artifacts": artifacts}}}, f)
+            written.append(override_path)
+        yield
+    finally:
+        for path in written:
+            path.unlink(missing_ok=True)
+        shutil.rmtree(project_path / STATE_DIR / "prebuilt", ignore_errors=True)
+
+
+def _compute_deploy_fingerprint(
+    metadata: ProjectMetadata, env: str, databricks_args: list[str]
+) -> str:
+    """Fingerprint everything that `databricks bundle deploy` and the upload use.
+
+    This covers the workspace selected by the CLI arguments and the
+    `WORKSPACE_ENV_VARS`, the bundle configuration, the generated resources,
+    the synced configuration and the inputs of the wheel built by the bundle
+    artifact. The `data` folder is only fingerprinted by file size and
+    modification time, as it can be arbitrarily large.
+
+    Args:
+        metadata (ProjectMetadata): The metadata of the project
+        env (str): The kedro environment that is deployed
+        databricks_args (list[str]): Arguments forwarded to the Databricks CLI
+
+    Returns:
+        str: hex digest of the deployment inputs
+    """
+    project_path = metadata.project_path
+    hasher = hashlib.sha256()
+    hasher.update("\0".join([env, *databricks_args]).encode())
+    for name in WORKSPACE_ENV_VARS:
+        hasher.update(f"\0{name}={os.environ.get(name, '')}".encode())
+    files = collect_files(
+        project_path,
+        [
+            "databricks.yml",
+            "pyproject.toml",
+            "resources/**/*.yml",
+            "resources/**/*.yaml",
+            "conf/logging.yml",
+            "conf/base/**/*",
+            f"conf/{env}/**/*",
+            "src/**/*",
+        ],
+    )
+    # The prebuilt overrides only exist while several targets are deployed.
+    files = [file for file in files if not file.name.startswith(PREBUILT_PREFIX)]
+    hash_files(project_path, files, hasher=hasher)
+    return hash_file_stats(
+        project_path, collect_files(project_path, ["data/**/*"]), hasher=hasher
+    )
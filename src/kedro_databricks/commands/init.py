@@ -1,14 +1,11 @@
 import ast
 import json
-import re
 import shutil
 import tempfile
-from functools import reduce
-from operator import add
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-import tomlkit
 import yaml
 from kedro.framework.startup import ProjectMetadata
 
@@ -22,12 +19,23 @@ from kedro_databricks.constants import (
     DEFAULT_SCHEMA_HELP,
     TEMPLATES,
 )
+from kedro_databricks.utilities.catalog_sync import (
+    find_catalog_files,
+    substitute_file_path,
+    write_snapshot,
+)
 from kedro_databricks.utilities.common import (
     get_value_from_dotpath,
     require_databricks_run_script,
 )
 from kedro_databricks.utilities.databricks_cli import DatabricksCli
+from kedro_databricks.utilities.instrumentation import write_databricks_run_script
 from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.template_renderer import (
+    is_service_principal,
+    render_template,
+    short_user_name,
+)
 
 log = get_logger("init")
 
@@ -51,6 +59,28 @@ log = get_logger("init")
     default=DEFAULT_SCHEMA,
     help=DEFAULT_SCHEMA_HELP,
 )
+@click.option(
+    "--host",
+    type=str,
+    default=None,
+    envvar="DATABRICKS_HOST",
+    help="Databricks workspace URL. Defaults to the DATABRICKS_HOST environment variable",
+)
+@click.option(
+    "--user",
+    type=str,
+    default=None,
+    envvar="DATABRICKS_USER",
+    help="Databricks user name, or application id of a service principal. "
+    "Defaults to the DATABRICKS_USER environment variable",
+)
+@click.option(
+    "--validate/--no-validate",
+    default=False,
+    show_default=True,
+    help="Validate the rendered bundle with the Databricks CLI, which requires "
+    "authentication. Always done when --host or --user is missing",
+)
 @click.option(
     "--overwrite",
     default=False,
@@ -58,6 +88,14 @@ log = get_logger("init")
     show_default=True,
     help="Overwrite existing initialization",
 )
+@click.option(
+    "--instrument",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="Add the databricks_run script that `bundle --instrument` runs the "
+    "tasks with to the project",
+)
 @click.argument(
     "databricks_args",
     nargs=-1,
@@ -69,19 +107,60 @@ def command(
     default_key: str,
     catalog: str,
     schema: str,
+    host: str | None,
+    user: str | None,
+    validate: bool,
     overwrite: bool,
+    instrument: bool,
     databricks_args: tuple[str, ...],
 ):
-    """Initialize a Kedro project for Databricks Asset Bundles."""
-    log.info("Initializing Databricks Asset Bundle...")
-    dbcli = DatabricksCli(metadata, additional_args=list(databricks_args))
-    assets_dir, template_params = _prepare_template(metadata)
+    """Initialize a Kedro project for Databricks Asset Bundles.
+
+    With a workspace host and user, `databricks.yml` is rendered locally and no
+    Databricks CLI command is run unless `--validate` is given, or the user is
+    a service principal, whose short name only the workspace knows. Otherwise the
+    template is rendered and validated with `databricks bundle init`. With
+    `--instrument`, the `databricks_run` script is added to the project, even
+    if it is already initialized.
+    """
     config_path = metadata.project_path / "databricks.yml"
+    if config_path.exists() and not overwrite and instrument:
+        # Adding the script does not need the bundle to be initialized again.
+        _write_databricks_run_script(metadata)
+        return
+    log.info("Initializing Databricks Asset Bundle...")
     if config_path.exists() and not overwrite:
         raise FileExistsError(f"`databricks.yml` already exist at {config_path}")
     elif config_path.exists() and overwrite:
         config_path.unlink(missing_ok=True)
-    validated_conf = dbcli.init(assets_dir, template_params)
+    select = ["workspace.current_user"]
+    if host and user:
+        _render_template(metadata, host, user)
+        if not validate and is_service_principal(user):
+            # Databricks derives the short name of a service principal from its
+            # display name, which only the workspace knows.
+            log.info(
+                "The user is a service principal, reading its short name with "
+                "`databricks bundle validate`"
+            )
+            validate = True
+        if validate:
+            dbcli = DatabricksCli(metadata, additional_args=list(databricks_args))
+            validated_conf = dbcli.validate(select=select)
+        else:
+            validated_conf = {
+                "workspace": {
+                    "current_user": {
+                        "userName": user,
+                        "short_name": short_user_name(user),
+                    }
+                }
+            }
+    else:
+        log.info("No workspace host or user given, using `databricks bundle init`")
+        dbcli = DatabricksCli(metadata, additional_args=list(databricks_args))
+        assets_dir, template_params = _prepare_template(metadata)
+        validated_conf = dbcli.init(assets_dir, template_params, select=select)
     log.info(f"Initialized Databricks Asset Bundle in {metadata.project_path}")
     _create_target_configs(
         metadata,
@@ -99,6 +178,8 @@ def command(
             "Kedro version less than 0.19.8 requires a script to run tasks on Databricks. "
         )
         _write_databricks_run_script(metadata)
+    elif instrument:
+        _write_databricks_run_script(metadata)
     log.info(
         f"Successfully initialized Databricks Asset Bundle in {metadata.project_path}"
     )
@@ -126,6 +207,23 @@ def _prepare_template(metadata: ProjectMetadata):
     return assets_dir, params_file
 
 
+def _render_template(metadata: ProjectMetadata, host: str, user: str):
+    template = (TEMPLATES / "databricks.yml.tmpl").read_text()
+    content = render_template(
+        template,
+        {
+            "project_name": metadata.package_name,
+            "project_slug": metadata.package_name,
+            "workspace_host": host,
+            "user_name": user,
+            "is_service_principal": is_service_principal(user),
+        },
+    )
+    config_path = metadata.project_path / "databricks.yml"
+    config_path.write_text(content.rstrip() + "\n")
+    log.info(f"Wrote {config_path.relative_to(metadata.project_path)}")
+
+
 def _update_gitignore(metadata: ProjectMetadata):
     gitignore_path = metadata.project_path / ".gitignore"
     if not gitignore_path.exists():
@@ -148,24 +246,7 @@ def _update_gitignore(metadata: ProjectMetadata):
 
 
 def _write_databricks_run_script(metadata: ProjectMetadata):
-    script_path = (
-        metadata.project_path / "src" / metadata.package_name / "databricks_run.py"
-    )
-    toml_path = metadata.project_path / "pyproject.toml"
-    shutil.copy(str(TEMPLATES / "databricks_run.py"), str(script_path))
-    log.info(f"Wrote {script_path.relative_to(metadata.project_path)}")
-
-    with open(toml_path) as f:
-        toml = tomlkit.load(f)
-
-    scripts = toml.get("project", {}).get("scripts", {})
-    if "databricks_run" not in scripts:
-        scripts["databricks_run"] = f"{metadata.package_name}.databricks_run:main"
-        toml["project"]["scripts"] = scripts  # type: ignore
-
-    log.info(f"Added script to {toml_path.relative_to(metadata.project_path)}")
-    with open(toml_path, "w") as f:
-        tomlkit.dump(toml, f)
+    write_databricks_run_script(metadata)
 
 
 def _create_target_configs(
@@ -179,7 +260,9 @@ def _create_target_configs(
     databricks_config = _read_databricks_config(metadata.project_path)
     bundle_name = _get_bundle_name(databricks_config)
     targets = _get_targets(databricks_config)
-    for target_name in targets.keys():
+    catalog_files = find_catalog_files(conf_dir / "base")
+
+    def _create(target_name: str):
         target_conf_dir = conf_dir / target_name
         target_conf_dir.mkdir(exist_ok=True)
         _save_gitkeep_file(target_conf_dir)
@@ -195,9 +278,13 @@ def _create_target_configs(
             volume_name=_create_volume_name(target_name, bundle_name, validated_conf),
             target_name=target_name if target_name != DEFAULT_ENV else bundle_name,
         )
-        _save_target_catalog(conf_dir, target_conf_dir, target_file_path)
+        _save_target_catalog(conf_dir, target_conf_dir, target_file_path, catalog_files)
         log.info(f"Created target config for {target_name} at {target_conf_dir}")
 
+    # The targets write to separate folders, so they can be created in parallel.
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_create, targets.keys()))
+
 
 ENV_CHECK = ast.If(
     test=ast.Compare(
@@ -349,30 +436,35 @@ def _make_target_file_path(
     return f"/Volumes/{catalog_name}/{schema_name}/{volume_name}/{target_name}"
 
 
-def _substitute_file_path(string: str) -> str:
-    """Substitute the file path in the catalog"""
-    lines = string.splitlines(keepends=True)
-    new_lines = []
-    for line in lines:
-        new_lines.append(
-            re.sub(
-                r"(.*:)\s*(?!https?://)(?:/[^/\s]+)*/?(data(?:/[^/\s]+)+).*",
-                r"\g<1> ${_file_path}/\g<2>",
-                line,
-            )
-        )
-    sub = reduce(add, new_lines)
-    return sub
-
-
 def _save_target_catalog(
-    conf_dir: Path, target_conf_dir: Path, target_file_path: str
-):  # pragma: no cover
-    with open(f"{conf_dir}/base/catalog.yml") as f:
-        cat = f.read()
-    target_catalog = _substitute_file_path(cat)
-    with open(target_conf_dir / "catalog.yml", "w") as f:
-        f.write("_file_path: " + target_file_path + "\n" + target_catalog)
+    conf_dir: Path,
+    target_conf_dir: Path,
+    target_file_path: str,
+    catalog_files: list[Path] | None = None,
+):
+    """Write the catalog files of the target with the file paths substituted.
+
+    Each file of the base catalog is streamed to the same relative path in the
+    target folder, line by line, so large catalogs are never held in memory.
+    The `_file_path` variable is defined at the top of the target `catalog.yml`.
+    The base catalog is stored as the snapshot `sync-catalog` merges from.
+    """
+    base_conf_dir = conf_dir / "base"
+    if catalog_files is None:
+        catalog_files = find_catalog_files(base_conf_dir)
+    header = f"_file_path: {target_file_path}\n"
+    main_catalog = base_conf_dir / "catalog.yml"
+    if main_catalog not in catalog_files:
+        (target_conf_dir / "catalog.yml").write_text(header)
+    for source in catalog_files:
+        target = target_conf_dir / source.relative_to(base_conf_dir)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(source) as src, open(target, "w") as dst:
+            if source == main_catalog:
+                dst.write(header)
+            for line in src:
+                dst.write(substitute_file_path(line))
+    write_snapshot(base_conf_dir, target_conf_dir, catalog_files)
 
 
 def _save_target_config(target_config: dict, target_conf_dir: Path):  # pragma: no cover
@@ -0,0 +1,26 @@
+import click
+from kedro.framework.startup import ProjectMetadata
+
+from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.wheel_cache import build_wheel
+
+log = get_logger("package")
+
+
+@click.command()
+@click.option(
+    "--force",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="Rebuild the wheel even if a cached build matches the sources",
+)
+@click.pass_obj
+def command(metadata: ProjectMetadata, force: bool):
+    """Build the project wheel, reusing a cached build when the sources are unchanged.
+
+    This is the build command of the `default` artifact in `databricks.yml`.
+    """
+    wheels = build_wheel(metadata.project_path, force=force)
+    for wheel in wheels:
+        log.info(f"Wheel available at {wheel.relative_to(metadata.project_path)}")
@@ -0,0 +1,71 @@
+import json
+
+import click
+from kedro.framework.startup import ProjectMetadata
+
+from kedro_databricks.utilities.instrumentation import (
+    SORT_KEYS,
+    format_report,
+    load_reports,
+    sort_summaries,
+    summarize_reports,
+)
+from kedro_databricks.utilities.logger import get_logger
+
+log = get_logger("report")
+
+
+@click.command()
+@click.argument(
+    "paths",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True),
+)
+@click.option(
+    "--run-id",
+    default=None,
+    help="Only aggregate the instrumentation files of this job run",
+)
+@click.option(
+    "--sort",
+    type=click.Choice(SORT_KEYS),
+    default="total",
+    show_default=True,
+    help="Column to sort the nodes by, the largest first",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    show_default=True,
+    help="Print a table, or the aggregated nodes as JSON",
+)
+@click.pass_obj
+def command(
+    metadata: ProjectMetadata,
+    paths: tuple[str, ...],
+    run_id: str | None,
+    sort: str,
+    output_format: str,
+):
+    """Aggregate the runtime of every node recorded by `bundle --instrument`.
+
+    PATHS are instrumentation files, or directories searched for them, e.g. a
+    copy of the instrumentation directory made with `databricks fs cp -r`. The
+    mean load, compute and save times and sizes of every node are reported
+    over all the runs found.
+    """
+    reports = load_reports(paths, run_id=run_id)
+    if not reports:
+        raise click.ClickException(
+            "No instrumentation files found"
+            + (f" for run '{run_id}'." if run_id else ".")
+        )
+    summaries = sort_summaries(summarize_reports(reports), sort)
+    log.info(f"Aggregated {len(reports)} instrumentation file(s)")
+    if output_format == "json":
+        click.echo(json.dumps([summary.to_dict() for summary in summaries], indent=2))
+    else:
+        click.echo(format_report(summaries))
@@ -0,0 +1,41 @@
+import click
+from kedro.framework.startup import ProjectMetadata
+
+from kedro_databricks.utilities.bundle_server import serve
+from kedro_databricks.utilities.file_watcher import POLL_INTERVAL
+
+
+@click.command()
+@click.option(
+    "-e",
+    "--env",
+    "envs",
+    multiple=True,
+    help="Kedro environment to load before accepting requests. Can be repeated.",
+)
+@click.option(
+    "--port",
+    type=int,
+    default=None,
+    help="Listen on this localhost TCP port instead of a Unix socket",
+)
+@click.option(
+    "--interval",
+    type=float,
+    default=POLL_INTERVAL,
+    show_default=True,
+    help="Seconds between two checks for changed files in src/ and conf/",
+)
+@click.pass_obj
+def command(
+    metadata: ProjectMetadata,
+    envs: tuple[str, ...],
+    port: int | None,
+    interval: float,
+):
+    """Serve bundle requests from a warm Kedro session.
+
+    Requests are sent with `python -m kedro_databricks.client bundle`, which
+    skips the startup of Kedro and answers from the sessions cached by the server.
+    """
+    serve(metadata, envs=list(envs), port=port, interval=interval)
@@ -0,0 +1,73 @@
+import click
+import yaml
+from kedro.framework.cli.project import CONF_SOURCE_HELP
+from kedro.framework.startup import ProjectMetadata
+
+from kedro_databricks.constants import DEFAULT_CONF_FOLDER
+from kedro_databricks.utilities.catalog_sync import sync_catalog
+from kedro_databricks.utilities.logger import get_logger
+
+log = get_logger("sync-catalog")
+
+
+@click.command()
+@click.option(
+    "-e",
+    "--env",
+    "envs",
+    multiple=True,
+    help="Target to sync. Can be repeated. Defaults to every target of databricks.yml",
+)
+@click.option(
+    "-c",
+    "--conf-source",
+    default=DEFAULT_CONF_FOLDER,
+    help=CONF_SOURCE_HELP,
+)
+@click.option(
+    "--check",
+    default=False,
+    is_flag=True,
+    show_default=True,
+    help="Fail if a target catalog is out of sync, without changing any file",
+)
+@click.pass_obj
+def command(
+    metadata: ProjectMetadata,
+    envs: tuple[str, ...],
+    conf_source: str,
+    check: bool,
+):
+    """Merge the changes of the base catalog into the target catalogs.
+
+    Only the entries changed in `conf/base` since the last sync are updated in
+    `conf/<target>`. Entries edited in the target are kept.
+    """
+    conf_dir = metadata.project_path / conf_source
+    targets = list(envs) or _get_targets(metadata)
+    out_of_sync = []
+    for target in targets:
+        if not (conf_dir / target).is_dir():
+            log.warning(
+                f"No configuration found for target '{target}', "
+                "run `kedro databricks init` first."
+            )
+            continue
+        result = sync_catalog(conf_dir, target, check=check)
+        log.info(
+            f"{target}: {len(result.added)} added, {len(result.updated)} updated, "
+            f"{len(result.removed)} removed, {len(result.conflicts)} conflict(s)"
+        )
+        if result.files or result.conflicts:
+            out_of_sync.append(target)
+    if check and out_of_sync:
+        raise click.ClickException(
+            f"The catalog of {', '.join(out_of_sync)} is out of sync with the base "
+            "catalog, run `kedro databricks sync-catalog`."
+        )
+
+
+def _get_targets(metadata: ProjectMetadata) -> list[str]:
+    with open(metadata.project_path / "databricks.yml") as f:
+        config = yaml.safe_load(f) or {}
+    return list(config.get("targets") or {})
@@ -5,4 +5,5 @@ import kedro_databricks
 
 @click.command()
 def command():
+    """Show the version of kedro-databricks."""
     click.echo(f"kedro-databricks version: {kedro_databricks.__version__}")
@@ -1,11 +1,24 @@
-from importlib import metadata, resources
+"""Constants used across the plugin.
 
-from packaging.version import Version
+Kedro imports the entry point of every installed plugin for every `kedro`
+command, so this module must stay cheap to import. Values that require I/O, such
+as `KEDRO_VERSION` and `TEMPLATES`, are computed on first access through the
+module level `__getattr__`.
+"""
+
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from importlib.resources.abc import Traversable
+
+    from packaging.version import Version
 
-TEMPLATES = resources.files("kedro_databricks").joinpath("templates")
+    TEMPLATES: Traversable
+    """Folder holding the templates shipped with the plugin."""
 
-KEDRO_VERSION = Version(metadata.version("kedro"))
-"""Kedro version used to build this plugin."""
+    KEDRO_VERSION: Version
+    """Kedro version used to build this plugin."""
 
 MINIMUM_DATABRICKS_VERSION = [0, 205, 0]
 """Minimum Databricks version required for this plugin."""
@@ -65,6 +78,12 @@ DEFAULT_CONFIG_GENERATOR = "node"
 DEFAULT_CONFIG_GENERATOR_HELP = "Generator used to create resources. Options are 'node' (create a job for each node) or 'pipeline' (create a single job for the entire pipeline)."
 """Help text for the resource generator option."""
 
+STATE_DIR = ".databricks/kedro-databricks"
+"""Folder, relative to the project root, where the plugin keeps its local state."""
+
+SERVER_INFO_FILE = "serve.json"
+"""Name of the file, in the state folder, holding the address of the bundle server."""
+
 INVALID_CONFIG_MSG = """
 No `databricks.yml` file found. Maybe you forgot to initialize the Databricks bundle?
 
@@ -83,3 +102,22 @@ conf/{DEFAULT_ENV}/**
 !conf/{DEFAULT_ENV}/.gitkeep
 """.strip()
 """Content to be added to `.gitignore` for Kedro Databricks configurations."""
+
+
+@cache
+def _load_lazy_constant(name: str) -> Any:
+    if name == "TEMPLATES":
+        from importlib import resources  # noqa: PLC0415
+
+        return resources.files("kedro_databricks").joinpath("templates")
+    if name == "KEDRO_VERSION":
+        from importlib import metadata  # noqa: PLC0415
+
+        from packaging.version import Version  # noqa: PLC0415
+
+        return Version(metadata.version("kedro"))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str) -> Any:
+    return _load_lazy_constant(name)
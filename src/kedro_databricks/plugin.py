@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 import click
 
+from kedro_databricks.commands import COMMANDS
 from kedro_databricks.utilities.plugin import Plugin
 
 
@@ -15,7 +14,7 @@ def commands():
 
 @commands.group(
     cls=Plugin,
-    commands_dir=Path(__file__).parent / "commands",
+    registry=COMMANDS,
     name="databricks",
 )
 def databricks_commands():
@@ -3,11 +3,206 @@
 # Do not modify this file directly.
 
 import argparse
+import json
 import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
 
+from kedro.framework.hooks import hook_impl
 from kedro.framework.project import configure_project
 from kedro.framework.session import KedroSession
 
+log = logging.getLogger(__name__)
+
+REPORT_VERSION = 1
+TASK_VALUE_KEY = "kedro_instrumentation"
+
+
+class InstrumentationHook:
+    """Record the time spent loading, running and saving every node.
+
+    The load and save times are recorded per dataset, with the number of bytes
+    read or written for datasets stored in files. When the pipeline finishes,
+    or fails, the records are written to `<output_dir>/<run_id>/<task_key>.json`
+    and, with `task_values`, summarized in a Databricks task value.
+    """
+
+    def __init__(self, output_dir, run_id, task_key, task_values=False):
+        self.output_dir = output_dir
+        self.run_id = run_id
+        self.task_key = task_key
+        self.task_values = task_values
+        self.started = datetime.now(timezone.utc).isoformat()
+        self.nodes = {}
+        self._catalog = None
+        self._starts = {}
+        self._lock = threading.Lock()
+
+    @hook_impl
+    def after_catalog_created(self, catalog):
+        self._catalog = catalog
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name, node):
+        self._starts[("load", node.name, dataset_name)] = time.perf_counter()
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name, node):
+        self._record_dataset("load", node.name, dataset_name)
+
+    @hook_impl
+    def before_node_run(self, node):
+        self._starts[("compute", node.name, None)] = time.perf_counter()
+
+    @hook_impl
+    def after_node_run(self, node):
+        seconds = self._elapsed(("compute", node.name, None))
+        with self._lock:
+            self._node(node.name)["compute_seconds"] += seconds
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name, node):
+        self._starts[("save", node.name, dataset_name)] = time.perf_counter()
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name, node):
+        self._record_dataset("save", node.name, dataset_name)
+
+    @hook_impl
+    def after_pipeline_run(self, run_params):
+        self.write(run_params, "success")
+
+    @hook_impl
+    def on_pipeline_error(self, run_params):
+        self.write(run_params, "failed")
+
+    def write(self, run_params=None, status="success"):
+        """Write the records, and set the task value if requested."""
+        run_params = run_params or {}
+        run_id = self.run_id or run_params.get("session_id") or "local"
+        task_key = self.task_key or "-".join(sorted(self.nodes)) or "pipeline"
+        report = {
+            "version": REPORT_VERSION,
+            "run_id": run_id,
+            "task_key": task_key,
+            "env": run_params.get("env"),
+            "started": self.started,
+            "status": status,
+            "nodes": list(self.nodes.values()),
+        }
+        path = os.path.join(self.output_dir, str(run_id), f"{task_key}.json")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+        except OSError as e:
+            log.warning(f"Could not write the instrumentation report to {path}: {e}")
+            path = None
+        else:
+            log.info(f"Wrote the instrumentation report to {path}")
+        if self.task_values:
+            _set_task_value(_summarize(report, path))
+
+    def _record_dataset(self, operation, node_name, dataset_name):
+        seconds = self._elapsed((operation, node_name, dataset_name))
+        size = _dataset_size(self._catalog, dataset_name)
+        with self._lock:
+            node = self._node(node_name)
+            node[f"{operation}_seconds"] += seconds
+            node["datasets"].append(
+                {
+                    "name": dataset_name,
+                    "operation": operation,
+                    "seconds": seconds,
+                    "bytes": size,
+                }
+            )
+
+    def _elapsed(self, key):
+        start = self._starts.pop(key, None)
+        return 0.0 if start is None else time.perf_counter() - start
+
+    def _node(self, name):
+        if name not in self.nodes:
+            self.nodes[name] = {
+                "name": name,
+                "load_seconds": 0.0,
+                "compute_seconds": 0.0,
+                "save_seconds": 0.0,
+                "datasets": [],
+            }
+        return self.nodes[name]
+
+
+def _dataset_size(catalog, dataset_name):
+    # Only datasets stored with fsspec have a size; any failure means unknown.
+    try:
+        get = getattr(catalog, "_get_dataset", None) or catalog.get
+        dataset = get(dataset_name)
+        fs = getattr(dataset, "_fs", None)
+        if fs is None:
+            return None
+        if hasattr(dataset, "_get_load_path"):
+            path = str(dataset._get_load_path())
+        else:
+            path = str(dataset._filepath)
+        return int(fs.du(path)) if fs.isdir(path) else int(fs.size(path))
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _summarize(report, path):
+    def total(field):
+        return sum(node[field] for node in report["nodes"])
+
+    def size(operation):
+        return sum(
+            dataset["bytes"] or 0
+            for node in report["nodes"]
+            for dataset in node["datasets"]
+            if dataset["operation"] == operation
+        )
+
+    return {
+        "path": path,
+        "status": report["status"],
+        "load_seconds": total("load_seconds"),
+        "compute_seconds": total("compute_seconds"),
+        "save_seconds": total("save_seconds"),
+        "bytes_read": size("load"),
+        "bytes_written": size("save"),
+    }
+
+
+def _set_task_value(value):
+    try:
+        from databricks.sdk.runtime import dbutils  # noqa: PLC0415
+
+        dbutils.jobs.taskValues.set(key=TASK_VALUE_KEY, value=value)
+    except Exception as e:  # noqa: BLE001
+        log.warning(f"Could not set the task value '{TASK_VALUE_KEY}': {e}")
+
+
+def _parse_params(params):
+    # `key=value` pairs separated by commas, like `kedro run --params`.
+    result = {}
+    for item in filter(None, (params or "").split(",")):
+        key, _, value = item.partition("=")
+        for convert in (int, float):
+            try:
+                value = convert(value)
+                break
+            except ValueError:
+                continue
+        *parents, leaf = key.strip().split(".")
+        target = result
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[leaf] = value
+    return result
+
 
 def main():
     parser = argparse.ArgumentParser()
@@ -15,23 +210,39 @@ def main():
     parser.add_argument("--conf-source", dest="conf_source", type=str)
     parser.add_argument("--package-name", dest="package_name", type=str)
     parser.add_argument("--nodes", dest="nodes", type=str)
+    parser.add_argument("--pipeline", dest="pipeline", type=str)
+    parser.add_argument("--params", dest="params", type=str)
+    parser.add_argument("--instrument-dir", dest="instrument_dir", type=str)
+    parser.add_argument("--run-id", dest="run_id", type=str)
+    parser.add_argument("--task-key", dest="task_key", type=str)
+    parser.add_argument("--task-values", dest="task_values", action="store_true")
 
     args = parser.parse_args()
     env = args.env
     conf_source = args.conf_source
     package_name = args.package_name
-    nodes = [node.strip() for node in args.nodes.split(",")]
+    nodes = [node.strip() for node in (args.nodes or "").split(",") if node.strip()]
 
     # https://kb.databricks.com/notebooks/cmd-c-on-object-id-p0.html
     logging.getLogger("py4j.java_gateway").setLevel(logging.ERROR)
     logging.getLogger("py4j.py4j.clientserver").setLevel(logging.ERROR)
 
     configure_project(package_name)
-    with KedroSession.create(env=env, conf_source=conf_source) as session:
+    with KedroSession.create(
+        env=env, conf_source=conf_source, extra_params=_parse_params(args.params)
+    ) as session:
+        if args.instrument_dir:
+            # Hooks of the project are registered on creation of the session,
+            # this one is only registered when the task asks for it.
+            session._hook_manager.register(
+                InstrumentationHook(
+                    args.instrument_dir, args.run_id, args.task_key, args.task_values
+                )
+            )
         if len(nodes) > 0:
-            session.run(node_names=nodes)
+            session.run(node_names=nodes, pipeline_name=args.pipeline)
         else:
-            session.run()
+            session.run(pipeline_name=args.pipeline)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,341 @@
+"""Long-running server that keeps Kedro sessions warm for bundle generation.
+
+Creating a Kedro session, loading the configuration and registering the
+pipelines dominates the time of `kedro databricks bundle`. The server does this
+once per environment and keeps the resulting context in memory. Requests are
+answered from the cached context until files in `src/` or `conf/` change:
+
+- a change in `conf/` closes the cached sessions, which are recreated on the
+  next request;
+- a change in `src/` additionally removes the project package from
+  `sys.modules` and bootstraps the project again, so that edited pipelines are
+  imported afresh.
+
+The server listens on a Unix socket in `.databricks/kedro-databricks/`, or on a
+TCP port bound to localhost on platforms without Unix sockets. The address is
+written to `.databricks/kedro-databricks/serve.json`, where `kedro_databricks.client`
+finds it. Each request and each response is a single line of JSON.
+
+Like `kedro databricks bundle`, the generated jobs are checked against the Jobs
+API schema before they are written, unless the request sets `validate` to
+false. The issues found are returned in the response, and invalid fields fail
+the request without writing any file.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from kedro.framework.session import KedroSession
+from kedro.framework.startup import ProjectMetadata, bootstrap_project
+
+from kedro_databricks.api import generate_bundle
+from kedro_databricks.constants import (
+    DEFAULT_CONF_FOLDER,
+    DEFAULT_CONFIG_GENERATOR,
+    DEFAULT_CONFIG_KEY,
+    DEFAULT_ENV,
+    SERVER_INFO_FILE,
+    STATE_DIR,
+)
+from kedro_databricks.utilities.file_watcher import POLL_INTERVAL, FileWatcher
+from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.resource_validator import validate_resources
+from kedro_databricks.utilities.resource_writer import (
+    DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_OUTPUT_LAYOUT,
+    DEFAULT_SHARDS,
+    save_resources,
+)
+
+log = get_logger("serve")
+
+SOCKET_FILE = "serve.sock"
+"""Name of the Unix socket, in the state folder, the server listens on."""
+
+WATCHED_PATTERNS = ["src/**/*", "conf/**/*", "pyproject.toml"]
+"""Glob patterns of the files that invalidate the cached sessions."""
+
+
+class BundleServer:
+    """Answer bundle requests from cached Kedro contexts.
+
+    Args:
+        metadata (ProjectMetadata): metadata of the Kedro project
+        interval (float): seconds between two checks for changed files
+        patterns (list[str] | None): glob patterns of the files that invalidate
+            the cached sessions, defaults to `WATCHED_PATTERNS`
+    """
+
+    def __init__(
+        self,
+        metadata: ProjectMetadata,
+        interval: float = POLL_INTERVAL,
+        patterns: list[str] | None = None,
+    ):
+        self.metadata = metadata
+        self.interval = interval
+        self.watcher = FileWatcher(metadata.project_path, patterns or WATCHED_PATTERNS)
+        self._sessions: dict[str, KedroSession] = {}
+        self._contexts: dict[str, Any] = {}
+        self._last_check = time.monotonic()
+        self.running = True
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle a single request.
+
+        Supported commands are `ping`, `bundle` and `shutdown`.
+
+        Args:
+            request (dict[str, Any]): the decoded request
+
+        Returns:
+            dict[str, Any]: the response, with `ok` set to whether it succeeded
+        """
+        start = time.perf_counter()
+        command = request.get("command")
+        try:
+            if command == "ping":
+                response = {"pid": os.getpid(), "envs": sorted(self._contexts)}
+            elif command == "bundle":
+                self.refresh(force=True)
+                response = self._bundle(request)
+            elif command == "shutdown":
+                self.running = False
+                response = {}
+            else:
+                raise ValueError(f"Unknown command '{command}'")
+        except Exception as exc:
+            log.exception(f"Failed to handle '{command}'")
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return {"ok": True, "elapsed_ms": round(elapsed_ms, 1), **response}
+
+    def refresh(self, force: bool = False) -> set[Path]:
+        """Invalidate the cached sessions if watched files changed.
+
+        Args:
+            force (bool): whether to check for changes even if the poll interval
+                has not passed yet
+
+        Returns:
+            set[Path]: the files that changed
+        """
+        now = time.monotonic()
+        if not force and now - self._last_check < self.interval:
+            return set()
+        self._last_check = now
+        changed = self.watcher.poll()
+        if changed:
+            self.reload(changed)
+        return changed
+
+    def reload(self, changed: set[Path]) -> None:
+        """Reload the cached sessions after the given files changed.
+
+        The sessions of all environments in use are recreated. If any of the
+        files is in `src/`, the project package is imported again as well.
+
+        Args:
+            changed (set[Path]): the files that changed
+        """
+        src_dir = self.metadata.project_path / "src"
+        envs = list(self._contexts)
+        self.close()
+        if any(src_dir in path.parents for path in changed):
+            log.info("Source files changed, reloading the project")
+            _purge_modules(self.metadata.package_name)
+            self.metadata = bootstrap_project(self.metadata.project_path)
+        else:
+            log.info("Configuration changed, reloading the Kedro sessions")
+        for env in envs:
+            self.get_context(env)
+
+    def get_context(self, env: str):
+        """Get the cached Kedro context of an environment, creating it if needed.
+
+        Args:
+            env (str): the Kedro environment
+
+        Returns:
+            KedroContext: the loaded context
+        """
+        if env not in self._contexts:
+            start = time.perf_counter()
+            session = KedroSession.create(
+                project_path=self.metadata.project_path, env=env
+            )
+            context = session.load_context()
+            # Pipelines are registered lazily, load them while warming up.
+            from kedro.framework.project import pipelines  # noqa: PLC0415
+
+            dict(pipelines)
+            self._sessions[env] = session
+            self._contexts[env] = context
+            elapsed = time.perf_counter() - start
+            log.info(f"Loaded Kedro context for '{env}' in {elapsed:.2f}s")
+        return self._contexts[env]
+
+    def close(self) -> None:
+        """Close all cached sessions."""
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+        self._contexts.clear()
+
+    def _bundle(self, request: dict[str, Any]) -> dict[str, Any]:
+        env = request.get("env") or DEFAULT_ENV
+        conf_source = request.get("conf_source") or DEFAULT_CONF_FOLDER
+        config_path = self.metadata.project_path / conf_source / env / "databricks.yml"
+        if not config_path.exists():
+            raise FileNotFoundError(
+                f"Databricks configuration for environment '{env}' not found "
+                f"in '{conf_source}/{env}/databricks.yml'."
+            )
+        resources = generate_bundle(
+            generator=request.get("generator") or DEFAULT_CONFIG_GENERATOR,
+            pipeline=request.get("pipeline"),
+            params=request.get("params"),
+            conf_source=conf_source,
+            default_key=request.get("default_key") or DEFAULT_CONFIG_KEY,
+            context=self.get_context(env),
+            metadata=self.metadata,
+        )
+        response: dict[str, Any] = {"resources": resources}
+        if request.get("validate", True):
+            issues = validate_resources(resources)
+            response["issues"] = [
+                {"path": issue.path, "message": issue.message, "error": issue.error}
+                for issue in issues
+            ]
+            errors = [str(issue) for issue in issues if issue.error]
+            if errors:
+                # Nothing is written, the caller gets the issues to fix.
+                response.pop("resources")
+                return {
+                    **response,
+                    "ok": False,
+                    "error": f"The jobs of environment '{env}' do not match the "
+                    "Jobs API schema:\n  " + "\n  ".join(errors),
+                }
+            for issue in issues:
+                log.warning(f"{issue} (environment '{env}')")
+        if request.get("write", True):
+            written = save_resources(
+                metadata=self.metadata,
+                env=env,
+                resources=resources,
+                overwrite=bool(request.get("overwrite", False)),
+                layout=request.get("output_layout") or DEFAULT_OUTPUT_LAYOUT,
+                shards=int(request.get("shards") or DEFAULT_SHARDS),
+                output_format=request.get("format") or DEFAULT_OUTPUT_FORMAT,
+                yaml_anchors=bool(request.get("yaml_anchors", False)),
+            )
+            response["files"] = [
+                path.relative_to(self.metadata.project_path).as_posix()
+                for path in written
+            ]
+        if not request.get("include_resources", True):
+            response.pop("resources")
+        return response
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            response = {"ok": False, "error": f"Invalid request: {exc}"}
+        else:
+            response = self.server.bundle_server.handle(request)  # type: ignore
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class _UnixServer(socketserver.UnixStreamServer):
+        bundle_server: BundleServer
+
+
+class _TCPServer(socketserver.TCPServer):
+    allow_reuse_address = True
+    bundle_server: BundleServer
+
+
+def serve(
+    metadata: ProjectMetadata,
+    envs: list[str],
+    port: int | None = None,
+    interval: float = POLL_INTERVAL,
+) -> None:
+    """Run the bundle server until it receives a `shutdown` request.
+
+    Args:
+        metadata (ProjectMetadata): metadata of the Kedro project
+        envs (list[str]): environments to load before accepting requests
+        port (int | None): serve on this localhost TCP port instead of a Unix socket
+        interval (float): seconds between two checks for changed files
+    """
+    bundle_server = BundleServer(metadata, interval=interval)
+    for env in envs:
+        bundle_server.get_context(env)
+
+    state_dir = metadata.project_path / STATE_DIR
+    state_dir.mkdir(parents=True, exist_ok=True)
+    info_path = state_dir / SERVER_INFO_FILE
+    socket_path = state_dir / SOCKET_FILE
+    if port is None and hasattr(socket, "AF_UNIX"):
+        _remove_stale_socket(socket_path)
+        server = _UnixServer(str(socket_path), _RequestHandler)
+        info = {"family": "unix", "address": str(socket_path)}
+    else:
+        server = _TCPServer(("127.0.0.1", port or 0), _RequestHandler)
+        info = {"family": "tcp", "address": list(server.server_address)}
+    server.bundle_server = bundle_server
+    server.timeout = interval
+    info_path.write_text(json.dumps({**info, "pid": os.getpid()}))
+    log.info(f"Serving bundle requests on {info['address']}")
+    try:
+        with server:
+            while bundle_server.running:
+                server.handle_request()
+                # Invalidate and warm up the sessions between requests, so that
+                # the next request after an edit does not pay for the reload.
+                bundle_server.refresh()
+    except KeyboardInterrupt:
+        log.info("Stopping the bundle server")
+    finally:
+        bundle_server.close()
+        info_path.unlink(missing_ok=True)
+        if info["family"] == "unix":
+            socket_path.unlink(missing_ok=True)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Remove a socket left behind by a server that did not shut down cleanly."""
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    raise RuntimeError(f"A bundle server is already listening on {socket_path}")
+
+
+def _purge_modules(package_name: str) -> None:
+    """Remove the modules of the project package, so they are imported again."""
+    for name in list(sys.modules):
+        if name == package_name or name.startswith(f"{package_name}."):
+            del sys.modules[name]
+    importlib.invalidate_caches()
@@ -0,0 +1,247 @@
+"""Regenerate the bundle resources whenever the project changes.
+
+`watch_bundle` keeps a warm Kedro session (see `BundleServer`) and polls the
+configuration of the environment and the sources of the project package. After
+each burst of changes it reloads what changed and regenerates:
+
+- all resources, if the configuration changed or a changed source file cannot
+  be attributed to a pipeline;
+- only the jobs of the affected pipelines otherwise. A pipeline is affected by
+  a source file if the file is in a folder holding one of its node functions,
+  which covers both `nodes.py` and `pipeline.py` of the usual layout.
+
+Only resource files whose content changed are written.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from kedro.framework.context import KedroContext
+from kedro.framework.startup import ProjectMetadata
+
+from kedro_databricks.api import (
+    apply_overrides,
+    generate_bundle,
+    load_databricks_config,
+)
+from kedro_databricks.utilities.bundle_server import BundleServer
+from kedro_databricks.utilities.file_watcher import DEBOUNCE, POLL_INTERVAL
+from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.resource_generator import RESOURCE_GENERATOR_RESOLVER
+from kedro_databricks.utilities.resource_validator import validate_resources
+from kedro_databricks.utilities.resource_writer import (
+    DEFAULT_OUTPUT_FORMAT,
+    DEFAULT_OUTPUT_LAYOUT,
+    DEFAULT_SHARDS,
+    save_resources,
+)
+
+log = get_logger("bundle")
+
+
+def watch_bundle(  # noqa: PLR0913
+    metadata: ProjectMetadata,
+    env: str,
+    generator: str,
+    pipeline: str | None,
+    params: str | None,
+    conf_source: str,
+    default_key: str,
+    interval: float = POLL_INTERVAL,
+    debounce: float = DEBOUNCE,
+    stop_event: threading.Event | None = None,
+    layout: str = DEFAULT_OUTPUT_LAYOUT,
+    shards: int = DEFAULT_SHARDS,
+    output_format: str = DEFAULT_OUTPUT_FORMAT,
+    yaml_anchors: bool = False,
+    validate: bool = True,
+) -> None:
+    """Generate the bundle resources, then regenerate them on every change.
+
+    Invalid fields found by `validate_resources` are logged, but the resources
+    are written anyway, to keep watching.
+
+    Args:
+        metadata (ProjectMetadata): metadata of the Kedro project
+        env (str): the Kedro environment
+        generator (str): name of the resource generator
+        pipeline (str | None): only generate the job of this pipeline
+        params (str | None): runtime parameters passed on to every task
+        conf_source (str): name of the configuration folder
+        default_key (str): key of the overrides applied to every resource
+        interval (float): seconds between two checks for changed files
+        debounce (float): seconds without changes that end a burst of changes
+        stop_event (threading.Event | None): event that stops watching when set
+        layout (str): layout of the resource files, see `save_resources`
+        shards (int): number of files in the `sharded` layout
+        output_format (str): format of the resource files
+        yaml_anchors (bool): whether to write repeated blocks with YAML aliases
+        validate (bool): whether to check the regenerated jobs against the Jobs
+            API schema
+    """
+    patterns = [
+        f"{conf_source}/base/**/*",
+        f"{conf_source}/{env}/**/*",
+        f"src/{metadata.package_name}/**/*.py",
+    ]
+    server = BundleServer(metadata, interval=interval, patterns=patterns)
+    affected: set[str] | None = None
+    current: dict[str, dict[str, Any]] = {}
+    start = time.perf_counter()
+    try:
+        while True:
+            context = server.get_context(env)
+            if affected is None:
+                resources = generate_bundle(
+                    generator=generator,
+                    pipeline=pipeline,
+                    params=params,
+                    conf_source=conf_source,
+                    default_key=default_key,
+                    context=context,
+                    metadata=server.metadata,
+                )
+                current = resources
+            else:
+                resources = generate_jobs(
+                    server.metadata,
+                    context,
+                    generator,
+                    sorted(affected),
+                    params,
+                    conf_source,
+                    default_key,
+                )
+                # The combined layouts write every resource, so keep the jobs
+                # that were not regenerated.
+                current = {
+                    **current,
+                    "jobs": {**current.get("jobs", {}), **resources["jobs"]},
+                }
+            if validate:
+                for issue in validate_resources(resources):
+                    if issue.error:
+                        log.error(str(issue))
+                    else:
+                        log.warning(str(issue))
+            written = save_resources(
+                server.metadata,
+                env,
+                current,
+                overwrite=True,
+                layout=layout,
+                shards=shards,
+                output_format=output_format,
+                yaml_anchors=yaml_anchors,
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            count = sum(len(items) for items in resources.values())
+            log.info(
+                f"Regenerated {count} resource(s) and wrote {len(written)} "
+                f"file(s) in {elapsed_ms:.0f}ms, watching for changes..."
+            )
+
+            changed = server.watcher.wait(interval, debounce, stop_event)
+            if not changed:
+                return
+            start = time.perf_counter()
+            server.reload(changed)
+            affected = affected_pipelines(server.metadata, changed)
+            if affected is not None and pipeline is not None:
+                affected &= {pipeline}
+    except KeyboardInterrupt:
+        log.info("Stopped watching")
+    finally:
+        server.close()
+
+
+def affected_pipelines(
+    metadata: ProjectMetadata, changed: set[Path]
+) -> set[str] | None:
+    """Get the pipelines affected by the given changed files.
+
+    Args:
+        metadata (ProjectMetadata): metadata of the Kedro project
+        changed (set[Path]): the files that changed
+
+    Returns:
+        set[str] | None: the names of the affected pipelines, or `None` if all
+            resources must be regenerated
+    """
+    from kedro.framework.project import pipelines  # noqa: PLC0415
+
+    package_dir = (metadata.source_dir / metadata.package_name).resolve()
+    changed = {path.resolve() for path in changed}
+    if any(package_dir not in path.parents for path in changed):
+        return None
+
+    folders: dict[str, set[Path]] = {}
+    for name, registered_pipeline in pipelines.items():
+        files = {_node_file(node.func) for node in registered_pipeline.nodes}
+        folders[name] = {file.parent for file in files if file is not None}
+
+    affected = set()
+    for path in changed:
+        owners = {name for name, dirs in folders.items() if path.parent in dirs}
+        # Shared modules, the pipeline registry or the settings can affect any job.
+        if not owners or path.parent == package_dir:
+            return None
+        affected |= owners
+    return affected
+
+
+def generate_jobs(  # noqa: PLR0913
+    metadata: ProjectMetadata,
+    context: KedroContext,
+    generator: str,
+    pipelines: list[str],
+    params: str | None,
+    conf_source: str,
+    default_key: str,
+) -> dict[str, dict[str, Any]]:
+    """Generate the jobs of the given pipelines, with the overrides applied.
+
+    Unlike `generate_bundle`, only the jobs of the pipelines are returned, and
+    not the resources only defined in the Databricks configuration.
+
+    Args:
+        metadata (ProjectMetadata): metadata of the Kedro project
+        context (KedroContext): the loaded Kedro context
+        generator (str): name of the resource generator
+        pipelines (list[str]): names of the pipelines
+        params (str | None): runtime parameters passed on to every task
+        conf_source (str): name of the configuration folder
+        default_key (str): key of the overrides applied to every resource
+
+    Returns:
+        dict[str, dict[str, Any]]: the jobs, keyed by `jobs` and the job name
+    """
+    overrides = load_databricks_config(context.config_loader).get("resources", {})
+    g = RESOURCE_GENERATOR_RESOLVER.resolve(generator)(
+        session=None,
+        metadata=metadata,
+        conf_source=conf_source,
+        params=params,
+        context=context,
+    )
+    jobs: dict[str, Any] = {}
+    for name in pipelines:
+        jobs.update(g.generate_jobs(name))
+    overridden = apply_overrides(
+        {"jobs": jobs}, {"jobs": overrides.get("jobs", {})}, default_key
+    )
+    return {"jobs": {name: overridden["jobs"][name] for name in jobs}}
+
+
+def _node_file(func) -> Path | None:
+    while isinstance(func, functools.partial):
+        func = func.func
+    module = sys.modules.get(getattr(func, "__module__", None) or "")
+    file = getattr(module, "__file__", None)
+    return Path(file).resolve() if file else None
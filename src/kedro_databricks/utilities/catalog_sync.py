@@ -0,0 +1,288 @@
+"""Keep the catalogs of the targets in sync with the base catalog.
+
+`init` copies the catalog files of `conf/base` to every target, with the local
+paths rewritten to the volume of the target (see `substitute_file_path`). The
+target catalogs are then edited by hand, and `sync_catalog` brings later
+changes of the base catalog over with a three-way merge of every entry between:
+
+- the base catalog the target was last synced with, stored next to the target
+  catalog in `SNAPSHOT_FILE`;
+- the current base catalog;
+- the target catalog.
+
+An entry changed, added or removed in the base catalog is changed, added or
+removed in the target, unless the target changed it as well. Such conflicts are
+reported and the entry of the target is kept. Entries are edited in place, so
+the rest of the target file, including comments and entries only defined in the
+target, is left untouched.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from kedro_databricks.utilities.logger import get_logger
+
+log = get_logger("sync-catalog")
+
+CATALOG_PATTERNS = [
+    "catalog*.yml",
+    "catalog*.yaml",
+    "catalog*/**/*.yml",
+    "catalog*/**/*.yaml",
+]
+"""Patterns of the catalog files in `conf/base` that are copied to the targets."""
+
+SNAPSHOT_FILE = ".catalog-base.yml"
+"""Snapshot of the base catalog in the configuration folder of a target."""
+
+_FILE_PATH_PATTERN = re.compile(
+    r"^(?P<key>[^#\n]*:)[ \t]*(?!https?://)(?:/[^/\s]+)*/?"
+    r"(?P<path>data(?:/[^/\s]+)+)(?P<comment>[ \t]+#.*)?.*$",
+    re.MULTILINE,
+)
+"""Local file paths under a `data` folder, outside of comments."""
+
+_FILE_PATH_REPLACEMENT = r"\g<key> ${_file_path}/\g<path>\g<comment>"
+"""Replacement of `_FILE_PATH_PATTERN`, keeping any trailing comment."""
+
+_ENTRY_PATTERN = re.compile(
+    r"""^(?:"(?P<double>[^"]*)"|'(?P<single>[^']*)'|(?P<plain>[^\s#'"][^:#]*?))"""
+    r"[ \t]*:(?:[ \t]|$)"
+)
+"""Key of a top level entry of a catalog file."""
+
+_MISSING = object()
+
+
+@dataclass
+class SyncResult:
+    """Changes made to the catalog of a target.
+
+    Attributes:
+        added (list[str]): entries added to the target
+        updated (list[str]): entries updated in the target
+        removed (list[str]): entries removed from the target
+        conflicts (list[str]): entries changed both in the base catalog and in
+            the target, which were left as they are
+        files (list[Path]): the target files that were changed
+    """
+
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    conflicts: list[str] = field(default_factory=list)
+    files: list[Path] = field(default_factory=list)
+
+
+def substitute_file_path(string: str) -> str:
+    """Substitute the file path in the catalog"""
+    return _FILE_PATH_PATTERN.sub(_FILE_PATH_REPLACEMENT, string)
+
+
+def find_catalog_files(base_conf_dir: Path) -> list[Path]:
+    """Find the catalog files of the base environment.
+
+    Args:
+        base_conf_dir (Path): the `base` configuration folder
+
+    Returns:
+        list[Path]: the `catalog*.yml` files and the files of `catalog*/`
+            folders, sorted by path
+    """
+    files: set[Path] = set()
+    for pattern in CATALOG_PATTERNS:
+        files.update(path for path in base_conf_dir.glob(pattern) if path.is_file())
+    return sorted(files)
+
+
+def write_snapshot(
+    base_conf_dir: Path, target_conf_dir: Path, catalog_files: list[Path] | None = None
+) -> None:
+    """Store the current base catalog as the one the target is in sync with.
+
+    Args:
+        base_conf_dir (Path): the `base` configuration folder
+        target_conf_dir (Path): the configuration folder of the target
+        catalog_files (list[Path] | None): the base catalog files, found with
+            `find_catalog_files` if not given
+    """
+    if catalog_files is None:
+        catalog_files = find_catalog_files(base_conf_dir)
+    snapshot = {
+        path.relative_to(base_conf_dir).as_posix(): _load_entries(
+            substitute_file_path(path.read_text())
+        )
+        for path in catalog_files
+    }
+    _save_snapshot(target_conf_dir, snapshot)
+
+
+def sync_catalog(conf_dir: Path, target: str, check: bool = False) -> SyncResult:
+    """Merge the changes of the base catalog into the catalog of a target.
+
+    Without a snapshot, for targets created before snapshots were stored, the
+    entries of the target are considered up to date and only the entries
+    missing from the target are added.
+
+    Args:
+        conf_dir (Path): the configuration folder of the project
+        target (str): the name of the target
+        check (bool): only compute the changes, without writing any file
+
+    Returns:
+        SyncResult: the changes made to the target
+    """
+    base_conf_dir = conf_dir / "base"
+    target_conf_dir = conf_dir / target
+    catalog_files = find_catalog_files(base_conf_dir)
+    base_texts = {
+        path.relative_to(base_conf_dir).as_posix(): substitute_file_path(
+            path.read_text()
+        )
+        for path in catalog_files
+    }
+    snapshot = _load_snapshot(target_conf_dir)
+    result = SyncResult()
+    for relative_path in sorted(set(base_texts) | set(snapshot or {})):
+        base_text = base_texts.get(relative_path, "")
+        target_path = target_conf_dir / relative_path
+        if target_path.exists():
+            target_text = target_path.read_text()
+            previous = None if snapshot is None else snapshot.get(relative_path, {})
+            merged = _merge(base_text, previous, target_text, result)
+        else:
+            target_text = None
+            merged = base_text
+            result.added.extend(_load_entries(base_text))
+        if merged == target_text or (target_text is None and not merged):
+            continue
+        result.files.append(target_path)
+        if check:
+            continue
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        target_path.write_text(merged)
+        log.info(f"Updated {target_path}")
+    for name in result.conflicts:
+        log.warning(
+            f"Entry '{name}' of the {target} catalog was changed both in "
+            "the base catalog and in the target, keeping the target entry."
+        )
+    if not check:
+        new_snapshot = {
+            relative_path: _load_entries(text)
+            for relative_path, text in base_texts.items()
+        }
+        if new_snapshot != snapshot:
+            _save_snapshot(target_conf_dir, new_snapshot)
+    return result
+
+
+def _merge(
+    base_text: str,
+    previous: dict[str, Any] | None,
+    target_text: str,
+    result: SyncResult,
+) -> str:
+    """Three-way merge the entries of a catalog file, returning the new target text."""
+    base_lines = base_text.splitlines(keepends=True)
+    target_lines = target_text.splitlines(keepends=True)
+    base_values = _load_entries(base_text)
+    target_values = _load_entries(target_text)
+    base_blocks = _entry_blocks(base_lines)
+    target_blocks = _entry_blocks(target_lines)
+    if previous is None:
+        previous = {name: base_values.get(name, _MISSING) for name in target_values}
+
+    edits: list[tuple[int, int, list[str]]] = []
+    appended: list[str] = []
+    for name in [*base_values, *(name for name in previous if name not in base_values)]:
+        old = previous.get(name, _MISSING)
+        new = base_values.get(name, _MISSING)
+        mine = target_values.get(name, _MISSING)
+        if new in (old, mine):
+            continue
+        unparsed = (mine is not _MISSING and name not in target_blocks) or (
+            new is not _MISSING and name not in base_blocks
+        )
+        if mine != old or unparsed:
+            result.conflicts.append(name)
+            continue
+        block = [] if new is _MISSING else _block(base_lines, base_blocks[name])
+        if mine is _MISSING:
+            appended.extend(["\n", *block])
+            result.added.append(name)
+            continue
+        start, end = target_blocks[name]
+        if block:
+            result.updated.append(name)
+        else:
+            while end < len(target_lines) and not target_lines[end].strip():
+                end += 1
+            result.removed.append(name)
+        edits.append((start, end, block))
+
+    for start, end, lines in sorted(edits, reverse=True):
+        target_lines[start:end] = lines
+    if appended:
+        if target_lines and not target_lines[-1].endswith("\n"):
+            target_lines[-1] += "\n"
+        if not target_lines:
+            appended = appended[1:]
+        target_lines.extend(appended)
+    return "".join(target_lines)
+
+
+def _entry_blocks(lines: list[str]) -> dict[str, tuple[int, int]]:
+    """Find the lines of every top level entry.
+
+    An entry spans its key and the indented lines that follow it. Blank lines
+    and comments after the last indented line belong to the next entry.
+    """
+    blocks: dict[str, tuple[int, int]] = {}
+    name = None
+    for i, line in enumerate(lines):
+        if line[:1] in (" ", "\t"):
+            if name is not None and line.strip():
+                blocks[name] = (blocks[name][0], i + 1)
+            continue
+        match = _ENTRY_PATTERN.match(line)
+        if match:
+            name = next(group for group in match.groups() if group is not None)
+            blocks[name] = (i, i + 1)
+        elif line.strip() and not line.startswith("#"):
+            name = None
+    return blocks
+
+
+def _block(lines: list[str], span: tuple[int, int]) -> list[str]:
+    block = lines[span[0] : span[1]]
+    if not block[-1].endswith("\n"):
+        block[-1] += "\n"
+    return block
+
+
+def _load_entries(text: str) -> dict[str, Any]:
+    entries = yaml.safe_load(text) or {}
+    if not isinstance(entries, dict):
+        raise ValueError("A catalog file must hold a mapping of entries.")
+    return entries
+
+
+def _load_snapshot(target_conf_dir: Path) -> dict[str, dict[str, Any]] | None:
+    snapshot_path = target_conf_dir / SNAPSHOT_FILE
+    if not snapshot_path.exists():
+        return None
+    with open(snapshot_path) as f:
+        return yaml.safe_load(f) or {}
+
+
+def _save_snapshot(target_conf_dir: Path, snapshot: dict[str, dict[str, Any]]) -> None:
+    with open(target_conf_dir / SNAPSHOT_FILE, "w") as f:
+        f.write("# Base catalog last synced with `kedro databricks sync-catalog`.\n")
+        yaml.safe_dump(snapshot, f, sort_keys=False)
@@ -1,43 +1,159 @@
 from __future__ import annotations
 
-import copy
+import fnmatch
+import functools
 import re
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from kedro.pipeline.node import Node
 from packaging.version import Version
 
-from kedro_databricks.constants import KEDRO_VERSION, MAX_TASK_KEY_LENGTH
+from kedro_databricks import constants
+from kedro_databricks.constants import MAX_TASK_KEY_LENGTH
 from kedro_databricks.utilities.logger import get_logger
 
 log = get_logger("utilities.common")
 
 
-def get_regex_values(
-    lookup_key: str,
-    values: dict[str, Any],
-    regex_prefix: str = "re:",
-) -> dict[str, Any]:
-    """Get values matching a regex
+REGEX_PREFIX = "re:"
+"""Prefix of the override keys matching resource or task keys with a regex."""
+
+GLOB_PREFIX = "glob:"
+"""Prefix of the override keys matching resource or task keys with a glob."""
+
+PATTERN_PREFIXES = (REGEX_PREFIX, GLOB_PREFIX)
+"""Prefixes of the override keys that are patterns rather than literal keys."""
+
+_REGEX_SYNTAX = re.compile(
+    r"\\([^A-Za-z0-9])|\\[A-Za-z0-9]|\[(?:\\.|[^\]])*\]|\{\d*,?\d*\}|[.^$*+?()|]"
+)
+_GLOB_SYNTAX = re.compile(r"\[[^\]]*\]|[*?]")
+
+
+def is_pattern_key(key: str) -> bool:
+    """Check whether an override key is a `re:` or `glob:` pattern.
+
+    Args:
+        key (str): the override key
+
+    Returns:
+        bool: whether the key is a pattern
+    """
+    return key.startswith(PATTERN_PREFIXES)
+
+
+class PatternIndex:
+    """Compiled `re:` and `glob:` keys of an overrides dictionary.
+
+    Regexes must match the start of a key, as with `re.match`, while globs
+    must match the whole key, as with `fnmatch.fnmatchcase`. The patterns are
+    ordered by specificity, i.e. the number of literal characters they contain,
+    and patterns that are equally specific by their position in the overrides.
+    Matches are returned least specific first, so that when they are merged in
+    that order the most specific pattern wins.
+
+    Patterns are bucketed by their literal first character, so a key is only
+    matched against the patterns that can match it, and the matches of every
+    key are memoized.
 
     Args:
-        lookup_key (str): key to match regexes to
+        keys (Iterable[str]): the override keys, other keys are ignored
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        patterns = []
+        for position, key in enumerate(keys):
+            if key.startswith(REGEX_PREFIX):
+                source = key[len(REGEX_PREFIX) :]
+                match = re.compile(source).match
+                specificity = len(_REGEX_SYNTAX.sub(lambda m: m.group(1) or "", source))
+                first = _regex_first_character(source)
+            elif key.startswith(GLOB_PREFIX):
+                source = key[len(GLOB_PREFIX) :]
+                match = re.compile(fnmatch.translate(source)).match
+                specificity = len(_GLOB_SYNTAX.sub("", source))
+                first = source[:1] if source[:1] not in ("", "*", "?", "[") else None
+            else:
+                continue
+            patterns.append(((specificity, position), first, key, match))
+        patterns.sort(key=lambda pattern: pattern[0])
+        self._unprefixed = [
+            (key, match) for _, first, key, match in patterns if not first
+        ]
+        self._buckets: dict[str, list[tuple[str, Callable]]] = {
+            first: [
+                (key, match)
+                for _, pattern_first, key, match in patterns
+                if pattern_first in (first, None)
+            ]
+            for first in {pattern[1] for pattern in patterns if pattern[1]}
+        }
+        self._matches: dict[str, list[str]] = {}
+
+    def match(self, lookup_key: str) -> list[str]:
+        """Get the pattern keys matching a key, least specific first.
+
+        Args:
+            lookup_key (str): the resource or task key
+
+        Returns:
+            list[str]: the matching keys, including their prefix
+        """
+        matches = self._matches.get(lookup_key)
+        if matches is None:
+            candidates = self._buckets.get(lookup_key[:1], self._unprefixed)
+            matches = [key for key, match in candidates if match(lookup_key)]
+            self._matches[lookup_key] = matches
+        return matches
+
+
+@functools.lru_cache(maxsize=128)
+def _pattern_index(keys: tuple[str, ...]) -> PatternIndex:
+    return PatternIndex(keys)
+
+
+def _regex_first_character(source: str) -> str | None:
+    # The literal character every match starts with, if any.
+    source = source.removeprefix("^")
+    if not source or "|" in source or source[0] in ".^$*+?()[]{}\\|":
+        return None
+    if source[1:2] in ("*", "?", "{"):
+        return None
+    return source[0]
+
+
+def get_pattern_keys(lookup_key: str, values: dict[str, Any]) -> list[str]:
+    """Get the `re:` and `glob:` keys of `values` matching the lookup key
+
+    The patterns of a dictionary are compiled once, and cached with the
+    matches of every lookup key. See `PatternIndex` for the order of the keys.
+
+    Args:
+        lookup_key (str): key to match the patterns to
         values (dict[str, Any]): The overrides to apply.
-        regex_prefix (str): prefix that identifies a key as a regex
 
     Returns:
-        dict[str, Any]: values where lookup key matches the regex
+        list[str]: the matching keys, including their prefix, least specific first
     """
-    matched_values = {}
-    for key, value in values.items():
-        if key.startswith(regex_prefix):
-            pattern = key[len(regex_prefix) :]
-            if re.match(pattern, lookup_key):
-                return value
-    return matched_values
+    return _pattern_index(tuple(values)).match(lookup_key)
+
 
+def get_pattern_values(lookup_key: str, values: dict[str, Any]) -> list[Any]:
+    """Get the values of all patterns matching the lookup key
 
-def require_databricks_run_script(_version=KEDRO_VERSION) -> bool:
+    Args:
+        lookup_key (str): key to match the patterns to
+        values (dict[str, Any]): The overrides to apply.
+
+    Returns:
+        list[Any]: values where the lookup key matches the pattern, in the order
+            they should be merged, see `PatternIndex`
+    """
+    return [values[key] for key in get_pattern_keys(lookup_key, values)]
+
+
+def require_databricks_run_script(_version: Version | None = None) -> bool:
     """Check if the current Kedro version is less than 0.19.8.
 
     Kedro 0.19.8 introduced a new `run_script` method that is required for
@@ -48,6 +164,8 @@ def require_databricks_run_script(_version=KEDRO_VERSION) -> bool:
     Returns:
         bool: whether the current Kedro version is less than 0.19.8
     """
+    if _version is None:
+        _version = constants.KEDRO_VERSION
     return _version < Version("0.19.8")
 
 
@@ -89,33 +207,38 @@ def get_arg_value(args: list[str], arg_name: str) -> str | None:
 def remove_nulls(value: dict[str, Any] | list[Any]) -> dict[str, Any] | list[Any]:
     """Remove None values from a dictionary or list.
 
+    Empty dictionaries and lists left after removing their None values are
+    removed as well. The value is not modified: the containers are rebuilt in
+    a single pass, while the other values are shared with the input.
+
     Args:
         value (Dict[Any, Any] | List[Dict[Any, Any]]): dictionary or list to remove None values from
 
     Returns:
         Dict[Any, Any] | List[Dict[Any, Any]]: dictionary or list with None values removed
     """
-    non_null = copy.deepcopy(value)
-    if isinstance(non_null, dict):
-        _remove_nulls_from_dict(non_null)
-    elif isinstance(non_null, list):
-        _remove_nulls_from_list(non_null)
-    return non_null
+    if isinstance(value, dict):
+        return _remove_nulls_from_dict(value)
+    if isinstance(value, list):
+        return _remove_nulls_from_list(value)
+    return value
 
 
 def _remove_nulls_from_list(lst: list) -> list:
     """Remove None values from a list.
 
     Args:
-        l (List[Dict[Any, Any]]): list to remove None values from
+        lst (List[Any]): list to remove None values from
+
+    Returns:
+        List[Any]: a new list without None values
     """
-    for i, item in enumerate(lst):
-        value = remove_nulls(item)
-        if not value:
-            del lst[i]
-        else:
-            lst[i] = value
-    return lst
+    result = []
+    for item in lst:
+        value = remove_nulls(item) if isinstance(item, (dict, list)) else item
+        if value:
+            result.append(value)
+    return result
 
 
 def _remove_nulls_from_dict(d: dict) -> dict:
@@ -125,15 +248,14 @@ def _remove_nulls_from_dict(d: dict) -> dict:
         d (Dict[str, Any]): dictionary to remove None values from
 
     Returns:
-        Dict[str, float | int | str | bool]: dictionary with None values removed
+        Dict[str, Any]: a new dictionary without None values
     """
-    for k, v in list(d.items()):
-        value = remove_nulls(v)
-        if not value:
-            del d[k]
-        else:
-            d[k] = value
-    return d
+    result = {}
+    for k, v in d.items():
+        value = remove_nulls(v) if isinstance(v, (dict, list)) else v
+        if value:
+            result[k] = value
+    return result
 
 
 def get_entry_point(project_name: str) -> str:
@@ -1,9 +1,9 @@
 import json
 import re
 import shutil
-import subprocess
-import time
+import threading
 from pathlib import Path
+from typing import TextIO
 
 import yaml
 from kedro.framework.startup import ProjectMetadata
@@ -13,7 +13,17 @@ from kedro_databricks.constants import (
     MINIMUM_DATABRICKS_VERSION,
 )
 from kedro_databricks.utilities.common import get_arg_value, version_to_str
+from kedro_databricks.utilities.json_select import load_json, select_paths
 from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.subprocess_runner import CommandResult, run_command
+
+_VERIFIED_EXECUTABLES: set[str] = set()
+"""Databricks CLI executables whose version has already been checked."""
+
+_VERIFY_LOCK = threading.Lock()
+
+VERSION_TIMEOUT = 60
+"""Seconds after which the Databricks CLI version check is stopped."""
 
 
 class DatabricksCli:
@@ -24,12 +34,21 @@ class DatabricksCli:
         metadata: ProjectMetadata,
         env: str = DEFAULT_ENV,
         additional_args: list[str] | None = None,
+        stream: TextIO | None = None,
+        timeout: float | None = None,
+        cancel_event: threading.Event | None = None,
     ):
         """Initialize the Databricks CLI command collection.
 
         Args:
             additional_args (list[str] | None): Additional arguments to be passed to the
                 `databricks` CLI.
+            stream (TextIO | None): Where to write the live output of commands.
+                Defaults to standard output. Output written to another stream is
+                prefixed with timestamps.
+            timeout (float | None): Seconds after which a command is stopped.
+            cancel_event (threading.Event | None): Event that stops the running
+                command when set.
         """
         self.log = get_logger("databricks_cli")
         if additional_args is None:
@@ -37,41 +56,60 @@ class DatabricksCli:
         self.metadata = metadata
         self.env = env
         self.args = additional_args
+        self.stream = stream
+        self.timeout = timeout
+        self.cancel_event = cancel_event
         self._check_self(warn=False)
 
     def version(self, warn=True):
-        result = self._run_command(["databricks", "--version"], warn=warn, silent=True)
-        self._check_result(
-            result,
-            "Failed to get Databricks CLI version",
-            pass_when_includes="Databricks CLI",
-        )
-        stdout = "\n".join(result.stdout).strip()
+        with self._run_command(
+            ["databricks", "--version"], warn=warn, silent=True, timeout=VERSION_TIMEOUT
+        ) as result:
+            self._check_result(
+                result,
+                "Failed to get Databricks CLI version",
+                pass_when_includes="Databricks CLI",
+            )
+        stdout = "".join(result.tail).strip()
         version_str = re.sub(r".*(v\d+\.\d+\.\d+)", r"\1", stdout)
         return list(map(int, version_str[1:].split(".")))
 
-    def validate(self):
+    def validate(self, select: list[str] | None = None):
+        """Validate the bundle and return its resolved configuration.
+
+        The JSON output is parsed from the spill file of the command, so it is
+        never held in memory as a string.
+
+        Args:
+            select (list[str] | None): dotted paths to keep from the configuration,
+                e.g. `workspace.current_user` or `resources.jobs.*.id`. Keeps
+                everything if not given.
+
+        Raises:
+            RuntimeError: if the bundle is invalid or its output cannot be parsed
+
+        Returns:
+            dict: the (projected) bundle configuration
+        """
         cmd = ["databricks", "bundle", "validate", "--output", "json"] + self.args
-        result = self._run_command(
+        with self._run_command(
             cmd, warn=True, cwd=self.metadata.project_path, silent=True
-        )
-        self._check_result(result, "Failed to validate Databricks Asset Bundle")
-        try:
-            # Skip any warnings before the JSON output
-            first_bracket = next(
-                i
-                for i, line in enumerate(result.stdout)
-                if line.strip().startswith("{")
-            )
+        ) as result:
+            self._check_result(result, "Failed to validate Databricks Asset Bundle")
+            try:
+                return _load_validate_output(result, select)
+            except json.JSONDecodeError as exc:
+                raise RuntimeError(
+                    "Failed to parse Databricks Asset Bundle validation output\n"
+                    + "".join(result.tail)
+                ) from exc
 
-            result.stdout = result.stdout[first_bracket:]
-            return json.loads("".join(result.stdout))
-        except json.JSONDecodeError as exc:
-            raise RuntimeError(
-                f"Failed to parse Databricks Asset Bundle validation output\n{''.join(result.stdout)}"
-            ) from exc
-
-    def init(self, assets_dir: Path, template_params: Path):
+    def init(
+        self,
+        assets_dir: Path,
+        template_params: Path,
+        select: list[str] | None = None,
+    ):
         cmd = [
             "databricks",
             "bundle",
@@ -82,16 +120,17 @@ class DatabricksCli:
             "--output-dir",
             self.metadata.project_path.as_posix(),
         ] + list(self.args)
-        result = self._run_command(cmd, warn=True, cwd=self.metadata.project_path)
-        self._check_result(result, "Failed to initialize Databricks Asset Bundle")
+        with self._run_command(
+            cmd, warn=True, cwd=self.metadata.project_path
+        ) as result:
+            self._check_result(result, "Failed to initialize Databricks Asset Bundle")
         shutil.rmtree(assets_dir)
-        max_wait_seconds = 10
-        while not (self.metadata.project_path / "databricks.yml").exists():
-            max_wait_seconds -= 1
-            if max_wait_seconds <= 0:
-                raise RuntimeError("Databricks Asset Bundle initialization timed out.")
-            time.sleep(1)
-        return self.validate()
+        # The CLI has exited, so the rendered template is complete if it exists.
+        if not (self.metadata.project_path / "databricks.yml").exists():
+            raise RuntimeError(
+                "Databricks Asset Bundle initialization did not create databricks.yml."
+            )
+        return self.validate(select=select)
 
     def deploy(self):
         cmd = (
@@ -103,12 +142,14 @@ class DatabricksCli:
             + list(self.args)
             + self._get_default_target()
         )
-        result = self._run_command(cmd, warn=True, cwd=self.metadata.project_path)
-        self._check_result(
-            result,
-            "Failed to deploy Databricks Asset Bundle",
-            pass_when_includes="Deployment complete!\n",
-        )
+        with self._run_command(
+            cmd, warn=True, cwd=self.metadata.project_path
+        ) as result:
+            self._check_result(
+                result,
+                "Failed to deploy Databricks Asset Bundle",
+                pass_when_includes="Deployment complete!\n",
+            )
 
     def summary(self):
         cmd = (
@@ -120,8 +161,10 @@ class DatabricksCli:
             + list(self.args)
             + self._get_default_target()
         )
-        result = self._run_command(cmd, warn=True, cwd=self.metadata.project_path)
-        self._check_result(result, "Failed to summarize Databricks Asset Bundle")
+        with self._run_command(
+            cmd, warn=True, cwd=self.metadata.project_path
+        ) as result:
+            self._check_result(result, "Failed to summarize Databricks Asset Bundle")
 
     def upload(self):
         source_path = self.metadata.project_path / "data"
@@ -148,8 +191,8 @@ class DatabricksCli:
             + self.args
             + self._get_default_target()
         )
-        result = self._run_command(cmd, cwd=self.metadata.project_path)
-        self._check_result(result, "Failed to upload data")
+        with self._run_command(cmd, cwd=self.metadata.project_path) as result:
+            self._check_result(result, "Failed to upload data")
 
     def run(self, pipeline: str):
         cmd = (
@@ -157,8 +200,10 @@ class DatabricksCli:
             + list(self.args)
             + self._get_default_target()
         )
-        result = self._run_command(cmd, warn=True, cwd=self.metadata.project_path)
-        self._check_result(result, "Failed to run Databricks job")
+        with self._run_command(
+            cmd, warn=True, cwd=self.metadata.project_path
+        ) as result:
+            self._check_result(result, "Failed to run Databricks job")
 
     def destroy(self):
         cmd = (
@@ -166,18 +211,27 @@ class DatabricksCli:
             + list(self.args)
             + self._get_default_target()
         )
-        result = self._run_command(cmd, warn=True, cwd=self.metadata.project_path)
-        self._check_result(result, "Failed to destroy Databricks resources")
+        with self._run_command(
+            cmd, warn=True, cwd=self.metadata.project_path
+        ) as result:
+            self._check_result(result, "Failed to destroy Databricks resources")
 
     def _check_self(self, warn=False):
-        if not shutil.which("databricks"):
+        executable = shutil.which("databricks")
+        if not executable:
             error_msg = (
                 "Databricks CLI is not installed or not found in PATH. "
                 "Please install it from "
                 "https://docs.databricks.com/en/dev-tools/cli/install.html"
             )
             raise RuntimeError(error_msg)
-        return self._check_version(warn=warn)
+        # The version only needs to be checked once per process, which matters
+        # when several targets are deployed from the same invocation.
+        with _VERIFY_LOCK:
+            if executable in _VERIFIED_EXECUTABLES:
+                return
+            self._check_version(warn=warn)
+            _VERIFIED_EXECUTABLES.add(executable)
 
     def _check_version(self, warn=False):
         current_databricks_version = self.version(warn=warn)
@@ -195,45 +249,31 @@ class DatabricksCli:
             return ["--target", self.env]
         return []
 
-    def _check_result(
-        self, result: subprocess.CompletedProcess, msg: str, pass_when_includes=None
-    ):
-        if result.returncode != 0 and not (
-            pass_when_includes is not None
-            and pass_when_includes in "".join(result.stdout)
-        ):  # pragma: no cover
-            err = "\n".join(result.stdout)
-            raise RuntimeError(f"({result.returncode}) {msg}\n{err}")
-
-    def _read_stdout(self, process: subprocess.Popen, silent=False):
-        stdout = []
-        while True:
-            line = process.stdout.readline()  # type: ignore - we know it's there
-            if not line and process.poll() is not None:
-                break
-            if not silent:
-                print(line, end="")  # noqa: T201
-            stdout.append(line)
-        return stdout
+    def _check_result(self, result: CommandResult, msg: str, pass_when_includes=None):
+        if result.returncode == 0:
+            return
+        if pass_when_includes is not None and result.includes(pass_when_includes):
+            return
+        if result.timed_out:
+            msg = f"{msg} (timed out after {self.timeout}s)"
+        elif result.cancelled:
+            msg = f"{msg} (cancelled)"
+        err = "".join(result.tail)
+        if result.output_path is not None:
+            err += f"\nThe full output is available in {result.output_path}"
+        raise RuntimeError(f"({result.returncode}) {msg}\n{err}")
 
-    def _run_command(self, command, warn=False, silent=False, **kwargs):
+    def _run_command(self, command, warn=False, silent=False, timeout=None, **kwargs):
         """Run a command while printing the live output"""
-        process = subprocess.Popen(
+        return run_command(
             command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            stream=self.stream,
+            silent=silent,
+            timestamps=self.stream is not None,
+            timeout=timeout or self.timeout,
+            cancel_event=self.cancel_event,
             **kwargs,
         )
-        stdout = self._read_stdout(process, silent=silent)
-        process.stdout.close()  # type: ignore - we know it's there
-        result = subprocess.CompletedProcess(
-            args=command,
-            returncode=process.returncode,
-            stdout=stdout or [""],
-            stderr=[],
-        )
-        return result
 
     def _get_env_file_path(self):
         """Get the file path for the given environment from the catalog.yml file.
@@ -256,3 +296,31 @@ class DatabricksCli:
         if not file_path:
             return
         return file_path
+
+
+def _load_validate_output(result: CommandResult, select: list[str] | None):
+    """Parse the JSON output of `databricks bundle validate`.
+
+    Any warnings printed before the JSON document are skipped. The output is
+    not parsed straight from the pipe: the runner spills it to a file while the
+    process runs, and the file is parsed incrementally once the process exited.
+    """
+    if result.output_path is None:
+        return select_paths(json.loads(_strip_preamble(result.tail)), select)
+    with open(result.output_path, "rb") as f:
+        while True:
+            offset = f.tell()
+            line = f.readline()
+            if not line:
+                raise json.JSONDecodeError("No JSON document found", "", 0)
+            if line.lstrip().startswith(b"{"):
+                break
+        f.seek(offset)
+        return load_json(f, select)
+
+
+def _strip_preamble(lines: list[str]) -> str:
+    for i, line in enumerate(lines):
+        if line.lstrip().startswith("{"):
+            return "".join(lines[i:])
+    return ""
@@ -0,0 +1,103 @@
+"""Poll project files for changes.
+
+The watcher keeps a snapshot of the size and modification time of every file
+matching a set of glob patterns, and compares it with a fresh snapshot on every
+poll. Polling is used instead of OS specific notification APIs, as it behaves
+the same on every platform and the watched folders (`src/` and `conf/`) are
+small enough to be scanned frequently.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from kedro_databricks.utilities.fingerprint import collect_files
+
+POLL_INTERVAL = 0.5
+"""Default number of seconds between two polls."""
+
+DEBOUNCE = 0.3
+"""Default number of seconds without changes before a burst of changes is reported."""
+
+
+class FileWatcher:
+    """Watch the files under a folder that match the given glob patterns.
+
+    Args:
+        root (Path): folder the patterns are relative to
+        patterns (Iterable[str]): glob patterns of the files to watch
+    """
+
+    def __init__(self, root: Path, patterns: Iterable[str]):
+        self.root = root
+        self.patterns = list(patterns)
+        self._snapshot = self._scan()
+
+    def poll(self) -> set[Path]:
+        """Get the files that were added, removed or modified since the last poll.
+
+        Returns:
+            set[Path]: the changed files
+        """
+        snapshot = self._scan()
+        changed = {
+            path
+            for path in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def wait(
+        self,
+        interval: float = POLL_INTERVAL,
+        debounce: float = DEBOUNCE,
+        stop_event: threading.Event | None = None,
+    ) -> set[Path]:
+        """Block until files change, and return all changes of the burst.
+
+        Once a change is seen, polling continues until no further change happens
+        for `debounce` seconds, so that e.g. an editor saving several files or a
+        `git checkout` is reported as a single set of changes.
+
+        Args:
+            interval (float): seconds between two polls while waiting for a change
+            debounce (float): seconds without changes that end a burst
+            stop_event (threading.Event | None): event that stops waiting when set
+
+        Returns:
+            set[Path]: the changed files, empty if `stop_event` was set
+        """
+        changed: set[Path] = set()
+        while not changed:
+            if _sleep(interval, stop_event):
+                return set()
+            changed = self.poll()
+        while True:
+            if _sleep(debounce, stop_event):
+                return set()
+            more = self.poll()
+            if not more:
+                return changed
+            changed |= more
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        for path in collect_files(self.root, self.patterns):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover - removed while scanning
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+def _sleep(seconds: float, stop_event: threading.Event | None) -> bool:
+    """Sleep, returning early with `True` if the stop event is set."""
+    if stop_event is None:
+        time.sleep(seconds)
+        return False
+    return stop_event.wait(seconds)
@@ -0,0 +1,139 @@
+"""Content fingerprints used to skip redundant work.
+
+A fingerprint is a SHA-256 digest over the relative paths and contents of a set
+of project files. The plugin stores fingerprints (and other small pieces of
+state) as JSON files under `.databricks/kedro-databricks`, which is already
+ignored by git through the `.databricks` entry added by `kedro databricks init`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from kedro_databricks.constants import STATE_DIR
+
+IGNORED_PARTS = {"__pycache__", ".ipynb_checkpoints"}
+"""Path components that never contribute to a fingerprint."""
+
+IGNORED_SUFFIXES = {".pyc", ".pyo"}
+"""File suffixes that never contribute to a fingerprint."""
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def collect_files(root: Path, patterns: Iterable[str]) -> list[Path]:
+    """Collect the files under `root` matching any of the given glob patterns.
+
+    Args:
+        root (Path): directory the patterns are relative to
+        patterns (Iterable[str]): glob patterns, e.g. `conf/base/**/*`
+
+    Returns:
+        list[Path]: unique matching files, sorted by their path relative to `root`
+    """
+    files = set()
+    for pattern in patterns:
+        for path in root.glob(pattern):
+            if not path.is_file():
+                continue
+            relative = path.relative_to(root)
+            if IGNORED_PARTS.intersection(relative.parts):
+                continue
+            if path.suffix in IGNORED_SUFFIXES:
+                continue
+            files.add(relative)
+    return [root / relative for relative in sorted(files, key=Path.as_posix)]
+
+
+def hash_files(root: Path, files: Iterable[Path], hasher=None) -> str:
+    """Hash the relative path and content of each file.
+
+    Args:
+        root (Path): directory the file paths are made relative to
+        files (Iterable[Path]): files to hash, in a deterministic order
+        hasher (hashlib._Hash | None): hash object to update, defaults to SHA-256
+
+    Returns:
+        str: hex digest of the files
+    """
+    hasher = hasher or hashlib.sha256()
+    for path in files:
+        hasher.update(path.relative_to(root).as_posix().encode())
+        hasher.update(b"\0")
+        with open(path, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                hasher.update(chunk)
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def hash_file_stats(root: Path, files: Iterable[Path], hasher=None) -> str:
+    """Hash the relative path, size and modification time of each file.
+
+    This is much cheaper than `hash_files` and is meant for large inputs, such as
+    the `data` folder, where reading every byte is not worth it.
+
+    Args:
+        root (Path): directory the file paths are made relative to
+        files (Iterable[Path]): files to hash, in a deterministic order
+        hasher (hashlib._Hash | None): hash object to update, defaults to SHA-256
+
+    Returns:
+        str: hex digest of the file stats
+    """
+    hasher = hasher or hashlib.sha256()
+    for path in files:
+        stat = path.stat()
+        hasher.update(path.relative_to(root).as_posix().encode())
+        hasher.update(f"\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+    return hasher.hexdigest()
+
+
+def get_state_path(project_path: Path, name: str) -> Path:
+    """Get the path of a state file.
+
+    Args:
+        project_path (Path): root of the Kedro project
+        name (str): name of the state, e.g. `deploy.dev`
+
+    Returns:
+        Path: path of the JSON state file
+    """
+    return project_path / STATE_DIR / f"{name}.json"
+
+
+def read_state(project_path: Path, name: str) -> dict[str, Any]:
+    """Read a state file.
+
+    Args:
+        project_path (Path): root of the Kedro project
+        name (str): name of the state
+
+    Returns:
+        dict[str, Any]: the stored state, or an empty dict if it is missing or invalid
+    """
+    path = get_state_path(project_path, name)
+    if not path.exists():
+        return {}
+    try:
+        state = json.loads(path.read_text())
+    except json.JSONDecodeError:
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def write_state(project_path: Path, name: str, state: dict[str, Any]) -> None:
+    """Write a state file.
+
+    Args:
+        project_path (Path): root of the Kedro project
+        name (str): name of the state
+        state (dict[str, Any]): JSON serializable state to store
+    """
+    path = get_state_path(project_path, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(state, indent=2, sort_keys=True))
@@ -0,0 +1,388 @@
+"""Runtime instrumentation of the tasks of the generated jobs.
+
+`kedro databricks init --instrument` adds the `databricks_run` script to the
+project, and `kedro databricks bundle --instrument <dir>` runs every Python
+wheel task through it, with the arguments that register its
+`InstrumentationHook`. The hook records, for every node, the time spent loading
+its inputs, running its function and saving its outputs, with the bytes read
+and written per dataset, and writes them to `<dir>/<run_id>/<task_key>.json`:
+
+```json
+{
+  "version": 1,
+  "run_id": "1234",
+  "task_key": "preprocess_companies_node",
+  "env": "dev",
+  "started": "2026-01-01T00:00:00+00:00",
+  "status": "success",
+  "nodes": [
+    {
+      "name": "preprocess_companies_node",
+      "load_seconds": 0.8,
+      "compute_seconds": 2.1,
+      "save_seconds": 1.3,
+      "datasets": [
+        {"name": "companies", "operation": "load", "seconds": 0.8, "bytes": 1024}
+      ]
+    }
+  ]
+}
+```
+
+With `--task-values`, a summary of the file is also set as the
+`kedro_instrumentation` task value of the task, for the tasks downstream and
+the run page. `kedro databricks report` aggregates the files per node.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import statistics
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import tomlkit
+from kedro.framework.startup import ProjectMetadata
+
+from kedro_databricks.constants import TEMPLATES
+from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.memory_tracer import format_size
+
+log = get_logger("instrumentation")
+
+RUN_SCRIPT = "databricks_run"
+"""Entry point running a task with the instrumentation hook."""
+
+REPORT_VERSION = 1
+"""Version of the instrumentation files read by `load_reports`."""
+
+SORT_KEYS = ["total", "load", "compute", "save", "read", "written", "name"]
+"""Columns the report can be sorted by, the largest first."""
+
+
+def instrument_resources(
+    resources: dict[str, dict[str, Any]],
+    package_name: str,
+    instrument_dir: str,
+    task_values: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Run the Python wheel tasks of the jobs with the instrumentation hook.
+
+    The tasks are switched to the `databricks_run` entry point, which must be
+    a script of the project, see `write_databricks_run_script`. The resources
+    are not modified.
+
+    Args:
+        resources (dict[str, dict[str, Any]]): the resources by type and name
+        package_name (str): the package of the Kedro project
+        instrument_dir (str): the directory the instrumentation files are
+            written to, usually on a Unity Catalog volume
+        task_values (bool): whether to also set a summary as a task value
+
+    Returns:
+        dict[str, dict[str, Any]]: the resources with instrumented tasks
+    """
+    jobs = resources.get("jobs")
+    if not jobs:
+        return resources
+    instrumented = dict(resources)
+    instrumented["jobs"] = {
+        name: _instrument_job(job, package_name, instrument_dir, task_values)
+        for name, job in jobs.items()
+    }
+    return instrumented
+
+
+def _instrument_job(
+    job: dict[str, Any], package_name: str, instrument_dir: str, task_values: bool
+) -> dict[str, Any]:
+    if not isinstance(job, dict) or not isinstance(job.get("tasks"), list):
+        return job
+    job = dict(job)
+    job["tasks"] = [
+        _instrument_task(task, package_name, instrument_dir, task_values)
+        for task in job["tasks"]
+    ]
+    return job
+
+
+def _instrument_task(
+    task: Any, package_name: str, instrument_dir: str, task_values: bool
+) -> Any:
+    if not isinstance(task, dict) or not isinstance(
+        task.get("python_wheel_task"), dict
+    ):
+        return task
+    task = copy.deepcopy(task)
+    wheel_task = task["python_wheel_task"]
+    parameters = [str(parameter) for parameter in wheel_task.get("parameters") or []]
+    if "--package-name" not in parameters:
+        parameters += ["--package-name", package_name]
+    parameters += [
+        "--instrument-dir",
+        instrument_dir,
+        "--run-id",
+        "{{job.run_id}}",
+        "--task-key",
+        "{{task.name}}",
+    ]
+    if task_values:
+        parameters.append("--task-values")
+    wheel_task["entry_point"] = RUN_SCRIPT
+    wheel_task["parameters"] = parameters
+    return task
+
+
+def write_databricks_run_script(metadata: ProjectMetadata) -> bool:
+    """Write the `databricks_run` script to the package of the project.
+
+    The script is registered in the `project.scripts` of `pyproject.toml`, so
+    that the wheel of the project provides it as an entry point. This is done
+    by `kedro databricks init --instrument`, `bundle --instrument` only checks
+    it with `is_databricks_run_script_current`.
+
+    Args:
+        metadata (ProjectMetadata): metadata of the Kedro project
+
+    Returns:
+        bool: whether the script or `pyproject.toml` was written, as the wheel
+            must then be built again
+    """
+    script_path = _script_path(metadata)
+    toml_path = metadata.project_path / "pyproject.toml"
+    written = False
+    if not _is_script_current(script_path):
+        script_path.write_text(_template())
+        log.info(f"Wrote {script_path.relative_to(metadata.project_path)}")
+        written = True
+
+    with open(toml_path) as f:
+        toml = tomlkit.load(f)
+    scripts = toml.get("project", {}).get("scripts", {})
+    if RUN_SCRIPT not in scripts:
+        scripts[RUN_SCRIPT] = _entry_point(metadata)
+        toml["project"]["scripts"] = scripts  # type: ignore
+        with open(toml_path, "w") as f:
+            tomlkit.dump(toml, f)
+        log.info(f"Added script to {toml_path.relative_to(metadata.project_path)}")
+        written = True
+    return written
+
+
+def is_databricks_run_script_current(metadata: ProjectMetadata) -> bool:
+    """Check that the project has the `databricks_run` script of the plugin.
+
+    Args:
+        metadata (ProjectMetadata): metadata of the Kedro project
+
+    Returns:
+        bool: whether the script matches the template of the installed plugin
+            and is registered in the `project.scripts` of `pyproject.toml`
+    """
+    if not _is_script_current(_script_path(metadata)):
+        return False
+    with open(metadata.project_path / "pyproject.toml") as f:
+        toml = tomlkit.load(f)
+    scripts = toml.get("project", {}).get("scripts", {})
+    return scripts.get(RUN_SCRIPT) == _entry_point(metadata)
+
+
+def _template() -> str:
+    return (TEMPLATES / f"{RUN_SCRIPT}.py").read_text()
+
+
+def _script_path(metadata: ProjectMetadata) -> Path:
+    return metadata.project_path / "src" / metadata.package_name / f"{RUN_SCRIPT}.py"
+
+
+def _entry_point(metadata: ProjectMetadata) -> str:
+    return f"{metadata.package_name}.{RUN_SCRIPT}:main"
+
+
+def _is_script_current(script_path: Path) -> bool:
+    return script_path.exists() and script_path.read_text() == _template()
+
+
+@dataclass
+class NodeSummary:
+    """Runtime of a node over the instrumented runs, in seconds and bytes."""
+
+    name: str
+    runs: int = 0
+    load_seconds: list[float] = field(default_factory=list)
+    compute_seconds: list[float] = field(default_factory=list)
+    save_seconds: list[float] = field(default_factory=list)
+    bytes_read: int | None = None
+    """Mean bytes read per run, None if no input has a known size."""
+    bytes_written: int | None = None
+    """Mean bytes written per run, None if no output has a known size."""
+
+    @property
+    def load(self) -> float:
+        """Mean time spent loading the inputs."""
+        return statistics.fmean(self.load_seconds) if self.runs else 0.0
+
+    @property
+    def compute(self) -> float:
+        """Mean time spent running the node function."""
+        return statistics.fmean(self.compute_seconds) if self.runs else 0.0
+
+    @property
+    def save(self) -> float:
+        """Mean time spent saving the outputs."""
+        return statistics.fmean(self.save_seconds) if self.runs else 0.0
+
+    @property
+    def total(self) -> float:
+        """Mean time spent in the node."""
+        return self.load + self.compute + self.save
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the means of the summary, as written by `report --format json`."""
+        return {
+            "name": self.name,
+            "runs": self.runs,
+            "load_seconds": self.load,
+            "compute_seconds": self.compute,
+            "save_seconds": self.save,
+            "total_seconds": self.total,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+        }
+
+
+def load_reports(
+    paths: Iterable[str | Path], run_id: str | None = None
+) -> list[dict[str, Any]]:
+    """Load the instrumentation files of the given paths.
+
+    Directories are searched recursively for `.json` files, e.g. a directory
+    copied from the volume with `databricks fs cp -r`. Files that are not
+    instrumentation files are skipped with a warning.
+
+    Args:
+        paths (Iterable[str | Path]): files and directories to load
+        run_id (str | None): only load the files of this job run
+
+    Returns:
+        list[dict[str, Any]]: the instrumentation files, in path order
+    """
+    files: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.json")))
+        elif path.exists():
+            files.append(path)
+        else:
+            raise FileNotFoundError(f"No such file or directory: '{path}'")
+    reports = []
+    for file in files:
+        try:
+            report = json.loads(file.read_text())
+        except (OSError, ValueError) as e:
+            log.warning(f"Skipping {file}: {e}")
+            continue
+        if not isinstance(report, dict) or report.get("version") != REPORT_VERSION:
+            log.warning(f"Skipping {file}: not an instrumentation file")
+            continue
+        if run_id is None or str(report.get("run_id")) == run_id:
+            reports.append(report)
+    return reports
+
+
+def summarize_reports(reports: Iterable[dict[str, Any]]) -> list[NodeSummary]:
+    """Aggregate the runtime of every node over the instrumentation files.
+
+    Args:
+        reports (Iterable[dict[str, Any]]): the files, see `load_reports`
+
+    Returns:
+        list[NodeSummary]: the summary of every node, in order of appearance
+    """
+    summaries: dict[str, NodeSummary] = {}
+    sizes: dict[str, dict[str, list[int]]] = {}
+    for report in reports:
+        for node in report.get("nodes", []):
+            name = node["name"]
+            summary = summaries.setdefault(name, NodeSummary(name))
+            summary.runs += 1
+            summary.load_seconds.append(node.get("load_seconds", 0.0))
+            summary.compute_seconds.append(node.get("compute_seconds", 0.0))
+            summary.save_seconds.append(node.get("save_seconds", 0.0))
+            node_sizes = sizes.setdefault(name, {"load": [], "save": []})
+            for operation, known in _known_sizes(node.get("datasets", [])).items():
+                if known is not None:
+                    node_sizes[operation].append(known)
+    for name, summary in summaries.items():
+        read, written = sizes[name]["load"], sizes[name]["save"]
+        summary.bytes_read = sum(read) // len(read) if read else None
+        summary.bytes_written = sum(written) // len(written) if written else None
+    return list(summaries.values())
+
+
+def _known_sizes(datasets: list[dict[str, Any]]) -> dict[str, int | None]:
+    # The bytes of one run per operation, None if no dataset has a known size.
+    sizes: dict[str, int | None] = {"load": None, "save": None}
+    for dataset in datasets:
+        size = dataset.get("bytes")
+        operation = dataset.get("operation")
+        if size is not None and operation in sizes:
+            sizes[operation] = (sizes[operation] or 0) + size
+    return sizes
+
+
+def sort_summaries(summaries: list[NodeSummary], sort: str) -> list[NodeSummary]:
+    """Sort the node summaries by a column of the report.
+
+    Args:
+        summaries (list[NodeSummary]): the summaries to sort
+        sort (str): one of `SORT_KEYS`
+
+    Returns:
+        list[NodeSummary]: the summaries, by name or the largest value first
+    """
+    if sort == "name":
+        return sorted(summaries, key=lambda s: s.name)
+    attribute = {"read": "bytes_read", "written": "bytes_written"}.get(sort, sort)
+    return sorted(summaries, key=lambda s: getattr(s, attribute) or 0, reverse=True)
+
+
+def format_report(summaries: list[NodeSummary]) -> str:
+    """Format the node summaries as a table.
+
+    Args:
+        summaries (list[NodeSummary]): the summaries, in the order to show them
+
+    Returns:
+        str: the table, with the mean times in seconds and sizes per run
+    """
+    header = ["node", "runs", "load", "compute", "save", "total", "read", "written"]
+    rows = [
+        [
+            summary.name,
+            str(summary.runs),
+            f"{summary.load:.2f}s",
+            f"{summary.compute:.2f}s",
+            f"{summary.save:.2f}s",
+            f"{summary.total:.2f}s",
+            _format_bytes(summary.bytes_read),
+            _format_bytes(summary.bytes_written),
+        ]
+        for summary in summaries
+    ]
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in [header, *rows]
+    ]
+    return "\n".join(lines)
+
+
+def _format_bytes(size: int | None) -> str:
+    return "-" if size is None else format_size(size)
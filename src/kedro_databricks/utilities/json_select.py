@@ -0,0 +1,339 @@
+"""Load JSON documents while keeping only selected paths.
+
+The output of `databricks bundle validate --output json` grows with the number
+of resources in the bundle and can be several megabytes large, while callers
+usually only need a handful of values from it, e.g. `workspace.current_user`.
+
+Paths are dot-separated keys, where `*` matches any key of an object or any item
+of an array, e.g. `resources.jobs.*.id`. The document is parsed incrementally
+and only the selected values are ever materialised, so memory stays flat in the
+size of the document. The parser of `ijson` is used when the `ijson` extra is
+installed, and a pure Python tokenizer reading the file in chunks otherwise,
+which skips the containers that are not selected without tokenizing them.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import IO, Any
+
+try:  # pragma: no cover - depends on the environment
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
+
+WILDCARD = "*"
+"""Path segment matching any key of an object or any item of an array."""
+
+_CAPTURE = "capture"
+_DESCEND = "descend"
+_SKIP = "skip"
+_MISSING = object()
+
+CHUNK_SIZE = 64 * 1024
+"""Number of bytes read at a time by the pure Python tokenizer."""
+
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_SKIPPED = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]|"')
+_TOKEN = re.compile(r"[-+.\w]*")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_LITERALS = {
+    "true": ("boolean", True),
+    "false": ("boolean", False),
+    "null": ("null", None),
+}
+
+
+class PathSelector:
+    """Match locations in a JSON document against a set of dotted paths.
+
+    Args:
+        paths (Iterable[str]): dotted paths to select, e.g. `resources.jobs.*.id`
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        self.paths = [path.split(".") for path in paths]
+
+    def match(self, location: list[Any]) -> str:
+        """Decide what to do with the value at a location.
+
+        Args:
+            location (list[Any]): keys and indices leading to the value
+
+        Returns:
+            str: `capture` if the value is selected, `descend` if values below it
+                may be selected and `skip` otherwise
+        """
+        result = _SKIP
+        for segments in self.paths:
+            n = min(len(segments), len(location))
+            if not all(
+                segment in (WILDCARD, str(key))
+                for segment, key in zip(segments[:n], location[:n])
+            ):
+                continue
+            if len(location) >= len(segments):
+                return _CAPTURE
+            result = _DESCEND
+        return result
+
+
+def select_paths(data: Any, paths: Iterable[str] | None) -> Any:
+    """Project a loaded JSON document onto the given paths.
+
+    Objects and arrays leading up to a selected value are kept, everything else
+    is dropped.
+
+    Args:
+        data (Any): the JSON document
+        paths (Iterable[str] | None): dotted paths to keep, `None` keeps everything
+
+    Returns:
+        Any: the projected document, or `None` if nothing was selected
+    """
+    if paths is None:
+        return data
+    projected = _project(data, [], PathSelector(paths))
+    return None if projected is _MISSING else projected
+
+
+def load_json(fp: IO[bytes], paths: Iterable[str] | None = None) -> Any:
+    """Load a JSON document from a binary file, keeping only the given paths.
+
+    Args:
+        fp (IO[bytes]): binary file positioned at the start of the document
+        paths (Iterable[str] | None): dotted paths to keep, `None` keeps everything
+
+    Raises:
+        json.JSONDecodeError: if the document is not valid JSON
+
+    Returns:
+        Any: the (projected) document
+    """
+    if paths is None:
+        return json.load(fp)
+    if ijson is None:
+        tokenizer = _Tokenizer(fp, CHUNK_SIZE)
+        return _stream_select(iter(tokenizer), PathSelector(paths), tokenizer.skip)
+    try:
+        return _stream_select(ijson.parse(fp, use_float=True), PathSelector(paths))
+    except ijson.JSONError as exc:
+        raise json.JSONDecodeError(str(exc), "", 0) from exc
+
+
+def _project(value: Any, location: list[Any], selector: PathSelector) -> Any:
+    state = selector.match(location)
+    if state == _CAPTURE:
+        return value
+    if state == _SKIP:
+        return _MISSING
+    if isinstance(value, dict):
+        items = ((k, _project(v, [*location, k], selector)) for k, v in value.items())
+        return {k: v for k, v in items if v is not _MISSING}
+    if isinstance(value, list):
+        items = (_project(v, [*location, i], selector) for i, v in enumerate(value))
+        return [v for v in items if v is not _MISSING]
+    return _MISSING
+
+
+def _parse(
+    fp: IO[bytes], chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, str, Any]]:
+    """Tokenize a JSON document into `ijson.parse` like events, chunk by chunk.
+
+    Only the events and values are produced, the prefix is always empty. The
+    document ends with its top-level value, anything after it is not read.
+    """
+    return iter(_Tokenizer(fp, chunk_size))
+
+
+class _Tokenizer:
+    def __init__(self, fp: IO[bytes], chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        # One entry per open container: whether an object expects a key, or
+        # None for an array.
+        self.stack: list[bool | None] = []
+
+    def more(self) -> bool:
+        """Append the next chunk to the buffer, returning whether one was read."""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        self.eof = not chunk
+        self.buffer = self.buffer[self.pos :] + self.decoder.decode(
+            chunk, final=self.eof
+        )
+        self.pos = 0
+        return True
+
+    def __iter__(self) -> Iterator[tuple[str, str, Any]]:
+        stack = self.stack
+        started = False
+        while not started or stack:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore[union-attr]
+            if self.pos >= len(self.buffer):
+                if self.more():
+                    continue
+                raise json.JSONDecodeError(
+                    "Unexpected end of document", self.buffer, self.pos
+                )
+            char = self.buffer[self.pos]
+            if char in ",:":
+                if char == "," and stack and stack[-1] is not None:
+                    stack[-1] = True
+                self.pos += 1
+                continue
+            started = True
+            if char in "{[":
+                self.pos += 1
+                stack.append(True if char == "{" else None)
+                yield "", "start_map" if char == "{" else "start_array", None
+            elif char in "}]":
+                if not stack:
+                    raise json.JSONDecodeError(
+                        f"Unexpected {char!r}", self.buffer, self.pos
+                    )
+                stack.pop()
+                self.pos += 1
+                yield "", "end_map" if char == "}" else "end_array", None
+            else:
+                event = self._scalar(char)
+                if event is not None:
+                    yield event
+
+    def skip(self) -> None:
+        """Skip the rest of the container just started, without its events.
+
+        Only strings and brackets are looked at, which is much faster than
+        tokenizing the container.
+        """
+        depth = 1
+        while True:
+            match = _SKIPPED.search(self.buffer, self.pos)
+            if match is None or match.group() == '"':
+                self.pos = len(self.buffer) if match is None else match.start()
+                if self.more():
+                    continue
+                raise json.JSONDecodeError(
+                    "Unexpected end of document", self.buffer, self.pos
+                )
+            self.pos = match.end()
+            token = match.group()
+            if token in "{[":
+                depth += 1
+            elif token in "}]":
+                depth -= 1
+                if depth == 0:
+                    self.stack.pop()
+                    return
+
+    def _scalar(self, char: str) -> tuple[str, str, Any] | None:
+        """Read a string, number or literal, or None if more input is needed."""
+        buffer, pos = self.buffer, self.pos
+        if char == '"':
+            try:
+                value, self.pos = json.decoder.scanstring(buffer, pos + 1)  # type: ignore[attr-defined]
+            except json.JSONDecodeError:
+                if self.more():
+                    return None
+                raise
+            if self.stack and self.stack[-1]:
+                self.stack[-1] = False
+                return "", "map_key", value
+            return "", "string", value
+        # A number or literal may continue in the next chunk.
+        if _TOKEN.match(buffer, pos).end() == len(buffer) and self.more():  # type: ignore[union-attr]
+            return None
+        match = _NUMBER.match(buffer, pos)
+        if match:
+            number = match.group()
+            self.pos = match.end()
+            is_float = any(c in number for c in ".eE")
+            return "", "number", float(number) if is_float else int(number)
+        for word, (event, value) in _LITERALS.items():
+            if buffer.startswith(word, pos):
+                self.pos = pos + len(word)
+                return "", event, value
+        raise json.JSONDecodeError("Expecting value", buffer, pos)
+
+
+class _Frame:
+    __slots__ = ("key", "node", "state")
+
+    def __init__(self, node: Any, state: str, key: Any):
+        self.node = node
+        self.state = state
+        self.key = key
+
+
+def _stream_select(
+    events: Iterable[tuple[str, str, Any]],
+    selector: PathSelector,
+    skip: Callable[[], None] | None = None,
+):
+    """Build the projected document from `ijson.parse` events.
+
+    `skip`, if given, consumes the rest of the container whose start event was
+    just produced, so that containers that are not selected are not tokenized.
+    """
+    result: Any = None
+    stack: list[_Frame] = []
+    for _, event, value in events:
+        if event == "map_key":
+            stack[-1].key = value
+            continue
+        if event in ("end_map", "end_array"):
+            stack.pop()
+            _advance(stack)
+            continue
+
+        parent = stack[-1] if stack else None
+        if parent is None or parent.state == _DESCEND:
+            state = selector.match([frame.key for frame in stack])
+        else:
+            state = parent.state
+        is_container = event in ("start_map", "start_array")
+        if is_container:
+            node = None if state == _SKIP else ({} if event == "start_map" else [])
+        else:
+            node = value
+        keep = state == _CAPTURE or (state == _DESCEND and is_container)
+        if keep and parent is None:
+            result = node
+        elif keep:
+            _insert(parent, node)
+        if is_container and not keep and skip is not None:
+            skip()
+            _advance(stack)
+        elif is_container:
+            stack.append(
+                _Frame(
+                    node,
+                    state if keep else _SKIP,
+                    0 if event == "start_array" else None,
+                )
+            )
+        else:
+            _advance(stack)
+    return result
+
+
+def _insert(parent: _Frame, node: Any) -> None:
+    if isinstance(parent.node, dict):
+        parent.node[parent.key] = node
+    else:
+        parent.node.append(node)
+
+
+def _advance(stack: list[_Frame]) -> None:
+    """Move to the next index once a value in an array is complete."""
+    if stack and isinstance(stack[-1].key, int):
+        stack[-1].key += 1
@@ -0,0 +1,188 @@
+"""Merging of lists holding items of several kinds, each identified by its own key.
+
+Several fields of a job hold lists whose items come in kinds, which are told
+apart by the field they set. A library is a `whl`, a `jar` or a `pypi` package
+among others, and an access control entry is granted to a `group_name`, a
+`user_name` or a `service_principal_name`. Items of the same kind with the same
+key, e.g. the same wheel or the same group, are merged, so that an override can
+change the permission of a group without repeating the other entries.
+
+A `KindedListMerger` sorts the items into their kind in a single pass over both
+lists, and merges items with the same key as it goes:
+
+```python
+LIBRARIES(
+    [{"whl": "a.whl"}, {"pypi": {"package": "numpy"}}],
+    [{"pypi": {"package": "numpy", "repo": "https://my-mirror"}}],
+)
+# [{"pypi": {"package": "numpy", "repo": "https://my-mirror"}}, {"whl": "a.whl"}]
+```
+
+The merged items are ordered by kind, in the order the kinds are given, and by
+key within a kind, so the output is the same whatever the order of the items.
+Items of an unknown kind, or without a key, are kept as they are after all
+others, in the order they appear. Within merged items, nested objects are merged
+and nested lists, such as the `exclusions` of a Maven library, concatenated like
+the rest of the job overrides, unless the merger replaces them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import Any
+
+KeyFunction = Callable[[Any], Hashable | None]
+"""Function returning the key of an item from the value of its kind field."""
+
+
+class KindedListMerger:
+    """Merge lists of items of several kinds, each merged by its own key.
+
+    Args:
+        kinds (dict[str, KeyFunction]): the field identifying every kind, in the
+            order of the kinds in the output, with the function returning the
+            key of an item from the value of that field
+        concatenate_lists (bool): whether the nested lists of merged items are
+            concatenated, or replaced by the overriding list
+    """
+
+    def __init__(self, kinds: dict[str, KeyFunction], concatenate_lists: bool = True):
+        self.kinds = kinds
+        self.concatenate_lists = concatenate_lists
+
+    def key(self, item: Any) -> tuple[str, Hashable] | None:
+        """Get the kind and key of an item.
+
+        Args:
+            item (Any): an item of a list
+
+        Returns:
+            tuple[str, Hashable] | None: the kind and key of the item, or None if
+                it has no known kind or no key
+        """
+        if not isinstance(item, dict):
+            return None
+        for field, value in item.items():
+            key_of = self.kinds.get(field)
+            if key_of is not None and value:
+                key = key_of(value)
+                return None if key is None else (field, key)
+        return None
+
+    def __call__(self, old: list[Any] | None, new: list[Any] | None) -> list[Any]:
+        """Merge the items of `new` into the items of `old`.
+
+        Neither list is modified. Items that are not merged with another item
+        are returned as they are.
+
+        Args:
+            old (list[Any] | None): the items to override
+            new (list[Any] | None): the overriding items
+
+        Returns:
+            list[Any]: the merged items
+        """
+        kinds = self.kinds
+        buckets: dict[str, dict[Hashable, Any]] = {kind: {} for kind in kinds}
+        others = []
+        for items in (old, new):
+            for item in items or []:
+                # Inlined `key`, as this runs for every library of every task.
+                key = None
+                if item.__class__ is dict:
+                    for field, value in item.items():
+                        key_of = kinds.get(field)
+                        if key_of is not None and value:
+                            key = key_of(value)
+                            break
+                if key is None:
+                    others.append(item)
+                    continue
+                bucket = buckets[field]
+                previous = bucket.get(key)
+                if previous is None or previous == item:
+                    bucket[key] = item
+                else:
+                    bucket[key] = _merge_item(previous, item, self.concatenate_lists)
+        merged = []
+        for bucket in buckets.values():
+            if len(bucket) > 1:
+                merged.extend(bucket[key] for key in sorted(bucket, key=str))
+            else:
+                merged.extend(bucket.values())
+        return merged + others
+
+
+def _merge_item(
+    old: dict[str, Any], new: dict[str, Any], concatenate_lists: bool
+) -> dict[str, Any]:
+    # Nested objects are merged, nested lists concatenated if requested, like
+    # the generic merge of the job overrides, other values replaced unless null.
+    merged = dict(old)
+    for field, value in new.items():
+        if value is None:
+            continue
+        previous = merged.get(field)
+        if isinstance(previous, dict) and isinstance(value, dict):
+            merged[field] = _merge_item(previous, value, concatenate_lists)
+        elif (
+            concatenate_lists and isinstance(previous, list) and isinstance(value, list)
+        ):
+            merged[field] = previous + value
+        else:
+            merged[field] = value
+    return merged
+
+
+def value_key(value: Any) -> Hashable | None:
+    """Key an item by the value of its kind field, e.g. the path of a `whl`.
+
+    Args:
+        value (Any): the value of the kind field
+
+    Returns:
+        Hashable | None: the value if it is a scalar, as paths, names and ids are
+    """
+    return value if isinstance(value, (str, int, float)) else None
+
+
+def field_key(name: str) -> KeyFunction:
+    """Key an item by a field of the object of its kind field.
+
+    Args:
+        name (str): the field, e.g. `package` for `{"pypi": {"package": ...}}`
+
+    Returns:
+        KeyFunction: the key function
+    """
+
+    def key_of(value: Any) -> Hashable | None:
+        return value_key(value.get(name)) if isinstance(value, dict) else None
+
+    return key_of
+
+
+LIBRARIES = KindedListMerger(
+    {
+        "cran": field_key("package"),
+        "egg": value_key,
+        "jar": value_key,
+        "maven": field_key("coordinates"),
+        "pypi": field_key("package"),
+        "requirements": value_key,
+        "whl": value_key,
+    }
+)
+"""Merger of task libraries, by kind of library and path or package."""
+
+ACCESS_CONTROL_LIST = KindedListMerger(
+    {
+        "group_name": value_key,
+        "user_name": value_key,
+        "service_principal_name": value_key,
+    }
+)
+"""Merger of access control lists, by kind and name of principal."""
+
+NOTIFICATION_DESTINATIONS = KindedListMerger({"id": value_key})
+"""Merger of the notification destinations of an event, by id."""
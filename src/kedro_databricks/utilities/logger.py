@@ -7,11 +7,16 @@ but this can be overridden by setting the `LOG_LEVEL` environment variable.
 
 import logging
 import os
+from functools import cache
 
-logging.basicConfig(
-    level=os.getenv("LOG_LEVEL", "INFO"),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+
+@cache
+def _configure_logging():
+    """Configure the root logger once, on the first call to `get_logger`."""
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -26,5 +31,6 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: The logger instance.
     """
+    _configure_logging()
     ROOT_LOGGER = logging.getLogger("kedro-databricks")
     return ROOT_LOGGER.getChild(name)
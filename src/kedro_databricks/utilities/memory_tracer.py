@@ -0,0 +1,198 @@
+"""Peak memory and top allocation sites of the phases of a command.
+
+`kedro databricks bundle --trace-memory` runs the command under a
+`MemoryTracer`, which traces the Python allocations with `tracemalloc`. The
+plugin marks its phases with `trace_phase`, which does nothing unless a tracer
+is active, so the phases cost nothing in normal runs:
+
+```python
+with trace_phase("generate_jobs"):
+    jobs = generator.generate_jobs(pipeline)
+```
+
+For every phase, the tracer records the peak of the memory allocated while the
+phase ran, the memory it left allocated, and the source lines that allocated
+the most of it. A phase entered several times, e.g. once per environment, is
+recorded every time.
+
+Tracing slows the command down considerably. The snapshots used to find the
+allocation sites are excluded from the peak of their own phase, but not from
+the peak of a phase enclosing it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import tracemalloc
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+TOP_ALLOCATIONS = 5
+"""Number of allocation sites reported for every phase."""
+
+_ACTIVE: MemoryTracer | None = None
+"""The tracer of the running command, if any."""
+
+
+@dataclass
+class PhaseStats:
+    """Memory used by a phase, in bytes."""
+
+    name: str
+    peak: int
+    """Peak of the memory allocated while the phase ran, above its start."""
+    retained: int
+    """Memory allocated by the phase and not yet freed when it finished."""
+    top: list[tuple[str, int]] = field(default_factory=list)
+    """Source lines which allocated the most of `retained`, with their size."""
+
+
+@dataclass
+class _Frame:
+    name: str
+    start: int
+    peak: int
+    snapshot: tracemalloc.Snapshot
+
+
+class MemoryTracer:
+    """Context manager tracing the memory of the phases marked with `trace_phase`.
+
+    Args:
+        top (int): number of allocation sites reported for every phase
+    """
+
+    def __init__(self, top: int = TOP_ALLOCATIONS):
+        self.top = top
+        self.phases: list[PhaseStats] = []
+        self.peak = 0
+        """Peak of the memory allocated while the tracer was active, in bytes."""
+        self._stack: list[_Frame] = []
+        self._start = 0
+        self._max = 0
+        self._stop = False
+
+    def __enter__(self) -> MemoryTracer:
+        global _ACTIVE  # noqa: PLW0603
+        if _ACTIVE is not None:
+            raise RuntimeError("A memory tracer is already active.")
+        self._stop = not tracemalloc.is_tracing()
+        if self._stop:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._start = self._max = tracemalloc.get_traced_memory()[0]
+        _ACTIVE = self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _ACTIVE  # noqa: PLW0603
+        _ACTIVE = None
+        self._observe()
+        self.peak = self._max - self._start
+        if self._stop:
+            tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the memory used by the enclosed block as a phase.
+
+        Args:
+            name (str): the name of the phase in the report
+
+        Yields:
+            None: once the phase started
+        """
+        self._observe()
+        snapshot = _filtered_snapshot()
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        frame = _Frame(name=name, start=current, peak=current, snapshot=snapshot)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._observe()
+            self._stack.pop()
+            current = tracemalloc.get_traced_memory()[0]
+            stats = _filtered_snapshot().compare_to(frame.snapshot, "lineno")
+            top = [
+                (
+                    f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    stat.size_diff,
+                )
+                for stat in stats[: self.top]
+                if stat.size_diff > 0
+            ]
+            self.phases.append(
+                PhaseStats(
+                    name=name,
+                    peak=frame.peak - frame.start,
+                    retained=current - frame.start,
+                    top=top,
+                )
+            )
+            tracemalloc.reset_peak()
+
+    def report(self) -> str:
+        """Format the peak memory and the phases as a human readable report.
+
+        Returns:
+            str: the report, one line per phase and allocation site
+        """
+        lines = [f"Peak memory: {format_size(self.peak)}"]
+        for phase in self.phases:
+            lines.append(
+                f"  {phase.name}: peak {format_size(phase.peak)}, "
+                f"retained {format_size(phase.retained)}"
+            )
+            lines.extend(f"    {site}: {format_size(size)}" for site, size in phase.top)
+        return "\n".join(lines)
+
+    def _observe(self) -> None:
+        # Fold the peak since the last reset into every open phase, before the
+        # peak is reset for the next one.
+        peak = tracemalloc.get_traced_memory()[1]
+        self._max = max(self._max, peak)
+        for frame in self._stack:
+            frame.peak = max(frame.peak, peak)
+
+
+def trace_phase(name: str) -> contextlib.AbstractContextManager:
+    """Record the enclosed block as a phase of the active `MemoryTracer`.
+
+    Args:
+        name (str): the name of the phase in the report
+
+    Returns:
+        contextlib.AbstractContextManager: the phase, or a context manager doing
+            nothing if no tracer is active
+    """
+    if _ACTIVE is None:
+        return contextlib.nullcontext()
+    return _ACTIVE.phase(name)
+
+
+def format_size(size: int) -> str:
+    """Format a number of bytes with a binary unit, e.g. `1.5 MiB`.
+
+    Args:
+        size (int): the number of bytes
+
+    Returns:
+        str: the formatted size
+    """
+    value = float(size)
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(value) < 1024:  # noqa: PLR2004
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def _filtered_snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
@@ -0,0 +1,127 @@
+"""Deep, keyed merging of resources along a compiled plan.
+
+A `MergePlan` describes how the fields of a resource are merged with an
+override. It is compiled once from a nested specification, in which every field
+maps to either the specification of a nested object or the `KindedListMerger`
+of a list:
+
+```python
+plan = MergePlan(
+    {
+        "config": {"served_entities": KindedListMerger({"name": value_key})},
+        "permissions": ACCESS_CONTROL_LIST,
+    }
+)
+plan.merge(endpoint, overrides)
+```
+
+Fields that are not in the specification are merged by their value: objects
+are merged field by field, and any other value, including a list, replaces the
+previous one. Null values never replace anything, like in the jobs overrider.
+Inputs are never modified, and values that are not merged are shared with the
+result.
+
+`MergePlan.record` replays a merge into a `Provenance`, so that `bundle
+--explain` can tell which layer set every field.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from kedro_databricks.utilities.list_merger import KindedListMerger
+from kedro_databricks.utilities.provenance import Provenance
+
+PlanSpec = dict[str, "PlanSpec | KindedListMerger"]
+"""Specification of a merge plan, by field name."""
+
+
+class MergePlan:
+    """Merge objects field by field, with list fields merged by key.
+
+    Args:
+        spec (PlanSpec | None): how to merge the fields, see the module
+            documentation; by default, every field is merged by its value
+    """
+
+    def __init__(self, spec: PlanSpec | None = None):
+        self.fields: dict[str, MergePlan | KindedListMerger] = {
+            name: MergePlan(field) if isinstance(field, dict) else field
+            for name, field in (spec or {}).items()
+        }
+
+    def merge(self, old: Any, new: Any) -> Any:
+        """Merge `new` into `old`.
+
+        Args:
+            old (Any): the value to override
+            new (Any): the overriding value
+
+        Returns:
+            Any: the merged objects, or `new` unless it is null if either value
+                is not an object
+        """
+        if new is None:
+            return old
+        if old.__class__ is not dict or new.__class__ is not dict:
+            return new
+        merged = dict(old)
+        for name, value in new.items():
+            if value is None:
+                continue
+            field = self.fields.get(name, _BY_VALUE)
+            previous = merged.get(name)
+            if field.__class__ is MergePlan:
+                merged[name] = field.merge(previous, value)  # type: ignore
+            elif isinstance(value, list) and isinstance(previous, (list, type(None))):
+                merged[name] = field(previous, value)  # type: ignore
+            else:
+                merged[name] = value
+        return merged
+
+    def record(
+        self, provenance: Provenance, source: str, value: Any, path: str = ""
+    ) -> None:
+        """Record `source` as the layer setting the fields `merge` sets.
+
+        Args:
+            provenance (Provenance): the provenance of the resource
+            source (str): the name of the layer
+            value (Any): the value the layer merges into the resource
+            path (str): the path of the value in the resource
+        """
+        if value is None:
+            return
+        if value.__class__ is not dict:
+            provenance.replace(source, value, path)
+            return
+        for name, item in value.items():
+            item_path = f"{path}.{name}" if path else name
+            field = self.fields.get(name, _BY_VALUE)
+            if isinstance(field, MergePlan):
+                field.record(provenance, source, item, item_path)
+            elif isinstance(item, list):
+                _record_items(field, provenance, source, item, item_path)
+            elif item is not None:
+                provenance.replace(source, item, item_path)
+
+
+_BY_VALUE = MergePlan()
+"""Plan merging objects by the value of their fields."""
+
+
+def _record_items(
+    merger: KindedListMerger,
+    provenance: Provenance,
+    source: str,
+    items: list[Any],
+    path: str,
+) -> None:
+    for item in items:
+        kind_key = merger.key(item)
+        if kind_key is None:
+            provenance.append(source, item, path)
+            continue
+        kind, key = kind_key
+        label = key if len(merger.kinds) == 1 else f"{kind}={key}"
+        _BY_VALUE.record(provenance, source, item, f"{path}[{label}]")
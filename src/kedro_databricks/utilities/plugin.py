@@ -1,33 +1,96 @@
-import importlib.util
+"""Click group that lazily loads the plugin commands.
+
+The commands are listed in a static registry in `kedro_databricks.commands`,
+which maps each command name to the module defining it and its short help text.
+Listing the commands, rendering `--help` and shell completion only use the
+registry, so a command module (and its dependencies, such as the Kedro session)
+is only imported when that command is actually run.
+
+The registry is generated by `scripts/generate_command_registry.py`.
+"""
+
+from __future__ import annotations
+
+import importlib
 from pathlib import Path
+from typing import NamedTuple
 
 import click
+from click.shell_completion import CompletionItem
+
+
+class CommandSpec(NamedTuple):
+    """Entry of the command registry.
+
+    Attributes:
+        module (str): dotted path of the module defining `command`
+        help (str): short help text shown in `--help` and shell completion
+    """
+
+    module: str
+    help: str
 
 
 class Plugin(click.Group):
     """Kedro-Databricks plugin for Kedro CLI"""
 
-    def __init__(self, commands_dir: Path, **kwargs):
+    def __init__(self, registry: dict[str, CommandSpec], **kwargs):
         super().__init__(**kwargs)
-        self.commands_dir = commands_dir
+        self.registry = registry
+        self._loaded: dict[str, click.Command] = {}
 
     def list_commands(self, ctx):
-        cmds = []
-        for cmd_file in self.commands_dir.glob("*.py"):
-            if cmd_file.stem != "__init__":
-                cmds.append(cmd_file.stem)
-        cmds.sort()
-        return cmds
+        return sorted(self.registry)
 
     def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
-        cmd_path = self.commands_dir / f"{cmd_name}.py"
-        if not cmd_path.exists():
+        if cmd_name in self._loaded:
+            return self._loaded[cmd_name]
+        spec = self.registry.get(cmd_name)
+        if spec is None:
             return None
-        spec = importlib.util.spec_from_file_location(cmd_name, cmd_path)
-        if (
-            not spec or not spec.loader
-        ):  # pragma: no cover - we already check for file existence and python extension
-            raise ImportError(f"Cannot find spec for module {cmd_name}")
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        return module.command
+        command = importlib.import_module(spec.module).command
+        self._loaded[cmd_name] = command
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        rows = [(name, self.registry[name].help) for name in self.list_commands(ctx)]
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str):
+        results = [
+            CompletionItem(name, help=self.registry[name].help)
+            for name in self.list_commands(ctx)
+            if name.startswith(incomplete)
+        ]
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+
+def discover_commands(
+    commands_dir: Path, package: str = "kedro_databricks.commands"
+) -> dict[str, CommandSpec]:
+    """Build the command registry by importing every command module.
+
+    This is only used to generate the static registry and to check that it is
+    up to date, as it imports all commands. Underscores in module names become
+    dashes in command names, so `sync_catalog.py` defines `sync-catalog`.
+
+    Args:
+        commands_dir (Path): folder holding the command modules
+        package (str): dotted path of the package of `commands_dir`
+
+    Returns:
+        dict[str, CommandSpec]: the command registry, sorted by command name
+    """
+    registry = {}
+    for path in sorted(commands_dir.glob("*.py")):
+        if path.stem == "__init__":
+            continue
+        module = f"{package}.{path.stem}"
+        command = importlib.import_module(module).command
+        registry[path.stem.replace("_", "-")] = CommandSpec(
+            module, command.get_short_help_str(limit=80)
+        )
+    return registry
@@ -0,0 +1,210 @@
+"""Provenance of the fields of the overridden resources.
+
+A job is built from layers that are merged in order: the generated job, the
+`default` overrides, every matching `re:` and `glob:` override and the
+overrides of the job itself. Within every job layer, the tasks are merged with the same
+layers again. It is therefore hard to tell which override set, say, the size
+of a cluster.
+
+When `apply_overrides` is given a provenance dictionary, the overriders record
+the layer that last set every leaf field of a resource in a `Provenance`. The
+layers are named after their path in the Databricks configuration, such as
+`resources.jobs.default.tasks[default]`, or `generated` for the output of the
+resource generator. The fields are named after their path in the resource,
+where list items merged by key are identified by that key:
+
+```
+tasks[train].new_cluster.num_workers  resources.jobs.re:.*_ml.tasks[default]
+job_clusters[default].new_cluster.spark_version  resources.jobs.default
+```
+
+Recording only happens on request, so it costs nothing in normal runs.
+`find_config_files` maps the layers to the configuration files they are
+defined in.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from kedro_databricks.utilities.list_merger import LIBRARIES
+
+GENERATED = "generated"
+"""Name of the layer holding the output of the resource generator."""
+
+CONFIG_FILE_PATTERNS = ["databricks*.yml", "databricks*.yaml", "databricks/**/*.yml"]
+"""Patterns of the Databricks configuration files in a configuration folder."""
+
+
+def _library_key(item: dict[str, Any]) -> str | None:
+    kind_key = LIBRARIES.key(item)
+    return None if kind_key is None else f"{kind_key[0]}={kind_key[1]}"
+
+
+def _by(*keys: str) -> Callable[[dict[str, Any]], str | None]:
+    def key_of(item: dict[str, Any]) -> str | None:
+        for key in keys:
+            if item.get(key):
+                return str(item[key])
+        return None
+
+    return key_of
+
+
+LIST_KEYS: dict[str, Callable[[dict[str, Any]], str | None]] = {
+    "tasks": _by("task_key"),
+    "depends_on": _by("task_key"),
+    "job_clusters": _by("job_cluster_key"),
+    "environments": _by("environment_key"),
+    "parameters": _by("name"),
+    "rules": _by("metric"),
+    "access_control_list": _by("group_name", "user_name", "service_principal_name"),
+    "libraries": _library_key,
+    "on_start": _by("id"),
+    "on_success": _by("id"),
+    "on_failure": _by("id"),
+    "on_duration_warning_threshold_exceeded": _by("id"),
+    "on_streaming_backlog_exceeded": _by("id"),
+}
+"""Functions returning the key by which the items of a list field are merged.
+
+Items without a key, such as the strings of a `parameters` list, are appended
+by the overriders, and identified by their position instead.
+"""
+
+
+class Provenance:
+    """The layer that set every leaf field of a resource, by field path."""
+
+    def __init__(self):
+        self.sources: dict[str, str] = {}
+        self._lengths: dict[str, int] = {}
+
+    def record(self, source: str, value: Any, path: str = "") -> None:
+        """Record `source` as the layer setting every leaf of `value`.
+
+        Dictionaries are merged into the fields recorded so far, and lists are
+        merged by the key of their items (see `LIST_KEYS`) or appended to.
+        Nulls are skipped, as the overriders do not apply them.
+
+        Args:
+            source (str): the name of the layer
+            value (Any): the value the layer merges into the resource
+            path (str): the path of the value in the resource
+        """
+        if value is None:
+            return
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self.record(source, item, f"{path}.{key}" if path else str(key))
+        elif isinstance(value, list):
+            key_of = LIST_KEYS.get(path.rsplit(".", 1)[-1].split("[", 1)[0])
+            for item in value:
+                key = key_of(item) if key_of and isinstance(item, dict) else None
+                if key is None:
+                    self.append(source, item, path)
+                else:
+                    self.record(source, item, f"{path}[{key}]")
+        else:
+            self.sources[path] = source
+
+    def append(self, source: str, value: Any, path: str) -> None:
+        """Record `source` as the layer appending `value` to the list at `path`.
+
+        Args:
+            source (str): the name of the layer
+            value (Any): the item appended to the list
+            path (str): the path of the list in the resource
+        """
+        index = self._lengths.get(path, 0)
+        self._lengths[path] = index + 1
+        self.record(source, value, f"{path}[{index}]")
+
+    def replace(self, source: str, value: Any, path: str) -> None:
+        """Record `source` as the only layer setting the field at `path`.
+
+        Args:
+            source (str): the name of the layer
+            value (Any): the value replacing the field
+            path (str): the path of the field in the resource
+        """
+        for recorded in list(self.sources):
+            if recorded == path or recorded.startswith((f"{path}.", f"{path}[")):
+                del self.sources[recorded]
+        self._lengths.pop(path, None)
+        self.record(source, value, path)
+
+    def select(self, prefix: str = "") -> dict[str, str]:
+        """The sources of the fields at or below `prefix`, sorted by path.
+
+        Args:
+            prefix (str): path of a field, e.g. `tasks[train]`
+
+        Returns:
+            dict[str, str]: the layer of every leaf field, by path
+        """
+        return {
+            path: source
+            for path, source in sorted(self.sources.items())
+            if not prefix
+            or path == prefix
+            or path.startswith((f"{prefix}.", f"{prefix}["))
+        }
+
+
+def find_config_files(
+    conf_dirs: Iterable[Path], sources: Iterable[str]
+) -> dict[str, Path]:
+    """Find the configuration file defining every layer.
+
+    The folders are searched in order, so pass the folder of the environment
+    before `base`, whose configuration it overrides.
+
+    Args:
+        conf_dirs (Iterable[Path]): the configuration folders to search
+        sources (Iterable[str]): the layers, e.g. `resources.jobs.default`
+
+    Returns:
+        dict[str, Path]: the file of every layer that was found
+    """
+    files = [
+        path
+        for conf_dir in conf_dirs
+        for pattern in CONFIG_FILE_PATTERNS
+        for path in sorted(conf_dir.glob(pattern))
+    ]
+    configs = []
+    for path in files:
+        with open(path) as f:
+            configs.append((path, yaml.safe_load(f) or {}))
+    found = {}
+    for source in set(sources):
+        for path, config in configs:
+            if _defines(config, source):
+                found[source] = path
+                break
+    return found
+
+
+def _defines(config: dict[str, Any], source: str) -> bool:
+    # `resources.<type>.<key>` optionally followed by `.tasks[<task_key>]`
+    parts = source.split(".", 2)
+    if len(parts) < 3 or parts[0] != "resources":  # noqa: PLR2004
+        return False
+    resource_type, rest = parts[1], parts[2]
+    key, _, task = rest.partition(".tasks[")
+    resources = config.get("resources") or {}
+    resource = (resources.get(resource_type) or {}).get(key)
+    if resource is None:
+        return False
+    if not task:
+        return True
+    task_key = task.removesuffix("]")
+    return any(
+        isinstance(t, dict) and t.get("task_key") == task_key
+        for t in resource.get("tasks") or []
+    )
@@ -12,6 +12,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterable, MutableMapping
 from typing import Any
 
+from kedro.framework.context import KedroContext
 from kedro.framework.project import pipelines
 from kedro.framework.session.session import KedroSession
 from kedro.framework.startup import ProjectMetadata
@@ -42,6 +43,14 @@ class AbstractResourceGenerator(ABC):
     for each according to the Databricks REST API
     """
 
+    env_independent: bool = False
+    """Whether the generated jobs are the same for every Kedro environment.
+
+    When bundling several environments at once, the jobs of such generators are
+    generated once and reused. The context of every environment is still passed
+    to the generator, so it can validate the environment's catalog.
+    """
+
     @abstractmethod
     def _create_job_dict(
         self, name: str, pipeline: Pipeline, pipeline_name: str
@@ -49,13 +58,31 @@ class AbstractResourceGenerator(ABC):
 
     def __init__(
         self,
-        session: KedroSession,
+        session: KedroSession | None,
         metadata: ProjectMetadata,
         conf_source: str = "conf",
         params: str | None = None,
+        context: KedroContext | None = None,
     ) -> None:
+        """Initialize the generator.
+
+        Args:
+            session (KedroSession | None): session used to load the Kedro context,
+                only used if `context` is not given
+            metadata (ProjectMetadata): metadata of the Kedro project
+            conf_source (str): name of the configuration folder
+            params (str | None): runtime parameters passed on to every task
+            context (KedroContext | None): an already loaded Kedro context
+
+        Raises:
+            ValueError: if neither a session nor a context is given
+        """
+        if context is None:
+            if session is None:
+                raise ValueError("Either a session or a context must be given.")
+            context = session.load_context()
         self.metadata = metadata
-        self.context = session.load_context()
+        self.context = context
         self.pipelines: MutableMapping = pipelines
         self.remote_conf_dir = f"/${{workspace.file_path}}/{conf_source}"
         self.params = params
@@ -7,6 +7,7 @@ with appropriate dependencies derived from the pipeline graph.
 from collections.abc import Iterable
 from typing import Any
 
+from kedro.framework.context import KedroContext
 from kedro.framework.session import KedroSession
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
@@ -21,14 +22,17 @@ from kedro_databricks.utilities.resource_generator.exceptions import MemoryDatas
 class NodeResourceGenerator(AbstractResourceGenerator):
     """Generate a job with one Databricks task per Kedro node."""
 
+    env_independent = True
+
     def __init__(
         self,
-        session: KedroSession,
+        session: KedroSession | None,
         metadata: ProjectMetadata,
         conf_source: str = "conf",
         params: str | None = None,
+        context: KedroContext | None = None,
     ) -> None:
-        super().__init__(session, metadata, conf_source, params)
+        super().__init__(session, metadata, conf_source, params, context=context)
         undeclared_datasets = self._get_memory_datasets()
         if len(undeclared_datasets) > 0:
             raise MemoryDatasetError(self, undeclared_datasets)
@@ -16,6 +16,8 @@ from kedro_databricks.utilities.resource_generator.abstract_resource_generator i
 class PipelineResourceGenerator(AbstractResourceGenerator):
     """Generate a job with a single task for the whole pipeline."""
 
+    env_independent = True
+
     def _create_job_dict(
         self,
         name: str,
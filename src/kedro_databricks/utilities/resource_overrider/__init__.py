@@ -18,6 +18,21 @@ from kedro_databricks.utilities.resource_overrider.default_resource_overrider im
 from kedro_databricks.utilities.resource_overrider.jobs_resource_overrider import (
     JobsResourceOverrider,
 )
+from kedro_databricks.utilities.resource_overrider.keyed_resource_overrider import (
+    AppsResourceOverrider,
+    ClustersResourceOverrider,
+    ExperimentsResourceOverrider,
+    KeyedResourceOverrider,
+    ModelServingEndpointsResourceOverrider,
+    ModelsResourceOverrider,
+    PermissionsResourceOverrider,
+    PipelinesResourceOverrider,
+    QualityMonitorsResourceOverrider,
+    RegisteredModelsResourceOverrider,
+    SchemasResourceOverrider,
+    SqlWarehousesResourceOverrider,
+    VolumesResourceOverrider,
+)
 
 RESOURCE_OVERRIDER_RESOLVER = CompositeResourceResolver[
     type[AbstractResourceOverrider]
@@ -26,6 +41,19 @@ RESOURCE_OVERRIDER_RESOLVER = CompositeResourceResolver[
         RegistryResourceResolver(
             {
                 "jobs": JobsResourceOverrider,
+                "apps": AppsResourceOverrider,
+                "clusters": ClustersResourceOverrider,
+                "dashboards": PermissionsResourceOverrider,
+                "experiments": ExperimentsResourceOverrider,
+                "model_serving_endpoints": ModelServingEndpointsResourceOverrider,
+                "models": ModelsResourceOverrider,
+                "pipelines": PipelinesResourceOverrider,
+                "quality_monitors": QualityMonitorsResourceOverrider,
+                "registered_models": RegisteredModelsResourceOverrider,
+                "schemas": SchemasResourceOverrider,
+                "secret_scopes": PermissionsResourceOverrider,
+                "sql_warehouses": SqlWarehousesResourceOverrider,
+                "volumes": VolumesResourceOverrider,
             },
             default=DefaultResourceOverrider,
         ),
@@ -43,5 +71,18 @@ __all__ = [
     "AbstractResourceOverrider",
     "JobsResourceOverrider",
     "DefaultResourceOverrider",
+    "KeyedResourceOverrider",
+    "AppsResourceOverrider",
+    "ClustersResourceOverrider",
+    "ExperimentsResourceOverrider",
+    "ModelServingEndpointsResourceOverrider",
+    "ModelsResourceOverrider",
+    "PermissionsResourceOverrider",
+    "PipelinesResourceOverrider",
+    "QualityMonitorsResourceOverrider",
+    "RegisteredModelsResourceOverrider",
+    "SchemasResourceOverrider",
+    "SqlWarehousesResourceOverrider",
+    "VolumesResourceOverrider",
     "RESOURCE_OVERRIDER_RESOLVER",
 ]
@@ -2,11 +2,19 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from kedro_databricks.constants import DEFAULT_CONFIG_KEY
+from kedro_databricks.utilities.provenance import Provenance
 
 
 class AbstractResourceOverrider(ABC):
     """Abstract base class for resource overriders."""
 
+    copy_inputs: bool = True
+    """Whether `apply_overrides` must pass copies of the resource and overrides.
+
+    Overriders that never modify their arguments set this to `False`, which
+    saves a deep copy of the overrides for every resource.
+    """
+
     @abstractmethod
     def override(
         self,
@@ -15,3 +23,27 @@ class AbstractResourceOverrider(ABC):
         overrides: dict[str, Any],
         default_key: str = DEFAULT_CONFIG_KEY,
     ) -> dict[str, Any]: ...
+
+    def record_provenance(  # noqa: PLR0913
+        self,
+        provenance: Provenance,
+        resource_type: str,
+        resource_key: str,
+        resource: dict[str, Any],
+        overrides: dict[str, Any],
+        default_key: str = DEFAULT_CONFIG_KEY,
+    ) -> None:
+        """Record which layer sets every field of the overridden resource.
+
+        Called by `apply_overrides` with the same arguments as `override` when
+        the provenance is requested, e.g. by `bundle --explain`. Overriders that
+        do not implement it record nothing.
+
+        Args:
+            provenance (Provenance): the provenance of the resource to fill in
+            resource_type (str): the type of the resource, e.g. `jobs`
+            resource_key (str): the key identifying the resource
+            resource (dict[str, Any]): the generated resource
+            overrides (dict[str, Any]): the overrides of the resource type
+            default_key (str): the key of the overrides applied to every resource
+        """
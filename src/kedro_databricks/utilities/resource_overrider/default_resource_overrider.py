@@ -2,12 +2,15 @@ from typing import Any
 
 from kedro_databricks.constants import DEFAULT_CONFIG_KEY
 from kedro_databricks.utilities.common import sort_dict
+from kedro_databricks.utilities.provenance import GENERATED, Provenance
 from kedro_databricks.utilities.resource_overrider import AbstractResourceOverrider
 
 
 class DefaultResourceOverrider(AbstractResourceOverrider):
     """A default resource overrider that performs no overrides."""
 
+    copy_inputs = False
+
     def override(
         self,
         resource_key: str,
@@ -30,7 +33,29 @@ class DefaultResourceOverrider(AbstractResourceOverrider):
             raise ValueError(f"resource must be a dictionary not {type(resource)}")
         if not isinstance(overrides, dict):
             raise ValueError(f"overrides must be a dictionary not {type(overrides)}")
-        specific_overrides = overrides.pop(resource_key, {})
-        default_overrides = overrides.pop(default_key, {})
+        specific_overrides = overrides.get(resource_key, {})
+        default_overrides = overrides.get(default_key, {})
         all_overrides = {**default_overrides, **specific_overrides}
         return sort_dict({**resource, **all_overrides})
+
+    def record_provenance(  # noqa: PLR0913
+        self,
+        provenance: Provenance,
+        resource_type: str,
+        resource_key: str,
+        resource: dict[str, Any],
+        overrides: dict[str, Any],
+        default_key: str = DEFAULT_CONFIG_KEY,
+    ) -> None:
+        """Record the layer setting every field, see `AbstractResourceOverrider`.
+
+        The top-level fields of every layer replace those of the previous one.
+        """
+        layers = [(GENERATED, resource)] + [
+            (f"resources.{resource_type}.{key}", overrides[key])
+            for key in [default_key, resource_key]
+            if isinstance(overrides.get(key), dict)
+        ]
+        for source, layer in layers:
+            for field, value in layer.items():
+                provenance.replace(source, value, field)
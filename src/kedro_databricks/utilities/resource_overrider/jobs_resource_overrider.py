@@ -5,8 +5,18 @@ from fuso import merge, merge_list_of_dicts_by_key
 from fuso.merge import create_merge_factory
 
 from kedro_databricks.constants import DEFAULT_CONFIG_KEY
-from kedro_databricks.utilities.common import get_regex_values
+from kedro_databricks.utilities.common import (
+    get_pattern_keys,
+    get_pattern_values,
+    is_pattern_key,
+)
+from kedro_databricks.utilities.list_merger import (
+    ACCESS_CONTROL_LIST,
+    LIBRARIES,
+    NOTIFICATION_DESTINATIONS,
+)
 from kedro_databricks.utilities.logger import get_logger
+from kedro_databricks.utilities.provenance import GENERATED, Provenance
 from kedro_databricks.utilities.resource_overrider.abstract_resource_overrider import (
     AbstractResourceOverrider,
 )
@@ -80,80 +90,25 @@ TASK_KEY_ORDER = [
 
 
 def _notification_overrider(old, new):
-    return create_merge_factory(
-        merge_functions={
-            "on_start": lambda old, new: merge_list_of_dicts_by_key(
-                old or [], new or [], key="id"
-            ),
-            "on_success": lambda old, new: merge_list_of_dicts_by_key(
-                old or [], new or [], key="id"
-            ),
-            "on_failure": lambda old, new: merge_list_of_dicts_by_key(
-                old or [], new or [], key="id"
-            ),
-            "on_duration_warning_threshold_exceeded": lambda old, new: (
-                merge_list_of_dicts_by_key(old or [], new or [], key="id")
-            ),
-            "on_streaming_backlog_exceeded": lambda old, new: (
-                merge_list_of_dicts_by_key(old or [], new or [], key="id")
-            ),
-        },
-        key_order=[],
-    )(old or {}, new or {})
+    old = old or {}
+    new = new or {}
+    notifications = dict(old)
+    for event, destinations in new.items():
+        if isinstance(destinations, list):
+            notifications[event] = NOTIFICATION_DESTINATIONS(
+                old.get(event), destinations
+            )
+        elif destinations is not None:
+            notifications[event] = destinations
+    return notifications
 
 
 def _access_control_list_overrider(old: list[dict], new: list[dict]) -> list[dict]:
-    old = old or []
-    new = new or []
-    old_groups = [o for o in old if o.get("group_name")]
-    new_groups = [n for n in new if n.get("group_name")]
-    old_users = [o for o in old if o.get("user_name")]
-    new_users = [n for n in new if n.get("user_name")]
-    old_spns = [o for o in old if o.get("service_principal_name")]
-    new_spns = [n for n in new if n.get("service_principal_name")]
-    merged_groups = merge_list_of_dicts_by_key(old_groups, new_groups, key="group_name")
-    merged_users = merge_list_of_dicts_by_key(old_users, new_users, key="user_name")
-    merged_spns = merge_list_of_dicts_by_key(
-        old_spns, new_spns, key="service_principal_name"
-    )
-    return merged_groups + merged_users + merged_spns
+    return ACCESS_CONTROL_LIST(old, new)
 
 
 def _libraries_overrider(old: list[dict], new: list[dict]) -> list[dict]:
-    old = old or []
-    new = new or []
-    old_cran = [o for o in old if o.get("cran")]
-    new_cran = [n for n in new if n.get("cran")]
-    old_egg = [o for o in old if o.get("egg")]
-    new_egg = [n for n in new if n.get("egg")]
-    old_jar = [o for o in old if o.get("jar")]
-    new_jar = [n for n in new if n.get("jar")]
-    old_maven = [o for o in old if o.get("maven")]
-    new_maven = [n for n in new if n.get("maven")]
-    old_pypi = [o for o in old if o.get("pypi")]
-    new_pypi = [n for n in new if n.get("pypi")]
-    old_requirements = [o for o in old if o.get("requirements")]
-    new_requirements = [n for n in new if n.get("requirements")]
-    old_whl = [o for o in old if o.get("whl")]
-    new_whl = [n for n in new if n.get("whl")]
-    merged_cran = merge_list_of_dicts_by_key(old_cran, new_cran, key="package")
-    merged_egg = merge_list_of_dicts_by_key(old_egg, new_egg, key="egg")
-    merged_jar = merge_list_of_dicts_by_key(old_jar, new_jar, key="jar")
-    merged_maven = merge_list_of_dicts_by_key(old_maven, new_maven, key="coordinates")
-    merged_pypi = merge_list_of_dicts_by_key(old_pypi, new_pypi, key="package")
-    merged_requirements = merge_list_of_dicts_by_key(
-        old_requirements, new_requirements, key="requirements"
-    )
-    merged_whl = merge_list_of_dicts_by_key(old_whl, new_whl, key="whl")
-    return (
-        merged_cran
-        + merged_egg
-        + merged_jar
-        + merged_maven
-        + merged_pypi
-        + merged_requirements
-        + merged_whl
-    )
+    return LIBRARIES(old, new)
 
 
 _task_overrider = create_merge_factory(
@@ -178,17 +133,17 @@ _task_overrider = create_merge_factory(
 def _tasks_overrider(old: list[dict], new: list[dict], default_key: str) -> list[dict]:
     old = old or []
     new = new or []
-    tasks = {o.pop("task_key"): o for o in old if o.get("task_key")}
-    overrides = {n.pop("task_key"): n for n in new if n.get("task_key")}
+    tasks = {o["task_key"]: _without_task_key(o) for o in old if o.get("task_key")}
+    overrides = {n["task_key"]: _without_task_key(n) for n in new if n.get("task_key")}
     default_overrides = overrides.pop(default_key, {})
     all_task_keys = set(list(tasks.keys()) + list(overrides.keys()))
     overriden_tasks = []
     for task_key in all_task_keys:
-        if task_key == default_key or task_key.startswith("re:"):
+        if task_key == default_key or is_pattern_key(task_key):
             continue
         task = tasks.get(task_key, {})
         task_overrides = overrides.get(task_key, {})
-        regex_overrides = get_regex_values(task_key, overrides)
+        pattern_overrides = get_pattern_values(task_key, overrides)
         overriden_tasks.append(
             {
                 "task_key": task_key,
@@ -197,7 +152,7 @@ def _tasks_overrider(old: list[dict], new: list[dict], default_key: str) -> list
                     [
                         task,
                         default_overrides,
-                        regex_overrides,
+                        *pattern_overrides,
                         task_overrides,
                     ],
                 ),
@@ -206,9 +161,15 @@ def _tasks_overrider(old: list[dict], new: list[dict], default_key: str) -> list
     return sorted(overriden_tasks, key=lambda x: x.get("task_key", ""))
 
 
+def _without_task_key(task: dict) -> dict:
+    return {key: value for key, value in task.items() if key != "task_key"}
+
+
 class JobsResourceOverrider(AbstractResourceOverrider):
     """Override a Databricks jobs resource with the default key."""
 
+    copy_inputs = False
+
     def override(
         self,
         resource_key: str,
@@ -265,16 +226,73 @@ class JobsResourceOverrider(AbstractResourceOverrider):
             },
             key_order=JOB_KEY_ORDER,
         )
-        default_overrides = overrides.pop(default_key, {})
-        regex_overrides = get_regex_values(resource_key, overrides)
-        resource_overrides = overrides.pop(resource_key, {})
+        default_overrides = overrides.get(default_key, {})
+        pattern_overrides = get_pattern_values(resource_key, overrides)
+        resource_overrides = overrides.get(resource_key, {})
         overriden = reduce(
             overrider,
             [
                 resource,
                 default_overrides,
-                regex_overrides,
+                *pattern_overrides,
                 resource_overrides,
             ],
         )
         return overriden
+
+    def record_provenance(  # noqa: PLR0913
+        self,
+        provenance: Provenance,
+        resource_type: str,
+        resource_key: str,
+        resource: dict[str, Any],
+        overrides: dict[str, Any],
+        default_key: str = DEFAULT_CONFIG_KEY,
+    ) -> None:
+        """Record the layer setting every field, see `AbstractResourceOverrider`.
+
+        The layers are recorded in the order `override` merges them: the
+        generated job, the `default`, pattern and job overrides, where the
+        tasks of every layer are merged with their own `default`, pattern and
+        task overrides.
+        """
+        layers = [(GENERATED, resource)] + [
+            (f"resources.{resource_type}.{key}", overrides[key])
+            for key in [
+                default_key,
+                *get_pattern_keys(resource_key, overrides),
+                resource_key,
+            ]
+            if isinstance(overrides.get(key), dict)
+        ]
+        task_keys = {
+            task["task_key"]
+            for _, layer in layers
+            for task in layer.get("tasks") or []
+            if task.get("task_key")
+            and task["task_key"] != default_key
+            and not is_pattern_key(task["task_key"])
+        }
+        for source, layer in layers:
+            for field, value in layer.items():
+                if field != "tasks":
+                    provenance.record(source, value, field)
+            tasks = {
+                task["task_key"]: task
+                for task in layer.get("tasks") or []
+                if task.get("task_key")
+            }
+            for task_key in sorted(task_keys):
+                for key in [default_key, *get_pattern_keys(task_key, tasks), task_key]:
+                    if key not in tasks:
+                        continue
+                    task_source = (
+                        source if source == GENERATED else f"{source}.tasks[{key}]"
+                    )
+                    if key == task_key:
+                        provenance.record(
+                            task_source, task_key, f"tasks[{task_key}].task_key"
+                        )
+                    provenance.record(
+                        task_source, _without_task_key(tasks[key]), f"tasks[{task_key}]"
+                    )
@@ -0,0 +1,251 @@
+"""Deep overriders for the resource types other than jobs.
+
+Every overrider merges the generated resource with the `default` overrides,
+every matching `re:` and `glob:` override and the overrides of the resource
+itself, in that order, along the `MergePlan` of its resource type. Nested
+objects such as `spark_conf` or `configuration` are merged field by field, and
+lists such as `grants`, `permissions` or the `clusters` of a pipeline are
+merged by key, so a target only needs to state what it changes. Lists nested
+in a merged item, such as the `privileges` of a grant, replace the previous
+list:
+
+```yaml
+resources:
+  volumes:
+    default:
+      grants:
+        - principal: data-engineers
+          privileges: [READ_VOLUME, WRITE_VOLUME]
+    "glob:raw_*":
+      volume_type: EXTERNAL
+```
+"""
+
+from functools import reduce
+from typing import Any
+
+from kedro_databricks.constants import DEFAULT_CONFIG_KEY
+from kedro_databricks.utilities.common import get_pattern_keys
+from kedro_databricks.utilities.list_merger import (
+    ACCESS_CONTROL_LIST,
+    KindedListMerger,
+    field_key,
+    value_key,
+)
+from kedro_databricks.utilities.merge_plan import MergePlan
+from kedro_databricks.utilities.provenance import GENERATED, Provenance
+from kedro_databricks.utilities.resource_overrider.abstract_resource_overrider import (
+    AbstractResourceOverrider,
+)
+
+GRANTS = KindedListMerger({"principal": value_key}, concatenate_lists=False)
+"""Merger of Unity Catalog grants, by principal."""
+
+TAGS = KindedListMerger({"key": value_key}, concatenate_lists=False)
+"""Merger of lists of `key`/`value` tags, by key."""
+
+BY_NAME = KindedListMerger({"name": value_key}, concatenate_lists=False)
+"""Merger of lists of named items, such as served entities or app resources."""
+
+PIPELINE_CLUSTERS = KindedListMerger({"label": value_key}, concatenate_lists=False)
+"""Merger of the clusters of a pipeline, by label."""
+
+PIPELINE_LIBRARIES = KindedListMerger(
+    {
+        "notebook": field_key("path"),
+        "file": field_key("path"),
+        "glob": field_key("include"),
+        "jar": value_key,
+        "maven": field_key("coordinates"),
+        "whl": value_key,
+    },
+    concatenate_lists=False,
+)
+"""Merger of the libraries of a pipeline, by kind and path or package."""
+
+INIT_SCRIPTS = KindedListMerger(
+    {
+        kind: field_key("destination")
+        for kind in ["workspace", "volumes", "dbfs", "s3", "abfss", "gcs", "file"]
+    },
+    concatenate_lists=False,
+)
+"""Merger of the init scripts of a cluster, by kind and destination."""
+
+
+class KeyedResourceOverrider(AbstractResourceOverrider):
+    """Override a resource deeply, merging its lists by key.
+
+    Subclasses set the `merge_plan` of their resource type. Without one,
+    objects are merged field by field and lists are replaced.
+    """
+
+    copy_inputs = False
+
+    merge_plan = MergePlan()
+    """How the fields of the resource are merged with the overrides."""
+
+    def override(
+        self,
+        resource_key: str,
+        resource: dict[str, Any],
+        overrides: dict[str, Any],
+        default_key: str = DEFAULT_CONFIG_KEY,
+    ) -> dict[str, Any]:
+        """Override a resource with the default, pattern and own overrides.
+
+        Args:
+            resource_key (str): the key identifying the resource
+            resource (Dict): the generated resource
+            overrides (Dict): the overrides of the resource type
+            default_key (str): the key of the overrides applied to every resource
+
+        Raises:
+            ValueError: if the resource or overrides are not dictionaries
+
+        Returns:
+            Dict[str, Any]: the resource with the overrides applied
+        """
+        if not isinstance(resource, dict):
+            raise ValueError(f"resource must be a dictionary not {type(resource)}")
+        if not isinstance(overrides, dict):
+            raise ValueError(f"overrides must be a dictionary not {type(overrides)}")
+        layers = [
+            overrides.get(key)
+            for key in [
+                default_key,
+                *get_pattern_keys(resource_key, overrides),
+                resource_key,
+            ]
+        ]
+        return reduce(self.merge_plan.merge, layers, resource)
+
+    def record_provenance(  # noqa: PLR0913
+        self,
+        provenance: Provenance,
+        resource_type: str,
+        resource_key: str,
+        resource: dict[str, Any],
+        overrides: dict[str, Any],
+        default_key: str = DEFAULT_CONFIG_KEY,
+    ) -> None:
+        """Record the layer setting every field, see `AbstractResourceOverrider`.
+
+        The layers are recorded in the order `override` merges them, along the
+        same `merge_plan`.
+        """
+        self.merge_plan.record(provenance, GENERATED, resource)
+        for key in [
+            default_key,
+            *get_pattern_keys(resource_key, overrides),
+            resource_key,
+        ]:
+            self.merge_plan.record(
+                provenance, f"resources.{resource_type}.{key}", overrides.get(key)
+            )
+
+
+class VolumesResourceOverrider(KeyedResourceOverrider):
+    """Override a Unity Catalog volume, merging its grants by principal."""
+
+    merge_plan = MergePlan({"grants": GRANTS})
+
+
+class SchemasResourceOverrider(KeyedResourceOverrider):
+    """Override a Unity Catalog schema, merging its grants by principal."""
+
+    merge_plan = MergePlan({"grants": GRANTS})
+
+
+class RegisteredModelsResourceOverrider(KeyedResourceOverrider):
+    """Override a Unity Catalog model, merging its grants and aliases."""
+
+    merge_plan = MergePlan(
+        {
+            "grants": GRANTS,
+            "aliases": KindedListMerger(
+                {"alias_name": value_key}, concatenate_lists=False
+            ),
+        }
+    )
+
+
+class PipelinesResourceOverrider(KeyedResourceOverrider):
+    """Override a pipeline, merging its clusters, libraries and permissions."""
+
+    merge_plan = MergePlan(
+        {
+            "clusters": PIPELINE_CLUSTERS,
+            "libraries": PIPELINE_LIBRARIES,
+            "permissions": ACCESS_CONTROL_LIST,
+        }
+    )
+
+
+class ClustersResourceOverrider(KeyedResourceOverrider):
+    """Override a cluster, merging its init scripts and permissions."""
+
+    merge_plan = MergePlan(
+        {"init_scripts": INIT_SCRIPTS, "permissions": ACCESS_CONTROL_LIST}
+    )
+
+
+class ExperimentsResourceOverrider(KeyedResourceOverrider):
+    """Override an MLflow experiment, merging its tags and permissions."""
+
+    merge_plan = MergePlan({"tags": TAGS, "permissions": ACCESS_CONTROL_LIST})
+
+
+class ModelsResourceOverrider(KeyedResourceOverrider):
+    """Override an MLflow model, merging its tags and permissions."""
+
+    merge_plan = MergePlan({"tags": TAGS, "permissions": ACCESS_CONTROL_LIST})
+
+
+class ModelServingEndpointsResourceOverrider(KeyedResourceOverrider):
+    """Override a serving endpoint, merging its entities, routes and tags."""
+
+    merge_plan = MergePlan(
+        {
+            "config": {
+                "served_entities": BY_NAME,
+                "served_models": BY_NAME,
+                "traffic_config": {
+                    "routes": KindedListMerger(
+                        {"served_model_name": value_key}, concatenate_lists=False
+                    )
+                },
+            },
+            "tags": TAGS,
+            "permissions": ACCESS_CONTROL_LIST,
+        }
+    )
+
+
+class QualityMonitorsResourceOverrider(KeyedResourceOverrider):
+    """Override a quality monitor, merging its custom metrics by name."""
+
+    merge_plan = MergePlan({"custom_metrics": BY_NAME})
+
+
+class SqlWarehousesResourceOverrider(KeyedResourceOverrider):
+    """Override a SQL warehouse, merging its custom tags and permissions."""
+
+    merge_plan = MergePlan(
+        {"tags": {"custom_tags": TAGS}, "permissions": ACCESS_CONTROL_LIST}
+    )
+
+
+class AppsResourceOverrider(KeyedResourceOverrider):
+    """Override an app, merging its resources and permissions."""
+
+    merge_plan = MergePlan({"resources": BY_NAME, "permissions": ACCESS_CONTROL_LIST})
+
+
+class PermissionsResourceOverrider(KeyedResourceOverrider):
+    """Override a resource whose only list is its permissions.
+
+    Used for dashboards and secret scopes.
+    """
+
+    merge_plan = MergePlan({"permissions": ACCESS_CONTROL_LIST})
@@ -0,0 +1,310 @@
+"""Offline validation of the generated resources against the Jobs API.
+
+`databricks bundle validate` needs the Databricks CLI, authentication and
+network access, so a typo in an override is usually only found after a full
+bundle and deploy cycle. `validate_resources` checks the jobs against a subset
+of the Jobs API 2.2 schema shipped with the plugin in `schemas/jobs.json`, and
+reports every offending field with its path:
+
+```
+jobs.my_job.tasks[3].depends_on[0]: missing required field 'task_key'
+jobs.my_job.tasks[3].max_retries: expected an integer, got 'three'
+```
+
+The schema is compiled once into nested validation functions, so validating
+even very large bundles takes milliseconds. Only the JSON schema keywords used
+by the vendored schema are supported: `type`, `properties`, `required`,
+`additionalProperties`, `items`, `enum` and local `$ref`s.
+
+Values are accepted where the Databricks CLI would convert them: any scalar for
+a string, strings of digits for integers, and `true`/`false` for booleans.
+Nulls and strings holding a `${...}` substitution are accepted for any type, as
+the CLI drops the former and resolves the latter. Fields that are not in the
+schema are reported as warnings rather than errors, since the schema only covers
+part of the API.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+SCHEMA_FILE = "jobs.json"
+"""Name of the vendored Jobs API schema, in the `schemas` folder of the package."""
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """A field of a resource that does not match the schema."""
+
+    path: str
+    """Path of the field, e.g. `jobs.my_job.tasks[0].task_key`."""
+    message: str
+    error: bool = True
+    """Whether the field is invalid, or only unknown to the schema."""
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+_Path = tuple[Any, str | int] | str
+"""Path of a value, as its parent path and key, or the name of a resource.
+
+Paths are only formatted for the values that have an issue, so that valid
+values cost no string formatting.
+"""
+
+_Validator = Callable[[Any, _Path, "str | int | None", list[ValidationIssue]], None]
+"""Validate a value, given its parent path, its key and the issues found so far."""
+
+
+def validate_resources(resources: dict[str, dict[str, Any]]) -> list[ValidationIssue]:
+    """Validate the jobs of the resources against the vendored Jobs API schema.
+
+    Besides the schema, the tasks of every job must have unique task keys, and
+    may only depend on tasks of the same job. Other resource types are not
+    validated.
+
+    Args:
+        resources (dict[str, dict[str, Any]]): the resources by type and name
+
+    Returns:
+        list[ValidationIssue]: the invalid and unknown fields, in document order
+    """
+    validate_job = _job_validator()
+    issues: list[ValidationIssue] = []
+    for name, job in resources.get("jobs", {}).items():
+        path = f"jobs.{name}"
+        validate_job(job, path, None, issues)
+        if isinstance(job, dict) and isinstance(job.get("tasks"), list):
+            _validate_dependencies(job["tasks"], path, issues)
+    return issues
+
+
+def _validate_dependencies(
+    tasks: list[Any], path: str, issues: list[ValidationIssue]
+) -> None:
+    task_keys = set()
+    for i, task in enumerate(tasks):
+        if not isinstance(task, dict) or "task_key" not in task:
+            continue
+        if task["task_key"] in task_keys:
+            issues.append(
+                ValidationIssue(
+                    f"{path}.tasks[{i}].task_key",
+                    f"duplicate task key '{task['task_key']}'",
+                )
+            )
+        task_keys.add(task["task_key"])
+    for i, task in enumerate(tasks):
+        if not isinstance(task, dict) or not isinstance(task.get("depends_on"), list):
+            continue
+        for j, dependency in enumerate(task["depends_on"]):
+            if not isinstance(dependency, dict):
+                continue
+            task_key = dependency.get("task_key")
+            if task_key is not None and task_key not in task_keys:
+                issues.append(
+                    ValidationIssue(
+                        f"{path}.tasks[{i}].depends_on[{j}].task_key",
+                        f"depends on unknown task '{task_key}'",
+                    )
+                )
+
+
+@cache
+def _job_validator() -> _Validator:
+    from importlib import resources  # noqa: PLC0415
+
+    schema_file = (
+        resources.files("kedro_databricks").joinpath("schemas").joinpath(SCHEMA_FILE)
+    )
+    schema = json.loads(schema_file.read_text())
+    return compile_schema(schema, schema.get("$defs", {}))
+
+
+def compile_schema(schema: dict[str, Any], defs: dict[str, Any]) -> _Validator:
+    """Compile a JSON schema into a function validating values against it.
+
+    The function is called with the value, the path of its parent, its key in
+    the parent (or `None` for the root) and the list to which it appends the
+    issues found.
+
+    Args:
+        schema (dict[str, Any]): the schema
+        defs (dict[str, Any]): the definitions `$ref`s may point to
+
+    Returns:
+        Callable: the validator
+    """
+    compiled: dict[str, _Validator] = {}
+
+    def _ref(name: str) -> _Validator:
+        # Looked up when called, so that definitions can refer to themselves.
+        def validate(value, parent, key, issues) -> None:
+            compiled[name](value, parent, key, issues)
+
+        return validate
+
+    def _compile(schema: dict[str, Any]) -> _Validator:
+        if "$ref" in schema:
+            return _ref(schema["$ref"].rsplit("/", 1)[-1])
+        schema_type = schema.get("type")
+        if schema_type == "object":
+            return _compile_object(schema, _compile)
+        if schema_type == "array":
+            return _compile_array(schema, _compile)
+        if schema_type in _SCALAR_CHECKS:
+            return _compile_scalar(schema_type, schema.get("enum"))
+        return _accept
+
+    for name, definition in defs.items():
+        compiled[name] = _compile(definition)
+    return _compile(schema)
+
+
+def _compile_object(
+    schema: dict[str, Any], compile_: Callable[[dict[str, Any]], _Validator]
+) -> _Validator:
+    properties = {
+        name: compile_(value) for name, value in schema.get("properties", {}).items()
+    }
+    required = schema.get("required", [])
+    additional = schema.get("additionalProperties", True)
+    validate_additional = compile_(additional) if isinstance(additional, dict) else None
+
+    def validate(value, parent, key, issues) -> None:
+        if value.__class__ is not dict:
+            if not _is_unset(value):
+                issues.append(
+                    _issue(parent, key, f"expected an object, got {_describe(value)}")
+                )
+            return
+        path = parent if key is None else (parent, key)
+        for name in required:
+            if name not in value:
+                issues.append(_issue(parent, key, f"missing required field '{name}'"))
+        for name, item in value.items():
+            validate_property = properties.get(name)
+            if validate_property is not None:
+                validate_property(item, path, name, issues)
+            elif validate_additional is not None:
+                validate_additional(item, path, name, issues)
+            elif additional is False:
+                issues.append(
+                    _issue(path, name, _unknown_field(name, properties), error=False)
+                )
+
+    return validate
+
+
+def _compile_array(
+    schema: dict[str, Any], compile_: Callable[[dict[str, Any]], _Validator]
+) -> _Validator:
+    validate_item = compile_(schema.get("items", {}))
+
+    def validate(value, parent, key, issues) -> None:
+        if value.__class__ is not list:
+            if not _is_unset(value):
+                issues.append(
+                    _issue(parent, key, f"expected a list, got {_describe(value)}")
+                )
+            return
+        path = parent if key is None else (parent, key)
+        for i, item in enumerate(value):
+            validate_item(item, path, i, issues)
+
+    return validate
+
+
+def _compile_scalar(schema_type: str, enum: list[str] | None) -> _Validator:
+    check, expected = _SCALAR_CHECKS[schema_type]
+    allowed = None if enum is None else set(enum)
+
+    def validate(value, parent, key, issues) -> None:
+        if not check(value):
+            if not _is_unset(value):
+                issues.append(
+                    _issue(parent, key, f"expected {expected}, got {_describe(value)}")
+                )
+        elif allowed is not None and str(value) not in allowed and not _is_unset(value):
+            issues.append(
+                _issue(
+                    parent,
+                    key,
+                    f"invalid value {value!r}, expected one of {', '.join(enum)}",  # type: ignore,
+                )
+            )
+
+    return validate
+
+
+def _accept(value, parent, key, issues) -> None:
+    return None
+
+
+def _is_string(value: Any) -> bool:
+    return value.__class__ is str or isinstance(value, (str, int, float, bool))
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lstrip("-").isdigit()
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    if isinstance(value, str):
+        try:
+            float(value)
+        except ValueError:
+            return False
+        return True
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool) or value in ("true", "false")
+
+
+_SCALAR_CHECKS: dict[str, tuple[Callable[[Any], bool], str]] = {
+    "string": (_is_string, "a string"),
+    "integer": (_is_integer, "an integer"),
+    "number": (_is_number, "a number"),
+    "boolean": (_is_boolean, "a boolean"),
+}
+
+
+def _is_unset(value: Any) -> bool:
+    # Null values are dropped, and substitutions resolved, by the Databricks CLI.
+    return value is None or (isinstance(value, str) and "${" in value)
+
+
+def _issue(parent: _Path, key: str | int | None, message: str, error: bool = True):
+    parts = []
+    while key is not None:
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+        parent, key = parent if isinstance(parent, tuple) else (parent, None)
+    return ValidationIssue(parent + "".join(reversed(parts)), message, error)
+
+
+def _describe(value: Any) -> str:
+    if isinstance(value, dict):
+        return "an object"
+    if isinstance(value, list):
+        return "a list"
+    if value is None:
+        return "null"
+    return repr(value)
+
+
+def _unknown_field(name: str, properties: dict[str, Any]) -> str:
+    message = f"unknown field '{name}'"
+    matches = difflib.get_close_matches(name, properties, n=1)
+    if matches:
+        message += f", did you mean '{matches[0]}'?"
+    return message
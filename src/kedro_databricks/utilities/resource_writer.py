@@ -0,0 +1,303 @@
+"""Write the generated resources to the `resources/` folder of the project.
+
+The resources of an environment can be laid out in three ways:
+
+- `per-job` (default): one file per resource, named
+  `target.<env>.<resource-type>.<resource-name>.yml`;
+- `single`: all resources in `target.<env>.yml`;
+- `sharded`: the resources spread over `target.<env>.shard-<i>.yml`, where the
+  shard of a resource is derived from a stable hash of its name, so that a
+  resource stays in the same shard as other resources are added or removed.
+
+Projects with many pipelines produce hundreds of small files in the `per-job`
+layout, which the Databricks CLI has to discover and parse on every `validate`
+and `deploy`. The other layouts trade this for fewer, larger files.
+
+Within a file, resource types and names are sorted, so the output does not
+depend on the order in which the resources were generated. The files written
+for an environment are recorded in the `resources.<env>` state of the plugin.
+With `overwrite`, recorded files of another layout left over for the same
+environment are removed. Files the plugin did not write, or any file without
+`overwrite`, are never removed.
+
+Files are written as block style YAML, using the libyaml emitter when PyYAML
+is built with it, or as compact JSON. As JSON is a subset of YAML, the JSON
+files keep the `.yml` extension and are included by the bundle as before, but
+they are written several times faster and are smaller.
+
+After the `default` overrides are applied, the tasks of a job repeat the same
+blocks, such as `libraries`, `health` or `email_notifications`. With
+`yaml_anchors`, identical blocks are written once with a YAML anchor and
+referenced with an alias everywhere else.
+"""
+
+from __future__ import annotations
+
+import filecmp
+import json
+import os
+import re
+import zlib
+from pathlib import Path
+from typing import Any
+
+import yaml
+from kedro.framework.startup import ProjectMetadata
+
+from kedro_databricks.utilities.fingerprint import read_state, write_state
+from kedro_databricks.utilities.logger import get_logger
+
+log = get_logger("bundle")
+
+OUTPUT_LAYOUTS = ["per-job", "single", "sharded"]
+"""Supported layouts of the generated resource files."""
+
+DEFAULT_OUTPUT_LAYOUT = "per-job"
+"""Default layout of the generated resource files."""
+
+DEFAULT_SHARDS = 8
+"""Default number of files in the `sharded` layout."""
+
+OUTPUT_FORMATS = ["yaml", "json"]
+"""Supported formats of the generated resource files."""
+
+DEFAULT_OUTPUT_FORMAT = "yaml"
+"""Default format of the generated resource files."""
+
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+"""Fastest available YAML dumper, the libyaml based one if PyYAML was built with it."""
+
+
+class _NoAliasDumper(_YAML_DUMPER):  # type: ignore[misc, valid-type]
+    """YAML dumper writing objects referenced more than once in full.
+
+    The resources may share nested values with the overrides they were built
+    from, which PyYAML would otherwise write as anchors and aliases.
+    """
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+def save_resources(  # noqa: PLR0913
+    metadata: ProjectMetadata,
+    env: str,
+    resources: dict[str, dict[str, Any]],
+    overwrite: bool,
+    layout: str = DEFAULT_OUTPUT_LAYOUT,
+    shards: int = DEFAULT_SHARDS,
+    output_format: str = DEFAULT_OUTPUT_FORMAT,
+    yaml_anchors: bool = False,
+) -> list[Path]:
+    """Save the given resources to the project directory.
+
+    Files whose content would not change are left untouched, so that tools
+    watching `resources/` only see the resources that were actually modified.
+    Existing files are only replaced, and files of another layout written by a
+    previous run only removed, with `overwrite`.
+
+    Args:
+        metadata (ProjectMetadata): The metadata of the project
+        env (str): The kedro environment
+        resources (dict[str, dict[str, Any]]): The resources to save
+        overwrite (bool): Whether to overwrite existing resources
+        layout (str): One of `OUTPUT_LAYOUTS`
+        shards (int): The number of files in the `sharded` layout
+        output_format (str): One of `OUTPUT_FORMATS`
+        yaml_anchors (bool): Whether to write repeated blocks once, and refer
+            to them with YAML aliases
+
+    Raises:
+        ValueError: if the layout, the number of shards or the format is
+            invalid, or if YAML anchors are requested for JSON
+
+    Returns:
+        list[Path]: The files that were written
+    """
+    if layout not in OUTPUT_LAYOUTS:
+        raise ValueError(
+            f"Invalid output layout '{layout}', expected one of {OUTPUT_LAYOUTS}."
+        )
+    if shards < 1:
+        raise ValueError(f"The number of shards must be positive, got {shards}.")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Invalid output format '{output_format}', expected one of {OUTPUT_FORMATS}."
+        )
+    if yaml_anchors and output_format != "yaml":
+        raise ValueError("YAML anchors can only be used with the 'yaml' format.")
+    resources_dir = metadata.project_path / "resources"
+    resources_dir.mkdir(exist_ok=True, parents=True)
+    files = _layout_files(env, resources, layout, shards)
+    state_name = f"resources.{env}"
+    recorded = set(read_state(metadata.project_path, state_name).get("files", []))
+    written = []
+    for file_name, file_resources in files.items():
+        file_path = resources_dir / file_name
+        data = {"targets": {env: {"resources": file_resources}}}
+        if yaml_anchors:
+            data = share_identical(data)
+        if _write(metadata, file_path, data, overwrite, output_format, yaml_anchors):
+            written.append(file_path)
+        if overwrite or file_path in written:
+            recorded.add(file_name)
+    if overwrite:
+        recorded -= _remove_stale_files(metadata, env, recorded, set(files), layout)
+    write_state(metadata.project_path, state_name, {"files": sorted(recorded)})
+    return written
+
+
+def _layout_files(
+    env: str, resources: dict[str, dict[str, Any]], layout: str, shards: int
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Assign the resources to the files of the given layout."""
+    files: dict[str, dict[str, dict[str, Any]]] = {}
+    for resource_type in sorted(resources):
+        items = resources[resource_type]
+        for resource_name in sorted(items):
+            if layout == "per-job":
+                file_name = f"target.{env}.{resource_type}.{resource_name}.yml"
+            elif layout == "single":
+                file_name = f"target.{env}.yml"
+            else:
+                shard = zlib.crc32(f"{resource_type}.{resource_name}".encode()) % shards
+                file_name = f"target.{env}.shard-{shard}.yml"
+            file_resources = files.setdefault(file_name, {})
+            file_resources.setdefault(resource_type, {})[resource_name] = items[
+                resource_name
+            ]
+    return dict(sorted(files.items()))
+
+
+def _write(
+    metadata: ProjectMetadata,
+    file_path: Path,
+    data: dict[str, Any],
+    overwrite: bool,
+    output_format: str,
+    yaml_anchors: bool = False,
+) -> bool:
+    """Write the data to a file, returning whether the file was written.
+
+    The data is streamed to a temporary file next to `file_path`, which then
+    replaces `file_path` unless both have the same content.
+    """
+    relative_path = file_path.relative_to(metadata.project_path)
+    exists = file_path.exists()
+    if exists and not overwrite:
+        log.warning(f"{relative_path} already exists. Use --overwrite to replace.")
+        return False
+
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            _dump(data, f, output_format, yaml_anchors)
+        if exists and filecmp.cmp(tmp_path, file_path, shallow=False):
+            log.debug(f"{relative_path} is unchanged")
+            return False
+        os.replace(tmp_path, file_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    if exists:
+        log.info(f"Overwrote {relative_path}")
+    else:
+        log.info(f"Wrote {relative_path}")
+    return True
+
+
+def _dump(
+    data: dict[str, Any], stream, output_format: str, yaml_anchors: bool = False
+) -> None:
+    if output_format == "json":
+        for chunk in json.JSONEncoder(separators=(",", ":")).iterencode(data):
+            stream.write(chunk)
+        stream.write("\n")
+        return
+    yaml.dump(
+        data,
+        stream,
+        Dumper=_YAML_DUMPER if yaml_anchors else _NoAliasDumper,
+        default_flow_style=False,
+        indent=4,
+        sort_keys=False,
+    )
+
+
+def share_identical(data: Any) -> Any:
+    """Replace identical dicts and lists with a single shared instance.
+
+    PyYAML writes an object referenced more than once as an anchor followed by
+    aliases. Containers with fewer than two items are not shared, as an alias
+    would not be shorter than the container itself. The input is not modified.
+
+    Args:
+        data (Any): the data to deduplicate
+
+    Returns:
+        Any: a copy of the data, where identical containers are the same object
+    """
+    shared: dict[tuple, Any] = {}
+
+    def _share(obj: Any) -> tuple[Any, Any]:
+        # Returns the shared object and a hashable key identifying its content.
+        # The key of a container refers to its shared children by id, which is
+        # unique as long as `shared` holds on to them, so keys stay shallow and
+        # cheap to hash.
+        if isinstance(obj, dict):
+            new: Any = {}
+            keys = []
+            for key, value in obj.items():
+                new[key], value_key = _share(value)
+                keys.append((key, value_key))
+            content_key: tuple = ("dict", tuple(keys))
+        elif isinstance(obj, list):
+            new = []
+            keys = []
+            for value in obj:
+                shared_value, value_key = _share(value)
+                new.append(shared_value)
+                keys.append(value_key)
+            content_key = ("list", tuple(keys))
+        else:
+            return obj, (type(obj), obj)
+        if len(new) < 2:  # noqa: PLR2004
+            # Not shared itself, but its content still identifies its parents.
+            return new, content_key
+        new = shared.setdefault(content_key, new)
+        return new, ("shared", id(new))
+
+    return _share(data)[0]
+
+
+def _remove_stale_files(
+    metadata: ProjectMetadata,
+    env: str,
+    recorded: set[str],
+    keep: set[str],
+    layout: str,
+) -> set[str]:
+    """Remove the files of the other layouts written for the given environment.
+
+    Args:
+        metadata (ProjectMetadata): The metadata of the project
+        env (str): The kedro environment
+        recorded (set[str]): The names of the files the plugin wrote for `env`
+        keep (set[str]): The names of the files of this run
+        layout (str): The layout of this run. Files of the `per-job` layout are
+            never removed in that layout, as they may belong to pipelines that
+            were not part of this run.
+
+    Returns:
+        set[str]: The names of the files that are gone
+    """
+    per_job = re.compile(rf"target\.{re.escape(env)}\.[^.]+\..+\.yml")
+    removed = set()
+    for name in sorted(recorded - keep):
+        if layout == DEFAULT_OUTPUT_LAYOUT and per_job.fullmatch(name):
+            continue
+        file_path = metadata.project_path / "resources" / name
+        if file_path.exists():
+            log.info(f"Removed {file_path.relative_to(metadata.project_path)}")
+            file_path.unlink()
+        removed.add(name)
+    return removed
@@ -0,0 +1,308 @@
+"""Run external commands with bounded memory usage.
+
+Commands such as `databricks bundle deploy` or `databricks bundle run` can
+produce a lot of output. Instead of keeping every line in memory, `run_command`
+streams the output of a command as it arrives, keeps only the last lines in a
+ring buffer and writes the complete output to a spill file on disk. The spill
+file is only read back when the full output is needed, e.g. to report an error
+or to parse the JSON output of a command.
+
+The runner is based on `asyncio`, which lets it enforce a timeout and react to a
+cancellation request without blocking on the output of the command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TextIO
+
+from kedro_databricks.utilities.logger import get_logger
+
+log = get_logger("subprocess_runner")
+
+TAIL_LINES = 200
+"""Number of output lines kept in memory for each command."""
+
+MAX_LINE_LENGTH = 64 * 1024
+"""Number of characters after which a line without a line break is flushed."""
+
+TERMINATE_GRACE_PERIOD = 5.0
+"""Seconds to wait for a command to exit after terminating it, before killing it."""
+
+_READ_SIZE = 64 * 1024
+_CANCEL_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class CommandResult:
+    """Result of a command run with `run_command`.
+
+    The result can be used as a context manager, which removes the spill file on
+    exit unless an exception was raised. This keeps the full output around for
+    inspection when a command fails.
+
+    Attributes:
+        args (list[str]): The command that was run
+        returncode (int): The exit code of the command
+        tail (list[str]): The last lines of the output, including line breaks
+        output_path (Path | None): The spill file holding the complete output
+        timed_out (bool): Whether the command was stopped because of a timeout
+        cancelled (bool): Whether the command was stopped because it was cancelled
+    """
+
+    args: list[str]
+    returncode: int
+    tail: list[str] = field(default_factory=list)
+    output_path: Path | None = None
+    timed_out: bool = False
+    cancelled: bool = False
+
+    def __enter__(self) -> CommandResult:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.cleanup()
+
+    def iter_lines(self) -> Iterator[str]:
+        """Iterate over the complete output of the command, one line at a time.
+
+        Yields:
+            str: a line of output, including its line break
+        """
+        if self.output_path is None or not self.output_path.exists():
+            yield from self.tail
+            return
+        with open(
+            self.output_path, encoding="utf-8", errors="replace", newline=""
+        ) as f:
+            yield from f
+
+    def read_output(self) -> str:
+        """Read the complete output of the command.
+
+        Returns:
+            str: the output of the command
+        """
+        return "".join(self.iter_lines())
+
+    def includes(self, text: str) -> bool:
+        """Check whether the output of the command includes the given text.
+
+        The ring buffer is checked first, and the spill file is only scanned if
+        the text is not found there. The text must not span multiple lines.
+
+        Args:
+            text (str): The text to look for
+
+        Returns:
+            bool: whether any line of output includes the text
+        """
+        if any(text in line for line in self.tail):
+            return True
+        return any(text in line for line in self.iter_lines())
+
+    def cleanup(self) -> None:
+        """Remove the spill file."""
+        if self.output_path is not None:
+            self.output_path.unlink(missing_ok=True)
+            self.output_path = None
+
+
+def run_command(
+    command: list[str],
+    cwd: Path | str | None = None,
+    stream: TextIO | None = None,
+    silent: bool = False,
+    timestamps: bool = False,
+    timeout: float | None = None,
+    cancel_event: threading.Event | None = None,
+    tail_lines: int = TAIL_LINES,
+    env: dict[str, str] | None = None,
+) -> CommandResult:
+    """Run a command, streaming its output while keeping memory usage bounded.
+
+    Standard error is merged into standard output, as the Databricks CLI reports
+    progress on standard error.
+
+    Args:
+        command (list[str]): The command to run
+        cwd (Path | str | None): The working directory of the command
+        stream (TextIO | None): Where to write the live output, defaults to stdout
+        silent (bool): Whether to suppress the live output
+        timestamps (bool): Whether to prefix each line of live output with a timestamp
+        timeout (float | None): Seconds after which the command is stopped
+        cancel_event (threading.Event | None): Event that stops the command when set
+        tail_lines (int): Number of output lines to keep in memory
+        env (dict[str, str] | None): Environment variables of the command
+
+    Raises:
+        FileNotFoundError: if the executable of the command does not exist
+
+    Returns:
+        CommandResult: The result of the command
+    """
+    fd, spill_path = tempfile.mkstemp(prefix="kedro-databricks-", suffix=".log")
+    os.close(fd)
+    runner = _CommandRunner(
+        command=command,
+        spill_path=Path(spill_path),
+        stream=stream,
+        silent=silent,
+        timestamps=timestamps,
+        tail_lines=tail_lines,
+    )
+    try:
+        return asyncio.run(
+            runner.run(cwd=cwd, env=env, timeout=timeout, cancel_event=cancel_event)
+        )
+    except BaseException:
+        Path(spill_path).unlink(missing_ok=True)
+        raise
+
+
+class _CommandRunner:
+    def __init__(
+        self,
+        command: list[str],
+        spill_path: Path,
+        stream: TextIO | None,
+        silent: bool,
+        timestamps: bool,
+        tail_lines: int,
+    ):
+        self.command = [str(arg) for arg in command]
+        self.spill_path = spill_path
+        self.stream = stream
+        self.silent = silent
+        self.timestamps = timestamps
+        self.tail: deque[str] = deque(maxlen=tail_lines)
+        self._line_start = True
+
+    async def run(
+        self,
+        cwd: Path | str | None,
+        env: dict[str, str] | None,
+        timeout: float | None,
+        cancel_event: threading.Event | None,
+    ) -> CommandResult:
+        process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            cwd=cwd,
+            env=env,
+        )
+        reader = asyncio.create_task(self._pump(process))
+        timed_out = cancelled = False
+        try:
+            stop = await self._wait(reader, timeout, cancel_event)
+            if stop == "timeout":
+                timed_out = True
+                log.warning(f"Command timed out after {timeout}s: {self.command[:3]}")
+            elif stop == "cancel":
+                cancelled = True
+                log.warning(f"Command cancelled: {self.command[:3]}")
+            if stop is not None:
+                await _stop_process(process)
+                # Child processes of the command may keep the pipe open.
+                await asyncio.wait({reader}, timeout=TERMINATE_GRACE_PERIOD)
+                reader.cancel()
+            else:
+                await reader
+            returncode = await process.wait()
+        except asyncio.CancelledError:
+            reader.cancel()
+            await _stop_process(process)
+            raise
+        return CommandResult(
+            args=self.command,
+            returncode=returncode,
+            tail=list(self.tail),
+            output_path=self.spill_path,
+            timed_out=timed_out,
+            cancelled=cancelled,
+        )
+
+    async def _wait(
+        self,
+        reader: asyncio.Task,
+        timeout: float | None,
+        cancel_event: threading.Event | None,
+    ) -> str | None:
+        """Wait for the output to end, returning why the command must be stopped."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait_for = _CANCEL_POLL_INTERVAL if cancel_event is not None else None
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0)
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+            done, _ = await asyncio.wait({reader}, timeout=wait_for)
+            if done:
+                return None
+            if cancel_event is not None and cancel_event.is_set():
+                return "cancel"
+            if deadline is not None and time.monotonic() >= deadline:
+                return "timeout"
+
+    async def _pump(self, process: asyncio.subprocess.Process) -> None:
+        """Copy the output of the process to the spill file, ring buffer and stream."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        with open(self.spill_path, "w", encoding="utf-8", newline="") as spill:
+            while chunk := await process.stdout.read(_READ_SIZE):  # type: ignore - we know it's there
+                text = decoder.decode(chunk)
+                spill.write(text)
+                # Partial lines are written right away, as they may be prompts.
+                self._write(text)
+                lines = (pending + text).splitlines(keepends=True)
+                pending = ""
+                if lines and not lines[-1].endswith(("\n", "\r")):
+                    pending = lines.pop()
+                    if len(pending) >= MAX_LINE_LENGTH:
+                        lines.append(pending)
+                        pending = ""
+                self.tail.extend(lines)
+            text = decoder.decode(b"", final=True)
+            spill.write(text)
+            self._write(text)
+            if pending + text:
+                self.tail.append(pending + text)
+
+    def _write(self, text: str) -> None:
+        if self.silent or not text:
+            return
+        if self.timestamps:
+            now = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            parts = []
+            for part in text.splitlines(keepends=True):
+                if self._line_start:
+                    parts.append(f"[{now}] ")
+                parts.append(part)
+                self._line_start = part.endswith(("\n", "\r"))
+            text = "".join(parts)
+        print(text, end="", file=self.stream, flush=True)  # noqa: T201
+
+
+async def _stop_process(process: asyncio.subprocess.Process) -> None:
+    """Terminate the process, killing it if it does not exit in time."""
+    if process.returncode is not None:
+        return
+    try:
+        process.terminate()
+        await asyncio.wait_for(process.wait(), TERMINATE_GRACE_PERIOD)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+    except ProcessLookupError:
+        pass
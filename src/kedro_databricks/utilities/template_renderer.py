@@ -0,0 +1,160 @@
+"""Render the `databricks.yml` template without the Databricks CLI.
+
+`databricks bundle init` renders Go templates. The template shipped with the
+plugin only uses a small subset of that language, which this module implements:
+
+- `{{ .name }}` inserts a template parameter;
+- `{{ name }}` inserts the value of a helper, such as `workspace_host`;
+- `{{ if cond }}`, `{{ if not cond }}`, `{{ else }}` and `{{ end }}`;
+- `{{-` and `-}}` trim the whitespace before and after the action.
+
+Anything else raises a `ValueError`, so that a template using more of the
+language fails loudly instead of being rendered incorrectly.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+_ACTION = re.compile(r"\{\{(-?)\s*(.*?)\s*(-?)\}\}", re.DOTALL)
+_UUID = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
+
+@dataclass
+class _If:
+    condition: str
+    then: list = field(default_factory=list)
+    otherwise: list = field(default_factory=list)
+
+
+def render_template(template: str, values: dict[str, Any]) -> str:
+    """Render a Go template using the supported subset of the language.
+
+    Args:
+        template (str): the template
+        values (dict[str, Any]): the template parameters and helpers, both
+            looked up by name
+
+    Raises:
+        ValueError: if the template uses unsupported syntax or unknown names
+
+    Returns:
+        str: the rendered template
+    """
+    return "".join(_render(_parse(template), values))
+
+
+def is_service_principal(user_name: str) -> bool:
+    """Whether the user name is the application id of a service principal.
+
+    Args:
+        user_name (str): the user name
+
+    Returns:
+        bool: whether the user name is a UUID, like service principal names
+    """
+    return bool(_UUID.fullmatch(user_name))
+
+
+def short_user_name(user_name: str) -> str:
+    """Derive the short name Databricks uses for a user.
+
+    The short name of a service principal is derived from its display name,
+    which is not known from its application id, so it cannot be derived here.
+
+    Args:
+        user_name (str): the user name, usually an email address
+
+    Raises:
+        ValueError: if the user name is the application id of a service principal
+
+    Returns:
+        str: the part before `@`, lowercased, with characters other than
+            letters, digits and underscores replaced by underscores
+    """
+    if is_service_principal(user_name):
+        raise ValueError(
+            f"The short name of service principal '{user_name}' depends on its "
+            "display name and cannot be derived from its application id."
+        )
+    local = user_name.split("@", 1)[0]
+    return re.sub(r"[^a-z0-9_]", "_", local.lower())
+
+
+def _parse(template: str) -> list:
+    """Parse the template into a tree of text, expressions and `_If` blocks."""
+    root: list = []
+    # Each entry is the list that new nodes are appended to, with the `_If`
+    # it belongs to, if any.
+    stack: list[tuple[list, _If | None]] = [(root, None)]
+    for piece in _split(template):
+        nodes, block = stack[-1]
+        if not isinstance(piece, re.Match):
+            if piece:
+                nodes.append(piece)
+            continue
+        action = piece.group(2)
+        keyword, _, rest = action.partition(" ")
+        if keyword == "if":
+            block = _If(rest.strip())
+            nodes.append(block)
+            stack.append((block.then, block))
+        elif keyword == "else":
+            if block is None or nodes is block.otherwise:
+                raise ValueError("Unexpected `else` in template")
+            stack[-1] = (block.otherwise, block)
+        elif keyword == "end":
+            if block is None:
+                raise ValueError("Unexpected `end` in template")
+            stack.pop()
+        else:
+            nodes.append(("expr", action))
+    if len(stack) > 1:
+        raise ValueError("Unclosed `if` in template")
+    return root
+
+
+def _split(template: str) -> list[str | re.Match]:
+    """Split the template into text and actions, applying the trim markers."""
+    pieces: list = []
+    position = 0
+    for match in _ACTION.finditer(template):
+        pieces.append(template[position : match.start()])
+        pieces.append(match)
+        position = match.end()
+    pieces.append(template[position:])
+    for i, piece in enumerate(pieces):
+        if isinstance(piece, re.Match):
+            if piece.group(1):
+                pieces[i - 1] = pieces[i - 1].rstrip()
+            if piece.group(3):
+                pieces[i + 1] = pieces[i + 1].lstrip()
+    return pieces
+
+
+def _render(nodes: list, values: dict[str, Any]):
+    for node in nodes:
+        if isinstance(node, str):
+            yield node
+        elif isinstance(node, _If):
+            branch = node.then if _evaluate(node.condition, values) else node.otherwise
+            yield from _render(branch, values)
+        else:
+            yield str(_evaluate(node[1], values))
+
+
+def _evaluate(expression: str, values: dict[str, Any]) -> Any:
+    expression = expression.strip()
+    if expression.startswith("not "):
+        return not _evaluate(expression[4:], values)
+    name = expression.removeprefix(".")
+    if not re.fullmatch(r"\w+", name):
+        raise ValueError(f"Unsupported template expression '{expression}'")
+    if name not in values:
+        raise ValueError(f"Unknown template value '{name}'")
+    value = values[name]
+    return value() if callable(value) else value
@@ -0,0 +1,131 @@
+"""Cached builds of the project wheel.
+
+`kedro package` rebuilds the project wheel from scratch on every call. The
+functions in this module fingerprint the inputs of the wheel (the `src` tree and
+the packaging metadata) and keep the resulting wheels in a cache folder under
+`.databricks/kedro-databricks/wheels/<fingerprint>`. When the fingerprint of the
+project matches a cached build, the cached wheel is copied to `dist/` instead of
+building it again.
+
+The cache lives outside of `dist/` on purpose, as `dist/` may be cleaned up by
+other tools, e.g. the Databricks CLI before it builds a bundle artifact.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from kedro_databricks.constants import STATE_DIR
+from kedro_databricks.utilities.fingerprint import collect_files, hash_files
+from kedro_databricks.utilities.logger import get_logger
+
+log = get_logger("wheel_cache")
+
+WHEEL_INPUTS = ["pyproject.toml", "setup.cfg", "setup.py", "README.md", "src/**/*"]
+"""Glob patterns, relative to the project root, of the files that make up the wheel."""
+
+MAX_CACHED_WHEELS = 3
+"""Number of cached builds to keep before the oldest ones are removed."""
+
+
+def get_wheel_fingerprint(project_path: Path) -> str:
+    """Fingerprint the inputs of the project wheel.
+
+    Args:
+        project_path (Path): root of the Kedro project
+
+    Returns:
+        str: hex digest of the wheel inputs
+    """
+    return hash_files(project_path, collect_files(project_path, WHEEL_INPUTS))
+
+
+def build_wheel(project_path: Path, force: bool = False) -> list[Path]:
+    """Build the project wheel, reusing a cached build if the sources are unchanged.
+
+    Args:
+        project_path (Path): root of the Kedro project
+        force (bool): whether to rebuild the wheel even if a cached build exists
+
+    Raises:
+        RuntimeError: if `kedro package` fails or does not produce a wheel
+
+    Returns:
+        list[Path]: the wheels in `dist/`
+    """
+    fingerprint = get_wheel_fingerprint(project_path)
+    cache_root = project_path / STATE_DIR / "wheels"
+    cache_dir = cache_root / fingerprint
+    cached = sorted(cache_dir.glob("*.whl"))
+    if cached and not force:
+        log.info(f"Sources unchanged, reusing cached wheel {fingerprint[:12]}")
+        os.utime(cache_dir)
+        return _copy_to_dist(project_path, cached)
+
+    dist_dir = project_path / "dist"
+    before = _snapshot(dist_dir)
+    _run_kedro_package(project_path)
+    built = [
+        wheel
+        for wheel, mtime in _snapshot(dist_dir).items()
+        if before.get(wheel) != mtime
+    ]
+    if not built:
+        raise RuntimeError(f"`kedro package` did not produce a wheel in {dist_dir}")
+
+    cache_root.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(tempfile.mkdtemp(dir=cache_root, prefix=".staging-"))
+    for wheel in built:
+        shutil.copy2(wheel, staging_dir / wheel.name)
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(staging_dir, cache_dir)
+    log.info(f"Cached wheel {fingerprint[:12]}")
+    _prune_cache(cache_root)
+    return sorted(built)
+
+
+def _run_kedro_package(project_path: Path) -> None:  # pragma: no cover
+    """Run `kedro package` in the project."""
+    result = subprocess.run(
+        [sys.executable, "-m", "kedro", "package"],
+        cwd=project_path,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"({result.returncode}) Failed to build the project wheel")
+
+
+def _snapshot(dist_dir: Path) -> dict[Path, int]:
+    return {wheel: wheel.stat().st_mtime_ns for wheel in dist_dir.glob("*.whl")}
+
+
+def _copy_to_dist(project_path: Path, wheels: list[Path]) -> list[Path]:
+    dist_dir = project_path / "dist"
+    dist_dir.mkdir(exist_ok=True)
+    copied = []
+    for wheel in wheels:
+        target = dist_dir / wheel.name
+        source_stat = wheel.stat()
+        if not (
+            target.exists()
+            and target.stat().st_size == source_stat.st_size
+            and target.stat().st_mtime_ns == source_stat.st_mtime_ns
+        ):
+            shutil.copy2(wheel, target)
+        copied.append(target)
+    return copied
+
+
+def _prune_cache(cache_root: Path, keep: int = MAX_CACHED_WHEELS) -> None:
+    entries = sorted(
+        (p for p in cache_root.iterdir() if p.is_dir() and not p.name.startswith(".")),
+        key=lambda p: p.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for entry in entries[keep:]:
+        shutil.rmtree(entry, ignore_errors=True)
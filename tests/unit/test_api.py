@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+import yaml
+from kedro.framework.session import KedroSession
+
+from kedro_databricks.api import apply_overrides, generate_bundle, generate_bundles
+from kedro_databricks.constants import DEFAULT_ENV
+from kedro_databricks.utilities.resource_generator import (
+    NodeResourceGenerator,
+    PipelineResourceGenerator,
+)
+from tests.utils import reset_project, write_catalog
+
+
+@pytest.fixture
+def project(metadata):
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    overrides = {
+        "resources": {
+            "jobs": {"default": {"tags": {"team": "data"}}},
+            "volumes": {"my_volume": {"name": "my_volume"}},
+        }
+    }
+    with open(
+        metadata.project_path / "conf" / DEFAULT_ENV / "databricks.yml", "w"
+    ) as f:
+        yaml.dump(overrides, f)
+    yield metadata
+    reset_project(metadata)
+
+
+def test_generate_bundle(project):
+    # Act
+    resources = generate_bundle(metadata=project, env=DEFAULT_ENV)
+
+    # Assert
+    assert set(resources) == {"jobs", "volumes"}
+    assert set(resources["jobs"]) == {
+        project.package_name,
+        f"{project.package_name}_namespaced_pipeline",
+        f"{project.package_name}_ds",
+    }
+    for job in resources["jobs"].values():
+        assert job["tags"] == {"team": "data"}
+        assert job["tasks"]
+    assert resources["volumes"] == {"my_volume": {"name": "my_volume"}}
+    assert not (project.project_path / "resources").exists()
+
+
+def test_generate_bundle_from_project_path(project):
+    # Act
+    resources = generate_bundle(project.project_path, env=DEFAULT_ENV)
+
+    # Assert
+    assert resources == generate_bundle(metadata=project, env=DEFAULT_ENV)
+
+
+def test_generate_bundle_reuses_session_and_context(project):
+    # Arrange
+    expected = generate_bundle(metadata=project, env=DEFAULT_ENV)
+
+    # Act
+    with KedroSession.create(project_path=project.project_path, env=DEFAULT_ENV) as s:
+        from_session = generate_bundle(session=s)
+        from_context = generate_bundle(context=s.load_context(), metadata=project)
+
+    # Assert
+    assert from_session == expected
+    assert from_context == expected
+
+
+def test_generate_bundle_with_generator_class(project):
+    # Act
+    resources = generate_bundle(
+        metadata=project,
+        env=DEFAULT_ENV,
+        generator=PipelineResourceGenerator,
+        pipeline="ds",
+    )
+
+    # Assert
+    assert list(resources["jobs"]) == [f"{project.package_name}_ds"]
+    assert len(resources["jobs"][f"{project.package_name}_ds"]["tasks"]) == 1
+
+
+def test_generate_bundle_invalid_default_key(project):
+    with pytest.raises(ValueError, match="Default key cannot start with `_`"):
+        generate_bundle(metadata=project, default_key="_default")
+
+
+def test_generate_bundle_without_resources(project):
+    # Arrange
+    (project.project_path / "conf" / DEFAULT_ENV / "databricks.yml").write_text(
+        "other: {}\n"
+    )
+
+    # Act & Assert
+    with pytest.raises(KeyError, match="'resources' key not found"):
+        generate_bundle(metadata=project, env=DEFAULT_ENV)
+
+
+def test_generate_bundles(project, monkeypatch):
+    # Arrange
+    write_catalog(project, "prod")
+    with open(project.project_path / "conf" / "prod" / "databricks.yml", "w") as f:
+        yaml.dump({"resources": {"jobs": {"default": {"tags": {"team": "ops"}}}}}, f)
+    calls = []
+    generate_jobs = NodeResourceGenerator.generate_jobs
+
+    def _generate_jobs(self, pipeline_name=None):
+        calls.append(self.context.env)
+        return generate_jobs(self, pipeline_name)
+
+    monkeypatch.setattr(NodeResourceGenerator, "generate_jobs", _generate_jobs)
+
+    # Act
+    bundles = generate_bundles([DEFAULT_ENV, "prod"], metadata=project)
+
+    # Assert
+    assert calls == [DEFAULT_ENV]
+    assert list(bundles) == [DEFAULT_ENV, "prod"]
+    assert bundles[DEFAULT_ENV] == generate_bundle(metadata=project, env=DEFAULT_ENV)
+    assert set(bundles["prod"]) == {"jobs"}
+    for env, team in [(DEFAULT_ENV, "data"), ("prod", "ops")]:
+        for job in bundles[env]["jobs"].values():
+            assert job["tags"] == {"team": team}
+    dev_tasks = bundles[DEFAULT_ENV]["jobs"][project.package_name]["tasks"]
+    prod_tasks = bundles["prod"]["jobs"][project.package_name]["tasks"]
+    assert dev_tasks == prod_tasks
+    assert dev_tasks is not prod_tasks
+
+
+def test_generate_bundles_env_dependent_generator(project, monkeypatch):
+    # Arrange
+    write_catalog(project, "prod")
+    (project.project_path / "conf" / "prod" / "databricks.yml").write_text(
+        "resources:\n  jobs: {}\n"
+    )
+    calls = []
+    generate_jobs = NodeResourceGenerator.generate_jobs
+
+    def _generate_jobs(self, pipeline_name=None):
+        calls.append(self.context.env)
+        return generate_jobs(self, pipeline_name)
+
+    monkeypatch.setattr(NodeResourceGenerator, "generate_jobs", _generate_jobs)
+    monkeypatch.setattr(NodeResourceGenerator, "env_independent", False)
+
+    # Act
+    generate_bundles([DEFAULT_ENV, "prod"], metadata=project)
+
+    # Assert
+    assert calls == [DEFAULT_ENV, "prod"]
+
+
+def test_apply_overrides_does_not_modify_inputs():
+    # Arrange
+    resources = {"jobs": {"job": {"name": "job", "tasks": [{"task_key": "a"}]}}}
+    overrides = {
+        "jobs": {
+            "default": {"tasks": [{"task_key": "default", "timeout_seconds": 10}]},
+            "job": {"max_concurrent_runs": 2},
+        }
+    }
+    resources_before = copy.deepcopy(resources)
+    overrides_before = copy.deepcopy(overrides)
+
+    # Act
+    result = apply_overrides(resources, overrides)
+
+    # Assert
+    assert result["jobs"]["job"]["max_concurrent_runs"] == 2
+    assert result["jobs"]["job"]["tasks"] == [{"task_key": "a", "timeout_seconds": 10}]
+    assert resources == resources_before
+    assert overrides == overrides_before
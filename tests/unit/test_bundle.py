@@ -12,6 +12,7 @@ from kedro_databricks.constants import (
 )
 from kedro_databricks.plugin import commands
 from kedro_databricks.utilities.common import get_arg_value
+from kedro_databricks.utilities.instrumentation import write_databricks_run_script
 from tests.utils import reset_project, validate_bundle, write_catalog
 
 
@@ -202,3 +203,310 @@ def test_bundle_invalid_resource_generator(cli_runner, metadata):
 
     # Assert
     assert result.exit_code == 1, (result.exit_code, result.stdout, result.exception)
+
+
+def test_bundle_single_output_layout(cli_runner, metadata):
+    # Arrange
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    with open(
+        metadata.project_path / "conf" / DEFAULT_ENV / "databricks.yml", "w"
+    ) as f:
+        yaml.dump({"resources": {"jobs": {}}}, f)
+
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        [
+            "databricks",
+            "bundle",
+            "--env",
+            DEFAULT_ENV,
+            "--output-layout",
+            "single",
+            "--overwrite",
+        ],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    resource_files = sorted((metadata.project_path / "resources").iterdir())
+    assert [p.name for p in resource_files] == [f"target.{DEFAULT_ENV}.yml"]
+    with open(resource_files[0]) as f:
+        jobs = yaml.safe_load(f)["targets"][DEFAULT_ENV]["resources"]["jobs"]
+    assert sorted(jobs) == [
+        metadata.package_name,
+        f"{metadata.package_name}_ds",
+        f"{metadata.package_name}_namespaced_pipeline",
+    ]
+
+    # Cleanup
+    reset_project(metadata)
+
+
+def test_bundle_yaml_anchors_with_json(cli_runner, metadata):
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        ["databricks", "bundle", "--format", "json", "--yaml-anchors"],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 2, (result.exit_code, result.stdout, result.exception)
+    assert "--yaml-anchors cannot be combined with --format json" in result.output
+
+
+def test_bundle_trace_memory(cli_runner, metadata, caplog):
+    # Arrange
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    with open(
+        metadata.project_path / "conf" / DEFAULT_ENV / "databricks.yml", "w"
+    ) as f:
+        yaml.dump({"resources": {"jobs": {}}}, f)
+
+    # Act
+    with caplog.at_level("INFO", logger="kedro-databricks"):
+        result = cli_runner.invoke(
+            commands,
+            ["databricks", "bundle", "--env", DEFAULT_ENV, "--trace-memory"],
+            obj=metadata,
+        )
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    report = next(r.message for r in caplog.records if "Peak memory" in r.message)
+    for phase in ["load_context", "generate_jobs", "apply_overrides", "save_resources"]:
+        assert f"  {phase}: peak " in report
+
+    # Cleanup
+    reset_project(metadata)
+
+
+def test_bundle_trace_memory_with_watch(cli_runner, metadata):
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        ["databricks", "bundle", "--watch", "--trace-memory"],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 2, (result.exit_code, result.stdout, result.exception)
+    assert "--trace-memory cannot be combined with --watch" in result.output
+
+
+def test_bundle_validate(cli_runner, metadata):
+    # Arrange
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    with open(
+        metadata.project_path / "conf" / DEFAULT_ENV / "databricks.yml", "w"
+    ) as f:
+        yaml.dump(
+            {"resources": {"jobs": {"default": {"max_concurrent_runs": "two"}}}}, f
+        )
+    args = ["databricks", "bundle", "--env", DEFAULT_ENV, "--overwrite"]
+
+    # Act
+    result = cli_runner.invoke(commands, args, obj=metadata)
+    unvalidated = cli_runner.invoke(commands, [*args, "--no-validate"], obj=metadata)
+
+    # Assert
+    assert result.exit_code == 1, (result.exit_code, result.stdout, result.exception)
+    assert (
+        f"jobs.{metadata.package_name}.max_concurrent_runs: "
+        "expected an integer, got 'two'" in result.output
+    )
+    assert unvalidated.exit_code == 0, (
+        unvalidated.exit_code,
+        unvalidated.stdout,
+        unvalidated.exception,
+    )
+
+    # Cleanup
+    reset_project(metadata)
+
+
+def test_bundle_explain(cli_runner, metadata):
+    # Arrange
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    with open(
+        metadata.project_path / "conf" / DEFAULT_ENV / "databricks.yml", "w"
+    ) as f:
+        yaml.dump(
+            {
+                "resources": {
+                    "jobs": {
+                        "default": {
+                            "tasks": [{"task_key": "default", "max_retries": 1}]
+                        },
+                        metadata.package_name: {"tags": {"team": "data"}},
+                    }
+                }
+            },
+            f,
+        )
+    args = ["databricks", "bundle", "--env", DEFAULT_ENV, "--explain"]
+
+    # Act
+    job = cli_runner.invoke(commands, [*args, metadata.package_name], obj=metadata)
+    missing = cli_runner.invoke(commands, [*args, "missing"], obj=metadata)
+
+    # Assert
+    assert job.exit_code == 0, (job.exit_code, job.stdout, job.exception)
+    lines = job.stdout.splitlines()
+    assert (
+        f"Provenance of jobs.{metadata.package_name} in environment '{DEFAULT_ENV}':"
+        in lines
+    )
+    conf_file = f"conf/{DEFAULT_ENV}/databricks.yml"
+    assert any(
+        line.split()
+        == ["tags.team", f"resources.jobs.{metadata.package_name}", f"({conf_file})"]
+        for line in lines
+    )
+    assert any(
+        line.split()[0].endswith("].max_retries")
+        and line.split()[1:]
+        == ["resources.jobs.default.tasks[default]", f"({conf_file})"]
+        for line in lines
+    )
+    assert any(line.split() == ["name", "generated"] for line in lines)
+    assert not (metadata.project_path / "resources").exists()
+    assert missing.exit_code == 1
+    assert f"Job 'missing' not found in environment '{DEFAULT_ENV}'" in missing.output
+
+    # Cleanup
+    reset_project(metadata)
+
+
+def test_bundle_multiple_envs(cli_runner, metadata):
+    # Arrange
+    reset_project(metadata)
+    for env in [DEFAULT_ENV, "prod"]:
+        write_catalog(metadata, env)
+        with open(metadata.project_path / "conf" / env / "databricks.yml", "w") as f:
+            yaml.dump({"resources": {"jobs": {"default": {"tags": {"env": env}}}}}, f)
+
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        ["databricks", "bundle", "--env", f"{DEFAULT_ENV},prod", "--overwrite"],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    for env in [DEFAULT_ENV, "prod"]:
+        path = (
+            metadata.project_path
+            / "resources"
+            / f"target.{env}.jobs.{metadata.package_name}.yml"
+        )
+        with open(path) as f:
+            job = yaml.safe_load(f)["targets"][env]["resources"]["jobs"][
+                metadata.package_name
+            ]
+        assert job["tags"] == {"env": env}
+
+    # Cleanup
+    reset_project(metadata)
+
+
+def test_bundle_instrument(cli_runner, metadata):
+    # Arrange
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    with open(
+        metadata.project_path / "conf" / DEFAULT_ENV / "databricks.yml", "w"
+    ) as f:
+        yaml.dump({"resources": {"jobs": {}}}, f)
+    script_path = (
+        metadata.project_path / "src" / metadata.package_name / "databricks_run.py"
+    )
+    write_databricks_run_script(metadata)
+    script = script_path.read_text()
+
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        [
+            "databricks",
+            "bundle",
+            "--env",
+            DEFAULT_ENV,
+            "--instrument",
+            "/Volumes/main/default/instrumentation",
+            "--task-values",
+        ],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert script_path.read_text() == script
+    with open(
+        metadata.project_path
+        / "resources"
+        / f"target.{DEFAULT_ENV}.jobs.{metadata.package_name}.yml"
+    ) as f:
+        job = yaml.safe_load(f)["targets"][DEFAULT_ENV]["resources"]["jobs"]
+    for task in job[metadata.package_name]["tasks"]:
+        wheel_task = task["python_wheel_task"]
+        params = wheel_task["parameters"]
+        assert wheel_task["entry_point"] == "databricks_run"
+        assert get_arg_value(params, "--package-name") == metadata.package_name
+        assert get_arg_value(params, "--instrument-dir") == (
+            "/Volumes/main/default/instrumentation"
+        )
+        assert get_arg_value(params, "--run-id") == "{{job.run_id}}"
+        assert get_arg_value(params, "--task-key") == "{{task.name}}"
+        assert params[-1] == "--task-values"
+
+    # Cleanup
+    script_path.unlink()
+    reset_project(metadata)
+
+
+def test_bundle_instrument_outdated_script(cli_runner, metadata):
+    # Arrange
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    script_path = (
+        metadata.project_path / "src" / metadata.package_name / "databricks_run.py"
+    )
+    script_path.write_text("# an older version of the script\n")
+
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        ["databricks", "bundle", "--instrument", "/Volumes/main/default/x"],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 1, (result.exit_code, result.stdout, result.exception)
+    assert "kedro databricks init --instrument" in result.output
+    assert script_path.read_text() == "# an older version of the script\n"
+    assert not (metadata.project_path / "resources").exists()
+
+    # Cleanup
+    script_path.unlink()
+    reset_project(metadata)
+
+
+def test_bundle_task_values_without_instrument(cli_runner, metadata):
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        ["databricks", "bundle", "--task-values"],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 2, (result.exit_code, result.stdout, result.exception)
+    assert "--task-values requires --instrument" in result.output
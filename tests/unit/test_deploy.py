@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+import yaml
+
+from kedro_databricks.commands import deploy
+from kedro_databricks.constants import DEFAULT_ENV, STATE_DIR
+from kedro_databricks.utilities.fingerprint import read_state, write_state
+
+
+def _cached_build_config():
+    return {
+        "artifacts": {"default": {"build": deploy.CACHED_BUILD_COMMAND}},
+        "include": ["resources/*.yml"],
+    }
+
+
+class FakeDatabricksCli:
+    calls: list[str] = []
+
+    failing: set[str] = set()
+
+    def __init__(self, metadata, env, additional_args, **kwargs):
+        self.env = env
+
+    def deploy(self):
+        if self.env in self.failing:
+            raise RuntimeError(f"Failed to deploy {self.env}")
+        self.calls.append(f"deploy:{self.env}")
+
+    def upload(self):
+        self.calls.append(f"upload:{self.env}")
+
+    def summary(self):
+        self.calls.append(f"summary:{self.env}")
+
+
+def test_deploy_skips_when_unchanged(cli_runner, metadata, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(deploy, "DatabricksCli", FakeDatabricksCli)
+    FakeDatabricksCli.calls = []
+    fingerprint = deploy._compute_deploy_fingerprint(metadata, DEFAULT_ENV, [])
+    write_state(
+        metadata.project_path, f"deploy.{DEFAULT_ENV}", {"fingerprint": fingerprint}
+    )
+
+    # Act
+    result = cli_runner.invoke(deploy.command, [], obj=metadata)
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert FakeDatabricksCli.calls == []
+
+
+def test_deploy_force(cli_runner, metadata, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(deploy, "DatabricksCli", FakeDatabricksCli)
+    FakeDatabricksCli.calls = []
+    fingerprint = deploy._compute_deploy_fingerprint(metadata, DEFAULT_ENV, [])
+    write_state(
+        metadata.project_path, f"deploy.{DEFAULT_ENV}", {"fingerprint": fingerprint}
+    )
+
+    # Act
+    result = cli_runner.invoke(deploy.command, ["--force"], obj=metadata)
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert FakeDatabricksCli.calls == [
+        f"deploy:{DEFAULT_ENV}",
+        f"upload:{DEFAULT_ENV}",
+        f"summary:{DEFAULT_ENV}",
+    ]
+
+
+def test_deploy_stores_fingerprint_per_target(cli_runner, metadata, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(deploy, "DatabricksCli", FakeDatabricksCli)
+    FakeDatabricksCli.calls = []
+
+    # Act
+    result = cli_runner.invoke(deploy.command, ["--", "--target", "prod"], obj=metadata)
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert read_state(metadata.project_path, "deploy.prod").get("fingerprint") == (
+        deploy._compute_deploy_fingerprint(metadata, DEFAULT_ENV, ["--target", "prod"])
+    )
+
+
+@pytest.mark.parametrize(
+    "name", ["DATABRICKS_HOST", "DATABRICKS_CONFIG_PROFILE", "DATABRICKS_CONFIG_FILE"]
+)
+def test_deploy_fingerprint_changes_with_workspace(metadata, monkeypatch, name):
+    # Arrange
+    monkeypatch.delenv(name, raising=False)
+    before = deploy._compute_deploy_fingerprint(metadata, DEFAULT_ENV, [])
+
+    # Act
+    monkeypatch.setenv(name, "other")
+    after = deploy._compute_deploy_fingerprint(metadata, DEFAULT_ENV, [])
+
+    # Assert
+    assert before != after
+
+
+def test_deploy_fingerprint_changes_with_resources(metadata):
+    # Arrange
+    before = deploy._compute_deploy_fingerprint(metadata, DEFAULT_ENV, [])
+    resources_dir = metadata.project_path / "resources"
+    resources_dir.mkdir(exist_ok=True)
+
+    # Act
+    (resources_dir / "target.dev.jobs.new.yml").write_text("targets: {}\n")
+    after = deploy._compute_deploy_fingerprint(metadata, DEFAULT_ENV, [])
+    (resources_dir / "target.dev.jobs.new.yml").unlink()
+
+    # Assert
+    assert before != after
+    assert before != deploy._compute_deploy_fingerprint(metadata, "prod", [])
+
+
+def test_deploy_multiple_targets(cli_runner, metadata, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(deploy, "DatabricksCli", FakeDatabricksCli)
+    monkeypatch.setattr(deploy, "build_wheel", lambda _: [])
+    FakeDatabricksCli.calls = []
+
+    # Act
+    result = cli_runner.invoke(
+        deploy.command, ["--env", "dev,prod", "--force"], obj=metadata
+    )
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert sorted(FakeDatabricksCli.calls) == [
+        "deploy:dev",
+        "deploy:prod",
+        "summary:dev",
+        "summary:prod",
+        "upload:dev",
+        "upload:prod",
+    ]
+    for env in ["dev", "prod"]:
+        assert read_state(metadata.project_path, f"deploy.{env}").get("fingerprint")
+        assert (
+            (metadata.project_path / ".databricks/kedro-databricks/logs")
+            .joinpath(f"deploy.{env}.log")
+            .exists()
+        )
+
+
+def test_deploy_multiple_targets_with_target_arg(cli_runner, metadata):
+    # Act
+    result = cli_runner.invoke(
+        deploy.command, ["--env", "dev,prod", "--", "--target", "prod"], obj=metadata
+    )
+
+    # Assert
+    assert result.exit_code == 2, (result.exit_code, result.stdout, result.exception)
+    assert "`--target` cannot be combined with multiple envs" in result.output
+
+
+def test_deploy_multiple_targets_reports_failures(cli_runner, metadata, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(deploy, "DatabricksCli", FakeDatabricksCli)
+    monkeypatch.setattr(deploy, "build_wheel", lambda _: [])
+    monkeypatch.setattr(FakeDatabricksCli, "failing", {"prod"})
+    FakeDatabricksCli.calls = []
+
+    # Act
+    result = cli_runner.invoke(
+        deploy.command, ["--env", "dev,prod", "--force"], obj=metadata
+    )
+
+    # Assert
+    assert result.exit_code == 1, (result.exit_code, result.stdout, result.exception)
+    assert "prod: Failed to deploy prod" in result.output
+    assert "summary:dev" in FakeDatabricksCli.calls
+    assert "deploy:prod" not in FakeDatabricksCli.calls
+
+
+def test_deploy_multiple_targets_builds_wheel_once(cli_runner, metadata, monkeypatch):
+    # Arrange
+    builds = []
+    monkeypatch.setattr(deploy, "DatabricksCli", FakeDatabricksCli)
+    monkeypatch.setattr(deploy, "build_wheel", lambda path: builds.append(path) or [])
+    config_path = metadata.project_path / "databricks.yml"
+    config_path.write_text(yaml.dump(_cached_build_config()))
+
+    # Act
+    try:
+        result = cli_runner.invoke(
+            deploy.command, ["--env", "dev,prod", "--force"], obj=metadata
+        )
+    finally:
+        config_path.unlink()
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert builds == [metadata.project_path]
+
+
+def test_get_artifact_builds():
+    # Arrange
+    config = {
+        "artifacts": {
+            "default": {"build": "kedro package"},
+            "other": {"type": "whl"},
+        }
+    }
+
+    # Act
+    builds = deploy._get_artifact_builds(config)
+
+    # Assert
+    assert builds == {"default": "kedro package"}
+    assert deploy._get_artifact_builds({}) == {}
+
+
+def test_deploy_multiple_targets_overlap(cli_runner, metadata, monkeypatch):
+    # Arrange
+    active = []
+    overlapping = []
+    overrides = {}
+    wheel = metadata.project_path / "dist" / "project-0.1-py3-none-any.whl"
+    wheel.parent.mkdir(exist_ok=True)
+    wheel.write_bytes(b"wheel")
+    resources_dir = metadata.project_path / "resources"
+
+    class SlowDatabricksCli(FakeDatabricksCli):
+        def deploy(self):
+            active.append(self.env)
+            path = resources_dir / f"{deploy.PREBUILT_PREFIX}{self.env}.yml"
+            overrides[self.env] = yaml.safe_load(path.read_text())
+            time.sleep(0.1)
+            overlapping.append(len(active) > 1)
+            active.remove(self.env)
+
+    monkeypatch.setattr(deploy, "DatabricksCli", SlowDatabricksCli)
+    monkeypatch.setattr(deploy, "build_wheel", lambda _: [wheel])
+    config_path = metadata.project_path / "databricks.yml"
+    config_path.write_text(yaml.dump(_cached_build_config()))
+    before = deploy._compute_deploy_fingerprint(metadata, "dev", [])
+
+    # Act
+    try:
+        result = cli_runner.invoke(
+            deploy.command,
+            ["--env", "dev,prod", "--force", "--max-parallel", "2"],
+            obj=metadata,
+        )
+        after = deploy._compute_deploy_fingerprint(metadata, "dev", [])
+    finally:
+        config_path.unlink()
+        wheel.unlink()
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert True in overlapping
+    for env in ["dev", "prod"]:
+        (artifact,) = overrides[env]["targets"][env]["artifacts"].values()
+        (file,) = artifact["files"]
+        assert artifact["build"] == ""
+        assert file["source"].endswith(f"prebuilt/{env}/{wheel.name}")
+    assert not list(resources_dir.glob(f"{deploy.PREBUILT_PREFIX}*"))
+    assert not (metadata.project_path / STATE_DIR / "prebuilt").exists()
+    assert before == after
+
+
+def test_deploy_multiple_targets_without_resources_include(
+    cli_runner, metadata, monkeypatch
+):
+    # Arrange
+    builds = []
+    monkeypatch.setattr(deploy, "DatabricksCli", FakeDatabricksCli)
+    monkeypatch.setattr(deploy, "build_wheel", lambda path: builds.append(path) or [])
+    config_path = metadata.project_path / "databricks.yml"
+    config_path.write_text(
+        yaml.dump({"artifacts": {"default": {"build": deploy.CACHED_BUILD_COMMAND}}})
+    )
+
+    # Act
+    try:
+        result = cli_runner.invoke(
+            deploy.command, ["--env", "dev,prod", "--force"], obj=metadata
+        )
+    finally:
+        config_path.unlink()
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert "does not include" in result.output
+    assert builds == []
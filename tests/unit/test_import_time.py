@@ -0,0 +1,103 @@
+"""Guard the cost of importing the plugin.
+
+Kedro imports the entry point of every installed plugin for every `kedro`
+command, so importing `kedro_databricks.plugin` must stay cheap.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from importlib import metadata
+from pathlib import Path
+
+import pytest
+from packaging.version import Version
+
+import kedro_databricks
+from kedro_databricks import constants
+
+IMPORT_BUDGET_US = 100_000
+"""Maximum cumulative import time of `kedro_databricks.plugin` in microseconds."""
+
+HEAVY_MODULES = [
+    "kedro.framework.session",
+    "kedro.framework.project",
+    "fuso",
+    "yaml",
+    "tomlkit",
+    "packaging.version",
+    "kedro_databricks.constants",
+    "kedro_databricks.commands.bundle",
+]
+"""Modules that must not be imported when the plugin is loaded."""
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    result = subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=PROJECT_ROOT,
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+
+def _parse_importtime(stderr: str) -> dict[str, int]:
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            timings[module.strip()] = int(cumulative)
+    return timings
+
+
+def test_import_time_within_budget():
+    # Act
+    timings = [
+        _parse_importtime(
+            _run("import kedro_databricks.plugin", "-X", "importtime").stderr
+        )["kedro_databricks.plugin"]
+        for _ in range(3)
+    ]
+
+    # Assert
+    assert min(timings) < IMPORT_BUDGET_US, (
+        f"Importing kedro_databricks.plugin took {min(timings) / 1000:.1f} ms, "
+        f"the budget is {IMPORT_BUDGET_US / 1000:.0f} ms"
+    )
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import kedro_databricks.plugin",
+        "from kedro_databricks.plugin import commands\n"
+        "commands(['databricks', '--help'], standalone_mode=False)",
+    ],
+    ids=["import", "help"],
+)
+def test_import_does_not_load_heavy_modules(code):
+    # Act
+    result = _run(code + "\nimport sys\nprint(','.join(sys.modules), file=sys.stderr)")
+
+    # Assert
+    loaded = set(result.stderr.strip().splitlines()[-1].split(","))
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+def test_lazy_attributes():
+    # Act & Assert
+    assert kedro_databricks.__version__ == metadata.version("kedro-databricks")
+    assert constants.KEDRO_VERSION == Version(metadata.version("kedro"))
+    assert constants.TEMPLATES.joinpath("databricks_run.py").is_file()
+    with pytest.raises(AttributeError):
+        constants.UNKNOWN
+    with pytest.raises(AttributeError):
+        kedro_databricks.UNKNOWN
@@ -10,12 +10,19 @@ import yaml
 from kedro_databricks.commands.init import (
     _create_target_configs,
     _prepare_template,
-    _substitute_file_path,
+    _save_target_catalog,
     _transform_spark_hook,
     _update_gitignore,
     _write_databricks_run_script,
 )
 from kedro_databricks.constants import DEFAULT_CATALOG, DEFAULT_SCHEMA
+from kedro_databricks.plugin import commands
+from kedro_databricks.utilities.catalog_sync import SNAPSHOT_FILE, substitute_file_path
+from kedro_databricks.utilities.databricks_cli import DatabricksCli
+from kedro_databricks.utilities.instrumentation import (
+    is_databricks_run_script_current,
+)
+from tests.utils import reset_project
 
 
 def test_update_gitignore(metadata):
@@ -91,10 +98,22 @@ def test_write_databricks_run_script(metadata):
             "file_path: https://website.com/data/file.json",
         ),
         ("data/01_raw/file.csv", "data/01_raw/file.csv"),
+        (
+            "file_path: data/01_raw/file.csv  # raw input",
+            "file_path: ${_file_path}/data/01_raw/file.csv  # raw input",
+        ),
+        (
+            "#  file_path: data/01_raw/file.csv",
+            "#  file_path: data/01_raw/file.csv",
+        ),
+        (
+            "file_path: ${_file_path}/data/01_raw/file.csv",
+            "file_path: ${_file_path}/data/01_raw/file.csv",
+        ),
     ],
 )
-def test_substitute_file_path(actual, expected):
-    result = _substitute_file_path(actual)
+def testsubstitute_file_path(actual, expected):
+    result = substitute_file_path(actual)
     assert result == expected, f"\n{result}\n{expected}"
 
 
@@ -125,6 +144,59 @@ def test_create_target_configs(metadata, monkeypatch):
     )
 
 
+def test_save_target_catalog(tmp_path):
+    # Arrange
+    conf_dir = tmp_path / "conf"
+    base_dir = conf_dir / "base"
+    (base_dir / "catalog" / "raw").mkdir(parents=True)
+    (base_dir / "catalog.yml").write_text(
+        "# Main catalog\niris:\n  filepath: data/01_raw/iris.csv\n"
+    )
+    (base_dir / "catalog_models.yml").write_text(
+        "model:\n  filepath: /dbfs/data/06_models/model.pkl  # trained\n"
+    )
+    (base_dir / "catalog" / "raw" / "bikes.yml").write_text(
+        "bikes:\n  filepath: s3://bucket/data/bikes.csv\n"
+    )
+    (base_dir / "parameters.yml").write_text("filepath: data/01_raw/other.csv\n")
+    target_dir = conf_dir / "dev"
+    target_dir.mkdir()
+
+    # Act
+    _save_target_catalog(conf_dir, target_dir, "/Volumes/c/s/v/dev")
+
+    # Assert
+    assert (target_dir / "catalog.yml").read_text() == (
+        "_file_path: /Volumes/c/s/v/dev\n"
+        "# Main catalog\n"
+        "iris:\n  filepath: ${_file_path}/data/01_raw/iris.csv\n"
+    )
+    assert (target_dir / "catalog_models.yml").read_text() == (
+        "model:\n  filepath: ${_file_path}/data/06_models/model.pkl  # trained\n"
+    )
+    assert (target_dir / "catalog" / "raw" / "bikes.yml").read_text() == (
+        "bikes:\n  filepath: s3://bucket/data/bikes.csv\n"
+    )
+    assert not (target_dir / "parameters.yml").exists()
+    assert (target_dir / SNAPSHOT_FILE).exists()
+
+
+def test_save_target_catalog_without_base_catalog(tmp_path):
+    # Arrange
+    conf_dir = tmp_path / "conf"
+    (conf_dir / "base").mkdir(parents=True)
+    target_dir = conf_dir / "prod"
+    target_dir.mkdir()
+
+    # Act
+    _save_target_catalog(conf_dir, target_dir, "/Volumes/c/s/v/prod")
+
+    # Assert
+    assert (target_dir / "catalog.yml").read_text() == (
+        "_file_path: /Volumes/c/s/v/prod\n"
+    )
+
+
 def test_prepare_template(metadata):
     assets_dir, template_params = _prepare_template(metadata)
     assert assets_dir.exists(), "Assets directory not created"
@@ -343,7 +415,7 @@ y_pred:
   type: pandas.ParquetDataset
   filepath: ${_file_path}/data/03_primary/y_pred.parquet
 """
-    assert _substitute_file_path(catalog) == expected
+    assert substitute_file_path(catalog) == expected
 
 
 def test_transform_spark_hook(tmp_path_factory):
@@ -403,3 +475,111 @@ class SparkHooks:
         _spark_session.sparkContext.setLogLevel('WARN')"""
 
     assert hook_file.read_text() == expected
+
+
+def test_init_offline(cli_runner, metadata, monkeypatch):
+    # Arrange
+    reset_project(metadata)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("The Databricks CLI must not be called")
+
+    monkeypatch.setattr(DatabricksCli, "init", _fail)
+    monkeypatch.setattr(DatabricksCli, "validate", _fail)
+
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        [
+            "databricks",
+            "init",
+            "--host",
+            "https://example.cloud.databricks.com",
+            "--user",
+            "Jane.Doe@example.com",
+        ],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    with open(metadata.project_path / "databricks.yml") as f:
+        config = yaml.safe_load(f)
+    assert config["bundle"]["name"] == metadata.package_name
+    assert config["targets"]["dev"]["workspace"]["host"] == (
+        "https://example.cloud.databricks.com"
+    )
+    assert config["targets"]["prod"]["run_as"] == {"user_name": "Jane.Doe@example.com"}
+    catalog = (metadata.project_path / "conf" / "dev" / "catalog.yml").read_text()
+    assert "/jane_doe/" in catalog
+    assert (metadata.project_path / "conf" / "prod" / "databricks.yml").exists()
+
+    # Cleanup
+    reset_project(metadata)
+
+
+def test_init_offline_service_principal(cli_runner, metadata, monkeypatch):
+    # Arrange
+    reset_project(metadata)
+    application_id = "6f1b9f2a-1c3d-4e5f-8a9b-0c1d2e3f4a5b"
+    selects = []
+
+    def _validate(self, select=None):
+        selects.append(select)
+        return {
+            "workspace": {
+                "current_user": {"userName": application_id, "short_name": "etl_sp"}
+            }
+        }
+
+    monkeypatch.setattr(DatabricksCli, "__init__", lambda self, *a, **kw: None)
+    monkeypatch.setattr(DatabricksCli, "validate", _validate)
+
+    # Act
+    result = cli_runner.invoke(
+        commands,
+        [
+            "databricks",
+            "init",
+            "--host",
+            "https://example.cloud.databricks.com",
+            "--user",
+            application_id,
+        ],
+        obj=metadata,
+    )
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert selects == [["workspace.current_user"]]
+    catalog = (metadata.project_path / "conf" / "dev" / "catalog.yml").read_text()
+    assert "/etl_sp/" in catalog
+    assert application_id.replace("-", "_") not in catalog
+
+    # Cleanup
+    reset_project(metadata)
+
+
+def test_init_instrument_initialized_project(cli_runner, metadata):
+    # Arrange
+    reset_project(metadata)
+    config_path = metadata.project_path / "databricks.yml"
+    config_path.write_text("bundle:\n  name: existing\n")
+    script_path = (
+        metadata.project_path / "src" / metadata.package_name / "databricks_run.py"
+    )
+    script_path.unlink(missing_ok=True)
+
+    # Act
+    result = cli_runner.invoke(
+        commands, ["databricks", "init", "--instrument"], obj=metadata
+    )
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert is_databricks_run_script_current(metadata)
+    assert config_path.read_text() == "bundle:\n  name: existing\n"
+
+    # Cleanup
+    script_path.unlink()
+    reset_project(metadata)
@@ -0,0 +1,59 @@
+import json
+
+from kedro_databricks.plugin import commands
+
+
+def _write_report(path, run_id, compute_seconds):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "run_id": run_id,
+                "task_key": "node",
+                "status": "success",
+                "nodes": [
+                    {
+                        "name": "node",
+                        "load_seconds": 1.0,
+                        "compute_seconds": compute_seconds,
+                        "save_seconds": 1.0,
+                        "datasets": [],
+                    }
+                ],
+            }
+        )
+    )
+
+
+def test_report(cli_runner, metadata, tmp_path):
+    # Arrange
+    _write_report(tmp_path / "1" / "node.json", "1", 2.0)
+    _write_report(tmp_path / "2" / "node.json", "2", 4.0)
+
+    # Act
+    table = cli_runner.invoke(
+        commands, ["databricks", "report", str(tmp_path)], obj=metadata
+    )
+    run = cli_runner.invoke(
+        commands,
+        ["databricks", "report", str(tmp_path), "--run-id", "2", "--format", "json"],
+        obj=metadata,
+    )
+
+    # Assert
+    assert table.exit_code == 0, (table.exit_code, table.stdout, table.exception)
+    assert "node     2  1.00s    3.00s  1.00s  5.00s     -        -" in table.stdout
+    assert run.exit_code == 0, (run.exit_code, run.stdout, run.exception)
+    assert json.loads(run.stdout)[0]["compute_seconds"] == 4.0  # noqa: PLR2004
+
+
+def test_report_no_files(cli_runner, metadata, tmp_path):
+    # Act
+    result = cli_runner.invoke(
+        commands, ["databricks", "report", str(tmp_path)], obj=metadata
+    )
+
+    # Assert
+    assert result.exit_code == 1, (result.exit_code, result.stdout, result.exception)
+    assert "No instrumentation files found" in result.output
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+import types
+
+import pytest
+import yaml
+
+from kedro_databricks.client import find_server, main, send
+from kedro_databricks.constants import DEFAULT_ENV, SERVER_INFO_FILE, STATE_DIR
+from kedro_databricks.utilities.bundle_server import (
+    BundleServer,
+    _purge_modules,
+    serve,
+)
+from tests.utils import reset_project, write_catalog
+
+
+def _write_overrides(metadata, tags):
+    overrides = {"resources": {"jobs": {"default": {"tags": tags}}}}
+    path = metadata.project_path / "conf" / DEFAULT_ENV / "databricks.yml"
+    with open(path, "w") as f:
+        yaml.dump(overrides, f)
+
+
+@pytest.fixture
+def project(metadata):
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    _write_overrides(metadata, {"team": "data"})
+    yield metadata
+    reset_project(metadata)
+
+
+def test_bundle_server_handle(project):
+    # Arrange
+    server = BundleServer(project)
+
+    # Act
+    ping = server.handle({"command": "ping"})
+    bundle = server.handle({"command": "bundle", "env": DEFAULT_ENV})
+    unknown = server.handle({"command": "unknown"})
+
+    # Assert
+    assert ping["ok"] and ping["envs"] == []
+    assert bundle["ok"]
+    assert bundle["issues"] == []
+    assert bundle["elapsed_ms"] >= 0
+    job = bundle["resources"]["jobs"][project.package_name]
+    assert job["tags"] == {"team": "data"}
+    assert f"resources/target.dev.jobs.{project.package_name}.yml" in bundle["files"]
+    assert server.handle({"command": "ping"})["envs"] == [DEFAULT_ENV]
+    assert unknown == {"ok": False, "error": "ValueError: Unknown command 'unknown'"}
+    server.close()
+
+
+def test_bundle_server_missing_env(project):
+    # Arrange
+    server = BundleServer(project)
+
+    # Act
+    response = server.handle({"command": "bundle", "env": "missing"})
+
+    # Assert
+    assert not response["ok"]
+    assert response["error"].startswith("FileNotFoundError")
+
+
+def test_bundle_server_validates_resources(project):
+    # Arrange
+    server = BundleServer(project)
+    path = project.project_path / "conf" / DEFAULT_ENV / "databricks.yml"
+    with open(path, "w") as f:
+        yaml.dump(
+            {"resources": {"jobs": {"default": {"max_concurrent_runs": "two"}}}}, f
+        )
+
+    # Act
+    invalid = server.handle({"command": "bundle", "overwrite": True})
+    unvalidated = server.handle(
+        {"command": "bundle", "overwrite": True, "validate": False}
+    )
+
+    # Assert
+    path = f"jobs.{project.package_name}.max_concurrent_runs"
+    assert not invalid["ok"]
+    assert {
+        "path": path,
+        "message": "expected an integer, got 'two'",
+        "error": True,
+    } in invalid["issues"]
+    assert f"{path}: expected an integer, got 'two'" in invalid["error"]
+    assert "files" not in invalid
+    assert "resources" not in invalid
+    assert unvalidated["ok"]
+    assert "issues" not in unvalidated
+    assert unvalidated["files"]
+    assert all((project.project_path / file).exists() for file in unvalidated["files"])
+    server.close()
+
+
+def test_bundle_server_reloads_changed_configuration(project):
+    # Arrange
+    server = BundleServer(project)
+    first = server.handle({"command": "bundle", "write": False})
+    context = server.get_context(DEFAULT_ENV)
+
+    # Act
+    time.sleep(0.01)
+    _write_overrides(project, {"team": "platform"})
+    second = server.handle({"command": "bundle", "write": False})
+
+    # Assert
+    assert first["resources"]["jobs"][project.package_name]["tags"] == {"team": "data"}
+    assert second["resources"]["jobs"][project.package_name]["tags"] == {
+        "team": "platform"
+    }
+    assert "files" not in second
+    assert server.get_context(DEFAULT_ENV) is not context
+    server.close()
+
+
+def test_purge_modules(monkeypatch):
+    # Arrange
+    for name in ["purged", "purged.pipelines", "purged_other"]:
+        monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+
+    # Act
+    _purge_modules("purged")
+
+    # Assert
+    assert "purged" not in sys.modules
+    assert "purged.pipelines" not in sys.modules
+    assert "purged_other" in sys.modules
+
+
+def test_serve_roundtrip(project, capsys, monkeypatch):
+    # Arrange
+    monkeypatch.chdir(project.project_path)
+    info_path = project.project_path / STATE_DIR / SERVER_INFO_FILE
+    thread = threading.Thread(
+        target=serve, args=(project, [DEFAULT_ENV]), kwargs={"interval": 0.05}
+    )
+    thread.start()
+    for _ in range(200):
+        if info_path.exists():
+            break
+        time.sleep(0.05)
+
+    # Act
+    server = find_server(project.project_path / "src")
+    server_info = json.loads(info_path.read_text())
+    ping = send({"command": "ping"}, server=server)
+    exit_code = main(["bundle", "--env", DEFAULT_ENV, "--overwrite"])
+    stop_code = main(["stop"])
+    thread.join(timeout=10)
+
+    # Assert
+    assert server == server_info
+    assert ping["ok"] and ping["envs"] == [DEFAULT_ENV]
+    assert exit_code == 0
+    assert stop_code == 0
+    assert (
+        f"Wrote resources/target.dev.jobs.{project.package_name}.yml"
+        in capsys.readouterr().out
+    )
+    assert not thread.is_alive()
+    assert not info_path.exists()
+
+
+def test_client_without_server(tmp_path, capsys, monkeypatch):
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+
+    # Act
+    exit_code = main(["ping"])
+
+    # Assert
+    assert exit_code == 1
+    assert "No bundle server found" in capsys.readouterr().err
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import types
+
+import yaml
+
+from kedro_databricks.commands.sync_catalog import command
+from kedro_databricks.utilities.catalog_sync import write_snapshot
+
+
+def _make_project(tmp_path):
+    (tmp_path / "databricks.yml").write_text(
+        yaml.safe_dump({"targets": {"dev": {}, "prod": {}}})
+    )
+    conf_dir = tmp_path / "conf"
+    (conf_dir / "base").mkdir(parents=True)
+    (conf_dir / "base" / "catalog.yml").write_text(
+        "iris:\n  type: pandas.CSVDataset\n  filepath: data/01_raw/iris.csv\n"
+    )
+    for target in ["dev", "prod"]:
+        (conf_dir / target).mkdir()
+        (conf_dir / target / "catalog.yml").write_text(
+            f"_file_path: /Volumes/c/s/v/{target}\n"
+            "iris:\n  type: pandas.CSVDataset\n"
+            "  filepath: ${_file_path}/data/01_raw/iris.csv\n"
+        )
+        write_snapshot(conf_dir / "base", conf_dir / target)
+    return types.SimpleNamespace(project_path=tmp_path)
+
+
+def test_sync_catalog_command(cli_runner, tmp_path):
+    # Arrange
+    metadata = _make_project(tmp_path)
+    base_path = tmp_path / "conf" / "base" / "catalog.yml"
+    base_path.write_text(base_path.read_text().replace("pandas", "polars"))
+
+    # Act
+    check = cli_runner.invoke(command, ["--check"], obj=metadata)
+    result = cli_runner.invoke(command, [], obj=metadata)
+    recheck = cli_runner.invoke(command, ["--check"], obj=metadata)
+
+    # Assert
+    assert check.exit_code == 1, (check.exit_code, check.stdout)
+    assert "dev, prod" in check.output
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    for target in ["dev", "prod"]:
+        catalog = (tmp_path / "conf" / target / "catalog.yml").read_text()
+        assert f"_file_path: /Volumes/c/s/v/{target}\n" in catalog
+        assert "polars.CSVDataset" in catalog
+    assert recheck.exit_code == 0, (recheck.exit_code, recheck.stdout)
+
+
+def test_sync_catalog_command_single_env(cli_runner, tmp_path):
+    # Arrange
+    metadata = _make_project(tmp_path)
+    base_path = tmp_path / "conf" / "base" / "catalog.yml"
+    base_path.write_text(base_path.read_text().replace("pandas", "polars"))
+
+    # Act
+    result = cli_runner.invoke(command, ["--env", "prod"], obj=metadata)
+
+    # Assert
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert "polars" in (tmp_path / "conf" / "prod" / "catalog.yml").read_text()
+    assert "pandas" in (tmp_path / "conf" / "dev" / "catalog.yml").read_text()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import types
+
+import pytest
+import yaml
+from kedro.framework.session import KedroSession
+from kedro.pipeline import Pipeline, node
+
+from kedro_databricks.constants import DEFAULT_CONF_FOLDER, DEFAULT_ENV
+from kedro_databricks.utilities.bundle_watcher import (
+    affected_pipelines,
+    generate_jobs,
+    watch_bundle,
+)
+from tests.utils import reset_project, write_catalog
+
+
+def _module(monkeypatch, name, path):
+    module = types.ModuleType(name)
+    module.__file__ = str(path)
+
+    def func(x):
+        return x
+
+    func.__module__ = name
+    module.func = func
+    monkeypatch.setitem(sys.modules, name, module)
+    return func
+
+
+@pytest.fixture
+def registered_pipelines(tmp_path, monkeypatch):
+    package_dir = tmp_path / "src" / "pkg"
+    a = _module(
+        monkeypatch, "pkg.pipelines.a.nodes", package_dir / "pipelines/a/nodes.py"
+    )
+    b = _module(
+        monkeypatch, "pkg.pipelines.b.nodes", package_dir / "pipelines/b/nodes.py"
+    )
+    pipelines = {
+        "a": Pipeline([node(a, "x", "y", name="a")]),
+        "b": Pipeline([node(b, "y", "z", name="b")]),
+    }
+    pipelines["__default__"] = pipelines["a"] + pipelines["b"]
+    monkeypatch.setattr("kedro.framework.project.pipelines", pipelines)
+    return types.SimpleNamespace(source_dir=tmp_path / "src", package_name="pkg")
+
+
+@pytest.mark.parametrize(
+    ["changed", "expected"],
+    [
+        (["pipelines/a/nodes.py"], {"a", "__default__"}),
+        (["pipelines/a/pipeline.py"], {"a", "__default__"}),
+        (["pipelines/a/nodes.py", "pipelines/b/nodes.py"], {"a", "b", "__default__"}),
+        (["pipelines/b/nodes.py", "pipeline_registry.py"], None),
+        (["utils/helpers.py"], None),
+    ],
+)
+def test_affected_pipelines(registered_pipelines, changed, expected):
+    # Arrange
+    package_dir = registered_pipelines.source_dir / "pkg"
+
+    # Act
+    result = affected_pipelines(
+        registered_pipelines, {package_dir / path for path in changed}
+    )
+
+    # Assert
+    assert result == expected
+
+
+def test_affected_pipelines_outside_package(registered_pipelines, tmp_path):
+    # Act
+    result = affected_pipelines(registered_pipelines, {tmp_path / "conf/base/x.yml"})
+
+    # Assert
+    assert result is None
+
+
+def _write_overrides(metadata, tags):
+    path = metadata.project_path / DEFAULT_CONF_FOLDER / DEFAULT_ENV / "databricks.yml"
+    with open(path, "w") as f:
+        yaml.dump({"resources": {"jobs": {"default": {"tags": tags}}}}, f)
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_generate_jobs(metadata):
+    # Arrange
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    _write_overrides(metadata, {"team": "data"})
+
+    # Act
+    with KedroSession.create(metadata.project_path, env=DEFAULT_ENV) as session:
+        resources = generate_jobs(
+            metadata,
+            session.load_context(),
+            "node",
+            ["ds"],
+            None,
+            DEFAULT_CONF_FOLDER,
+            "default",
+        )
+
+    # Assert
+    assert list(resources["jobs"]) == [f"{metadata.package_name}_ds"]
+    assert resources["jobs"][f"{metadata.package_name}_ds"]["tags"] == {"team": "data"}
+    reset_project(metadata)
+
+
+def test_watch_bundle(metadata):
+    # Arrange
+    reset_project(metadata)
+    write_catalog(metadata, DEFAULT_ENV)
+    _write_overrides(metadata, {"team": "data"})
+    job_file = (
+        metadata.project_path
+        / "resources"
+        / f"target.{DEFAULT_ENV}.jobs.{metadata.package_name}.yml"
+    )
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=watch_bundle,
+        kwargs={
+            "metadata": metadata,
+            "env": DEFAULT_ENV,
+            "generator": "node",
+            "pipeline": None,
+            "params": None,
+            "conf_source": DEFAULT_CONF_FOLDER,
+            "default_key": "default",
+            "interval": 0.02,
+            "debounce": 0.02,
+            "stop_event": stop_event,
+        },
+    )
+
+    # Act
+    thread.start()
+    try:
+        initial = _wait_for(job_file.exists)
+        _write_overrides(metadata, {"team": "platform"})
+        updated = _wait_for(lambda: "platform" in job_file.read_text())
+    finally:
+        stop_event.set()
+        thread.join(timeout=10)
+
+    # Assert
+    assert initial
+    assert updated
+    assert not thread.is_alive()
+    reset_project(metadata)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import pytest
+
+from kedro_databricks.utilities.catalog_sync import (
+    SNAPSHOT_FILE,
+    find_catalog_files,
+    sync_catalog,
+    write_snapshot,
+)
+
+BASE_CATALOG = """\
+# Raw data
+iris:
+  type: pandas.CSVDataset
+  filepath: data/01_raw/iris.csv
+
+model:
+  type: pickle.PickleDataset
+  filepath: data/06_models/model.pkl
+"""
+
+TARGET_CATALOG = """\
+_file_path: /Volumes/workspace/default/project/dev
+# Raw data
+iris:
+  type: pandas.CSVDataset
+  filepath: ${_file_path}/data/01_raw/iris.csv
+
+model:
+  type: pickle.PickleDataset
+  filepath: ${_file_path}/data/06_models/model.pkl
+
+# Only in dev
+debug:
+  type: MemoryDataset
+"""
+
+
+@pytest.fixture
+def conf_dir(tmp_path):
+    conf_dir = tmp_path / "conf"
+    (conf_dir / "base").mkdir(parents=True)
+    (conf_dir / "dev").mkdir()
+    (conf_dir / "base" / "catalog.yml").write_text(BASE_CATALOG)
+    (conf_dir / "dev" / "catalog.yml").write_text(TARGET_CATALOG)
+    write_snapshot(conf_dir / "base", conf_dir / "dev")
+    return conf_dir
+
+
+def test_find_catalog_files(tmp_path):
+    # Arrange
+    (tmp_path / "catalog" / "raw").mkdir(parents=True)
+    for name in [
+        "catalog.yml",
+        "catalog_models.yaml",
+        "catalog/raw/bikes.yml",
+        "parameters.yml",
+    ]:
+        (tmp_path / name).write_text("")
+
+    # Act
+    files = find_catalog_files(tmp_path)
+
+    # Assert
+    assert [file.relative_to(tmp_path).as_posix() for file in files] == [
+        "catalog/raw/bikes.yml",
+        "catalog.yml",
+        "catalog_models.yaml",
+    ]
+
+
+def test_sync_catalog_unchanged(conf_dir):
+    # Act
+    result = sync_catalog(conf_dir, "dev")
+
+    # Assert
+    assert result.files == []
+    assert (conf_dir / "dev" / "catalog.yml").read_text() == TARGET_CATALOG
+
+
+def test_sync_catalog_merges_changed_entries(conf_dir):
+    # Arrange
+    base = BASE_CATALOG.replace("pickle.PickleDataset", "joblib.JoblibDataset")
+    base = base.replace(
+        "# Raw data\niris:",
+        "# Raw data\nbikes:\n  type: pandas.CSVDataset\n  filepath: data/01_raw/bikes.csv\n\niris:",
+    )
+    (conf_dir / "base" / "catalog.yml").write_text(base)
+
+    # Act
+    result = sync_catalog(conf_dir, "dev")
+
+    # Assert
+    assert result.added == ["bikes"]
+    assert result.updated == ["model"]
+    assert result.conflicts == []
+    assert (conf_dir / "dev" / "catalog.yml").read_text() == TARGET_CATALOG.replace(
+        "pickle.PickleDataset", "joblib.JoblibDataset"
+    ) + (
+        "\nbikes:\n  type: pandas.CSVDataset\n"
+        "  filepath: ${_file_path}/data/01_raw/bikes.csv\n"
+    )
+    assert sync_catalog(conf_dir, "dev").files == []
+
+
+def test_sync_catalog_removes_entries(conf_dir):
+    # Arrange
+    base = BASE_CATALOG.split("\nmodel:", maxsplit=1)[0]
+    (conf_dir / "base" / "catalog.yml").write_text(base)
+
+    # Act
+    result = sync_catalog(conf_dir, "dev")
+
+    # Assert
+    assert result.removed == ["model"]
+    target = (conf_dir / "dev" / "catalog.yml").read_text()
+    assert "model:" not in target
+    assert "debug:" in target and "# Only in dev" in target
+
+
+def test_sync_catalog_keeps_conflicting_target_entries(conf_dir):
+    # Arrange
+    target_path = conf_dir / "dev" / "catalog.yml"
+    target = TARGET_CATALOG.replace("pandas.CSVDataset", "spark.SparkDataset")
+    target_path.write_text(target)
+    base = BASE_CATALOG.replace("pandas.CSVDataset", "polars.CSVDataset")
+    (conf_dir / "base" / "catalog.yml").write_text(base)
+
+    # Act
+    result = sync_catalog(conf_dir, "dev")
+
+    # Assert
+    assert result.conflicts == ["iris"]
+    assert target_path.read_text() == target
+    assert sync_catalog(conf_dir, "dev").conflicts == []
+
+
+def test_sync_catalog_check(conf_dir):
+    # Arrange
+    (conf_dir / "base" / "catalog_extra.yml").write_text(
+        "extra:\n  type: MemoryDataset\n"
+    )
+    snapshot = (conf_dir / "dev" / SNAPSHOT_FILE).read_text()
+
+    # Act
+    result = sync_catalog(conf_dir, "dev", check=True)
+
+    # Assert
+    assert result.files == [conf_dir / "dev" / "catalog_extra.yml"]
+    assert result.added == ["extra"]
+    assert not (conf_dir / "dev" / "catalog_extra.yml").exists()
+    assert (conf_dir / "dev" / SNAPSHOT_FILE).read_text() == snapshot
+
+
+def test_sync_catalog_without_snapshot(conf_dir):
+    # Arrange
+    (conf_dir / "dev" / SNAPSHOT_FILE).unlink()
+    target_path = conf_dir / "dev" / "catalog.yml"
+    target = TARGET_CATALOG.replace("pandas.CSVDataset", "spark.SparkDataset")
+    target_path.write_text(target)
+    base = BASE_CATALOG + "\nextra:\n  type: MemoryDataset\n"
+    (conf_dir / "base" / "catalog.yml").write_text(base)
+
+    # Act
+    result = sync_catalog(conf_dir, "dev")
+
+    # Assert
+    assert result.added == ["extra"]
+    assert result.updated == [] and result.conflicts == []
+    assert target_path.read_text() == target + "\nextra:\n  type: MemoryDataset\n"
+    assert (conf_dir / "dev" / SNAPSHOT_FILE).exists()
@@ -2,9 +2,13 @@ import pytest
 from packaging.version import Version
 
 from kedro_databricks.utilities.common import (
+    PatternIndex,
     get_arg_value,
     get_entry_point,
+    get_pattern_keys,
+    get_pattern_values,
     get_value_from_dotpath,
+    is_pattern_key,
     remove_nulls,
     sanitize_name,
     sort_dict,
@@ -103,12 +107,26 @@ def test_require_databricks_run_script(value, expected):
         ({"a": 1, "b": None}, {"a": 1}),
         ({"a": 1, "b": {"c": None}}, {"a": 1}),
         ({"a": 1, "b": {"c": {"d": None}}}, {"a": 1}),
+        ([None, None, 1], [1]),
+        ([[None], {"a": None}, 1], [1]),
     ],
 )
 def test_remove_nulls_from_dict(value, expected):
     assert remove_nulls(value) == expected
 
 
+def test_remove_nulls_does_not_modify_value():
+    # Arrange
+    value = {"a": [None, {"b": None}, 1], "c": {"d": 2}}
+
+    # Act
+    result = remove_nulls(value)
+
+    # Assert
+    assert result == {"a": [1], "c": {"d": 2}}
+    assert value == {"a": [None, {"b": None}, 1], "c": {"d": 2}}
+
+
 @pytest.mark.parametrize(
     ["version", "expected", "raises"],
     [
@@ -162,3 +180,72 @@ def test_get_arg_value(args, arg, expected):
 def test_get_value_from_dotpath(dotpath, conf, expected):
     value = get_value_from_dotpath(conf, dotpath)
     assert value == expected, f"Expected {expected}, got {value}"
+
+
+@pytest.mark.parametrize(
+    ["key", "expected"],
+    [
+        ("re:.*", True),
+        ("glob:*", True),
+        ("default", False),
+        ("my_job", False),
+    ],
+)
+def test_is_pattern_key(key, expected):
+    assert is_pattern_key(key) == expected
+
+
+@pytest.mark.parametrize(
+    ["lookup_key", "keys", "expected"],
+    [
+        ("train_model", ["re:train", "glob:train"], ["re:train"]),
+        ("train_model", ["re:model", "glob:*model"], ["glob:*model"]),
+        ("a.b", ["glob:a.b", "glob:a?b", "re:a.b"], ["glob:a?b", "re:a.b", "glob:a.b"]),
+        (
+            "model",
+            ["glob:[mn]odel", "re:(?i)MODEL", "glob:*"],
+            ["glob:*", "glob:[mn]odel", "re:(?i)MODEL"],
+        ),
+        ("x", ["default", "x", "re:y", "glob:x*"], ["glob:x*"]),
+        ("x", [], []),
+    ],
+)
+def test_get_pattern_keys(lookup_key, keys, expected):
+    assert get_pattern_keys(lookup_key, dict.fromkeys(keys)) == expected
+
+
+def test_get_pattern_keys_orders_by_specificity():
+    # Arrange
+    values = {
+        "glob:forecast_sales_*": {"retries": 3},
+        "re:.*": {"retries": 0},
+        "re:forecast_.*": {"retries": 1},
+        "glob:*_train": {"retries": 2},
+    }
+
+    # Act
+    keys = get_pattern_keys("forecast_sales_train", values)
+
+    # Assert
+    assert keys == ["re:.*", "glob:*_train", "re:forecast_.*", "glob:forecast_sales_*"]
+    assert get_pattern_values("forecast_sales_train", values)[-1] == {"retries": 3}
+
+
+def test_get_pattern_keys_equal_specificity_keeps_order():
+    values = {"re:a.": 1, "glob:*b": 2, "glob:a?": 3}
+    assert get_pattern_keys("ab", values) == ["re:a.", "glob:*b", "glob:a?"]
+
+
+def test_pattern_index_memoizes_matches():
+    # Arrange
+    index = PatternIndex(["re:a.*", "glob:*b"])
+
+    # Act
+    first = index.match("ab")
+    second = index.match("ab")
+
+    # Assert
+    assert first == ["re:a.*", "glob:*b"]
+    assert second is first
+    assert index.match("cb") == ["glob:*b"]
+    assert index.match("") == []
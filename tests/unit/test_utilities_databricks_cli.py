@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from kedro_databricks.utilities.databricks_cli import _load_validate_output
+from kedro_databricks.utilities.subprocess_runner import CommandResult
+
+
+def test_load_validate_output_skips_preamble(tmp_path):
+    # Arrange
+    output_path = tmp_path / "validate.log"
+    document = {"workspace": {"current_user": {"short_name": "user"}}, "bundle": {}}
+    output_path.write_text("Warning: something\n" + json.dumps(document, indent=2))
+    result = CommandResult(args=[], returncode=0, output_path=output_path)
+
+    # Act
+    validated = _load_validate_output(result, ["workspace.current_user"])
+
+    # Assert
+    assert validated == {"workspace": {"current_user": {"short_name": "user"}}}
+
+
+def test_load_validate_output_from_tail():
+    # Arrange
+    result = CommandResult(args=[], returncode=0, tail=["Warning\n", '{"a": 1}\n'])
+
+    # Act
+    validated = _load_validate_output(result, None)
+
+    # Assert
+    assert validated == {"a": 1}
+
+
+def test_load_validate_output_without_json(tmp_path):
+    # Arrange
+    output_path = tmp_path / "validate.log"
+    output_path.write_text("Error: not a bundle\n")
+    result = CommandResult(args=[], returncode=0, output_path=output_path)
+
+    # Act & Assert
+    with pytest.raises(json.JSONDecodeError):
+        _load_validate_output(result, None)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import threading
+
+from kedro_databricks.utilities.file_watcher import FileWatcher
+
+
+def _touch(path, content="x", mtime_ns=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_file_watcher_poll(tmp_path):
+    # Arrange
+    _touch(tmp_path / "src" / "a.py", mtime_ns=1_000)
+    _touch(tmp_path / "src" / "b.py", mtime_ns=1_000)
+    _touch(tmp_path / "ignored.txt")
+    watcher = FileWatcher(tmp_path, ["src/**/*.py"])
+
+    # Act
+    unchanged = watcher.poll()
+    _touch(tmp_path / "src" / "a.py", mtime_ns=2_000)
+    (tmp_path / "src" / "b.py").unlink()
+    _touch(tmp_path / "src" / "c.py")
+    _touch(tmp_path / "ignored.txt", "changed")
+    changed = watcher.poll()
+
+    # Assert
+    assert unchanged == set()
+    assert changed == {
+        tmp_path / "src" / "a.py",
+        tmp_path / "src" / "b.py",
+        tmp_path / "src" / "c.py",
+    }
+    assert watcher.poll() == set()
+
+
+def test_file_watcher_wait_collects_burst(tmp_path):
+    # Arrange
+    watcher = FileWatcher(tmp_path, ["*.py"])
+    timer = threading.Timer(0.05, _touch, args=(tmp_path / "a.py",))
+
+    # Act
+    timer.start()
+    changed = watcher.wait(interval=0.01, debounce=0.05)
+    timer.join()
+
+    # Assert
+    assert changed == {tmp_path / "a.py"}
+
+
+def test_file_watcher_wait_stops(tmp_path):
+    # Arrange
+    watcher = FileWatcher(tmp_path, ["*.py"])
+    stop_event = threading.Event()
+    stop_event.set()
+
+    # Act
+    changed = watcher.wait(interval=10, stop_event=stop_event)
+
+    # Assert
+    assert changed == set()
@@ -0,0 +1,59 @@
+from kedro_databricks.utilities.fingerprint import (
+    collect_files,
+    get_state_path,
+    hash_file_stats,
+    hash_files,
+    read_state,
+    write_state,
+)
+
+
+def _make_tree(root):
+    (root / "conf" / "base").mkdir(parents=True)
+    (root / "conf" / "base" / "catalog.yml").write_text("a: 1\n")
+    (root / "conf" / "base" / "__pycache__").mkdir()
+    (root / "conf" / "base" / "__pycache__" / "x.pyc").write_bytes(b"\0")
+    (root / "databricks.yml").write_text("bundle: {}\n")
+
+
+def test_collect_files(tmp_path):
+    _make_tree(tmp_path)
+    files = collect_files(tmp_path, ["databricks.yml", "conf/base/**/*", "missing/*"])
+    assert [f.relative_to(tmp_path).as_posix() for f in files] == [
+        "conf/base/catalog.yml",
+        "databricks.yml",
+    ]
+
+
+def test_hash_files_changes_with_content(tmp_path):
+    _make_tree(tmp_path)
+    files = collect_files(tmp_path, ["**/*"])
+    before = hash_files(tmp_path, files)
+    assert before == hash_files(tmp_path, files), "Hash is not deterministic"
+    (tmp_path / "conf" / "base" / "catalog.yml").write_text("a: 2\n")
+    assert before != hash_files(tmp_path, files), "Hash did not change"
+
+
+def test_hash_files_changes_with_path(tmp_path):
+    _make_tree(tmp_path)
+    before = hash_files(tmp_path, collect_files(tmp_path, ["**/*"]))
+    (tmp_path / "conf" / "base" / "catalog.yml").rename(
+        tmp_path / "conf" / "base" / "catalog2.yml"
+    )
+    assert before != hash_files(tmp_path, collect_files(tmp_path, ["**/*"]))
+
+
+def test_hash_file_stats(tmp_path):
+    _make_tree(tmp_path)
+    files = collect_files(tmp_path, ["**/*"])
+    before = hash_file_stats(tmp_path, files)
+    (tmp_path / "databricks.yml").write_text("bundle: {name: x}\n")
+    assert before != hash_file_stats(tmp_path, files)
+
+
+def test_state_roundtrip(tmp_path):
+    assert read_state(tmp_path, "deploy.dev") == {}
+    write_state(tmp_path, "deploy.dev", {"fingerprint": "abc"})
+    assert read_state(tmp_path, "deploy.dev") == {"fingerprint": "abc"}
+    get_state_path(tmp_path, "deploy.dev").write_text("not json")
+    assert read_state(tmp_path, "deploy.dev") == {}
@@ -0,0 +1,274 @@
+import copy
+import importlib.util
+import json
+from types import SimpleNamespace
+
+import fsspec
+import pytest
+import tomlkit
+
+from kedro_databricks.constants import TEMPLATES
+from kedro_databricks.utilities.instrumentation import (
+    format_report,
+    instrument_resources,
+    is_databricks_run_script_current,
+    load_reports,
+    sort_summaries,
+    summarize_reports,
+    write_databricks_run_script,
+)
+
+
+@pytest.fixture(scope="module")
+def databricks_run():
+    spec = importlib.util.spec_from_file_location(
+        "databricks_run", TEMPLATES / "databricks_run.py"
+    )
+    module = importlib.util.module_from_spec(spec)  # type: ignore
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def _report(run_id, nodes):
+    return {
+        "version": 1,
+        "run_id": run_id,
+        "task_key": "task",
+        "status": "success",
+        "nodes": [
+            {
+                "name": name,
+                "load_seconds": load,
+                "compute_seconds": compute,
+                "save_seconds": save,
+                "datasets": [
+                    {"name": "in", "operation": "load", "seconds": load, "bytes": 100},
+                    {
+                        "name": "out",
+                        "operation": "save",
+                        "seconds": save,
+                        "bytes": None,
+                    },
+                ],
+            }
+            for name, load, compute, save in nodes
+        ],
+    }
+
+
+def test_instrument_resources():
+    # Arrange
+    resources = {
+        "jobs": {
+            "job": {
+                "tasks": [
+                    {
+                        "task_key": "node",
+                        "python_wheel_task": {
+                            "package_name": "pkg",
+                            "entry_point": "pkg",
+                            "parameters": ["--nodes", "node", "--env", "dev"],
+                        },
+                    },
+                    {"task_key": "notebook", "notebook_task": {"path": "/nb"}},
+                ]
+            }
+        },
+        "volumes": {"volume": {"name": "volume"}},
+    }
+    expected = copy.deepcopy(resources)
+
+    # Act
+    result = instrument_resources(resources, "pkg", "/Volumes/a/b/c", task_values=True)
+
+    # Assert
+    assert resources == expected
+    assert result["volumes"] is resources["volumes"]
+    wheel_task, notebook_task = result["jobs"]["job"]["tasks"]
+    assert notebook_task == resources["jobs"]["job"]["tasks"][1]
+    assert wheel_task["python_wheel_task"] == {
+        "package_name": "pkg",
+        "entry_point": "databricks_run",
+        "parameters": [
+            "--nodes",
+            "node",
+            "--env",
+            "dev",
+            "--package-name",
+            "pkg",
+            "--instrument-dir",
+            "/Volumes/a/b/c",
+            "--run-id",
+            "{{job.run_id}}",
+            "--task-key",
+            "{{task.name}}",
+            "--task-values",
+        ],
+    }
+
+
+def test_write_databricks_run_script(metadata):
+    # Arrange
+    script_path = (
+        metadata.project_path / "src" / metadata.package_name / "databricks_run.py"
+    )
+    script_path.unlink(missing_ok=True)
+    missing = is_databricks_run_script_current(metadata)
+
+    # Act
+    written = write_databricks_run_script(metadata)
+    rewritten = write_databricks_run_script(metadata)
+
+    # Assert
+    assert not missing
+    assert written
+    assert not rewritten
+    assert is_databricks_run_script_current(metadata)
+    assert script_path.read_text() == (TEMPLATES / "databricks_run.py").read_text()
+    with open(metadata.project_path / "pyproject.toml") as f:
+        scripts = tomlkit.load(f)["project"]["scripts"]
+    assert scripts["databricks_run"] == f"{metadata.package_name}.databricks_run:main"
+
+    # Cleanup
+    script_path.unlink()
+
+
+def test_load_reports(tmp_path):
+    # Arrange
+    (tmp_path / "1").mkdir()
+    (tmp_path / "1" / "a.json").write_text(json.dumps(_report("1", [])))
+    (tmp_path / "1" / "b.json").write_text(json.dumps(_report(1, [])))
+    (tmp_path / "2.json").write_text(json.dumps(_report("2", [])))
+    (tmp_path / "other.json").write_text(json.dumps({"version": 2}))
+    (tmp_path / "invalid.json").write_text("{")
+
+    # Act
+    everything = load_reports([tmp_path])
+    run = load_reports([tmp_path], run_id="1")
+    single = load_reports([tmp_path / "2.json"])
+
+    # Assert
+    assert len(everything) == 3
+    assert [report["run_id"] for report in run] == ["1", 1]
+    assert single == [_report("2", [])]
+    with pytest.raises(FileNotFoundError):
+        load_reports([tmp_path / "missing"])
+
+
+def test_summarize_reports():
+    # Arrange
+    reports = [
+        _report("1", [("a", 1.0, 2.0, 3.0), ("b", 0.0, 10.0, 0.0)]),
+        _report("2", [("a", 3.0, 4.0, 5.0)]),
+    ]
+
+    # Act
+    a, b = summarize_reports(reports)
+
+    # Assert
+    assert (a.name, a.runs, a.load, a.compute, a.save, a.total) == (
+        "a",
+        2,
+        2.0,
+        3.0,
+        4.0,
+        9.0,
+    )
+    assert (a.bytes_read, a.bytes_written) == (100, None)
+    assert b.to_dict() == {
+        "name": "b",
+        "runs": 1,
+        "load_seconds": 0.0,
+        "compute_seconds": 10.0,
+        "save_seconds": 0.0,
+        "total_seconds": 10.0,
+        "bytes_read": 100,
+        "bytes_written": None,
+    }
+    assert [s.name for s in sort_summaries([a, b], "total")] == ["b", "a"]
+    assert [s.name for s in sort_summaries([b, a], "save")] == ["a", "b"]
+    assert [s.name for s in sort_summaries([b, a], "name")] == ["a", "b"]
+
+
+def test_format_report():
+    # Arrange
+    summaries = summarize_reports([_report("1", [("node", 1.0, 2.5, 0.25)])])
+
+    # Act
+    table = format_report(summaries)
+
+    # Assert
+    assert table.splitlines() == [
+        "node  runs   load  compute   save  total   read  written",
+        "node     1  1.00s    2.50s  0.25s  3.75s  100 B        -",
+    ]
+
+
+def test_instrumentation_hook(databricks_run, tmp_path):
+    # Arrange
+    data = tmp_path / "data.csv"
+    data.write_text("a,b\n1,2\n")
+    datasets = {
+        "data": SimpleNamespace(_fs=fsspec.filesystem("file"), _filepath=data),
+        "memory": SimpleNamespace(),
+    }
+    catalog = SimpleNamespace(get=datasets.get)
+    node = SimpleNamespace(name="node")
+    hook = databricks_run.InstrumentationHook(str(tmp_path), "42", "task")
+
+    # Act
+    hook.after_catalog_created(catalog=catalog)
+    hook.before_dataset_loaded(dataset_name="data", node=node)
+    hook.after_dataset_loaded(dataset_name="data", node=node)
+    hook.before_node_run(node=node)
+    hook.after_node_run(node=node)
+    hook.before_dataset_saved(dataset_name="memory", node=node)
+    hook.after_dataset_saved(dataset_name="memory", node=node)
+    hook.after_pipeline_run(run_params={"env": "dev"})
+
+    # Assert
+    report = json.loads((tmp_path / "42" / "task.json").read_text())
+    assert (report["run_id"], report["task_key"], report["env"]) == (
+        "42",
+        "task",
+        "dev",
+    )
+    assert report["status"] == "success"
+    (node_report,) = report["nodes"]
+    assert node_report["name"] == "node"
+    assert node_report["compute_seconds"] >= 0
+    assert [
+        (d["name"], d["operation"], d["bytes"]) for d in node_report["datasets"]
+    ] == [("data", "load", data.stat().st_size), ("memory", "save", None)]
+    assert summarize_reports(load_reports([tmp_path]))[0].bytes_read == (
+        data.stat().st_size
+    )
+
+
+def test_instrumentation_hook_task_values(databricks_run, tmp_path, monkeypatch):
+    # Arrange
+    values = {}
+    monkeypatch.setattr(databricks_run, "_set_task_value", values.update)
+    hook = databricks_run.InstrumentationHook(str(tmp_path), None, None, True)
+
+    # Act
+    hook.on_pipeline_error(run_params={"session_id": "session"})
+
+    # Assert
+    assert values == {
+        "path": str(tmp_path / "session" / "pipeline.json"),
+        "status": "failed",
+        "load_seconds": 0,
+        "compute_seconds": 0,
+        "save_seconds": 0,
+        "bytes_read": 0,
+        "bytes_written": 0,
+    }
+
+
+def test_parse_params(databricks_run):
+    # Act
+    params = databricks_run._parse_params("a=1,b.c=0.5,b.d=text")
+
+    # Assert
+    assert params == {"a": 1, "b": {"c": 0.5, "d": "text"}}
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from kedro_databricks.utilities import json_select
+from kedro_databricks.utilities.json_select import PathSelector, load_json, select_paths
+
+DOCUMENT = {
+    "bundle": {"name": "project", "target": "dev"},
+    "workspace": {
+        "current_user": {"userName": "user@example.com", "short_name": "user"},
+        "file_path": "/Workspace/Users/user/files",
+    },
+    "resources": {
+        "jobs": {
+            "a": {"id": "1", "tasks": [{"task_key": "x"}, {"task_key": "y"}]},
+            "b": {"id": "2", "tasks": []},
+        }
+    },
+    "variables": [1, 2.5, None, True],
+}
+
+CASES = [
+    (
+        ["workspace.current_user"],
+        {"workspace": {"current_user": DOCUMENT["workspace"]["current_user"]}},
+    ),
+    (
+        ["resources.jobs.*.id", "workspace.file_path"],
+        {
+            "workspace": {"file_path": "/Workspace/Users/user/files"},
+            "resources": {"jobs": {"a": {"id": "1"}, "b": {"id": "2"}}},
+        },
+    ),
+    (
+        ["resources.jobs.a.tasks.*.task_key"],
+        {
+            "resources": {
+                "jobs": {"a": {"tasks": [{"task_key": "x"}, {"task_key": "y"}]}}
+            }
+        },
+    ),
+    (["variables.1"], {"variables": [2.5]}),
+    (["missing"], {}),
+]
+
+
+@pytest.mark.parametrize("paths, expected", CASES)
+def test_select_paths(paths, expected):
+    assert select_paths(DOCUMENT, paths) == expected
+
+
+@pytest.mark.parametrize("paths, expected", CASES)
+def test_load_json_streaming(paths, expected):
+    pytest.importorskip("ijson")
+    fp = io.BytesIO(json.dumps(DOCUMENT).encode())
+    assert load_json(fp, paths) == expected
+
+
+@pytest.mark.parametrize("paths, expected", CASES)
+def test_load_json_without_ijson(monkeypatch, paths, expected):
+    monkeypatch.setattr(json_select, "ijson", None)
+    fp = io.BytesIO(json.dumps(DOCUMENT).encode())
+    assert load_json(fp, paths) == expected
+
+
+def test_load_json_everything():
+    fp = io.BytesIO(json.dumps(DOCUMENT).encode())
+    assert load_json(fp) == DOCUMENT
+
+
+def test_load_json_invalid():
+    pytest.importorskip("ijson")
+    with pytest.raises(json.JSONDecodeError):
+        load_json(io.BytesIO(b'{"workspace": '), ["workspace"])
+
+
+@pytest.mark.parametrize(
+    "document", [b'{"workspace": ', b'{"workspace": tru}', b"[1,", b"", b'{"a": "x']
+)
+def test_load_json_invalid_without_ijson(monkeypatch, document):
+    monkeypatch.setattr(json_select, "ijson", None)
+    with pytest.raises(json.JSONDecodeError):
+        load_json(io.BytesIO(document), ["workspace"])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+def test_parse_across_chunks(chunk_size):
+    # Arrange
+    document = {
+        "numbers": [0, -2.5e3, 12345678901234, 0.125],
+        "text": 'quote " and unicode \u00e9 \u00fc' * 10,
+        "literals": [True, False, None],
+        "nested": {"empty": {}, "arrays": [[], [{}]]},
+    }
+    raw = json.dumps(document, ensure_ascii=False).encode()
+
+    # Act
+    events = json_select._parse(io.BytesIO(raw), chunk_size)
+    result = json_select._stream_select(events, PathSelector(["*"]))
+
+    # Assert
+    assert result == document
+
+
+def test_path_selector():
+    selector = PathSelector(["resources.jobs.*.id"])
+    assert selector.match([]) == "descend"
+    assert selector.match(["resources", "jobs", "a"]) == "descend"
+    assert selector.match(["resources", "jobs", "a", "id"]) == "capture"
+    assert selector.match(["resources", "pipelines"]) == "skip"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+@pytest.mark.parametrize("paths, expected", CASES)
+def test_skip_across_chunks(chunk_size, paths, expected):
+    # Arrange
+    raw = json.dumps(DOCUMENT).replace("x", 'x\\"[{').encode()
+    tokenizer = json_select._Tokenizer(io.BytesIO(raw), chunk_size)
+
+    # Act
+    result = json_select._stream_select(
+        iter(tokenizer), PathSelector(paths), tokenizer.skip
+    )
+
+    # Assert
+    assert result == select_paths(json.loads(raw), paths)
@@ -0,0 +1,184 @@
+import copy
+
+import pytest
+
+from kedro_databricks.utilities.list_merger import (
+    ACCESS_CONTROL_LIST,
+    LIBRARIES,
+    NOTIFICATION_DESTINATIONS,
+    KindedListMerger,
+)
+
+
+@pytest.mark.parametrize(
+    ["item", "expected"],
+    [
+        ({"whl": "a.whl"}, ("whl", "a.whl")),
+        ({"pypi": {"package": "numpy", "repo": "r"}}, ("pypi", "numpy")),
+        ({"maven": {"coordinates": "a:b:1"}}, ("maven", "a:b:1")),
+        ({"cran": {"package": "dplyr"}}, ("cran", "dplyr")),
+        ({"requirements": "/r.txt"}, ("requirements", "/r.txt")),
+        ({"pypi": {"repo": "r"}}, None),
+        ({"pypi": None}, None),
+        ({"nuget": "x"}, None),
+        ("a.whl", None),
+    ],
+)
+def test_libraries_key(item, expected):
+    assert LIBRARIES.key(item) == expected
+
+
+def test_libraries_merge_all_kinds():
+    # Arrange
+    old = [
+        {"whl": "b.whl"},
+        {"pypi": {"package": "numpy"}},
+        {"jar": "a.jar"},
+        {"maven": {"coordinates": "a:b:1", "exclusions": ["x:y"]}},
+        {"whl": "a.whl"},
+    ]
+    new = [
+        {"pypi": {"package": "numpy", "repo": "https://mirror"}},
+        {"cran": {"package": "dplyr"}},
+        {"egg": "a.egg"},
+        {"requirements": "/requirements.txt"},
+        {"maven": {"coordinates": "a:b:1", "exclusions": ["z:w"]}},
+        {"whl": "b.whl"},
+    ]
+
+    # Act
+    result = LIBRARIES(old, new)
+
+    # Assert
+    assert result == [
+        {"cran": {"package": "dplyr"}},
+        {"egg": "a.egg"},
+        {"jar": "a.jar"},
+        {"maven": {"coordinates": "a:b:1", "exclusions": ["x:y", "z:w"]}},
+        {"pypi": {"package": "numpy", "repo": "https://mirror"}},
+        {"requirements": "/requirements.txt"},
+        {"whl": "a.whl"},
+        {"whl": "b.whl"},
+    ]
+
+
+def test_libraries_merge_keeps_unknown_kinds():
+    # Arrange
+    old = [{"nuget": "x"}, {"whl": "a.whl"}]
+    new = [{"pypi": {"repo": "r"}}, {"nuget": "x"}]
+
+    # Act
+    result = LIBRARIES(old, new)
+
+    # Assert
+    assert result == [
+        {"whl": "a.whl"},
+        {"nuget": "x"},
+        {"pypi": {"repo": "r"}},
+        {"nuget": "x"},
+    ]
+
+
+def test_libraries_merge_is_stable():
+    # Arrange
+    libraries = [{"whl": f"{i}.whl"} for i in range(10)]
+
+    # Act
+    forward = LIBRARIES(libraries[:5], libraries[5:])
+    backward = LIBRARIES(libraries[5:][::-1], libraries[:5][::-1])
+
+    # Assert
+    assert forward == backward == sorted(libraries, key=lambda x: x["whl"])
+
+
+def test_merge_does_not_modify_inputs():
+    # Arrange
+    old = [{"group_name": "admins", "permission_level": "CAN_VIEW"}]
+    new = [{"group_name": "admins", "permission_level": "CAN_MANAGE"}]
+    expected_old, expected_new = copy.deepcopy((old, new))
+
+    # Act
+    result = ACCESS_CONTROL_LIST(old, new)
+
+    # Assert
+    assert result == [{"group_name": "admins", "permission_level": "CAN_MANAGE"}]
+    assert (old, new) == (expected_old, expected_new)
+
+
+def test_access_control_list_merge():
+    # Arrange
+    old = [
+        {"user_name": "me@example.com", "permission_level": "IS_OWNER"},
+        {"group_name": "users", "permission_level": "CAN_VIEW"},
+        {"service_principal_name": "spn", "permission_level": "CAN_MANAGE_RUN"},
+    ]
+    new = [
+        {"group_name": "users", "permission_level": "CAN_MANAGE_RUN"},
+        {"group_name": "admins", "permission_level": "CAN_MANAGE"},
+        {"user_name": "me@example.com", "permission_level": None},
+    ]
+
+    # Act
+    result = ACCESS_CONTROL_LIST(old, new)
+
+    # Assert
+    assert result == [
+        {"group_name": "admins", "permission_level": "CAN_MANAGE"},
+        {"group_name": "users", "permission_level": "CAN_MANAGE_RUN"},
+        {"user_name": "me@example.com", "permission_level": "IS_OWNER"},
+        {"service_principal_name": "spn", "permission_level": "CAN_MANAGE_RUN"},
+    ]
+
+
+def test_notification_destinations_merge():
+    # Arrange
+    old = [{"id": "b"}, {"id": "a"}]
+    new = [{"id": "c"}, {"id": "a"}]
+
+    # Act
+    result = NOTIFICATION_DESTINATIONS(old, new)
+
+    # Assert
+    assert result == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+
+
+def test_kinded_list_merger_custom_kinds():
+    # Arrange
+    merger = KindedListMerger({"name": lambda name: name.lower()})
+
+    # Act
+    result = merger(
+        [{"name": "A", "value": {"x": 1, "y": 2}}],
+        [{"name": "a", "value": {"y": 3}}, None],
+    )
+
+    # Assert
+    assert result == [{"name": "a", "value": {"x": 1, "y": 3}}, None]
+
+
+def test_merge_concatenates_nested_lists():
+    # Arrange
+    old = [{"id": "a", "tags": ["x"], "options": {"values": [1]}}]
+    new = [{"id": "a", "tags": ["x", "y"], "options": {"values": [2]}}]
+
+    # Act
+    result = NOTIFICATION_DESTINATIONS(old, new)
+
+    # Assert
+    assert result == [
+        {"id": "a", "tags": ["x", "x", "y"], "options": {"values": [1, 2]}}
+    ]
+
+
+def test_merge_replaces_nested_lists():
+    # Arrange
+    merger = KindedListMerger({"principal": lambda p: p}, concatenate_lists=False)
+
+    # Act
+    result = merger(
+        [{"principal": "users", "privileges": ["READ"]}],
+        [{"principal": "users", "privileges": ["READ", "WRITE"]}],
+    )
+
+    # Assert
+    assert result == [{"principal": "users", "privileges": ["READ", "WRITE"]}]
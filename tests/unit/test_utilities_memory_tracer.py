@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+
+from kedro_databricks.utilities.memory_tracer import (
+    MemoryTracer,
+    format_size,
+    trace_phase,
+)
+
+
+def test_memory_tracer_phases():
+    # Arrange
+    size = 1024 * 1024
+
+    # Act
+    with MemoryTracer(top=3) as tracer:
+        with trace_phase("temporary"):
+            data = bytearray(size)
+            del data
+        with trace_phase("retained"):
+            with trace_phase("nested"):
+                kept = [bytearray(size)]
+
+    # Assert
+    assert [phase.name for phase in tracer.phases] == [
+        "temporary",
+        "nested",
+        "retained",
+    ]
+    temporary, nested, retained = tracer.phases
+    assert temporary.peak >= size and temporary.retained < size
+    assert nested.retained >= size and retained.peak >= size
+    assert __file__ in nested.top[0][0]
+    assert tracer.peak >= size
+    assert not tracemalloc.is_tracing()
+    assert kept
+
+
+def test_memory_tracer_report():
+    # Act
+    with MemoryTracer() as tracer, trace_phase("phase"):
+        data = bytearray(1024)
+
+    # Assert
+    report = tracer.report()
+    assert report.startswith("Peak memory: ")
+    assert "\n  phase: peak " in report
+    assert data
+
+
+def test_memory_tracer_nested():
+    with MemoryTracer(), pytest.raises(RuntimeError, match="already active"):
+        with MemoryTracer():
+            pass
+
+
+def test_trace_phase_inactive():
+    # Act
+    with trace_phase("phase"):
+        pass
+
+    # Assert
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.parametrize(
+    ["size", "expected"],
+    [
+        (512, "512 B"),
+        (1536, "1.5 KiB"),
+        (3 * 1024 * 1024, "3.0 MiB"),
+        (2 * 1024**3, "2.0 GiB"),
+    ],
+)
+def test_format_size(size, expected):
+    assert format_size(size) == expected
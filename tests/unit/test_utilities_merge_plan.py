@@ -0,0 +1,90 @@
+import copy
+
+from kedro_databricks.utilities.list_merger import KindedListMerger, value_key
+from kedro_databricks.utilities.merge_plan import MergePlan
+from kedro_databricks.utilities.provenance import Provenance
+
+PLAN = MergePlan(
+    {
+        "config": {
+            "entities": KindedListMerger({"name": value_key}, concatenate_lists=False)
+        },
+        "grants": KindedListMerger({"principal": value_key}, concatenate_lists=False),
+    }
+)
+
+
+def test_merge_plan_merge():
+    # Arrange
+    old = {
+        "name": "endpoint",
+        "config": {
+            "entities": [{"name": "a", "size": "Small", "env": {"X": "1"}}],
+            "timeout": 10,
+        },
+        "grants": [{"principal": "users", "privileges": ["READ"]}],
+        "tags": ["x"],
+    }
+    new = {
+        "config": {"entities": [{"name": "a", "size": "Large", "env": {"Y": "2"}}]},
+        "grants": [{"principal": "users", "privileges": ["READ", "WRITE"]}],
+        "tags": ["y"],
+        "comment": None,
+    }
+    expected_old, expected_new = copy.deepcopy((old, new))
+
+    # Act
+    result = PLAN.merge(old, new)
+
+    # Assert
+    assert result == {
+        "name": "endpoint",
+        "config": {
+            "entities": [{"name": "a", "size": "Large", "env": {"X": "1", "Y": "2"}}],
+            "timeout": 10,
+        },
+        "grants": [{"principal": "users", "privileges": ["READ", "WRITE"]}],
+        "tags": ["y"],
+    }
+    assert (old, new) == (expected_old, expected_new)
+
+
+def test_merge_plan_merge_non_objects():
+    assert PLAN.merge({"a": 1}, None) == {"a": 1}
+    assert PLAN.merge({"a": 1}, "${var.x}") == "${var.x}"
+    assert PLAN.merge(None, {"grants": [{"principal": "b"}, {"principal": "a"}]}) == {
+        "grants": [{"principal": "b"}, {"principal": "a"}]
+    }
+    assert PLAN.merge({}, {"grants": [{"principal": "b"}, {"principal": "a"}]}) == {
+        "grants": [{"principal": "a"}, {"principal": "b"}]
+    }
+
+
+def test_merge_plan_record():
+    # Arrange
+    provenance = Provenance()
+
+    # Act
+    PLAN.record(
+        provenance,
+        "a",
+        {
+            "config": {"entities": [{"name": "x", "size": "Small"}]},
+            "grants": [{"principal": "users"}, {"privileges": ["READ"]}],
+            "tags": ["x", "y"],
+        },
+    )
+    PLAN.record(
+        provenance,
+        "b",
+        {"config": {"entities": [{"name": "x", "size": "Large"}]}, "tags": ["z"]},
+    )
+
+    # Assert
+    assert provenance.select() == {
+        "config.entities[x].name": "b",
+        "config.entities[x].size": "b",
+        "grants[0].privileges[0]": "a",
+        "grants[users].principal": "a",
+        "tags[0]": "b",
+    }
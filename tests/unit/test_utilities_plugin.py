@@ -1,14 +1,21 @@
-from kedro_databricks.plugin import Path, commands
+import subprocess
+import sys
+from pathlib import Path
+
+from kedro_databricks.commands import COMMANDS
+from kedro_databricks.plugin import commands
+from kedro_databricks.utilities.plugin import Plugin, discover_commands
+
+COMMANDS_PATH = (
+    Path(__file__).parent.parent.parent / "src" / "kedro_databricks" / "commands"
+)
 
 
 def test_plugin_list_commands(cli_runner, metadata):
     # Arrange
-    commands_path = (
-        Path(__file__).parent.parent.parent / "src" / "kedro_databricks" / "commands"
-    )
     cmds = [
         p
-        for p in commands_path.iterdir()
+        for p in COMMANDS_PATH.iterdir()
         if p.is_file() and p.suffix == ".py" and p.stem != "__init__"
     ]
 
@@ -23,7 +30,7 @@ def test_plugin_list_commands(cli_runner, metadata):
     assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
 
     for cmd in cmds:
-        assert f"{cmd.stem}" in result.stdout
+        assert cmd.stem.replace("_", "-") in result.stdout
 
 
 def test_plugin_get_command(cli_runner, metadata):
@@ -48,3 +55,67 @@ def test_plugin_get_invalid_command(cli_runner, metadata):
 
     # Assert
     assert result.exit_code == 2, (result.exit_code, result.stdout, result.exception)
+
+
+def test_plugin_registry_is_up_to_date():
+    # Act
+    registry = discover_commands(COMMANDS_PATH)
+
+    # Assert
+    assert registry == COMMANDS, (
+        "The command registry is out of date, "
+        "run `python scripts/generate_command_registry.py`"
+    )
+
+
+def test_plugin_get_command_is_cached():
+    # Arrange
+    plugin = Plugin(registry=COMMANDS, name="databricks")
+
+    # Act
+    first = plugin.get_command(None, "version")  # type: ignore
+    second = plugin.get_command(None, "version")  # type: ignore
+
+    # Assert
+    assert first is second
+    assert plugin.get_command(None, "non-existent-command") is None  # type: ignore
+
+
+def test_plugin_shell_complete():
+    # Arrange
+    plugin = Plugin(registry=COMMANDS, name="databricks")
+    ctx = plugin.make_context("databricks", [], resilient_parsing=True)
+
+    # Act
+    items = plugin.shell_complete(ctx, "de")
+
+    # Assert
+    assert [item.value for item in items] == ["deploy", "destroy"]
+    assert items[0].help == COMMANDS["deploy"].help
+    assert plugin._loaded == {}
+
+
+def test_plugin_help_does_not_import_commands():
+    # Arrange
+    code = (
+        "import sys\n"
+        "from kedro_databricks.plugin import commands\n"
+        "commands(['databricks', '--help'], standalone_mode=False)\n"
+        "loaded = [m for m in sys.modules if m.startswith('kedro_databricks.commands.')]\n"
+        "print(','.join(loaded), file=sys.stderr)\n"
+    )
+
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=Path(__file__).parent.parent.parent,
+    )
+
+    # Assert
+    assert result.returncode == 0, result.stderr
+    assert result.stderr.strip() == ""
+    for name in COMMANDS:
+        assert name in result.stdout
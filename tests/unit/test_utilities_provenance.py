@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import yaml
+
+from kedro_databricks.utilities.provenance import (
+    GENERATED,
+    Provenance,
+    find_config_files,
+)
+from kedro_databricks.utilities.resource_overrider import (
+    DefaultResourceOverrider,
+    JobsResourceOverrider,
+)
+
+
+def test_provenance_record():
+    # Arrange
+    provenance = Provenance()
+
+    # Act
+    provenance.record(
+        "a",
+        {
+            "tags": {"team": "data"},
+            "libraries": [{"whl": "x.whl"}, {"pypi": {"package": "numpy"}}],
+            "parameters": ["--env", "dev"],
+            "timeout_seconds": None,
+        },
+    )
+    provenance.record(
+        "b",
+        {
+            "tags": {"owner": "me"},
+            "libraries": [{"whl": "x.whl"}],
+            "parameters": ["--verbose"],
+        },
+    )
+
+    # Assert
+    assert provenance.select() == {
+        "libraries[pypi=numpy].pypi.package": "a",
+        "libraries[whl=x.whl].whl": "b",
+        "parameters[0]": "a",
+        "parameters[1]": "a",
+        "parameters[2]": "b",
+        "tags.owner": "b",
+        "tags.team": "a",
+    }
+    assert provenance.select("tags") == {"tags.owner": "b", "tags.team": "a"}
+
+
+def test_provenance_replace():
+    # Arrange
+    provenance = Provenance()
+    provenance.record("a", {"spec": {"x": 1, "y": 2}, "specs": ["z"]})
+
+    # Act
+    provenance.replace("b", {"x": 3}, "spec")
+
+    # Assert
+    assert provenance.select() == {"spec.x": "b", "specs[0]": "a"}
+
+
+def test_jobs_overrider_record_provenance():
+    # Arrange
+    resource = {
+        "name": "job_ml",
+        "tasks": [
+            {"task_key": "train", "python_wheel_task": {"package_name": "p"}},
+            {"task_key": "score", "depends_on": [{"task_key": "train"}]},
+        ],
+    }
+    overrides = {
+        "default": {
+            "tags": {"team": "data"},
+            "tasks": [{"task_key": "default", "max_retries": 1}],
+        },
+        "re:.*_ml": {
+            "tasks": [
+                {"task_key": "re:tr.*", "max_retries": 2},
+                {"task_key": "default", "timeout_seconds": 60},
+            ]
+        },
+        "job_ml": {
+            "tags": {"team": "ml"},
+            "tasks": [{"task_key": "score", "max_retries": 3}],
+        },
+    }
+    provenance = Provenance()
+
+    # Act
+    JobsResourceOverrider().record_provenance(
+        provenance, "jobs", "job_ml", resource, overrides, "default"
+    )
+
+    # Assert
+    assert provenance.select() == {
+        "name": GENERATED,
+        "tags.team": "resources.jobs.job_ml",
+        "tasks[score].depends_on[train].task_key": GENERATED,
+        "tasks[score].max_retries": "resources.jobs.job_ml.tasks[score]",
+        "tasks[score].task_key": "resources.jobs.job_ml.tasks[score]",
+        "tasks[score].timeout_seconds": "resources.jobs.re:.*_ml.tasks[default]",
+        "tasks[train].max_retries": "resources.jobs.re:.*_ml.tasks[re:tr.*]",
+        "tasks[train].python_wheel_task.package_name": GENERATED,
+        "tasks[train].task_key": GENERATED,
+        "tasks[train].timeout_seconds": "resources.jobs.re:.*_ml.tasks[default]",
+    }
+
+
+def test_jobs_overrider_record_provenance_layered_patterns():
+    # Arrange
+    resource = {"name": "job_ml", "tasks": [{"task_key": "train_model"}]}
+    overrides = {
+        "glob:job_*": {"timeout_seconds": 60},
+        "re:.*": {
+            "timeout_seconds": 30,
+            "max_concurrent_runs": 1,
+            "tasks": [
+                {"task_key": "glob:*_model", "max_retries": 2},
+                {"task_key": "re:.*", "max_retries": 1, "timeout_seconds": 10},
+            ],
+        },
+    }
+    provenance = Provenance()
+
+    # Act
+    JobsResourceOverrider().record_provenance(
+        provenance, "jobs", "job_ml", resource, overrides, "default"
+    )
+
+    # Assert
+    assert provenance.select() == {
+        "max_concurrent_runs": "resources.jobs.re:.*",
+        "name": GENERATED,
+        "tasks[train_model].max_retries": "resources.jobs.re:.*.tasks[glob:*_model]",
+        "tasks[train_model].task_key": GENERATED,
+        "tasks[train_model].timeout_seconds": "resources.jobs.re:.*.tasks[re:.*]",
+        "timeout_seconds": "resources.jobs.glob:job_*",
+    }
+
+
+def test_default_overrider_record_provenance():
+    # Arrange
+    provenance = Provenance()
+
+    # Act
+    DefaultResourceOverrider().record_provenance(
+        provenance,
+        "volumes",
+        "volume",
+        {"name": "volume", "grants": {"a": 1, "b": 2}},
+        {"default": {"grants": {"c": 3}}, "volume": {"comment": "x"}},
+        "default",
+    )
+
+    # Assert
+    assert provenance.select() == {
+        "comment": "resources.volumes.volume",
+        "grants.c": "resources.volumes.default",
+        "name": GENERATED,
+    }
+
+
+def test_find_config_files(tmp_path):
+    # Arrange
+    for env, jobs in [
+        ("base", {"default": {}, "job": {"tasks": [{"task_key": "a"}]}}),
+        ("dev", {"job": {"tasks": [{"task_key": "b"}]}}),
+    ]:
+        (tmp_path / env).mkdir()
+        with open(tmp_path / env / "databricks.yml", "w") as f:
+            yaml.safe_dump({"resources": {"jobs": jobs}}, f)
+
+    # Act
+    files = find_config_files(
+        [tmp_path / "dev", tmp_path / "base"],
+        [
+            "resources.jobs.default",
+            "resources.jobs.job",
+            "resources.jobs.job.tasks[a]",
+            "resources.jobs.missing",
+            GENERATED,
+        ],
+    )
+
+    # Assert
+    assert files == {
+        "resources.jobs.default": tmp_path / "base" / "databricks.yml",
+        "resources.jobs.job": tmp_path / "dev" / "databricks.yml",
+        "resources.jobs.job.tasks[a]": tmp_path / "base" / "databricks.yml",
+    }
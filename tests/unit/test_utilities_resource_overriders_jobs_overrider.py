@@ -1,3 +1,4 @@
+import copy
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -48,6 +49,28 @@ def test_job_overrider(example_name):
     assert result == example.result
 
 
+@pytest.mark.parametrize("example_name", EXAMPLES)
+def test_job_overrider_does_not_modify_inputs(example_name):
+    # Arrange
+    example = _load_example(example_name)
+    jobs = example.resources.get("resources", {}).get("jobs", {})
+    overrides = example.overrides.get("resources", {}).get("jobs", {})
+    expected_jobs, expected_overrides = copy.deepcopy((jobs, overrides))
+
+    # Act
+    for job_name, job in jobs.items():
+        JobsResourceOverrider().override(
+            resource_key=job_name,
+            resource=job,
+            overrides=overrides,
+            default_key="default",
+        )
+
+    # Assert
+    assert jobs == expected_jobs
+    assert overrides == expected_overrides
+
+
 @pytest.mark.parametrize(
     ["args", "error", "match"],
     [
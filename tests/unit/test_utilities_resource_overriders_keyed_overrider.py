@@ -0,0 +1,197 @@
+import copy
+
+import pytest
+
+from kedro_databricks.utilities.provenance import GENERATED, Provenance
+from kedro_databricks.utilities.resource_overrider import (
+    RESOURCE_OVERRIDER_RESOLVER,
+    DefaultResourceOverrider,
+    JobsResourceOverrider,
+    KeyedResourceOverrider,
+    PipelinesResourceOverrider,
+    VolumesResourceOverrider,
+)
+
+
+@pytest.mark.parametrize(
+    ["args", "error", "match"],
+    [
+        ([None, None, {}], ValueError, "resource must be a dictionary"),
+        ([None, {}, None], ValueError, "overrides must be a dictionary"),
+    ],
+)
+def test_override_fail(args, error, match):
+    with pytest.raises(error, match=match):
+        KeyedResourceOverrider().override(*args)
+
+
+@pytest.mark.parametrize(
+    ["resource_type", "expected"],
+    [
+        ("jobs", JobsResourceOverrider),
+        ("volumes", VolumesResourceOverrider),
+        ("pipelines", PipelinesResourceOverrider),
+        ("unknown", DefaultResourceOverrider),
+    ],
+)
+def test_resolve_overrider(resource_type, expected):
+    assert RESOURCE_OVERRIDER_RESOLVER.resolve(resource_type) is expected
+
+
+@pytest.mark.parametrize(
+    ["resource_type", "resource", "overrides", "expected"],
+    [
+        (
+            "volumes",
+            {"name": "raw_sales", "catalog_name": "main"},
+            {
+                "default": {
+                    "schema_name": "default",
+                    "grants": [{"principal": "users", "privileges": ["READ_VOLUME"]}],
+                },
+                "glob:raw_*": {"volume_type": "EXTERNAL"},
+                "raw_sales": {
+                    "grants": [
+                        {"principal": "users", "privileges": ["WRITE_VOLUME"]},
+                        {"principal": "admins", "privileges": ["ALL_PRIVILEGES"]},
+                    ]
+                },
+            },
+            {
+                "name": "raw_sales",
+                "catalog_name": "main",
+                "schema_name": "default",
+                "grants": [
+                    {"principal": "admins", "privileges": ["ALL_PRIVILEGES"]},
+                    {"principal": "users", "privileges": ["WRITE_VOLUME"]},
+                ],
+                "volume_type": "EXTERNAL",
+            },
+        ),
+        (
+            "clusters",
+            {
+                "spark_conf": {"a": "1"},
+                "init_scripts": [{"volumes": {"destination": "/a.sh"}}],
+            },
+            {
+                "default": {
+                    "spark_conf": {"b": "2"},
+                    "init_scripts": [{"workspace": {"destination": "/b.sh"}}],
+                    "permissions": [{"group_name": "users", "level": "CAN_ATTACH_TO"}],
+                },
+                "cluster": {
+                    "permissions": [{"group_name": "users", "level": "CAN_RESTART"}]
+                },
+            },
+            {
+                "spark_conf": {"a": "1", "b": "2"},
+                "init_scripts": [
+                    {"workspace": {"destination": "/b.sh"}},
+                    {"volumes": {"destination": "/a.sh"}},
+                ],
+                "permissions": [{"group_name": "users", "level": "CAN_RESTART"}],
+            },
+        ),
+        (
+            "model_serving_endpoints",
+            {
+                "config": {
+                    "served_entities": [{"name": "model", "workload_size": "Small"}],
+                    "traffic_config": {
+                        "routes": [
+                            {"served_model_name": "model", "traffic_percentage": 100}
+                        ]
+                    },
+                }
+            },
+            {
+                "re:.*": {
+                    "config": {
+                        "served_entities": [
+                            {"name": "model", "scale_to_zero_enabled": True}
+                        ]
+                    },
+                    "tags": [{"key": "team", "value": "ml"}],
+                },
+                "endpoint": {
+                    "config": {
+                        "served_entities": [{"name": "model", "workload_size": "Large"}]
+                    }
+                },
+            },
+            {
+                "config": {
+                    "served_entities": [
+                        {
+                            "name": "model",
+                            "workload_size": "Large",
+                            "scale_to_zero_enabled": True,
+                        }
+                    ],
+                    "traffic_config": {
+                        "routes": [
+                            {"served_model_name": "model", "traffic_percentage": 100}
+                        ]
+                    },
+                },
+                "tags": [{"key": "team", "value": "ml"}],
+            },
+        ),
+        (
+            "schemas",
+            {"name": "s"},
+            {
+                "default": {"properties": {"a": "1"}},
+                "re:x.*": {"comment": "not applied"},
+            },
+            {"name": "s", "properties": {"a": "1"}},
+        ),
+    ],
+)
+def test_keyed_resource_overrider(resource_type, resource, overrides, expected):
+    # Arrange
+    overrider = RESOURCE_OVERRIDER_RESOLVER.resolve(resource_type)()
+    resource_key = {"volumes": "raw_sales", "clusters": "cluster"}.get(
+        resource_type, "endpoint"
+    )
+    expected_inputs = copy.deepcopy((resource, overrides))
+
+    # Act
+    result = overrider.override(resource_key, resource, overrides, "default")
+
+    # Assert
+    assert result == expected
+    assert (resource, overrides) == expected_inputs
+
+
+def test_keyed_resource_overrider_record_provenance():
+    # Arrange
+    resource = {
+        "name": "pipeline",
+        "clusters": [{"label": "default", "num_workers": 1}],
+    }
+    overrides = {
+        "default": {
+            "clusters": [{"label": "default", "num_workers": 2}],
+            "libraries": [{"notebook": {"path": "/a"}}],
+        },
+        "glob:pipe*": {"configuration": {"env": "dev"}},
+        "pipeline": {"libraries": [{"file": {"path": "/b.py"}}]},
+    }
+    provenance = Provenance()
+
+    # Act
+    PipelinesResourceOverrider().record_provenance(
+        provenance, "pipelines", "pipeline", resource, overrides, "default"
+    )
+
+    # Assert
+    assert provenance.select() == {
+        "clusters[default].label": "resources.pipelines.default",
+        "clusters[default].num_workers": "resources.pipelines.default",
+        "configuration.env": "resources.pipelines.glob:pipe*",
+        "libraries[file=/b.py].file.path": "resources.pipelines.pipeline",
+        "libraries[notebook=/a].notebook.path": "resources.pipelines.default",
+        "name": GENERATED,
+    }
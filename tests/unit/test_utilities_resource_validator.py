@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import pytest
+
+from kedro_databricks.utilities.resource_validator import (
+    ValidationIssue,
+    compile_schema,
+    validate_resources,
+)
+
+
+def _job(**fields):
+    return {
+        "name": "job",
+        "tasks": [
+            {
+                "task_key": "a",
+                "python_wheel_task": {"package_name": "p", "entry_point": "e"},
+            },
+            {"task_key": "b", "depends_on": [{"task_key": "a"}]},
+        ],
+        **fields,
+    }
+
+
+def test_validate_resources_valid():
+    # Arrange
+    job = _job(
+        tags={"team": "data", "cost_center": 1234},
+        max_concurrent_runs="2",
+        schedule={
+            "quartz_cron_expression": "0 0 * * * ?",
+            "timezone_id": "UTC",
+            "pause_status": "${var.pause_status}",
+        },
+        job_clusters=[
+            {
+                "job_cluster_key": "default",
+                "new_cluster": {"num_workers": 2, "spark_conf": {"a": "b"}},
+            }
+        ],
+        timeout_seconds=None,
+    )
+
+    # Act
+    issues = validate_resources({"jobs": {"job": job}, "volumes": {"v": {"x": 1}}})
+
+    # Assert
+    assert issues == []
+
+
+@pytest.mark.parametrize(
+    ["fields", "expected"],
+    [
+        (
+            {"max_concurrent_runs": "two"},
+            ("jobs.job.max_concurrent_runs", "expected an integer, got 'two'"),
+        ),
+        (
+            {"tags": ["team"]},
+            ("jobs.job.tags", "expected an object, got a list"),
+        ),
+        (
+            {"schedule": {"quartz_cron_expression": "0 0 * * * ?"}},
+            ("jobs.job.schedule", "missing required field 'timezone_id'"),
+        ),
+        (
+            {"access_control_list": [{"permission_level": "CAN_RUN"}]},
+            (
+                "jobs.job.access_control_list[0].permission_level",
+                "invalid value 'CAN_RUN', expected one of CAN_MANAGE, "
+                "CAN_MANAGE_RUN, CAN_VIEW, IS_OWNER",
+            ),
+        ),
+        (
+            {
+                "job_clusters": [
+                    {"job_cluster_key": "a", "new_cluster": {"num_workers": True}}
+                ]
+            },
+            (
+                "jobs.job.job_clusters[0].new_cluster.num_workers",
+                "expected an integer, got True",
+            ),
+        ),
+    ],
+)
+def test_validate_resources_invalid_fields(fields, expected):
+    # Act
+    issues = validate_resources({"jobs": {"job": _job(**fields)}})
+
+    # Assert
+    assert issues == [ValidationIssue(*expected)]
+
+
+def test_validate_resources_unknown_fields():
+    # Arrange
+    job = _job(notitication_settings={})
+    job["tasks"][0]["max_retires"] = 3
+
+    # Act
+    issues = validate_resources({"jobs": {"job": job}})
+
+    # Assert
+    assert [str(issue) for issue in issues] == [
+        "jobs.job.tasks[0].max_retires: unknown field 'max_retires', "
+        "did you mean 'max_retries'?",
+        "jobs.job.notitication_settings: unknown field 'notitication_settings', "
+        "did you mean 'notification_settings'?",
+    ]
+    assert not any(issue.error for issue in issues)
+
+
+def test_validate_resources_task_dependencies():
+    # Arrange
+    job = _job()
+    job["tasks"].append({"task_key": "a", "depends_on": [{"task_key": "c"}]})
+
+    # Act
+    issues = validate_resources({"jobs": {"job": job}})
+
+    # Assert
+    assert [str(issue) for issue in issues] == [
+        "jobs.job.tasks[2].task_key: duplicate task key 'a'",
+        "jobs.job.tasks[2].depends_on[0].task_key: depends on unknown task 'c'",
+    ]
+
+
+def test_validate_resources_nested_tasks():
+    # Arrange
+    job = _job()
+    job["tasks"][1]["for_each_task"] = {"inputs": "[1, 2]", "task": {"max_retries": 1}}
+
+    # Act
+    issues = validate_resources({"jobs": {"job": job}})
+
+    # Assert
+    assert [str(issue) for issue in issues] == [
+        "jobs.job.tasks[1].for_each_task.task: missing required field 'task_key'"
+    ]
+
+
+def test_compile_schema():
+    # Arrange
+    validate = compile_schema(
+        {
+            "type": "array",
+            "items": {"$ref": "#/$defs/Node"},
+        },
+        {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "flag": {"type": "boolean"},
+                    "ratio": {"type": "number"},
+                    "children": {"type": "array", "items": {"$ref": "#/$defs/Node"}},
+                },
+            }
+        },
+    )
+    issues = []
+
+    # Act
+    validate(
+        [{"flag": "true", "ratio": "0.5", "children": [{"flag": "yes", "ratio": "x"}]}],
+        "root",
+        None,
+        issues,
+    )
+
+    # Assert
+    assert [str(issue) for issue in issues] == [
+        "root[0].children[0].flag: expected a boolean, got 'yes'",
+        "root[0].children[0].ratio: expected a number, got 'x'",
+    ]
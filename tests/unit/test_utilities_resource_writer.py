@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import copy
+import types
+
+import pytest
+import yaml
+
+from kedro_databricks.utilities.resource_writer import save_resources, share_identical
+
+RESOURCES = {
+    "volumes": {"volume": {"name": "volume"}},
+    "jobs": {
+        "project_b": {"name": "project_b"},
+        "project": {"name": "project"},
+        "project_a": {"name": "project_a"},
+    },
+}
+
+
+@pytest.fixture
+def metadata(tmp_path):
+    return types.SimpleNamespace(project_path=tmp_path)
+
+
+def _names(metadata):
+    return sorted(p.name for p in (metadata.project_path / "resources").iterdir())
+
+
+def _load(metadata, name):
+    with open(metadata.project_path / "resources" / name) as f:
+        return yaml.safe_load(f)
+
+
+def test_save_resources_per_job(metadata):
+    # Act
+    written = save_resources(metadata, "dev", RESOURCES, overwrite=True)
+    rewritten = save_resources(metadata, "dev", RESOURCES, overwrite=True)
+
+    # Assert
+    assert [p.name for p in written] == [
+        "target.dev.jobs.project.yml",
+        "target.dev.jobs.project_a.yml",
+        "target.dev.jobs.project_b.yml",
+        "target.dev.volumes.volume.yml",
+    ]
+    assert rewritten == []
+    assert _load(metadata, "target.dev.jobs.project_a.yml") == {
+        "targets": {
+            "dev": {"resources": {"jobs": {"project_a": {"name": "project_a"}}}}
+        }
+    }
+
+
+def test_save_resources_single(metadata):
+    # Arrange
+    save_resources(metadata, "dev", RESOURCES, overwrite=True)
+    save_resources(metadata, "prod", RESOURCES, overwrite=True)
+
+    # Act
+    written = save_resources(
+        metadata, "dev", RESOURCES, overwrite=True, layout="single"
+    )
+
+    # Assert
+    assert [p.name for p in written] == ["target.dev.yml"]
+    assert "target.dev.yml" in _names(metadata)
+    assert not any(n.startswith("target.dev.jobs") for n in _names(metadata))
+    assert "target.prod.jobs.project.yml" in _names(metadata)
+    content = (metadata.project_path / "resources" / "target.dev.yml").read_text()
+    resources = yaml.safe_load(content)["targets"]["dev"]["resources"]
+    assert list(resources) == ["jobs", "volumes"]
+    assert list(resources["jobs"]) == ["project", "project_a", "project_b"]
+
+
+def test_save_resources_sharded(metadata):
+    # Act
+    written = save_resources(
+        metadata, "dev", RESOURCES, overwrite=True, layout="sharded", shards=2
+    )
+    again = save_resources(
+        metadata, "dev", RESOURCES, overwrite=True, layout="sharded", shards=2
+    )
+
+    # Assert
+    assert again == []
+    assert 1 <= len(written) <= 2
+    assert all(p.name.startswith("target.dev.shard-") for p in written)
+    merged = {}
+    for path in written:
+        for rtype, items in _load(metadata, path.name)["targets"]["dev"][
+            "resources"
+        ].items():
+            merged.setdefault(rtype, {}).update(items)
+    assert merged == RESOURCES
+
+
+def test_save_resources_switching_back_to_per_job(metadata):
+    # Arrange
+    save_resources(metadata, "dev", RESOURCES, overwrite=True, layout="sharded")
+
+    # Act
+    save_resources(metadata, "dev", RESOURCES, overwrite=True)
+
+    # Assert
+    assert not any("shard" in n for n in _names(metadata))
+    assert len(_names(metadata)) == 4
+
+
+@pytest.mark.parametrize("layout", ["per-job", "single", "sharded"])
+def test_save_resources_without_overwrite_keeps_existing_files(metadata, layout):
+    # Arrange
+    resources_dir = metadata.project_path / "resources"
+    resources_dir.mkdir()
+    existing = {
+        "target.dev.yml": "handwritten: true\n",
+        "target.dev.jobs.other.yml": "other: true\n",
+        "target.dev.shard-0.yml": "shard: true\n",
+        "target.dev.jobs.project.yml": "project: true\n",
+    }
+    for name, content in existing.items():
+        (resources_dir / name).write_text(content)
+
+    # Act
+    save_resources(metadata, "dev", RESOURCES, overwrite=False, layout=layout, shards=1)
+
+    # Assert
+    for name, content in existing.items():
+        assert (resources_dir / name).read_text() == content
+
+
+def test_save_resources_overwrite_keeps_files_not_written_by_plugin(metadata):
+    # Arrange
+    resources_dir = metadata.project_path / "resources"
+    resources_dir.mkdir()
+    (resources_dir / "target.dev.jobs.other.yml").write_text("other: true\n")
+    (resources_dir / "target.dev.shard-3.yml").write_text("shard: true\n")
+    save_resources(metadata, "dev", RESOURCES, overwrite=True)
+
+    # Act
+    save_resources(metadata, "dev", RESOURCES, overwrite=True, layout="single")
+
+    # Assert
+    assert _names(metadata) == [
+        "target.dev.jobs.other.yml",
+        "target.dev.shard-3.yml",
+        "target.dev.yml",
+    ]
+
+
+def test_save_resources_invalid(metadata):
+    with pytest.raises(ValueError, match="Invalid output layout"):
+        save_resources(metadata, "dev", RESOURCES, overwrite=True, layout="other")
+    with pytest.raises(ValueError, match="Invalid output format"):
+        save_resources(metadata, "dev", RESOURCES, overwrite=True, output_format="x")
+    with pytest.raises(ValueError, match="must be positive"):
+        save_resources(
+            metadata, "dev", RESOURCES, overwrite=True, layout="sharded", shards=0
+        )
+
+
+@pytest.mark.parametrize("output_format", ["yaml", "json"])
+def test_save_resources_formats(metadata, output_format):
+    # Arrange
+    resources = {"jobs": {"job": {"name": "jöb", "tasks": [{"task_key": "a: b"}]}}}
+
+    # Act
+    written = save_resources(
+        metadata, "dev", resources, overwrite=True, output_format=output_format
+    )
+
+    # Assert
+    assert [p.name for p in written] == ["target.dev.jobs.job.yml"]
+    assert _load(metadata, "target.dev.jobs.job.yml") == {
+        "targets": {"dev": {"resources": resources}}
+    }
+    assert _names(metadata) == ["target.dev.jobs.job.yml"]
+
+
+def test_save_resources_json_is_compact(metadata):
+    # Act
+    save_resources(metadata, "dev", RESOURCES, overwrite=True, output_format="json")
+
+    # Assert
+    content = (
+        metadata.project_path / "resources" / "target.dev.jobs.project.yml"
+    ).read_text()
+    assert content == (
+        '{"targets":{"dev":{"resources":{"jobs":{"project":{"name":"project"}}}}}}\n'
+    )
+
+
+def test_share_identical():
+    # Arrange
+    libraries = [{"whl": "a.whl"}, {"pypi": {"package": "b"}}]
+    data = {
+        "tasks": [
+            {"task_key": f"node_{i}", "libraries": copy.deepcopy(libraries), "x": []}
+            for i in range(3)
+        ]
+    }
+    original = copy.deepcopy(data)
+
+    # Act
+    result = share_identical(data)
+
+    # Assert
+    assert result == original
+    assert data == original
+    tasks = result["tasks"]
+    assert tasks[0]["libraries"] is tasks[1]["libraries"] is tasks[2]["libraries"]
+    assert tasks[0]["x"] is not tasks[1]["x"]
+    assert tasks[0] is not tasks[1]
+    assert share_identical([1, True, 1.0]) == [1, True, 1.0]
+
+
+def test_save_resources_shared_values_without_anchors(metadata):
+    # Arrange
+    libraries = [{"whl": "../dist/*.whl"}]
+    resources = {
+        "jobs": {
+            "job": {
+                "tasks": [
+                    {"task_key": f"n{i}", "libraries": libraries} for i in range(2)
+                ]
+            }
+        }
+    }
+
+    # Act
+    save_resources(metadata, "dev", resources, overwrite=True)
+
+    # Assert
+    content = (
+        metadata.project_path / "resources" / "target.dev.jobs.job.yml"
+    ).read_text()
+    assert "&id" not in content
+    assert content.count("whl: ../dist/*.whl") == 2
+
+
+def test_save_resources_yaml_anchors(metadata):
+    # Arrange
+    task = {"health": {"rules": [{"metric": "RUN"}, {"metric": "QUEUE"}]}}
+    resources = {
+        "jobs": {"job": {"tasks": [{"task_key": f"n{i}", **task} for i in range(3)]}}
+    }
+
+    # Act
+    save_resources(metadata, "dev", resources, overwrite=True, yaml_anchors=True)
+
+    # Assert
+    content = (
+        metadata.project_path / "resources" / "target.dev.jobs.job.yml"
+    ).read_text()
+    assert content.count("&id001") == 1
+    assert content.count("*id001") == 2
+    assert _load(metadata, "target.dev.jobs.job.yml") == {
+        "targets": {"dev": {"resources": resources}}
+    }
+    with pytest.raises(ValueError, match="YAML anchors"):
+        save_resources(
+            metadata,
+            "dev",
+            resources,
+            overwrite=True,
+            output_format="json",
+            yaml_anchors=True,
+        )
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import io
+import sys
+import threading
+
+import pytest
+
+from kedro_databricks.utilities import subprocess_runner
+from kedro_databricks.utilities.subprocess_runner import CommandResult, run_command
+
+
+def _python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_run_command_streams_output():
+    # Arrange
+    stream = io.StringIO()
+
+    # Act
+    with run_command(
+        _python("import sys; print('out'); print('err', file=sys.stderr)"),
+        stream=stream,
+    ) as result:
+        output = result.read_output()
+
+    # Assert
+    assert result.returncode == 0
+    assert stream.getvalue().splitlines() == ["out", "err"]
+    assert output.splitlines() == ["out", "err"]
+    assert result.output_path is None
+
+
+def test_run_command_timestamps():
+    # Arrange
+    stream = io.StringIO()
+
+    # Act
+    run_command(_python("print('a'); print('b')"), stream=stream, timestamps=True)
+
+    # Assert
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert all(line.startswith("[") and "] " in line for line in lines)
+    assert [line.split("] ", 1)[1] for line in lines] == ["a", "b"]
+
+
+def test_run_command_keeps_bounded_tail():
+    # Act
+    result = run_command(
+        _python("for i in range(1000): print(i)"), silent=True, tail_lines=10
+    )
+
+    # Assert
+    assert result.tail == [f"{i}\n" for i in range(990, 1000)]
+    assert len(result.read_output().splitlines()) == 1000
+    assert result.includes("5\n")
+    assert not result.includes("1000")
+    result.cleanup()
+
+
+def test_run_command_partial_lines_are_streamed():
+    # Arrange
+    stream = io.StringIO()
+
+    # Act
+    result = run_command(
+        _python("import sys; sys.stdout.write('Are you sure? ')"), stream=stream
+    )
+
+    # Assert
+    assert stream.getvalue() == "Are you sure? "
+    assert result.tail == ["Are you sure? "]
+    result.cleanup()
+
+
+def test_run_command_keeps_spill_file_on_error():
+    # Act
+    with pytest.raises(RuntimeError):
+        with run_command(_python("print('boom')"), silent=True) as result:
+            raise RuntimeError("failed")
+
+    # Assert
+    assert result.output_path is not None
+    assert result.output_path.read_text() == "boom\n"
+    result.cleanup()
+
+
+def test_run_command_timeout(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(subprocess_runner, "TERMINATE_GRACE_PERIOD", 1)
+
+    # Act
+    result = run_command(
+        _python("import time; print('start', flush=True); time.sleep(30)"),
+        silent=True,
+        timeout=0.5,
+    )
+
+    # Assert
+    assert result.timed_out
+    assert result.returncode != 0
+    assert result.tail == ["start\n"]
+    result.cleanup()
+
+
+def test_run_command_cancel():
+    # Arrange
+    cancel_event = threading.Event()
+    timer = threading.Timer(0.3, cancel_event.set)
+
+    # Act
+    timer.start()
+    result = run_command(
+        _python("import time; time.sleep(30)"), silent=True, cancel_event=cancel_event
+    )
+
+    # Assert
+    assert result.cancelled
+    assert not result.timed_out
+    assert result.returncode != 0
+    result.cleanup()
+
+
+def test_command_result_without_spill_file():
+    # Arrange
+    result = CommandResult(args=["x"], returncode=0, tail=["a\n", "b\n"])
+
+    # Assert
+    assert result.read_output() == "a\nb\n"
+    assert result.includes("b")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pytest
+import yaml
+
+from kedro_databricks.constants import TEMPLATES
+from kedro_databricks.utilities.template_renderer import (
+    is_service_principal,
+    render_template,
+    short_user_name,
+)
+
+
+@pytest.mark.parametrize(
+    ["template", "expected"],
+    [
+        ("name: {{ .name }}", "name: project"),
+        ("host: {{host}}", "host: https://host"),
+        ("a\n  {{- if flag }}\nb{{ end }}", "a\nb"),
+        ("{{ if not flag }}yes{{ else }}no{{ end }}", "no"),
+        ("{{ if flag }}{{ if not flag }}x{{ end }}y{{ end }}", "y"),
+        ("x  {{- .name -}}  \n y", "xprojecty"),
+    ],
+)
+def test_render_template(template, expected):
+    # Act
+    result = render_template(
+        template, {"name": "project", "host": lambda: "https://host", "flag": True}
+    )
+
+    # Assert
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    ["template", "match"],
+    [
+        ("{{ .missing }}", "Unknown template value 'missing'"),
+        ("{{ regexp `a` }}", "Unsupported template expression"),
+        ("{{ if flag }}", "Unclosed `if`"),
+        ("{{ end }}", "Unexpected `end`"),
+        ("{{ if flag }}{{ else }}{{ else }}{{ end }}", "Unexpected `else`"),
+    ],
+)
+def test_render_template_errors(template, match):
+    with pytest.raises(ValueError, match=match):
+        render_template(template, {"flag": True})
+
+
+@pytest.mark.parametrize("service_principal", [True, False])
+def test_render_databricks_template(service_principal):
+    # Arrange
+    template = (TEMPLATES / "databricks.yml.tmpl").read_text()
+
+    # Act
+    result = render_template(
+        template,
+        {
+            "project_slug": "my_project",
+            "workspace_host": "https://host",
+            "user_name": "me@example.com",
+            "is_service_principal": service_principal,
+        },
+    )
+
+    # Assert
+    config = yaml.safe_load(result)
+    assert config["bundle"]["name"] == "my_project"
+    assert config["targets"]["prod"]["workspace"]["host"] == "https://host"
+    assert ("run_as" in config["targets"]["prod"]) is not service_principal
+
+
+def test_user_helpers():
+    assert is_service_principal("6f1b9f2a-1c3d-4e5f-8a9b-0c1d2e3f4a5b")
+    assert not is_service_principal("me@example.com")
+    assert short_user_name("Jane.Doe+test@example.com") == "jane_doe_test"
+
+
+def test_short_user_name_service_principal():
+    with pytest.raises(ValueError, match="display name"):
+        short_user_name("6f1b9f2a-1c3d-4e5f-8a9b-0c1d2e3f4a5b")
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from kedro_databricks.commands.package import command
+from kedro_databricks.utilities import wheel_cache
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'pkg'\n")
+    builds = []
+
+    def _fake_package(project_path):
+        builds.append(project_path)
+        dist = project_path / "dist"
+        dist.mkdir(exist_ok=True)
+        (dist / "pkg-0.1-py3-none-any.whl").write_text(f"build {len(builds)}")
+
+    monkeypatch.setattr(wheel_cache, "_run_kedro_package", _fake_package)
+    return tmp_path, builds
+
+
+def test_build_wheel_reuses_cache(project):
+    project_path, builds = project
+
+    first = wheel_cache.build_wheel(project_path)
+    second = wheel_cache.build_wheel(project_path)
+
+    assert len(builds) == 1, "Wheel was rebuilt for unchanged sources"
+    assert first == second == [project_path / "dist" / "pkg-0.1-py3-none-any.whl"]
+
+
+def test_build_wheel_restores_cleaned_dist(project):
+    project_path, builds = project
+    wheel_cache.build_wheel(project_path)
+    (project_path / "dist" / "pkg-0.1-py3-none-any.whl").unlink()
+
+    wheels = wheel_cache.build_wheel(project_path)
+
+    assert len(builds) == 1
+    assert wheels[0].read_text() == "build 1"
+
+
+def test_build_wheel_rebuilds_on_change(project):
+    project_path, builds = project
+    wheel_cache.build_wheel(project_path)
+    (project_path / "src" / "pkg" / "__init__.py").write_text("x = 1\n")
+
+    wheels = wheel_cache.build_wheel(project_path)
+
+    assert len(builds) == 2
+    assert wheels[0].read_text() == "build 2"
+
+
+def test_build_wheel_force(project):
+    project_path, builds = project
+    wheel_cache.build_wheel(project_path)
+    wheel_cache.build_wheel(project_path, force=True)
+    assert len(builds) == 2
+
+
+def test_build_wheel_without_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(wheel_cache, "_run_kedro_package", lambda _: None)
+    with pytest.raises(RuntimeError, match="did not produce a wheel"):
+        wheel_cache.build_wheel(tmp_path)
+
+
+def test_prune_cache(project):
+    project_path, _ = project
+    for i in range(wheel_cache.MAX_CACHED_WHEELS + 2):
+        (project_path / "src" / "pkg" / "__init__.py").write_text(f"x = {i}\n")
+        wheel_cache.build_wheel(project_path)
+    cache_root = project_path / ".databricks" / "kedro-databricks" / "wheels"
+    assert len(list(cache_root.iterdir())) == wheel_cache.MAX_CACHED_WHEELS
+
+
+def test_package_command(cli_runner, metadata, monkeypatch):
+    built = []
+    monkeypatch.setattr(
+        "kedro_databricks.commands.package.build_wheel",
+        lambda project_path, force: built.append(force) or [],
+    )
+    result = cli_runner.invoke(command, ["--force"], obj=metadata)
+    assert result.exit_code == 0, (result.exit_code, result.stdout, result.exception)
+    assert built == [True]